@@ -12,7 +12,8 @@ from flask import send_from_directory
 from flask_compress import Compress
 from sol.opt import NetworkConfig, NetworkCaps
 from sol.opt.composer import compose_apps
-from sol.path.generate import generate_paths_ie
+from sol.opt.warmstart import WarmStart
+from sol.path.generate import generate_paths_pairs
 from sol.path.paths import PPTC
 from sol.path.predicates import null_predicate, has_mbox_predicate
 from sol.topology.topologynx import Topology
@@ -29,6 +30,7 @@ logger.addHandler(logging.StreamHandler())
 __API_VERSION = 1  # the current api version
 _json_pretty = False  # whether to pretty print json or not (not == save space)
 _gzip = True  # whether to gzip the returned responses
+_warm_start = None  # if set, successive compose requests are warm started from the previous solution
 
 
 # SET THIS TO THE TOPOLOGY WE ARE TESTING
@@ -203,7 +205,11 @@ def composeview():
     for r in resource_cost.keys():
         ncaps.add_cap(r,None,1)
     opt = compose_apps(apps, topology, NetworkConfig(networkcaps=ncaps), epoch_mode=EpochComposition.WORST, fairness=Fairness.WEIGHTED, weights = None)
+    if _warm_start is not None:
+        _warm_start.apply(opt)
     opt.solve()
+    if _warm_start is not None:
+        _warm_start.record(opt)
     result = []
     for app in apps:
         result_app = {"app": app.name, "tcs": []}
@@ -251,12 +257,11 @@ def topology():
 #        _topology = Topology.from_json(data)
         logging.info('Topology read successfully as:')
         logging.info(_topology.to_json())
-        _paths = {}
-        for s in _topology.nodes():
-            _paths[s] = {}
-            for t in _topology.nodes():
-                # this is where the predicate needs to be defined TODO
-                _paths[s][t] = list(generate_paths_ie(s, t, _topology, null_predicate, 100, 5))
+        _paths = {s: {} for s in _topology.nodes()}
+        # this is where the predicate needs to be defined TODO
+        pairs = [(s, t) for s in _topology.nodes() for t in _topology.nodes()]
+        for (s, t), paths in generate_paths_pairs(_topology, pairs, null_predicate, 100, 5).items():
+            _paths[s][t] = paths
         return ""
     else:
         abort(405)  # method not allowed
@@ -287,6 +292,8 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('--dev', action='store_true')
     parser.add_argument('--debug', action='store_true')
+    parser.add_argument('--warm-start', action='store_true',
+                        help='start each composition from the solution of the previous one')
     options = parser.parse_args()
 
     if options.dev:
@@ -298,4 +305,6 @@ if __name__ == '__main__':
         c.init_app(app)
     if options.debug:
         logger.setLevel(logging.DEBUG)
+    if options.warm_start:
+        _warm_start = WarmStart()
     app.run(debug=options.dev)
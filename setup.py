@@ -29,6 +29,16 @@ ext = [
         define_macros=[('CYTHON_TRACE', 1),
                        ('CYTHON_TRACE_NOGIL', 1)]
     ),
+    Extension(
+        'sol.opt.highswrapper',
+        ['src/sol/opt/highswrapper.pyx'],
+        include_dirs=[numpy.get_include()]
+    ),
+    Extension(
+        'sol.opt.optbase',
+        ['src/sol/opt/optbase.pyx'],
+        include_dirs=[numpy.get_include()]
+    ),
     Extension(
         'sol.opt.varnames',
         ['src/sol/opt/varnames.pyx'],
@@ -39,6 +49,16 @@ ext = [
         ['src/sol/path/generate.pyx'],
         include_dirs=[numpy.get_include()]
     ),
+    Extension(
+        'sol.path.ksp',
+        ['src/sol/path/ksp.pyx'],
+        include_dirs=[numpy.get_include()]
+    ),
+    Extension(
+        'sol.path.pathcache',
+        ['src/sol/path/pathcache.pyx'],
+        include_dirs=[numpy.get_include()]
+    ),
     Extension(
         'sol.path.paths',
         ['src/sol/path/paths.pyx'],
@@ -7,10 +7,11 @@ from .opt.app import App, AppBuilder
 from .opt.composer import compose_apps
 from .opt import funcs, NetworkCaps, NetworkConfig
 from .opt.quickstart import from_app
-from .utils.const import EpochComposition, Fairness, NodeConsumeMode, ResConsumeMode, Objective, Constraint
+from .utils.const import EpochComposition, Fairness, NodeConsumeMode, ResConsumeMode, Objective, Constraint, Backend
 from .opt.solution import Solution
 from .utils import const
 __version__ = 0.9
 __all__ = ['Topology', 'TrafficClass', 'make_tc', 'Path', 'PPTC', 'PathWithMbox', 'App', 'AppBuilder',
            'compose_apps', 'funcs', 'from_app', 'NetworkCaps', 'NetworkConfig', 'EpochComposition', 'Fairness',
-           'NodeConsumeMode', 'ResConsumeMode', 'Objective', 'Constraint', 'Solution', 'const']
+           'NodeConsumeMode', 'ResConsumeMode', 'Objective', 'Constraint', 'Solution', 'const',
+           'Backend']
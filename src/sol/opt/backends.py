@@ -0,0 +1,36 @@
+# coding=utf-8
+"""
+Lookup of the optimization backends (solvers) SOL can build models with
+"""
+
+from sol.utils.const import Backend, DEFAULT_BACKEND, ERR_UNKNOWN_MODE
+from sol.utils.exceptions import InvalidConfigException
+
+__all__ = ['get_backend']
+
+
+def get_backend(backend=None):
+    """
+    Return the optimization class that implements the given backend.
+
+    :param backend: either a :py:class:`~sol.utils.const.Backend` value, its string name
+        (e.g., 'gurobi' or 'highs'), or an optimization class which is returned as is.
+        If None, :py:data:`~sol.utils.const.DEFAULT_BACKEND` is used.
+    :return: a subclass of :py:class:`~sol.opt.optbase.Optimization`
+    :raises InvalidConfigException: if the backend is not known
+    """
+    if backend is None:
+        backend = DEFAULT_BACKEND
+    if isinstance(backend, type):
+        return backend
+    try:
+        backend = Backend(backend)
+    except ValueError:
+        raise InvalidConfigException(ERR_UNKNOWN_MODE % ('optimization backend', backend))
+    # Import lazily, so that only the solver that is actually used has to be installed
+    if backend == Backend.GUROBI:
+        from sol.opt.gurobiwrapper import OptimizationGurobi
+        return OptimizationGurobi
+    elif backend == Backend.HIGHS:
+        from sol.opt.highswrapper import OptimizationHighs
+        return OptimizationHighs
@@ -1,4 +1,6 @@
 # coding=utf-8
 from sol.topology.topologynx cimport Topology
+from sol.path.paths cimport PPTC
 
-cpdef compose_apps(apps, Topology topo, network_config, epoch_mode=*, fairness=*, weights=*)
+cpdef compose_apps(apps, Topology topo, network_config, epoch_mode=*, fairness=*, weights=*, backend=*, backend_opts=*,
+                   PPTC all_pptc=*, cache=*)
@@ -4,8 +4,8 @@ from __future__ import division
 from __future__ import print_function
 
 from numpy import array, stack
-from sol.opt.gurobiwrapper import OptimizationGurobi
-from sol.opt.gurobiwrapper cimport OptimizationGurobi
+from sol.opt.backends import get_backend
+from sol.opt.warmstart import WarmStart
 from sol.topology.topologynx cimport Topology
 from sol.path.paths import PPTC
 from sol.path.paths cimport PPTC
@@ -16,7 +16,7 @@ from sol.utils.logger import logger
 
 
 cpdef compose_apps(apps, Topology topo, network_config, epoch_mode=EpochComposition.AVG, fairness=Fairness.WEIGHTED,
-                   weights=None):
+                   weights=None, backend=None, backend_opts=None, PPTC all_pptc=None, cache=None):
     """
     Compose multiple applications into a single optimization
     :param apps: a list of App objects
@@ -29,80 +29,161 @@ cpdef compose_apps(apps, Topology topo, network_config, epoch_mode=EpochComposit
         (only relative to each other). That is if apps have weights 0.5 and 1, app with priority 1
         is given more importance. Setting weights to be equal (both either 0.5 or 1) has no effect on
         fairness
+    :param backend: the optimization backend (solver) to use. See :py:class:`~sol.utils.const.Backend`.
+        If None, the default backend is used.
+    :param backend_opts: a dictionary of extra keyword arguments passed to the backend constructor
+        (e.g., *matrix=True* for Gurobi, or *profile=True* to measure model sizes in
+        :py:meth:`~sol.opt.optbase.Optimization.get_profile`)
+    :param all_pptc: paths the optimization is built over. If None, the paths of all applications are merged
+    :param cache: a :py:class:`~sol.opt.modelcache.ModelCache`. If the same composition (up to traffic
+        volumes) was built before, the optimization is restored from the cache instead of being built
     :return:
     """
     # TODO: refactor epoch_mode and fairness into network config?
     logger.debug("Starting composition")
 
     # Merge all paths per traffic class into a single object so we can start the optimization
-    all_pptc = PPTC.merge([a.pptc for a in apps])
-
-    # Start the optimization
-    opt = OptimizationGurobi(topo, all_pptc)
-    # Extract the capacities from all links and nodes
-    node_caps = {node: topo.get_resources(node) for node in topo.nodes()}
-    link_caps = {link: topo.get_resources(link) for link in topo.links()}
-
-    # Consume network resources. For each resource, generate resource constraints by considering the
-    # load imposed by all traffic classes
-    rset = set()
-    for app in apps:
-        rset.update(app.resource_cost.keys())
-    # print (rset)
-    for r in rset:
-        logger.debug("App Resource Cost List: " + str(r))
-        logger.debug(str([app.resource_cost[r] for app in apps if r in app.resource_cost]))
-        modes, cost_vals, cost_funcs = zip(*[app.resource_cost[r] for app in apps if r in app.resource_cost])
-        # Make sure all the modes agree for a given resource
-        assert len(set(modes)) == 1
-        mode = modes[0]
-        if mode == NODES or mode== MBOXES:
-            capacities = {n: node_caps[n][r] for n in node_caps if r in node_caps[n]}
-        elif mode == LINKS:
-            capacities = {l: link_caps[l][r] for l in link_caps if r in link_caps[l]}
-        else:
-            raise InvalidConfigException(ERR_UNKNOWN_MODE % ('resource owner', mode))
-        # Avoid using cost funcs for now
-        # TODO: figure out efficient way of evaluating cost funcs
-        opt.consume(all_pptc.tcs(), r, capacities, mode, max(cost_vals), None)
-
-    # Cap the resources, if caps were given
-    if network_config is not None:
-        caps = network_config.get_caps()
-        if caps is not None:
-            for r in caps.resources():
-                opt.cap(r, caps.caps(r))
-
-    # And add any other constraints the app might desire
-    for app in apps:
-        opt.add_named_constraints(app)
+    if all_pptc is None:
+        all_pptc = PPTC.merge([a.pptc for a in apps])
 
     # Compute app weights
     if weights is None:
         volumes = stack([app.epoch_volumes() for app in apps], axis=0)
-        weights = volumes / volumes.sum(axis=0)
+        app_weights = volumes / volumes.sum(axis=0)
     else:
         assert 0 < weights <= 1
+        app_weights = weights
+    logger.debug('App weights %s' % app_weights)
+
+    backend_cls = get_backend(backend)
+    key = None
+    if cache is not None:
+        key = cache.key(apps, topo, network_config, epoch_mode, fairness, weights, backend_cls.__name__,
+                        backend_opts, all_pptc)
+        opt = cache.get(key, backend_cls, topo, all_pptc, app_weights,
+                        profile=(backend_opts or {}).get('profile', False))
+        if opt is not None:
+            return opt
 
-    logger.debug('App weights %s' % weights)
-
-    # Add objectives
-    objs = []
-    for app in apps:
-        logger.debug("Currently on app: " + str(app))
-        logger.debug("App Objectives: " + str(app.obj))
+    # Start the optimization
+    opt = backend_cls(topo, all_pptc, **(backend_opts or {}))
+    # Build the whole model with a single update at the end
+    with opt.batch():
+        # Extract the capacities from all links and nodes
+        node_caps = {node: topo.get_resources(node) for node in topo.nodes()}
+        link_caps = {link: topo.get_resources(link) for link in topo.links()}
+
+        # Consume network resources. For each resource, generate resource constraints by considering the
+        # load imposed by all traffic classes
+        rset = set()
+        for app in apps:
+            rset.update(app.resource_cost.keys())
+        # print (rset)
+        for r in rset:
+            logger.debug("App Resource Cost List: " + str(r))
+            logger.debug(str([app.resource_cost[r] for app in apps if r in app.resource_cost]))
+            modes, cost_vals, cost_funcs = zip(*[app.resource_cost[r] for app in apps if r in app.resource_cost])
+            # Make sure all the modes agree for a given resource
+            assert len(set(modes)) == 1
+            mode = modes[0]
+            if mode == NODES or mode== MBOXES:
+                capacities = {n: node_caps[n][r] for n in node_caps if r in node_caps[n]}
+            elif mode == LINKS:
+                capacities = {l: link_caps[l][r] for l in link_caps if r in link_caps[l]}
+            else:
+                raise InvalidConfigException(ERR_UNKNOWN_MODE % ('resource owner', mode))
+            # Avoid using cost funcs for now
+            # TODO: figure out efficient way of evaluating cost funcs
+            with opt.phase(u'consume', r):
+                opt.consume(all_pptc.tcs(), r, capacities, mode, max(cost_vals), None)
+
+        # Cap the resources, if caps were given
+        if network_config is not None:
+            caps = network_config.get_caps()
+            if caps is not None:
+                for r in caps.resources():
+                    with opt.phase(u'cap', r):
+                        opt.cap(r, caps.caps(r))
+
+        # And add any other constraints the app might desire
+        for app in apps:
+            opt.add_named_constraints(app)
+
+        # Add objectives
+        objs = []
+        for app in apps:
+            logger.debug("Currently on app: " + str(app))
+            logger.debug("App Objectives: " + str(app.obj))
+
+            kwargs = app.obj[2].copy()    #THIS COPY CALL KEEPS SEGFAULTING
+            logger.debug("Just copied kwargs")
+            kwargs.update(dict(varname=app.name, tcs=app.obj_tc))
+            logger.debug("Just finished update")            
+            with opt.phase(u'objective', app.name):
+                epoch_objs = opt.add_single_objective(app.obj[0], *app.obj[1], **kwargs)
+            logger.debug("Added Objective")
+            objs.append(epoch_objs)
+
+
+        logger.debug("Composing Objectives")
+
+        with opt.phase(u'compose_objectives'):
+            opt.compose_objectives(array(objs), epoch_mode, fairness, app_weights)
+    if cache is not None:
+        cache.put(key, opt)
+    return opt
 
-        kwargs = app.obj[2].copy()    #THIS COPY CALL KEEPS SEGFAULTING
-        logger.debug("Just copied kwargs")
-        kwargs.update(dict(varname=app.name, tcs=app.obj_tc))
-        logger.debug("Just finished update")            
-        epoch_objs = opt.add_single_objective(app.obj[0], *app.obj[1], **kwargs)
-        logger.debug("Added Objective")
-        objs.append(epoch_objs)
 
+class CompositionSession(object):
+    """
+    A long-lived composition of applications, built once over all candidate paths
+    and re-solved in place as the path masks change.
 
-    logger.debug("Composing Objectives")
-        
-    opt.compose_objectives(array(objs), epoch_mode, fairness, weights)
-    return opt
+    Masked paths are disabled by forcing their flow to 0 (see
+    :py:meth:`~sol.opt.optbase.Optimization.mask_paths`) instead of rebuilding the optimization,
+    which makes iterative path selection much cheaper.
+    Arguments are the same as for :py:func:`compose_apps`, with the addition of:
 
+    :param warm_start: if True, every solve is started from the previous solution
+        (see :py:class:`~sol.opt.warmstart.WarmStart`)
+    :param cache: a :py:class:`~sol.opt.modelcache.ModelCache` the optimization is restored from (or added to)
+    """
+    def __init__(self, apps, Topology topo, network_config, epoch_mode=EpochComposition.AVG,
+                 fairness=Fairness.WEIGHTED, weights=None, backend=None, backend_opts=None,
+                 warm_start=False, cache=None):
+        # Paths of all applications. Masks are shared with the applications' paths
+        self.pptc = PPTC.merge([a.pptc for a in apps])
+        # The optimization is built over an unmasked copy of the same paths
+        self._candidates = self.pptc.copy(deep=True)
+        self._candidates.clear_masks()
+        self.opt = compose_apps(apps, topo, network_config, epoch_mode, fairness, weights, backend,
+                                backend_opts, self._candidates, cache)
+        self.warm_start = WarmStart() if warm_start else None
+
+    def solve(self):
+        """
+        Apply the current path masks and re-solve the optimization
+
+        :return: the optimization
+        """
+        self.opt.mask_paths(self.pptc)
+        if self.warm_start is not None:
+            self.warm_start.apply(self.opt)
+        self.opt.solve()
+        if self.warm_start is not None:
+            self.warm_start.record(self.opt)
+        return self.opt
+
+    def get_chosen_paths(self, relaxed=False):
+        """
+        Mask the paths that were not chosen by the last solution, in the applications' paths.
+        See :py:meth:`~sol.opt.optbase.Optimization.get_chosen_paths`.
+
+        :rtype: :py:class:`sol.PPTC`
+        """
+        chosen = self.opt.get_chosen_paths(relaxed)
+        for tc in chosen.tcs():
+            self.pptc.mask(tc, chosen.get_mask(tc))
+        # keep the optimization's own paths unmasked, so it can be solved again
+        self._candidates.clear_masks()
+        return self.pptc
@@ -3,36 +3,58 @@ from sol.path.paths cimport PPTC
 from sol.topology.topologynx cimport Topology
 from cpython cimport bool
 from numpy cimport ndarray
+from sol.opt.optbase cimport Optimization
 
 # noinspection PyClassicStyleClass
-cdef class OptimizationGurobi:
+cdef class OptimizationGurobi(Optimization):
 
     # the gurobi model
     cdef public opt
-    # topology
-    cdef public Topology topo
-    # time measurement vars
-    cdef bool _do_time
-    cdef double _time
-    # load computation dict
-    cdef public _load_dict
-    # number of epochd
-    cdef int num_epochs
+    # whether the model is built in blocks, using sparse matrices
+    cdef public bool _matrix
+    # objective variables, by name
+    cdef dict _named
+    # constraints with volume-dependent coefficients: load rows, and (constraint, objectives)
+    # pairs of the weighted objective composition. If loads are summed across epochs,
+    # the model only fits the exact volumes it was built with
+    cdef list _volume_constrs
+    cdef list _weight_constrs
+    cdef bool _exact_volumes
     # all the gurobi var multi-dimensional arrays
     cdef ndarray _xps
     cdef ndarray _als
     cdef ndarray _bps
     cdef ndarray _bes
     cdef ndarray _bns
-    # max number of paths in a single traffic class
-    cdef int _max_paths
-    # all the paths per traffic class
-    cdef PPTC _all_pptc
+
+    # deferred updates and named variables
+    cdef _flush(self)
+    cdef tuple _model_size(self)
+    cdef _add_named_var(self, unicode name, double lb=*, double ub=*, double obj=*)
+    cdef unicode _var_name(self, v)
+
+    # matrix building helpers
+    cdef ndarray _add_var_block(self, list names, double lb, double ub, vtype)
+    cdef _add_matrix_constrs(self, ndarray rows, ndarray cols, ndarray vals, ndarray variables, sense, rhs,
+                             int num_rows)
+    cdef ndarray _valid_paths(self, ndarray ids)
+    cdef _allocate_flow_matrix(self, tcs, allocation)
+    cdef _load_matrix(self, unicode resource, tcind, ndarray capvals, bool path_dep)
 
     # internal variables and routing constraints
     cdef _add_decision_vars(self)
     cdef _add_binary_vars(self, PPTC pptc, vtypes)
     cdef _disable_paths(self, tcs=*)
+    cdef _mask_columns(self, ndarray off)
+    cdef bool _paths_priced(self)
+    cdef _grow(self, int max_paths)
+    cdef ndarray _add_path_vars(self, ndarray new)
+    cdef _set_coeffs(self, ndarray rows, ndarray variables, ndarray vals)
+    cdef ndarray _add_le_rows(self, ndarray rows, ndarray variables, ndarray vals, ub, int num_rows)
+    cdef ndarray _x_values(self)
+    cdef ndarray _b_values(self)
+    cdef _set_start_values(self, ndarray x, ndarray b)
+    cdef ndarray _row_duals(self, rows)
     cpdef allocate_flow(self, tcs, allocation=*)
 
     # Routing and path constraints
@@ -43,7 +65,6 @@ cdef class OptimizationGurobi:
 
 
     # resource consumption functions
-    cpdef consume(self, tcs, unicode resource, caps, mode, double cost_val, cost_funcs=*)
     cpdef cap(self, unicode resource, caps, path_dep=*, tcs=*)
 
     # Objective computation functions
@@ -58,6 +79,7 @@ cdef class OptimizationGurobi:
     # TODO: find a way to define a custom objective function
 
     # Node/link toggle functions
+    cdef _req_incidence(self, req_type, traffic_classes, node_mode)
     cdef _req_some(self, req_type, traffic_classes=*, node_mode=*)
     cdef _req_all(self, req_type, traffic_classes=*, node_mode=*)
     cpdef req_all_nodes(self, traffic_classes=*, node_mode=*)
@@ -69,9 +91,8 @@ cdef class OptimizationGurobi:
     # Solution parsing functions and general helper funcs
     # def solve(self)
     cpdef is_solved(self)
-    cpdef get_paths(self, int epoch=*)
+    cpdef has_solution(self)
     cpdef get_solved_objective(self, app=*)
-    cpdef get_chosen_paths(self, relaxed=*)
     cpdef get_var_values(self)
     cpdef get_enabled_nodes(self)
     cpdef get_enabled_links(self)
@@ -82,12 +103,16 @@ cdef class OptimizationGurobi:
 
     cpdef write(self, fname)
     cpdef write_solution(self, fname)
-    cpdef set_time_limit(self, long time)
-    cpdef double get_time(self)
+    cpdef set_time_limit(self, double time)
 
     # Advanced functionality functions
     cpdef relax_to_lp(self)
     cpdef get_gurobi_model(self)
+
+    # Saving and restoring built models
+    cpdef save(self, fname)
+    cdef _restore(self, model, dict layout)
+    cdef _rescale(self, dict layout, ndarray volumes, weights)
     # TODO: bring back mindiff
     # TODO: MIP starts?
 
@@ -37,69 +37,73 @@ warnings.filterwarnings('ignore', category=FutureWarning,
 import time
 
 import cython
-from numpy import ma, zeros, arange, array, ndarray, frompyfunc, log, ones, full, tile, uint8
+from numpy import ma, zeros, arange, array, ndarray, frompyfunc, log, ones, full, tile, uint8, concatenate, \
+    int64, unique, argsort, searchsorted, isnan, nan, flatnonzero, empty, savez, array_equal, load as load_npz
+from scipy.sparse import coo_matrix
 from numpy cimport ndarray
-from six import iterkeys, next
+from six import iterkeys, iteritems, next
 from six.moves import range
 from cpython cimport bool
 from sol.utils.exceptions import SOLException, InvalidConfigException
 from sol.topology.traffic cimport TrafficClass
 from sol.topology.topologynx cimport Topology
 from sol.opt.varnames cimport xp, al, be, bn, bp
+from sol.opt.optbase cimport Optimization
 from sol.opt import NetworkCaps
 from sol.utils.const import *
 from sol.path.paths cimport Path, PPTC
 
+def _var_index(v):
+    return v.index if isinstance(v, Var) else -1
+
+cdef ndarray _var_indices(ndarray variables):
+    """
+    Model (column) indices of an array of gurobi variables, -1 where there is no variable
+    """
+    if variables is None:
+        return zeros(0, dtype=int64)
+    return frompyfunc(_var_index, 1, 1)(variables).astype(int64)
+
+cdef ndarray _index_vars(ndarray vars, ndarray indices):
+    """
+    Inverse of :py:func:`_var_indices`, with 0 where there is no variable
+    """
+    cdef ndarray res = zeros((<object> indices).shape, dtype=object)
+    valid = indices >= 0
+    res[valid] = vars[indices[valid]]
+    return res
+
 # This is used in the node_budget function.
 # Figured I'd make it private a cdef inline for speed
 cdef _one_func(x):
     return 1
 
-cdef __get_x(x):
-    return x.x
-
-# Create a numpy ufunc for getting .x attributes of gurobi varibles
-_get_x = frompyfunc(__get_x, 1, 1)
 # _is_var = frompyfunc(lambda x: isinstance(x, Var), 1, 1)
 
 # noinspection PyClassicStyleClass
-cdef class OptimizationGurobi:
+cdef class OptimizationGurobi(Optimization):
     """
     Represents a SOL optimization problem.
     Uses Gurobi for building and solving the model.
+
+    :param topo: the network topology
+    :param all_pptc: paths per traffic class, for all traffic classes
+    :param matrix: if True, variables are added in blocks (as Gurobi MVars) and
+        the flow allocation, path disabling, capacity and load rows are assembled
+        as sparse matrices and added with a single *addMConstr* call each.
+        This is much faster to build for large models.
     """
-    def __init__(self, Topology topo, PPTC all_pptc):
+    def __init__(self, Topology topo, PPTC all_pptc, bool matrix=False, bool profile=False):
+        # Compute epochs, max paths and resources
+        Optimization.__init__(self, topo, all_pptc, profile)
+        self._matrix = matrix
         # Create a gurobi model
         self.opt = Model()
         # This will disable console output
         self.opt.params.LogToConsole = 0
         # Maximize the optimization
         self.opt.ModelSense = GRB.MAXIMIZE
-        # Keep track of the topology and all traffic classes
-        self.topo = topo
-        self._all_pptc = all_pptc
-
-        # Should we measure the time it takes to solve the optimization
-        self._do_time = True
-        self._time = 0
-
-        # Compute the set of all resources
-        res_set = set()
-        for node in topo.nodes():
-            rl = topo.get_resources(node)
-            res_set.update(rl)
-        for link in topo.links():
-            rl = topo.get_resources(link)
-            res_set.update(rl)
-        # Ensure that number of epochs matches up across all traffic classes
-        if len(set([ma.compressed(x.volFlows).size for x in all_pptc.tcs()])) != 1:
-            raise ValueError(ERR_EPOCH_MISMATCH)
-        # Store total number of epochs
-        self.num_epochs = ma.compressed(next(all_pptc.tcs()).volFlows).size
-        # Maximum number of paths for a single traffic class (to calculate the number of x_* variables)
-        self._max_paths = all_pptc.max_paths(all=False)
-        logger.debug('Gurobi wrapper computed: num_epochs=%d, max_paths=%d, num_tcs=%d' %
-                     (self.num_epochs, self._max_paths, self._all_pptc.num_tcs()))
+
         # The array that hold all of the x_* variables
         self._xps = zeros(shape=(all_pptc.num_tcs(), self._max_paths, self.num_epochs),
                           dtype=object)
@@ -108,22 +112,120 @@ cdef class OptimizationGurobi:
         self._bps = zeros((all_pptc.num_tcs(), self._max_paths), dtype=object)
         self._bns = zeros(topo.num_nodes(), dtype=object)
         self._bes = zeros((topo.num_nodes(), topo.num_nodes()), dtype=object)
-        # Create the load dictionary -- stores linear expressions that compute load per resource
-        self._load_dict = {}
-        # Initialize the load dict. Maps resource->node->value
-        for res in res_set:
-            self._load_dict[res] = {}
-            for n in topo.nodes():
-                self._load_dict[res][n] = None
-
-            for l in topo.links():
-                self._load_dict[res][l] = None
-        # Create all of the x_* variables
-        self._add_decision_vars()
-        self.allocate_flow(self._all_pptc.tcs())
+        # Objective variables, by name
+        self._named = {}
+        # Constraints whose coefficients depend on traffic volumes (see save() and load())
+        self._volume_constrs = []
+        self._weight_constrs = []
+        self._exact_volumes = False
+        # Create all of the x_* variables. The model is updated by the next modification
+        # (or by the batch the optimization is built in), not right away
+        self._batch += 1
+        with self.phase(u'decision_vars'):
+            self._add_decision_vars()
+        with self.phase(u'allocate_flow'):
+            self.allocate_flow(self._all_pptc.tcs())
+        self._batch -= 1
 
         logger.info("Initialized Gurobi wrapper")
 
+    cdef _flush(self):
+        """
+        Apply all pending model modifications
+        """
+        self.opt.update()
+
+    cdef tuple _model_size(self):
+        """
+        Measured only when profiling, since it applies all pending modifications
+        """
+        if not self._profile_sizes:
+            return None
+        self.opt.update()
+        return self.opt.NumVars, self.opt.NumConstrs + self.opt.NumGenConstrs, self.opt.NumNZs
+
+    cdef _add_named_var(self, unicode name, double lb=0, double ub=1, double obj=0):
+        """
+        Add a (continuous) objective variable, which can later be looked up by its name
+        without querying the model.
+        """
+        v = self.opt.addVar(lb=lb, ub=ub, obj=obj, name=name)
+        self._named[name] = v
+        return v
+
+    cdef unicode _var_name(self, v):
+        """
+        Name of a variable created with :py:meth:`_add_named_var`
+        """
+        for name, var in iteritems(self._named):
+            if var is v:
+                return name
+        return v.VarName
+
+    cdef ndarray _add_var_block(self, list names, double lb, double ub, vtype):
+        """
+        Add a block of variables to the model. In matrix mode the block is added
+        as a single MVar, otherwise variables are added one by one.
+
+        :param names: names of the variables
+        :param lb: lower bound
+        :param ub: upper bound
+        :param vtype: gurobi variable type
+        :return: a 1-d object array of gurobi variables
+        """
+        cdef ndarray block = zeros(len(names), dtype=object)
+        if not names:
+            return block
+        if self._matrix:
+            block[:] = self.opt.addMVar(len(names), lb=lb, ub=ub, vtype=vtype, name=names).tolist()
+        else:
+            for i, n in enumerate(names):
+                block[i] = self.opt.addVar(lb=lb, ub=ub, vtype=vtype, name=n)
+        return block
+
+    cdef _add_matrix_constrs(self, ndarray rows, ndarray cols, ndarray vals, ndarray variables, sense, rhs,
+                             int num_rows):
+        """
+        Add a block of constraints A x (sense) rhs, with a sparse A.
+        In matrix mode the block is added with a single *addMConstr* call, otherwise
+        a linear expression is built for every row.
+
+        :param rows: row index of each non-zero coefficient
+        :param cols: column index of each non-zero coefficient (an index into *variables*)
+        :param vals: the coefficients
+        :param variables: the gurobi variables that make up the columns of A
+        :param sense: constraint sense (GRB.LESS_EQUAL, GRB.EQUAL, GRB.GREATER_EQUAL)
+        :param rhs: right-hand side, a scalar or an array with *num_rows* values
+        :param num_rows: number of constraints
+        :return: a list of the new constraints
+        """
+        cdef int r
+        if num_rows == 0:
+            return []
+        rhs = full(num_rows, rhs, dtype=float)
+        if self._matrix:
+            a = coo_matrix((vals, (rows, cols)), shape=(num_rows, variables.size)).tocsr()
+            return self.opt.addMConstr(a, variables.tolist(), sense, rhs).tolist()
+        # one linear expression per row
+        order = argsort(rows, kind='stable')
+        bounds = searchsorted(rows[order], arange(num_rows + 1))
+        constrs = []
+        for r in range(num_rows):
+            sel = order[bounds[r]:bounds[r + 1]]
+            constrs.append(self.opt.addLConstr(LinExpr(vals[sel].tolist(), variables[cols[sel]].tolist()),
+                                               sense, rhs[r]))
+        return constrs
+
+    cdef ndarray _valid_paths(self, ndarray ids):
+        """
+        Compute which path indices exist for given traffic classes
+
+        :param ids: traffic class IDs
+        :return: a 2-d boolean array (traffic classes by paths)
+        """
+        nps = array([self._all_pptc.num_paths(self._all_pptc.tc_byid(i)) for i in ids], dtype=int64)
+        return arange(self._max_paths)[None, :] < nps[:, None]
+
     cdef _add_decision_vars(self):
         """
         Add desicision (x_*) variables responsible for determining
@@ -133,11 +235,17 @@ cdef class OptimizationGurobi:
         cdef int epoch, pi  # path index
         # for each traffic class, path, and epoch add a variable
         # use the loops so we get different objects & names. Do not use numpy fill
-        for tc in self._all_pptc.tcs():
+        ids = array(sorted([tc.ID for tc in self._all_pptc.tcs()]), dtype=int64)
+        names = []
+        for tc in [self._all_pptc.tc_byid(i) for i in ids]:
             for pi in range(self._all_pptc.num_paths(tc)):
                 for epoch in range(self.num_epochs):
-                    self._xps[tc.ID, pi, epoch] = self.opt.addVar(lb=0, ub=1, name=xp(tc, pi, epoch))
-        self.opt.update()
+                    names.append(xp(tc, pi, epoch))
+        valid = zeros((<object> self._xps).shape, dtype=bool)
+        valid[ids] = self._valid_paths(ids)[:, :, None]
+        # boolean indexing goes in the same (ID, path, epoch) order as the names
+        self._xps[valid] = self._add_var_block(names, 0, 1, GRB.CONTINUOUS)
+        self._update()
         logger.debug("Added desicion variables")
 
     cdef _add_binary_vars(self, PPTC pptc, vtypes):
@@ -155,27 +263,25 @@ cdef class OptimizationGurobi:
         # For each variable type
         for t in vtypes:
             if t == BinType.BIN_NODE:
-                for n in self.topo.nodes(False):
-                    if isinstance(self._bns[n], float):
-                        self._bns[n] = self.opt.addVar(vtype=GRB.BINARY, name=bn(n))
-                        mod = True
+                new = [n for n in self.topo.nodes(False) if not isinstance(self._bns[n], Var)]
+                self._bns[new] = self._add_var_block([bn(n) for n in new], 0, 1, GRB.BINARY)
             elif t == BinType.BIN_EDGE:
-                for u, v in self.topo.links(False):
-                    if isinstance(self._bes[u, v], float):
-                        self._bes[u, v] = self.opt.addVar(vtype=GRB.BINARY, name=be(u, v))
-                        mod = True
+                new = [(u, v) for u, v in self.topo.links(False) if not isinstance(self._bes[u, v], Var)]
+                block = self._add_var_block([be(u, v) for u, v in new], 0, 1, GRB.BINARY)
+                for i, (u, v) in enumerate(new):
+                    self._bes[u, v] = block[i]
             elif t == BinType.BIN_PATH:
-                for tc in pptc.tcs():
-                    for pi in arange(pptc.num_paths(tc)):
-                        if not isinstance(self._bps[tc.ID, pi], Var):
-                            self._bps[tc.ID, pi] = \
-                                self.opt.addVar(vtype=GRB.BINARY, name=bp(tc, pi))
-                            mod = True
+                new = [(tc, pi) for tc in pptc.tcs() for pi in range(pptc.num_paths(tc))
+                       if not isinstance(self._bps[tc.ID, pi], Var)]
+                block = self._add_var_block([bp(tc, pi) for tc, pi in new], 0, 1, GRB.BINARY)
+                for i, (tc, pi) in enumerate(new):
+                    self._bps[tc.ID, pi] = block[i]
             else:
                 raise SOLException("Unknown binary variable type")
+            mod = mod or len(new) > 0
         # if new vars were added, update the model
         if mod:
-            self.opt.update()
+            self._update()
 
     cpdef allocate_flow(self, tcs, allocation=None):
         """
@@ -193,6 +299,8 @@ cdef class OptimizationGurobi:
         cdef TrafficClass tc
         cdef ndarray on
         logger.debug('Allocating flow')
+        if self._matrix:
+            return self._allocate_flow_matrix(tcs, allocation)
         for tc in tcs:
             np = self._all_pptc.num_paths(tc)
             on = ones(np, dtype=uint8)
@@ -201,12 +309,44 @@ cdef class OptimizationGurobi:
                     self._als[tc.ID, epoch] = v = self.opt.addVar(lb=0, ub=1, name=al(tc, epoch))
                 # construct the expression: sum up all varibles per traffic class
                 expr = LinExpr(on.tolist(), self._xps[tc.ID, :np, epoch].tolist())
-                self.opt.addConstr(expr, GRB.EQUAL, v)
+                self._alloc_rows[tc.ID, epoch] = self.opt.addConstr(expr == v)
                 # If we also have an allocation value, add that constraint as well
                 if allocation is not None:
                     self.opt.addConstr(v == allocation)
         # Update the model
-        self.opt.update()
+        self._update()
+
+    cdef _allocate_flow_matrix(self, tcs, allocation):
+        """
+        Matrix version of :py:meth:`allocate_flow`: one sum(x_*) - a_* == 0 row per
+        traffic class and epoch, added as a single sparse block.
+        """
+        if allocation is not None and not 0 <= allocation <= 1:
+            raise ValueError(ERR_BAD_CAPVAL)
+        cdef TrafficClass tc
+        cdef int epoch
+        cdef int ne = self.num_epochs
+        tcs = list(tcs)
+        ids = array([tc.ID for tc in tcs], dtype=int64)
+        # Create the missing allocation variables
+        new = [tc for tc in tcs if not isinstance(self._als[tc.ID, 0], Var)]
+        self._als[[tc.ID for tc in new]] = self._add_var_block(
+            [al(tc, epoch) for tc in new for epoch in range(ne)], 0, 1, GRB.CONTINUOUS).reshape(-1, ne)
+        # Flow on all paths of a traffic class sums up to its allocation
+        valid = self._valid_paths(ids)[:, :, None].repeat(ne, axis=2)
+        xvars = self._xps[ids][valid]
+        avars = self._als[ids].ravel()
+        rows = arange(ids.size * ne).reshape(ids.size, 1, ne).repeat(self._max_paths, axis=1)[valid]
+        constrs = self._add_matrix_constrs(concatenate([rows, arange(avars.size)]),
+                                           arange(xvars.size + avars.size),
+                                           concatenate([ones(xvars.size), full(avars.size, -1.0)]),
+                                           concatenate([xvars, avars]), GRB.EQUAL, 0, avars.size)
+        self._alloc_rows[ids] = array(constrs, dtype=object).reshape(-1, ne)
+        # If we also have an allocation value, fix the allocation variables
+        if allocation is not None:
+            self.opt.setAttr(GRB.Attr.LB, avars.tolist(), [allocation] * avars.size)
+            self.opt.setAttr(GRB.Attr.UB, avars.tolist(), [allocation] * avars.size)
+        self._update()
 
     cpdef route_all(self, tcs=None):
         """
@@ -225,81 +365,19 @@ cdef class OptimizationGurobi:
                 # on a variable to be 1
                 self._als[tc.ID, epoch].lb = 1
         # Update the model
-        self.opt.update()
-
-
-    cpdef consume(self, tcs, unicode resource, capacities, mode, double cost_val, cost_funcs=None):
-        """
-        Compute the loads on a given resource by given traffic classes
-
-        :param tcs: traffic classes that cosume the resource
-        :param resource: resource to be consumed
-        :param cost_funcs: an iterable containing cost functions
-        :param capacities: capacities of links (or nodes)
-        :param mode: either 'links' or 'nodes' -- determines what to iterate over
-        """
-        logger.debug(u'Consuming resource %s' % resource)
-        cdef int pi  # path index
-        cdef TrafficClass tc
-        cdef Path path
-
-        for tc in tcs:
-            vols = tc.volFlows.compressed()
-            for pi, path in enumerate(self._all_pptc.paths(tc)):
-                if mode == NODES:  # iterate over path nodes
-                    # iterate over all nodes,
-                    # the cost function is responsible for determining the cost (could be 0)
-                    for node in path.nodes():
-                        if node in capacities and capacities[node] > 0:
-                            # Make sure we don't get key error/non-existent array
-                            if self._load_dict[resource][node] is None:
-                                self._load_dict[resource][node] = zeros((self._all_pptc.num_tcs(),
-                                                                         self._max_paths, self.num_epochs), dtype=float)
-                            if cost_funcs is not None:
-                                vals = array([func(tc, path, node) for func in cost_funcs]).max(axis=0) / capacities[node]
-                            else:
-                                vals = vols * cost_val / capacities[node]
-                            self._load_dict[resource][node][tc.ID, pi, :] += vals
-
-                elif mode == MBOXES:
-                   for node in path.mboxes(): # iterate over middbleboxes only
-                        if node in capacities and capacities[node] > 0:
-                            # Make sure we don't get key error/non-existent array
-                            if self._load_dict[resource][node] is None:
-                                self._load_dict[resource][node] = zeros((self._all_pptc.num_tcs(),
-                                                                         self._max_paths, self.num_epochs), dtype=float)
-                            if cost_funcs is not None:
-                                vals = array([func(tc, path, node) for func in cost_funcs]).max(axis=0) / capacities[node]
-                            else:
-                                vals = vols * cost_val/ capacities[node]
-                            self._load_dict[resource][node][tc.ID, pi, :] += vals
-
-
-                elif mode == LINKS:  # iterate over path links
-                    for link in path.links():
-                        if link in capacities and capacities[link] > 0:
-                            if self._load_dict[resource][link] is None:
-                                self._load_dict[resource][link] = zeros((self._all_pptc.num_tcs(),
-                                                                         self._max_paths, self.num_epochs), dtype=float)
-                            if cost_funcs is not None:
-                                vals = array([func(tc, path, link) for func in cost_funcs]).max(axis=0) / capacities[link]
-                            else:
-                                vals = vols * cost_val/ capacities[link]
-                            self._load_dict[resource][link][tc.ID, pi, :] += vals
+        self._update()
 
 
     cpdef cap(self, unicode resource, caps, path_dep=False, tcs=None):
-        """ Cap the usage of a given resource with a given value. 
+        """ Cap the usage of a given resource with a given value.
 
         :param resource: the name of resource to cap
         :param tcs: traffic classes that consume the resource. If None, all traffic classes are used
         :param caps: the maximum utilization of a given resource
+        :param path_dep: whether the resource is consumed per enabled path (and not per flow)
         """
         logger.debug("Capping resource %s" % resource)
-        # Sanity check on cap value
-        cdef int e, i, c
         cdef TrafficClass tc
-        cdef ndarray coeffs, vars
 
         # if no classes are given, take all of them
         if tcs is None:
@@ -308,7 +386,7 @@ cdef class OptimizationGurobi:
             tcs = list(tcs)
 
         # if caps is just an integer, expand into uniform capacities across the topology
-        if not isinstance(caps, Iterable):
+        if not isinstance(caps, dict):
             v = caps
             caps = NetworkCaps(self.topo)
             caps.add_cap(resource, cap=v)
@@ -317,94 +395,127 @@ cdef class OptimizationGurobi:
         if path_dep:
             self._disable_paths(tcs)
 
-        for node_or_link in self._load_dict[resource]:
-            # if no load has been computed or node/link not capped, skip
-            if self._load_dict[resource][node_or_link] is None or node_or_link not in caps:
-                continue
-
-            # For each epoch
-            for e in range(self.num_epochs):
-                expr = LinExpr()
-                coeffs = self._load_dict[resource][node_or_link][:,:,e]
-                vars = self._xps[:,:,e] if not path_dep else self._bps
-                ind = coeffs.nonzero()
-                # for c in range(coeffs.size):
-                #     if coeffs[c] > 0:
-                #         expr.add(vars[c], coeffs[c])
-                expr.addTerms(coeffs[ind].reshape(-1), vars[ind].reshape(-1))
-                # for tc in tcs:
-                #     # extract valid x_* variables or b_* variables if resource is counted per path
-                #     vars = self._xps[tc.ID, :num_paths[tc], e] if not path_dep else self._bps[tc.ID, :num_paths[tc]].reshape((1, self._max_paths, 1))
-                #     # generate coefficients for variables (i.e., the load across all paths)
-                #     coeffs = self._load_dict[resource][node_or_link][tc.ID, :num_paths[tc], e]
-                #     ind = coeffs > 0  # get non-zero coefficients, and only add those variables
-                #     expr.addTerms(coeffs[ind], vars[ind])
-                self.opt.addConstr(expr, GRB.LESS_EQUAL, caps[node_or_link],
-                                   # name='Cap.{}.{}.{}'.format(resource, str(node_or_link), e)
-                                   )
-        self.opt.update()
+        capvals = full(len(self._elements), nan)
+        for node_or_link in caps:
+            if node_or_link in self._elem_index:
+                capvals[self._elem_index[node_or_link]] = caps[node_or_link]
+        rows, cols, vals, variables, keys = self._load_matrix(resource, None, capvals, path_dep)
+        # One row per capped node/link and epoch
+        constrs = self._add_matrix_constrs(rows, cols, vals, variables, GRB.LESS_EQUAL,
+                                           capvals[keys // self.num_epochs], keys.size)
+        if path_dep:
+            # loads of all epochs are summed up per b_* variable, they cannot be rescaled per epoch
+            self._exact_volumes = True
+        else:
+            self._volume_constrs.extend(constrs)
+            self._load_rows.append((resource, keys, None, array(constrs, dtype=object), capvals, None))
+        self._update()
+
+    cdef _load_matrix(self, unicode resource, tcind, ndarray capvals, bool path_dep):
+        """
+        Collect the load on nodes/links in coordinate form, with one row per
+        node/link and epoch that carries any load.
+
+        :param resource: the resource
+        :param tcind: IDs of traffic classes to account for. If None, all traffic classes are used.
+        :param capvals: capacity of every node/link, NaN if not capped. Uncapped nodes/links are skipped.
+            If None, all nodes/links are used.
+        :param path_dep: if True, the columns are the b_* variables, not the x_* variables
+        :return: a tuple of (rows, columns, coefficients, variables, row keys). Row keys are
+            node/link index * number of epochs + epoch.
+        """
+        cdef int ne = self.num_epochs
+        load = self._resource_load(resource)
+        if load is None:
+            return zeros(0, dtype=int64), zeros(0, dtype=int64), zeros(0), zeros(0, dtype=object), \
+                   zeros(0, dtype=int64)
+        keep = ones(load.nnz, dtype=bool)
+        if tcind is not None:
+            tcmask = zeros(self._all_pptc.num_tcs(), dtype=bool)
+            tcmask[tcind] = True
+            keep &= tcmask[load.col // (self._max_paths * ne)]
+        if capvals is not None:
+            keep &= ~isnan(capvals[load.row])
+        row, pos, data = load.row[keep], load.col[keep], load.data[keep]
+        keys, rows = unique(row * ne + pos % ne, return_inverse=True)
+        # only pass the variables that are actually used to gurobi.
+        # Flat position of the variable in either the x_* or b_* array
+        if path_dep:
+            pos = pos // ne
+        upos, cols = unique(pos, return_inverse=True)
+        variables = (self._bps if path_dep else self._xps).ravel()[upos]
+        return rows.ravel(), cols.ravel(), data, variables, keys
+
+    cdef _req_incidence(self, req_type, traffic_classes, node_mode):
+        """
+        Compute which binary node (or link) variables each path depends on
+
+        :param req_type: either :py:attr:`BinType.BIN_NODE` or :py:attr:`BinType.BIN_EDGE`
+        :param traffic_classes: traffic classes to use
+        :param node_mode: whether to use all nodes or middleboxes only
+        :return: a tuple of (path rows, b_* path variables, element columns, b_* element variables).
+            Path rows and element columns are aligned, one entry per path/element pair.
+        """
+        cdef int nn = self.topo.num_nodes()
+        if req_type == BinType.BIN_NODE:
+            self._add_binary_vars(self._all_pptc, [BinType.BIN_NODE])
+            # depening on the mode, use either all nodes or middleboxes only
+            if node_mode == NodeConsumeMode.ALL:
+                inc = self._all_pptc.incidence(NODES, nn)
+            elif node_mode == NodeConsumeMode.MBOXES:
+                inc = self._all_pptc.incidence(MBOXES, nn)
+            else:
+                raise TypeError(ERR_UNKNOWN_MODE % (u'node consumption', node_mode))
+            elements = self._bns
+        elif req_type == BinType.BIN_EDGE:
+            self._add_binary_vars(self._all_pptc, [BinType.BIN_EDGE])
+            inc = self._all_pptc.incidence(LINKS, nn)
+            elements = self._bes.ravel()
+        else:
+            raise SOLException(u'Unknown type of binary variable: %s' % req_type)
+        tcids, pind = self._all_pptc.path_index()
+        # Only keep the paths of the given traffic classes
+        tcmask = zeros(self._all_pptc.num_tcs(), dtype=bool)
+        tcmask[[tc.ID for tc in traffic_classes]] = True
+        paths = flatnonzero(tcmask[tcids])
+        inc = inc[paths].tocoo()
+        # only pass the variables that are actually used to gurobi
+        ucols, cols = unique(inc.col, return_inverse=True)
+        return inc.row, self._bps[tcids[paths], pind[paths]], cols.ravel(), elements[ucols]
 
     cdef _req_all(self, req_type, traffic_classes=None, node_mode=NodeConsumeMode.ALL):
-        # ensure x_* <= b_*
-        self._disable_paths(pptc)
-        cdef int pi  # path index
-        cdef int u, v  # links
-        # if no traffic classes, use all
         if traffic_classes is None:
-            traffic_classes = pptc.keys()
-        if req_type.lower() == BinType.BIN_NODE:
-            for tc in traffic_classes:
-                for pi, path in enumerate(pptc[tc]):
-                    nodes = None
-                    # depening on the mode, use either all nodes or middleboxes only
-                    if node_mode == NodeConsumeMode.ALL:
-                        nodes = list(path.nodes())
-                    elif node_mode == NodeConsumeMode.MBOXES:
-                        nodes = list(path.mboxes())
-                    else:
-                        raise TypeError(ERR_UNKNOWN_MODE % ('node consumption', node_mode))
-                    self.opt.addConstr(self._bps[tc.ID, pi] <= self._bns[nodes])
-        elif req_type.lower() == BinType.BIN_EDGE:
-            for tc in traffic_classes:
-                for pi, path in enumerate(pptc[tc]):
-                    for u, v in path.links():
-                        self.opt.addConstr(self._bps[tc, pi] <= self._bes[u, v])
+            traffic_classes = list(self._all_pptc.tcs())
         else:
-            raise SOLException(u'Unknown type of constraint for _req_all()')
+            traffic_classes = list(traffic_classes)
+        # ensure x_* <= b_*
+        self._disable_paths(traffic_classes)
+        rows, bpaths, cols, belements = self._req_incidence(req_type, traffic_classes, node_mode)
+        cdef int n = rows.size
+        # b_path - b_element <= 0, for every node (link) of every path
+        self._add_matrix_constrs(concatenate([arange(n), arange(n)]),
+                                 concatenate([rows, bpaths.size + cols]),
+                                 concatenate([ones(n), full(n, -1.0)]),
+                                 concatenate([bpaths, belements]), GRB.LESS_EQUAL, 0, n)
         # update the model
-        self.opt.update()
+        self._update()
 
     cdef _req_some(self, req_type, traffic_classes=None, node_mode=NodeConsumeMode.ALL):
-        # ensure x_* <= b_*
-        self._disable_paths(traffic_classes)
-        cdef int pi  # path index
-        cdef int u, v  # links
         if traffic_classes is None:
-            traffic_classes = iterkeys(pptc.keys)
-        if req_type.lower() == BinType.BIN_NODE:
-            for tc in traffic_classes:
-                for pi, path in enumerate(pptc[tc]):
-                    expr = LinExpr()
-                    nodes = None
-                    # depening on the mode, use either all nodes or middleboxes only
-                    if node_mode == NodeConsumeMode.ALL:
-                        nodes = list(path.nodes())
-                    elif node_mode == NodeConsumeMode.MBOXES:
-                        nodes = list(path.mboxes())
-                    else:
-                        raise TypeError(ERR_UNKNOWN_MODE % (u'node consumption', node_mode))
-                    self.opt.addConstr(self._bps[tc, pi] <= quicksum(self._bns[nodes]))
-        elif req_type.lower() == BinType.BIN_EDGE:
-            for tc in traffic_classes:
-                for pi, path in enumerate(pptc[tc]):
-                    expr = LinExpr()
-                    for u, v in path.links():
-                        expr.add(self._bes[u, v])
-                    self.opt.addConstr(self._bps[tc, pi] <= expr)
+            traffic_classes = list(self._all_pptc.tcs())
         else:
-            raise SOLException(u'Unknown type of constraint for _req_some()')
+            traffic_classes = list(traffic_classes)
+        # ensure x_* <= b_*
+        self._disable_paths(traffic_classes)
+        rows, bpaths, cols, belements = self._req_incidence(req_type, traffic_classes, node_mode)
+        cdef int n = bpaths.size
+        # b_path - sum(b_element) <= 0, for every path
+        self._add_matrix_constrs(concatenate([arange(n), rows]),
+                                 concatenate([arange(n), n + cols]),
+                                 concatenate([ones(n), full(rows.size, -1.0)]),
+                                 concatenate([bpaths, belements]), GRB.LESS_EQUAL, 0, n)
         # update the model
-        self.opt.update()  # update the model
+        self._update()  # update the model
 
     cpdef req_all_nodes(self, traffic_classes=None, node_mode=NodeConsumeMode.ALL):
         """
@@ -414,7 +525,7 @@ cdef class OptimizationGurobi:
         :param node_mode: whether to count all nodes as enabled (:py:attr:NodeConsumeMode.ALL) or only middleboxes
             (:py:attr:`~sol.const.NodeConsumeMode.MBOXES`)
         """
-        return self._req_all(BinType.BIN_NODE, traffic_classes)
+        return self._req_all(BinType.BIN_NODE, traffic_classes, node_mode)
 
     cpdef req_all_links(self, traffic_classes=None):
         """
@@ -435,7 +546,7 @@ cdef class OptimizationGurobi:
             (:py:attr:`~sol.const.NodeConsumeMode.MBOXES`)
         
         """
-        return self._req_some(BinType.BIN_NODE, node_mode, traffic_classes)
+        return self._req_some(BinType.BIN_NODE, traffic_classes, node_mode)
 
     cpdef req_some_links(self, traffic_classes=None):
         """
@@ -461,12 +572,138 @@ cdef class OptimizationGurobi:
         cdef Path path
         cdef int epoch
 
+        if self._matrix:
+            ids = array([tc.ID for tc in tcs], dtype=int64)
+            vp = self._valid_paths(ids)
+            valid = vp[:, :, None].repeat(self.num_epochs, axis=2)
+            xvars = self._xps[ids][valid]
+            bvars = self._bps[ids][vp]
+            # index of the b_* variable for every x_* variable
+            bind = zeros((<object> vp).shape, dtype=int64)
+            bind[vp] = arange(bvars.size)
+            bind = bind[:, :, None].repeat(self.num_epochs, axis=2)[valid]
+            # x_* - b_* <= 0
+            self._add_matrix_constrs(concatenate([arange(xvars.size), arange(xvars.size)]),
+                                     concatenate([arange(xvars.size), xvars.size + bind]),
+                                     concatenate([ones(xvars.size), full(xvars.size, -1.0)]),
+                                     concatenate([xvars, bvars]), GRB.LESS_EQUAL, 0, xvars.size)
+            self._update()
+            return
+
         for tc in tcs:
             for pi, path in enumerate(self._all_pptc.paths(tc)):
                 for epoch in range(self.num_epochs):
                     # x_* <= b_*
                     self.opt.addConstr(self._xps[tc.ID, pi, epoch] <= self._bps[tc.ID, pi])
-        self.opt.update()
+        self._update()
+
+    cdef _mask_columns(self, ndarray off):
+        """
+        Set the upper bounds of the x_* (and b_*, if present) variables of disabled paths to 0,
+        and of all other paths to 1.
+
+        :param off: a 2-d boolean array (traffic classes by paths), True means the path is disabled
+        """
+        vp = self._valid_paths(arange(self._all_pptc.num_tcs()))
+        ub = (~off[vp]).astype(float)
+        self.opt.setAttr(u'UB', self._xps[vp].ravel().tolist(), ub.repeat(self.num_epochs).tolist())
+        bvars = self._bps[vp]
+        hasb = array([isinstance(b, Var) for b in bvars], dtype=bool)
+        if hasb.any():
+            self.opt.setAttr(u'UB', bvars[hasb].tolist(), ub[hasb].tolist())
+        self._update()
+
+    cdef bool _paths_priced(self):
+        """
+        The x_* variables are looked up in the constraint matrix of the model
+        """
+        self._flush()
+        if self.opt.NumIntVars > 0:
+            return False
+        xcols = _var_indices(self._xps.ravel())
+        xcols = xcols[xcols >= 0]
+        if array(self.opt.getAttr(u'Obj', self.opt.getVars()))[xcols].any():
+            return False
+        for row in self._alloc_rows.ravel():
+            if row is None:
+                return False
+        priced = zeros(self.opt.NumConstrs, dtype=bool)
+        priced[[c.index for c in self._alloc_rows.ravel()]] = True
+        for group in self._load_rows:
+            priced[[c.index for c in group[3]]] = True
+        return bool(priced[self.opt.getA().tocsc()[:, xcols].tocoo().row].all())
+
+    cdef _grow(self, int max_paths):
+        """
+        Pad the x_* and b_* variable arrays
+        """
+        cdef int nt = self._all_pptc.num_tcs()
+        cdef int pad = max_paths - self._max_paths
+        self._xps = concatenate([self._xps, zeros((nt, pad, self.num_epochs), dtype=object)], axis=1)
+        self._bps = concatenate([self._bps, zeros((nt, pad), dtype=object)], axis=1)
+        Optimization._grow(self, max_paths)
+
+    cdef ndarray _add_path_vars(self, ndarray new):
+        """
+        Add the x_* variables of new paths, and update the model so that they can be used right away
+        """
+        cdef int e
+        tcids, pind = new.nonzero()
+        names = [xp(self._all_pptc.tc_byid(t), pi, e) for t, pi in zip(tcids, pind)
+                 for e in range(self.num_epochs)]
+        self._xps[new] = self._add_var_block(names, 0, 1, GRB.CONTINUOUS).reshape(-1, self.num_epochs)
+        self._flush()
+        return self._xps[new]
+
+    cdef _set_coeffs(self, ndarray rows, ndarray variables, ndarray vals):
+        """
+        Change the coefficients one by one
+        """
+        for c, v, a in zip(rows, variables, vals):
+            self.opt.chgCoeff(c, v, a)
+
+    cdef ndarray _add_le_rows(self, ndarray rows, ndarray variables, ndarray vals, ub, int num_rows):
+        """
+        Add rows as loads, whose coefficients depend on traffic volumes
+        """
+        constrs = self._add_matrix_constrs(rows, arange(variables.size), vals, variables, GRB.LESS_EQUAL, ub,
+                                           num_rows)
+        self._volume_constrs.extend(constrs)
+        return array(constrs, dtype=object)
+
+    cdef ndarray _x_values(self):
+        """
+        Values of the x_* variables, in the shape of :py:meth:`get_xps`. Missing variables have a value of 0.
+        """
+        vp = self._valid_paths(arange(self._all_pptc.num_tcs()))
+        vals = zeros((<object> self._xps).shape)
+        vals[vp] = array(self.opt.getAttr(u'X', self._xps[vp].ravel().tolist())).reshape(-1, self.num_epochs)
+        return vals
+
+    cdef ndarray _b_values(self):
+        """
+        Values of the b_* variables (traffic classes by paths). Missing variables have a value of nan.
+        """
+        vals = full((<object> self._bps).shape, nan)
+        hasb = array([isinstance(b, Var) for b in self._bps.ravel()], dtype=bool).reshape(vals.shape)
+        if hasb.any():
+            vals[hasb] = self.opt.getAttr(u'X', self._bps[hasb].tolist())
+        return vals
+
+    cdef _set_start_values(self, ndarray x, ndarray b):
+        """
+        Set the *Start* attribute of the x_* and b_* variables. A value of nan means no starting value.
+        """
+        vp = self._valid_paths(arange(self._all_pptc.num_tcs()))
+        xs = x[vp].ravel()
+        xs[isnan(xs)] = GRB.UNDEFINED
+        self.opt.setAttr(u'Start', self._xps[vp].ravel().tolist(), xs.tolist())
+        hasb = array([isinstance(v, Var) for v in self._bps.ravel()], dtype=bool).reshape((<object> b).shape)
+        if hasb.any():
+            bs = b[hasb]
+            bs[isnan(bs)] = GRB.UNDEFINED
+            self.opt.setAttr(u'Start', self._bps[hasb].tolist(), bs.tolist())
+        self._update()
 
     cpdef enforce_single_path(self, traffic_classes):
         """
@@ -483,7 +720,7 @@ cdef class OptimizationGurobi:
             # sum of all binary path variables is 1. That is only a single 1 is allowed,
             # everything else is 0
             self.opt.addConstr(quicksum(self._bps[tc, :]) == 1)
-        self.opt.update()
+        self._update()
 
     cpdef flow_affinity(self, tc_pairs):
         """ 
@@ -522,7 +759,7 @@ cdef class OptimizationGurobi:
         self._disable_paths(pptc.tcs())
         # reshapte all into a 1-d array and sum all binary path variables
         self.opt.addConstr(quicksum(self._bps.reshape(-1)) <= max_paths, name='path_cap')
-        self.opt.update()  # model update
+        self._update()  # model update
 
     cpdef min_latency(self, tcs=None, bool norm=True, cost_func=None, varname=None):
         """
@@ -551,34 +788,38 @@ cdef class OptimizationGurobi:
         per_epoch_obj = zeros(self.num_epochs, dtype=object)
 
         for epoch in range(self.num_epochs):
-            per_epoch_obj[epoch] = latency = self.opt.addVar(name='{}_{}'.format(varname, epoch), lb=0, ub=1)
+            per_epoch_obj[epoch] = latency = self._add_named_var(u'{}_{}'.format(varname, epoch))
             latency_expr = LinExpr()
             for tc in tcs:
                 for pi, path in enumerate(self._all_pptc.paths(tc)):
                     latency_expr.addTerms(cost_func(path)/norm_factor, self._xps[tc.ID, pi, epoch])
             # Since the global direction is maximize, and latency is minimize, we gotta do '1-' trick
             self.opt.addConstr(latency <= 1 - latency_expr)
-        self.opt.update()
+        self._update()
         return per_epoch_obj
 
     cpdef min_enabled_nodes(self, cost_func=None, varname=None):
+        """
+        Minimize the number of enabled nodes
+
+        :param cost_func: compute the cost of a single node. If None, every node costs 1
+        :param varname: variable name to use. If None, one will be picked automatically
+        :return: An array of objective variables, one per epoch
+        """
         if varname is None:
             varname = Objective.MIN_ENABLED_NODES.name
         if cost_func is None:
             cost_func = _one_func
-        cdef float total = 0
         cdef ndarray coeffs
-        cdef int n = 0
-        # if not norm:
-        #     warnigns.warn(ERR_NO_NORM)
-        #     total = 1
-        # else:
-        coeffs = array([cost_func(n) for n in range(self._bns.size)])
-        total = sum(coeffs)
+        self._add_binary_vars(self._all_pptc, [BinType.BIN_NODE])
+        coeffs = array([cost_func(n) for n in range(self._bns.size)], dtype=float)
+        # Normalize by the total cost, so objective stays in [0, 1]
+        enabled = quicksum(self._bns * (coeffs / coeffs.sum()))
+        per_epoch_obj = zeros(self.num_epochs, dtype=object)
         for epoch in range(self.num_epochs):
-            per_epoch_obj[epoch] = num_nodes = self.opt.addVar(name='{}_{}'.format(varname, epoch), lb=0, ub=1)
-            self.opt.addConstr(num_nodes == 1-quicksum(self._bns * coeffs))
-        self.opt.update()
+            per_epoch_obj[epoch] = num_nodes = self._add_named_var(u'{}_{}'.format(varname, epoch))
+            self.opt.addConstr(num_nodes == 1 - enabled)
+        self._update()
         return per_epoch_obj
 
     cpdef node_budget(self, int bound, budget_func=None):
@@ -599,7 +840,7 @@ cdef class OptimizationGurobi:
             expr.addTerms(budget_func(n), self._bns[n])
         # and bound them
         self.opt.addConstr(expr <= bound)
-        self.opt.update()
+        self._update()
 
 
     cdef _min_load(self, unicode resource, tcs, varname):
@@ -630,25 +871,22 @@ cdef class OptimizationGurobi:
         # this will create variables for objective within each epoch
         for e in range(self.num_epochs):
             per_epoch_name = u'{}_{}'.format(varname, e)
-            per_epoch_objs[e] = self.opt.addVar(lb=0, ub=1, name=per_epoch_name)
-        self.opt.update()  # update model
+            per_epoch_objs[e] = self._add_named_var(per_epoch_name)
+        self._update()  # update model
 
         # Proceed to compute the load
-        tcind = [tc.ID for tc in tcs]
-        for node_or_link in self._load_dict[resource]:
-            # Skip non-existent resource-node combos
-            if not isinstance(self._load_dict[resource][node_or_link], ndarray):
-                continue
-            for e in range(self.num_epochs):
-                expr = LinExpr()
-                coeffs = self._load_dict[resource][node_or_link][tcind, :, e]
-                ind = coeffs.nonzero()
-                expr.addTerms(coeffs[ind].reshape(-1), self._xps[tcind, :, e][ind].reshape(-1))
-                expr.addTerms(1, per_epoch_objs[e])
-                self.opt.addConstr(expr, GRB.LESS_EQUAL, 1,
-                                   # name='ml_{}_{}'.format(str(node_or_link), e)
-                                   )
-        self.opt.update()
+        tcind = array([tc.ID for tc in tcs], dtype=int64)
+        rows, cols, vals, variables, keys = self._load_matrix(resource, tcind, None, False)
+        # load + objective <= 1, for every node/link and epoch
+        constrs = self._add_matrix_constrs(concatenate([rows, arange(keys.size)]),
+                                           concatenate([cols, variables.size + keys % self.num_epochs]),
+                                           concatenate([vals, ones(keys.size)]),
+                                           concatenate([variables, per_epoch_objs]), GRB.LESS_EQUAL, 1, keys.size)
+        self._volume_constrs += constrs
+        tcmask = zeros(self._all_pptc.num_tcs(), dtype=bool)
+        tcmask[tcind] = True
+        self._load_rows.append((resource, keys, tcmask, array(constrs, dtype=object), None, per_epoch_objs))
+        self._update()
         return per_epoch_objs
 
     cpdef min_node_load(self, unicode resource, tcs=None, varname=None):
@@ -691,14 +929,14 @@ cdef class OptimizationGurobi:
         # generate a variable for each epoch
         per_epoch_objs = zeros(self.num_epochs, dtype=object)
         for e in range(self.num_epochs):
-            per_epoch_objs[e] = obje = self.opt.addVar(lb=0, ub=1, name='{}_{}'.format(varname, e))
+            per_epoch_objs[e] = obje = self._add_named_var(u'{}_{}'.format(varname, e))
             # simply sum all allocations, normalize by the number of traffic classes, and that
             # is our objective
             expr = LinExpr(full(len(tcs), 1.0/len(tcs), dtype=float).tolist(),
                            self._als[[tc.ID for tc in tcs], e].tolist())
-            self.opt.addConstr(expr, GRB.GREATER_EQUAL, obje)
+            self.opt.addConstr(expr >= obje)
             # self.opt.addConstr(obje == quicksum([self._als[tc.ID, e] for tc in tcs]) / len(tcs))
-        self.opt.update()
+        self._update()
         return per_epoch_objs
 
     cdef _compose_obj_one_epoch(self, int epoch, ndarray obj, fairness_mode, weight_arr):
@@ -714,7 +952,8 @@ cdef class OptimizationGurobi:
         cdef float s
         epoch_obj = self.opt.addVar(name='{}_{}'.format(THE_OBJECTIVE, epoch))
         if fairness_mode == Fairness.WEIGHTED:
-            self.opt.addConstr(epoch_obj == LinExpr(weight_arr.tolist(), obj.tolist()))
+            self._weight_constrs.append((self.opt.addConstr(epoch_obj == LinExpr(weight_arr.tolist(), obj.tolist())),
+                                         obj))
         elif fairness_mode == Fairness.MAXMIN:
             for o in obj:
                 self.opt.addConstr(epoch_obj <= o)
@@ -733,7 +972,7 @@ cdef class OptimizationGurobi:
             for o in obj:
                 # Set the lower bound of o to not be 0. Because log(0) makes no sense
                 # o.lb = EPSILON
-                o_approx = self.opt.addVar(name='{}_{}'.format(o.VarName, 'approx'))
+                o_approx = self.opt.addVar(name='{}_{}'.format(self._var_name(o), 'approx'))
                 # For all pieces of the linear apporoximation
                 for i in range(len(x)-1):
                     s = (y[i+1] - y[i])/(x[i+1]-x[i])
@@ -746,7 +985,7 @@ cdef class OptimizationGurobi:
             self.opt.addConstr(epoch_obj == LinExpr(ones(obj.size), obj.tolist()))
         else:
             raise InvalidConfigException(ERR_UNKNOWN_MODE % ('fairness', fairness_mode))
-        self.opt.update()
+        self._update()
         return epoch_obj
 
     cpdef compose_objectives(self, ndarray obj_arr, epoch_mode, fairness_mode, weight_arr):
@@ -769,7 +1008,7 @@ cdef class OptimizationGurobi:
         """
         # repeat the weight array across ecpochs if only a single set of weights has been specified
         if weight_arr.ndim == 1:
-            weight_arr = tile(weight_arr, (1, self.num_epochs))
+            weight_arr = tile(weight_arr.reshape(-1, 1), (1, self.num_epochs))
 
         the_obj = self.opt.addVar(obj=1.0, name=THE_OBJECTIVE)
         if epoch_mode == EpochComposition.AVG:
@@ -785,7 +1024,7 @@ cdef class OptimizationGurobi:
                 self.opt.addConstr(the_obj <= expr)
         else:
             raise ValueError(ERR_UNKNOWN_MODE % (u'epoch composition', epoch_mode))
-        self.opt.update()
+        self._update()
         return the_obj
 
     cpdef relax_to_lp(self):
@@ -798,20 +1037,21 @@ cdef class OptimizationGurobi:
             This assumes you know what you are doing and are intentionally attempting to
             implement randomized rounding or other similar techniques.
         """
+        # getVars() only returns variables that have been added to the model
+        self._flush()
         for v in self.opt.getVars():
             if v.vType == GRB.BINARY:
-                self.intvars.add(v)
                 v.vType = GRB.CONTINUOUS
-        self.opt.update()
+        self._update()
 
-    cpdef set_time_limit(self, long time):
+    cpdef set_time_limit(self, double time):
         """
         Limit how long Gurobi looks for the solution.
-        :param time: time, in milliseconds
+        :param time: time, in seconds. Use *inf* to remove the limit.
         :return:
         """
-        self.opt.params.TimeLimit = time
-        self.opt.update()
+        self.opt.params.TimeLimit = min(time, GRB.INFINITY)
+        self._update()
 
     def solve(self):
         """
@@ -822,7 +1062,9 @@ cdef class OptimizationGurobi:
         """
         logger.info("Running Gurobi solver")
         start = time.time()
-        self.opt.optimize()
+        self._duals = None
+        with self.phase(u'solve'):
+            self.opt.optimize()
         if self._do_time:
             self._time = time.time() - start
 
@@ -844,6 +1086,126 @@ cdef class OptimizationGurobi:
         """
         self.opt.write("{}.sol".format(fname))
 
+    cpdef save(self, fname):
+        """
+        Write the model to *fname*.mps, and the layout of its variables and of the
+        volume-dependent constraints to *fname*.npz, so that it can be restored with :py:meth:`load`.
+
+        :param fname: file name, without the suffix
+        :return: a list of the files written
+        """
+        self._flush()
+        vars = self.opt.getVars()
+        names = sorted(self._named)
+        layout = dict(
+            matrix=self._matrix,
+            xps=_var_indices(self._xps), als=_var_indices(self._als), bps=_var_indices(self._bps),
+            bns=_var_indices(self._bns), bes=_var_indices(self._bes),
+            named=array(names, dtype=object).astype(unicode),
+            named_index=array([self._named[n].index for n in names], dtype=int64),
+            volumes=self._all_pptc.volumes(),
+            exact_volumes=self._exact_volumes,
+            volume_rows=array([c.index for c in self._volume_constrs], dtype=int64),
+            weight_rows=array([c.index for c, _ in self._weight_constrs], dtype=int64),
+            weight_vars=array([_var_indices(o) for _, o in self._weight_constrs], dtype=int64))
+        self.opt.write(u'{}.mps'.format(fname))
+        savez(u'{}.npz'.format(fname), **layout)
+        return [u'{}.mps'.format(fname), u'{}.npz'.format(fname)]
+
+    @staticmethod
+    def load(Topology topo, PPTC all_pptc, fname, weights=None, bool profile=False):
+        """
+        Restore an optimization written by :py:meth:`save`, without building it again.
+        Coefficients that depend on traffic volumes (loads of capped or minimized resources,
+        and the weights of the composed objectives) are updated to match the volumes of
+        *all_pptc*, which must have the same paths as the saved optimization.
+
+        .. note::
+            Loads are not recomputed, so no more resource caps or load objectives can be added.
+
+        :param topo: the topology
+        :param all_pptc: paths per traffic class
+        :param fname: file name given to :py:meth:`save`
+        :param weights: the new weights of the composed objectives (apps by epochs, or one weight per app
+            for all epochs). If None, the saved weights are kept
+        :param profile: see :py:meth:`~sol.opt.optbase.Optimization.get_profile`
+        :return: the optimization, or None if it was built for other volumes and cannot be rescaled
+        """
+        with load_npz(u'{}.npz'.format(fname)) as npz:
+            layout = dict(npz)
+        volumes = all_pptc.volumes()
+        if layout[u'exact_volumes'] and not array_equal(volumes, layout[u'volumes']):
+            return None
+        # loads of a traffic class were saved as 0 where it had no volume, and cannot be scaled up
+        if layout[u'volume_rows'].size and ((layout[u'volumes'] == 0) & (volumes > 0)).any():
+            return None
+        cdef OptimizationGurobi opt = OptimizationGurobi.__new__(OptimizationGurobi)
+        Optimization.__init__(opt, topo, all_pptc, profile)
+        with opt.phase(u'load'):
+            opt._restore(read(u'{}.mps'.format(fname)), layout)
+        with opt.phase(u'rescale'):
+            opt._rescale(layout, volumes, weights)
+        return opt
+
+    cdef _restore(self, model, dict layout):
+        """
+        Point the variable arrays at the variables of a model read from disk
+        """
+        self.opt = model
+        self.opt.params.LogToConsole = 0
+        self.opt.ModelSense = GRB.MAXIMIZE
+        self._matrix = bool(layout[u'matrix'])
+        cdef ndarray allvars = empty(self.opt.NumVars, dtype=object)
+        allvars[:] = self.opt.getVars()
+        self._xps = _index_vars(allvars, layout[u'xps'])
+        self._als = _index_vars(allvars, layout[u'als'])
+        self._bps = _index_vars(allvars, layout[u'bps'])
+        self._bns = _index_vars(allvars, layout[u'bns'])
+        self._bes = _index_vars(allvars, layout[u'bes'])
+        self._named = {n: allvars[i] for n, i in zip(layout[u'named'], layout[u'named_index'])}
+        constrs = self.opt.getConstrs()
+        self._volume_constrs = [constrs[i] for i in layout[u'volume_rows']]
+        self._weight_constrs = [(constrs[i], _index_vars(allvars, o))
+                                for i, o in zip(layout[u'weight_rows'], layout[u'weight_vars'])]
+        self._exact_volumes = bool(layout[u'exact_volumes'])
+
+    cdef _rescale(self, dict layout, ndarray volumes, weights):
+        """
+        Update the volume-dependent coefficients of a restored model. Load coefficients are
+        proportional to the volume of the traffic class in the epoch, so the columns of the x_*
+        variables are scaled by the ratio of new to saved volumes in the load rows.
+        """
+        cdef int e, i
+        if weights is not None and self._weight_constrs:
+            weights = array(weights, dtype=float)
+            # the same weights in every epoch, as in compose_objectives
+            if weights.ndim == 1:
+                weights = tile(weights.reshape(-1, 1), (1, self.num_epochs))
+            if weights.ndim != 2:
+                raise ValueError(u'Weights must be given per objective, or per objective and epoch')
+            for e, (c, obj) in enumerate(self._weight_constrs):
+                for i in range(obj.size):
+                    self.opt.chgCoeff(c, obj[i], -weights[i, e])
+        if not self._volume_constrs:
+            self._update()
+            return
+        saved = layout[u'volumes']
+        ratio = ones((<object> volumes).shape)
+        nz = saved > 0
+        ratio[nz] = volumes[nz] / saved[nz]
+        xind = layout[u'xps']
+        valid = xind >= 0
+        scale = ones(self.opt.NumVars)
+        scale[xind[valid]] = ratio[:, None, :].repeat(self._max_paths, axis=1)[valid]
+        a = self.opt.getA().tocsr()[layout[u'volume_rows']]
+        a = a.multiply(scale[None, :]).tocsr()
+        sense = self.opt.getAttr(GRB.Attr.Sense, self._volume_constrs)
+        rhs = self.opt.getAttr(GRB.Attr.RHS, self._volume_constrs)
+        # replace the load rows with the rescaled ones
+        self.opt.remove(self._volume_constrs)
+        self._volume_constrs = self.opt.addMConstr(a, self.opt.getVars(), array(sense), array(rhs)).tolist()
+        self._update()
+
     cpdef get_gurobi_model(self):
         """
         Returns the underlying Gurobi model
@@ -852,6 +1214,7 @@ cdef class OptimizationGurobi:
             Changes to the underlying model can lead to incorrect results.
             Use with caution. Advanced users only.
         """
+        self._flush()
         return self.opt
 
     cpdef save_hints(self, fname):
@@ -884,7 +1247,8 @@ cdef class OptimizationGurobi:
         """
         Returns the mapping of variable names to values assigned by optimization
         """
-        return {var.VarName: var.x for var in self.opt.getVars()}
+        allvars = self.opt.getVars()
+        return dict(zip(self.opt.getAttr(u'VarName', allvars), self.opt.getAttr(u'X', allvars)))
 
     cpdef get_solved_objective(self, app=None):
         """
@@ -896,7 +1260,7 @@ cdef class OptimizationGurobi:
         if app is None:
             return self.opt.getObjective().getValue()
         else:
-            return [self.opt.getVarByName('{}_{}'.format(app.name, e)).x for e in range(self.num_epochs)]
+            return [self._named[u'{}_{}'.format(app.name, e)].x for e in range(self.num_epochs)]
 
     cpdef is_solved(self):
         """
@@ -906,6 +1270,25 @@ cdef class OptimizationGurobi:
         """
         return self.opt.Status == GRB.OPTIMAL
 
+    cpdef has_solution(self):
+        """
+        Check if the optimization has a solution, even if it is not (proven to be) optimal
+
+        :return: True if a feasible solution has been found
+        """
+        return self.opt.SolCount > 0
+
+    cdef ndarray _row_duals(self, rows):
+        """
+        Dual values (Gurobi's *Pi* attribute) of the given constraints
+        """
+        if not self.is_solved() or self.opt.IsMIP:
+            raise SOLException(ERR_NO_DUALS)
+        rows = list(rows)
+        if not rows:
+            return zeros(0)
+        return array(self.opt.getAttr(GRB.Attr.Pi, rows), dtype=float)
+
     cpdef get_xps(self):
         """
         Return the 3-dimentional array of all decision variables.
@@ -916,12 +1299,14 @@ cdef class OptimizationGurobi:
         3. Epochs
 
 
+        If paths were masked with :py:meth:`mask_paths`, only the variables of unmasked paths are returned.
+
         .. warning::
             This reflects internal state of the optimization, use for read-only purposes
 
         :return:  numpy array
         """
-        return self._xps
+        return self._exposed(self._xps, 0)
 
     # cpdef get_load_dict(self):
     #     """
@@ -947,73 +1332,22 @@ cdef class OptimizationGurobi:
         Return the list of enabled nodes, as determined by the optimization
         :return:
         """
-        result = []
-        for n in self.topo.nodes():
-            v = self.opt.getVarByName(bn(n))
-            if v is not None and v.x == 1:
-                result.append(n)
-        return result
+        nodes = [n for n in self.topo.nodes() if isinstance(self._bns[n], Var)]
+        if not nodes:
+            return []
+        vals = self.opt.getAttr(u'X', self._bns[nodes].tolist())
+        return [n for n, val in zip(nodes, vals) if val == 1]
 
     cpdef get_enabled_links(self):
         """
         Return the list of enabled links, as determined by the optimization
         :return:
         """
-        result = []
-        for u, v in self.topo.links():
-            var = self.opt.getVarByName(be(u, v))
-            if var is not None and var.x == 1:
-                result.append(n)
-        return result
-
-    cpdef get_paths(self, int epoch=0):
-        """
-        :param epoch: Return the paths for this epoch. By default the paths for the first epoch
-            are returned (that is *epoch=0*)
-        :return: paths per traffic class with set flow fractions
-        :rtype: :py:class:`sol.PPTC`
-        """
-        cdef TrafficClass tc
-        cdef int pi
-        cdef Path p
-        cdef PPTC c = self._all_pptc.copy(deep=True)
-        for tc in c.tcs():
-            for pi, p in enumerate(c.paths(tc)):
-                p.set_flow_fraction(self._xps[tc.ID, pi, epoch].x)
-        return c
-
-
-    # TODO: bring back mindiff functionality
-    # TODO: add MIP hints/starts
-
-    cpdef get_chosen_paths(self, relaxed=False):
-        """
-        Return the paths that were deemed "enabled" by the optimization
-        :rtype: :py:class:`sol.PPTC`
-        """
-        # Go through the variables and pick our paths.
-        cdef TrafficClass tc
-        cdef int pid, i, np, anp
-        cdef ndarray m
-        for tc in self._all_pptc.tcs():
-            np = self._all_pptc.num_paths(tc)
-            anp = self._all_pptc.num_paths(tc, all=True)
-            for i, p in enumerate(self._all_pptc.paths(tc)):
-                p.set_flow_fraction(max([x.x for x in self._xps[tc.ID, i, :]]))
-            if relaxed:
-                # Get the indices where x_p variable is 0 for all epochs, i.e., the path is unused across all epochs
-                ind = [i for i in range(np) if any([x.x != 0 for x in self._xps[tc.ID, i, :]]) ]
-                # logger.debug(ind)
-            else:
-                # Get the indices where b_p variable is 0, i.e., the path is unused.
-                ind = [i for i in range(np) if self._bps[tc.ID, i].x != 0]
-            # Mask the unused paths in the PPTC
-            m = ones(anp, dtype=bool)
-            m[ind] = 0
-            self._all_pptc.mask(tc, m)
-            # logger.debug(self._all_pptc.paths(tc))
-        # print(self._xps.shape[1])
-        return self._all_pptc
+        links = [(u, v) for u, v in self.topo.links() if isinstance(self._bes[u, v], Var)]
+        if not links:
+            return []
+        vals = self.opt.getAttr(u'X', [self._bes[u, v] for u, v in links])
+        return [l for l, val in zip(links, vals) if val == 1]
 
     cpdef fix_paths(self, PPTC pptc, fix_zero_paths=False):
         """
@@ -1034,63 +1368,4 @@ cdef class OptimizationGurobi:
                         # logger.debug("%d, %d, %f" % (tc.ID, pi, p.flow_fraction()))
                         self.opt.addConstr(self._xps[tc.ID, pi, e] == \
                                            p.flow_fraction())
-        self.opt.update()
-
-    cpdef double get_time(self):
-        """
-        :return: The time it took to solve the optimization
-        """
-        return self._time
-
-    def add_single_objective(self, name, *args, **kwargs):
-        """
-        Add an objective to the optimization
-        :param name: name of the objective
-        :param args: arguments to be passed to the objective generation function
-        :param kwargs: keyword arguments to be passed to objective generation function
-        :return:
-        """
-        logger.debug("add Single Objective")
-        
-        epoch_objs = None
-        if name == Objective.MIN_LINK_LOAD:
-            epoch_objs = self.min_link_load(*args, **kwargs)
-        elif name == Objective.MIN_NODE_LOAD:
-            epoch_objs = self.min_node_load(*args, **kwargs)
-        elif name == Objective.MIN_LATENCY:
-            epoch_objs = self.min_latency(*args, **kwargs)
-        elif name == Objective.MAX_FLOW:
-            epoch_objs = self.max_flow(*args, **kwargs)
-        elif name == Objective.MIN_ENABLED_NODES:
-            epoch_objs = self.min_enabled_nodes(*args, **kwargs)
-        else:
-            raise InvalidConfigException("Unknown objective %s" % name)
-        return epoch_objs
-
-    def add_named_constraints(self, app):
-        """
-        Add supported constraints from the application to the optimization
-        :param app: the application
-        """
-        for c in app.constraints:
-            args, kwargs = c[1], c[2]
-#            if c[0] == Constraint.ALLOCATE_FLOW:
-#                self.allocate_flow(*args, **kwargs)
-            if c[0] == Constraint.ROUTE_ALL:
-                self.route_all(*args, **kwargs)
-            elif c[0] == Constraint.CAP_LINKS or c[0] == Constraint.CAP_NODES:
-                self.cap(*args, **kwargs)
-            elif c[0] == Constraint.REQ_ALL_LINKS:
-                self.req_all_links(*args, **kwargs)
-            elif c[0] == Constraint.REQ_ALL_NODES:
-                self.req_all_nodes(*args, **kwargs)
-            elif c[0] == Constraint.REQ_SOME_LINKS:
-                self.req_some_links(*args, **kwargs)
-            elif c[0] == Constraint.REQ_SOME_NODES:
-                self.req_some_nodes(*args, **kwargs)
-            elif c[0] == Constraint.FIX_PATHS:
-                self.fix_paths(*args, **kwargs)
-            elif c[0] == Constraint.NODE_BUDGET:
-                self.node_budget(*args, **kwargs)
-            else:
-                raise InvalidConfigException("Unsupported constraint type %s" % c)
+        self._update()
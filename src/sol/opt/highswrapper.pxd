@@ -0,0 +1,67 @@
+# coding=utf-8
+from sol.path.paths cimport PPTC
+from cpython cimport bool
+from numpy cimport ndarray
+from sol.opt.optbase cimport Optimization
+
+# noinspection PyClassicStyleClass
+cdef class OptimizationHighs(Optimization):
+
+    # variable bounds, objective coefficients and integrality (one entry per column)
+    cdef ndarray _lb
+    cdef ndarray _ub
+    cdef ndarray _obj
+    cdef ndarray _integrality
+    cdef int _num_vars
+    # constraint matrix in coordinate form, stored in chunks until the model is solved
+    cdef list _rows
+    cdef list _cols
+    cdef list _vals
+    cdef list _rlb
+    cdef list _rub
+    cdef int _num_rows
+    cdef long _num_nonzeros
+    # column indices of the variable arrays, -1 means no variable
+    cdef ndarray _xps
+    cdef ndarray _als
+    cdef ndarray _bps
+    cdef ndarray _bes
+    cdef ndarray _bns
+    # traffic classes for which x_* <= b_* has been enforced
+    cdef ndarray _disabled
+    # columns whose upper bound is forced to 0 (variables of masked paths)
+    cdef ndarray _off
+    # names of the objective variables, mapped to their columns
+    cdef dict _named
+    # solver options and the result of the last solve
+    cdef public dict _options
+    cdef public _result
+    # dual values of all rows, if the last solve was a linear program
+    cdef ndarray _row_dual_values
+
+    # model building helpers
+    cdef ndarray _add_vars(self, int num, lb=*, ub=*, bool binary=*)
+    cdef _add_rows(self, ndarray rows, ndarray cols, ndarray vals, lb, ub, int num_rows)
+    cdef _constraint_matrix(self)
+    cdef _solve_lp(self, a, ndarray rlb, ndarray rub, ndarray ub)
+    cdef tuple _model_size(self)
+    cdef ndarray _x_values(self)
+    cdef ndarray _b_values(self)
+    cdef _set_start_values(self, ndarray x, ndarray b)
+    cdef ndarray _row_duals(self, rows)
+
+    # internal variables and routing constraints
+    cdef _add_decision_vars(self)
+    cdef _add_binary_vars(self, vtypes)
+    cdef _disable_paths(self, tcs=*)
+    cdef _mask_columns(self, ndarray off)
+    cdef bool _paths_priced(self)
+    cdef _grow(self, int max_paths)
+    cdef ndarray _add_path_vars(self, ndarray new)
+    cdef _set_coeffs(self, ndarray rows, ndarray variables, ndarray vals)
+    cdef ndarray _add_le_rows(self, ndarray rows, ndarray variables, ndarray vals, ub, int num_rows)
+    cdef _min_load(self, unicode resource, tcs, varname)
+    cdef _compose_obj_one_epoch(self, int epoch, ndarray obj, fairness_mode, weight_arr)
+    cdef _req_incidence(self, req_type, traffic_classes, node_mode)
+    cdef _req_some(self, req_type, traffic_classes=*, node_mode=*)
+    cdef _req_all(self, req_type, traffic_classes=*, node_mode=*)
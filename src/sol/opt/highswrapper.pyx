@@ -0,0 +1,997 @@
+# coding=utf-8
+# cython: profile=True
+# cython: binding=True
+
+"""
+Wrapper around the HiGHS solver (through :py:func:`scipy.optimize.milp`).
+
+Unlike the Gurobi wrapper, no per-variable Python objects are created: variables
+are plain column indices and all constraints are accumulated as sparse
+coordinate chunks that are assembled into a single CSR matrix at solve time.
+"""
+
+from __future__ import division, print_function
+
+import time
+
+from numpy import ma, zeros, arange, array, full, ones, tile, repeat, concatenate, \
+    unique, log, isnan, nan, inf, int64, uint8, savez, flatnonzero, around, column_stack
+from numpy cimport ndarray
+from six.moves import range
+from cpython cimport bool
+from sol.utils.const import ERR_NO_HIGHS
+from sol.utils.logger import logger
+
+try:
+    from scipy.optimize import milp, linprog, LinearConstraint, Bounds
+    from scipy.sparse import coo_matrix, vstack
+except ImportError as e:
+    logger.error(ERR_NO_HIGHS)
+    logger.error('HiGHS optimization capabilities will not be available!')
+
+from sol.utils.exceptions import SOLException, InvalidConfigException
+from sol.topology.traffic cimport TrafficClass
+from sol.topology.topologynx cimport Topology
+from sol.opt.varnames cimport xp, al, be, bn, bp
+from sol.opt.optbase cimport Optimization
+from sol.opt import NetworkCaps
+from sol.utils.const import *
+from sol.path.paths cimport Path, PPTC
+
+cdef _one_func(x):
+    return 1
+
+# noinspection PyClassicStyleClass
+cdef class OptimizationHighs(Optimization):
+    """
+    Represents a SOL optimization problem.
+    Uses HiGHS for solving the model, which is built as a single sparse matrix.
+    """
+    def __init__(self, Topology topo, PPTC all_pptc, bool profile=False):
+        Optimization.__init__(self, topo, all_pptc, profile)
+        # Columns of the model
+        self._num_vars = 0
+        self._lb = zeros(0, dtype=float)
+        self._ub = zeros(0, dtype=float)
+        self._obj = zeros(0, dtype=float)
+        self._integrality = zeros(0, dtype=uint8)
+        # Rows of the model
+        self._num_rows = 0
+        self._num_nonzeros = 0
+        self._rows = []
+        self._cols = []
+        self._vals = []
+        self._rlb = []
+        self._rub = []
+        self._named = {}
+        self._options = {u'disp': False}
+        self._result = None
+        self._row_dual_values = None
+
+        # Index arrays, pointing to columns of the x_*, a_*, and b_* variables
+        self._xps = full((all_pptc.num_tcs(), self._max_paths, self.num_epochs), -1, dtype=int64)
+        self._als = full((all_pptc.num_tcs(), self.num_epochs), -1, dtype=int64)
+        self._bps = full((all_pptc.num_tcs(), self._max_paths), -1, dtype=int64)
+        self._bns = full(topo.num_nodes(), -1, dtype=int64)
+        self._bes = full((topo.num_nodes(), topo.num_nodes()), -1, dtype=int64)
+        self._disabled = zeros(all_pptc.num_tcs(), dtype=bool)
+        self._off = zeros(0, dtype=int64)
+
+        # Create all of the x_* variables
+        with self.phase(u'decision_vars'):
+            self._add_decision_vars()
+        with self.phase(u'allocate_flow'):
+            self.allocate_flow(self._all_pptc.tcs())
+
+        logger.info("Initialized HiGHS wrapper")
+
+    cdef ndarray _add_vars(self, int num, lb=0, ub=1, bool binary=False):
+        """
+        Add a block of new columns to the model
+
+        :param num: number of variables to add
+        :param lb: lower bound (a scalar or an array of size *num*)
+        :param ub: upper bound (a scalar or an array of size *num*)
+        :param binary: whether the new variables are binary
+        :return: column indices of the new variables
+        """
+        cdef ndarray ind = arange(self._num_vars, self._num_vars + num, dtype=int64)
+        self._lb = concatenate([self._lb, full(num, lb, dtype=float)])
+        self._ub = concatenate([self._ub, full(num, ub, dtype=float)])
+        self._obj = concatenate([self._obj, zeros(num, dtype=float)])
+        self._integrality = concatenate([self._integrality, full(num, binary, dtype=uint8)])
+        self._num_vars += num
+        return ind
+
+    cdef _add_rows(self, ndarray rows, ndarray cols, ndarray vals, lb, ub, int num_rows):
+        """
+        Add a block of constraints of the form lb <= A x <= ub
+
+        :param rows: row indices of the non-zero coefficients, local to this block (0 to num_rows-1)
+        :param cols: column indices of the non-zero coefficients
+        :param vals: the coefficients
+        :param lb: lower bounds of the rows (a scalar or an array of size *num_rows*)
+        :param ub: upper bounds of the rows (a scalar or an array of size *num_rows*)
+        :param num_rows: number of rows in this block
+        """
+        if num_rows == 0:
+            return
+        self._rows.append(rows + self._num_rows)
+        self._cols.append(cols)
+        self._vals.append(vals)
+        self._rlb.append(full(num_rows, lb, dtype=float))
+        self._rub.append(full(num_rows, ub, dtype=float))
+        self._num_rows += num_rows
+        self._num_nonzeros += vals.size
+
+    cdef tuple _model_size(self):
+        """
+        The model is kept in memory, so its size is cheap to measure
+        """
+        if not self._profile_sizes:
+            return None
+        return self._num_vars, self._num_rows, self._num_nonzeros
+
+    cdef _constraint_matrix(self):
+        """
+        Assemble all constraint chunks into a single CSR matrix
+
+        :return: a tuple of (matrix, row lower bounds, row upper bounds)
+        """
+        if self._num_rows == 0:
+            return coo_matrix((0, self._num_vars)).tocsr(), zeros(0), zeros(0)
+        a = coo_matrix((concatenate(self._vals), (concatenate(self._rows), concatenate(self._cols))),
+                       shape=(self._num_rows, self._num_vars)).tocsr()
+        return a, concatenate(self._rlb), concatenate(self._rub)
+
+    cdef _add_decision_vars(self):
+        """
+        Add desicision (x_*) variables responsible for determining
+        the amount of flow on each path for each TraffiClass (in each epoch).
+        """
+        cdef TrafficClass tc
+        # Paths that exist, per traffic class
+        valid = zeros((<object> self._xps).shape[:2], dtype=bool)
+        for tc in self._all_pptc.tcs():
+            valid[tc.ID, :self._all_pptc.num_paths(tc)] = True
+        self._xps[valid] = self._add_vars(valid.sum() * self.num_epochs, 0, 1).reshape(-1, self.num_epochs)
+        logger.debug("Added desicion variables")
+
+    cdef _add_binary_vars(self, vtypes):
+        """
+        Add binary variables of given types to the optimization. Supported types are variables
+        per node, per link, or per path.
+
+        :param vtypes: list of variable types. See `:py:sol.utils.const.BinType`
+        """
+        cdef int u, v
+        for t in vtypes:
+            if t == BinType.BIN_NODE:
+                new = self._bns < 0
+                self._bns[new] = self._add_vars(new.sum(), 0, 1, True)
+            elif t == BinType.BIN_EDGE:
+                for u, v in self.topo.links():
+                    if self._bes[u, v] < 0:
+                        self._bes[u, v] = self._add_vars(1, 0, 1, True)[0]
+            elif t == BinType.BIN_PATH:
+                new = (self._xps[:, :, 0] >= 0) & (self._bps < 0)
+                self._bps[new] = self._add_vars(new.sum(), 0, 1, True)
+            else:
+                raise SOLException("Unknown binary variable type")
+
+    cpdef allocate_flow(self, tcs, allocation=None):
+        """
+        Allocate network flow for each traffic class by allocating flow on each
+        path (and summing it up for each traffic class).
+
+        This function can be called multiple times with different traffic classes
+
+        :param tcs: traffic classes
+        :param allocation: if given, allocation for given traffic classes will
+            be set to this value. Allocation must be between 0 and 1
+        :raises: ValueError if the given allocation is not between 0 and 1
+        """
+        if allocation is not None and not 0 <= allocation <= 1:
+            raise ValueError(ERR_BAD_CAPVAL)
+        logger.debug('Allocating flow')
+        ids = array([tc.ID for tc in tcs], dtype=int64)
+        new = self._als[ids] < 0
+        self._als[ids[new.any(axis=1)]] = self._add_vars(new.sum(), 0, 1).reshape(-1, self.num_epochs)
+        # One row per traffic class and epoch: sum of x_* - a_* == 0
+        xs = self._xps[ids]
+        valid = xs >= 0
+        tcrow = arange(ids.size * self.num_epochs).reshape(ids.size, 1, self.num_epochs)
+        rows = tcrow.repeat(xs.shape[1], axis=1)[valid]
+        self._alloc_rows[ids] = self._num_rows + tcrow.reshape(ids.size, self.num_epochs)
+        self._add_rows(concatenate([rows, arange(ids.size * self.num_epochs)]),
+                       concatenate([xs[valid], self._als[ids].ravel()]),
+                       concatenate([ones(rows.size), full(ids.size * self.num_epochs, -1.0)]),
+                       0, 0, ids.size * self.num_epochs)
+        if allocation is not None:
+            self._lb[self._als[ids].ravel()] = allocation
+            self._ub[self._als[ids].ravel()] = allocation
+
+    cpdef route_all(self, tcs=None):
+        """
+        Ensure that all available traffic is routed (no drops) by forcing the allocation of flow to be 1
+        for all given traffic classes.
+
+        :param tcs: list of traffic classes
+        """
+        if tcs is None:
+            tcs = self._all_pptc.tcs()
+        ids = array([tc.ID for tc in tcs], dtype=int64)
+        self._lb[self._als[ids].ravel()] = 1
+
+    cpdef cap(self, unicode resource, caps, path_dep=False, tcs=None):
+        """ Cap the usage of a given resource with a given value.
+
+        :param resource: the name of resource to cap
+        :param caps: the maximum utilization of a given resource
+        :param path_dep: whether the resource is consumed per enabled path (and not per flow)
+        :param tcs: traffic classes that consume the resource. If None, all traffic classes are used
+        """
+        logger.debug("Capping resource %s" % resource)
+        # if no classes are given, take all of them
+        if tcs is None:
+            tcs = list(self._all_pptc.tcs())
+        else:
+            tcs = list(tcs)
+
+        # if caps is just a number, expand into uniform capacities across the topology
+        if not isinstance(caps, dict):
+            v = caps
+            caps = NetworkCaps(self.topo)
+            caps.add_cap(resource, cap=v)
+            caps = caps.caps(resource)
+
+        if path_dep:
+            self._disable_paths(tcs)
+
+        load = self._resource_load(resource)
+        if load is None:
+            return
+        capvals = full(len(self._elements), nan)
+        for node_or_link in caps:
+            if node_or_link in self._elem_index:
+                capvals[self._elem_index[node_or_link]] = caps[node_or_link]
+        # if node/link is not capped, skip
+        keep = ~isnan(capvals[load.row])
+        row, pos, data = load.row[keep], load.col[keep], load.data[keep]
+        # one row per capped node/link and epoch
+        key, local = unique(row * self.num_epochs + pos % self.num_epochs, return_inverse=True)
+        if path_dep:
+            cols = self._bps.ravel()[pos // self.num_epochs]
+        else:
+            cols = self._xps.ravel()[pos]
+            self._load_rows.append((resource, key, None, self._num_rows + arange(key.size), capvals, None))
+        self._add_rows(local.ravel(), cols, data, -inf, capvals[key // self.num_epochs], key.size)
+
+    cdef _req_incidence(self, req_type, traffic_classes, node_mode):
+        """
+        Compute which binary node (or link) variables each path depends on
+
+        :param req_type: either :py:attr:`BinType.BIN_NODE` or :py:attr:`BinType.BIN_EDGE`
+        :param traffic_classes: traffic classes to use
+        :param node_mode: whether to use all nodes or middleboxes only
+        :return: a tuple of (path rows, b_* path columns, b_* element columns).
+            Path rows and element columns are aligned, one entry per path/element pair.
+        """
+        cdef int nn = self.topo.num_nodes()
+        if req_type == BinType.BIN_NODE:
+            self._add_binary_vars([BinType.BIN_NODE])
+            # depening on the mode, use either all nodes or middleboxes only
+            if node_mode == NodeConsumeMode.ALL:
+                inc = self._all_pptc.incidence(NODES, nn)
+            elif node_mode == NodeConsumeMode.MBOXES:
+                inc = self._all_pptc.incidence(MBOXES, nn)
+            else:
+                raise TypeError(ERR_UNKNOWN_MODE % (u'node consumption', node_mode))
+            elements = self._bns
+        elif req_type == BinType.BIN_EDGE:
+            self._add_binary_vars([BinType.BIN_EDGE])
+            inc = self._all_pptc.incidence(LINKS, nn)
+            elements = self._bes.ravel()
+        else:
+            raise SOLException(u'Unknown type of binary variable: %s' % req_type)
+        tcids, pind = self._all_pptc.path_index()
+        # Only keep the paths of the given traffic classes
+        tcmask = zeros(self._all_pptc.num_tcs(), dtype=bool)
+        tcmask[[tc.ID for tc in traffic_classes]] = True
+        paths = flatnonzero(tcmask[tcids])
+        inc = inc[paths].tocoo()
+        return inc.row.astype(int64), self._bps[tcids[paths], pind[paths]], elements[inc.col]
+
+    cdef _req_all(self, req_type, traffic_classes=None, node_mode=NodeConsumeMode.ALL):
+        if traffic_classes is None:
+            traffic_classes = list(self._all_pptc.tcs())
+        else:
+            traffic_classes = list(traffic_classes)
+        # ensure x_* <= b_*
+        self._disable_paths(traffic_classes)
+        rows, bpaths, belements = self._req_incidence(req_type, traffic_classes, node_mode)
+        cdef int n = rows.size
+        # b_path - b_element <= 0, for every node (link) of every path
+        self._add_rows(tile(arange(n), 2), concatenate([bpaths[rows], belements]),
+                       concatenate([ones(n), full(n, -1.0)]), -inf, 0, n)
+
+    cdef _req_some(self, req_type, traffic_classes=None, node_mode=NodeConsumeMode.ALL):
+        if traffic_classes is None:
+            traffic_classes = list(self._all_pptc.tcs())
+        else:
+            traffic_classes = list(traffic_classes)
+        # ensure x_* <= b_*
+        self._disable_paths(traffic_classes)
+        rows, bpaths, belements = self._req_incidence(req_type, traffic_classes, node_mode)
+        cdef int n = bpaths.size
+        # b_path - sum(b_element) <= 0, for every path
+        self._add_rows(concatenate([arange(n), rows]), concatenate([bpaths, belements]),
+                       concatenate([ones(n), full(rows.size, -1.0)]), -inf, 0, n)
+
+    cpdef req_all_nodes(self, traffic_classes=None, node_mode=NodeConsumeMode.ALL):
+        """
+        Require all nodes to be enabled for each path
+
+        :param traffic_classes: traffic classes for which to enable this constraint. If None, all are used
+        :param node_mode: whether to count all nodes as enabled (:py:attr:NodeConsumeMode.ALL) or only middleboxes
+            (:py:attr:`~sol.const.NodeConsumeMode.MBOXES`)
+        """
+        return self._req_all(BinType.BIN_NODE, traffic_classes, node_mode)
+
+    cpdef req_all_links(self, traffic_classes=None):
+        """
+        Require all links to be enabled for each path
+
+        :param traffic_classes: traffic classes for which to enable this constraint. If None, all are used
+        """
+        return self._req_all(BinType.BIN_EDGE, traffic_classes)
+
+    cpdef req_some_nodes(self, traffic_classes=None, node_mode=NodeConsumeMode.ALL):
+        """
+        Require at least one node to be enabled for each path
+
+        :param traffic_classes: traffic classes for which to enable this constraint. If None, all are used
+        :param node_mode: whether to count all nodes as enabled (:py:attr:NodeConsumeMode.ALL) or only middleboxes
+            (:py:attr:`~sol.const.NodeConsumeMode.MBOXES`)
+        """
+        return self._req_some(BinType.BIN_NODE, traffic_classes, node_mode)
+
+    cpdef req_some_links(self, traffic_classes=None):
+        """
+        Require at least one link to be enabled for each path
+
+        :param traffic_classes: traffic classes for which to enable this constraint. If None, all are used
+        """
+        return self._req_some(BinType.BIN_EDGE, traffic_classes)
+
+    cdef _mask_columns(self, ndarray off):
+        """
+        Force the x_* (and b_*, if present) variables of disabled paths to 0 at solve time.
+        The stored upper bounds are left untouched, so paths can be enabled again.
+
+        :param off: a 2-d boolean array (traffic classes by paths), True means the path is disabled
+        """
+        xcols = self._xps[off].ravel()
+        bcols = self._bps[off]
+        self._off = concatenate([xcols[xcols >= 0], bcols[bcols >= 0]])
+
+    cdef bool _paths_priced(self):
+        """
+        The x_* columns are looked up in the constraint chunks
+        """
+        if self._integrality.any():
+            return False
+        xcols = self._xps[self._xps >= 0]
+        if self._obj[xcols].any():
+            return False
+        for row in self._alloc_rows.ravel():
+            if row is None:
+                return False
+        priced = zeros(self._num_rows, dtype=bool)
+        priced[self._alloc_rows.ravel().astype(int64)] = True
+        for group in self._load_rows:
+            priced[array(list(group[3]), dtype=int64)] = True
+        isx = zeros(self._num_vars, dtype=bool)
+        isx[xcols] = True
+        rows, cols = concatenate(self._rows), concatenate(self._cols)
+        return bool(priced[rows[isx[cols]]].all())
+
+    cdef _grow(self, int max_paths):
+        """
+        Pad the x_* and b_* column index arrays
+        """
+        cdef int nt = self._all_pptc.num_tcs()
+        cdef int pad = max_paths - self._max_paths
+        self._xps = concatenate([self._xps, full((nt, pad, self.num_epochs), -1, dtype=int64)], axis=1)
+        self._bps = concatenate([self._bps, full((nt, pad), -1, dtype=int64)], axis=1)
+        Optimization._grow(self, max_paths)
+
+    cdef ndarray _add_path_vars(self, ndarray new):
+        """
+        Add the x_* columns of new paths
+        """
+        self._xps[new] = self._add_vars(new.sum() * self.num_epochs, 0, 1).reshape(-1, self.num_epochs)
+        return self._xps[new]
+
+    cdef _set_coeffs(self, ndarray rows, ndarray variables, ndarray vals):
+        """
+        Coefficients are added as a chunk without rows of its own
+        """
+        self._rows.append(rows.astype(int64))
+        self._cols.append(variables.astype(int64))
+        self._vals.append(vals.astype(float))
+        self._num_nonzeros += vals.size
+
+    cdef ndarray _add_le_rows(self, ndarray rows, ndarray variables, ndarray vals, ub, int num_rows):
+        """
+        Add the rows as a chunk, and return their indices
+        """
+        cdef int start = self._num_rows
+        self._add_rows(rows, variables.astype(int64), vals, -inf, ub, num_rows)
+        return start + arange(num_rows)
+
+    cdef _disable_paths(self, tcs=None):
+        """
+        Add constraints which force paths where binpath_* variable is 0 to not carry any flow
+
+        :param tcs: traffic classes for which to enable this constraint. If None, all are used
+        """
+        self._add_binary_vars([BinType.BIN_PATH])
+        if tcs is None:
+            tcs = self._all_pptc.tcs()
+        ids = array([tc.ID for tc in tcs], dtype=int64)
+        # Only add the constraints once per traffic class
+        ids = unique(ids[~self._disabled[ids]])
+        if ids.size == 0:
+            return
+        self._disabled[ids] = True
+        xs = self._xps[ids]
+        valid = xs >= 0
+        bs = self._bps[ids][:, :, None].repeat(self.num_epochs, axis=2)
+        cdef int n = valid.sum()
+        # x_* - b_* <= 0
+        self._add_rows(tile(arange(n), 2), concatenate([xs[valid], bs[valid]]),
+                       concatenate([ones(n), full(n, -1.0)]), -inf, 0, n)
+
+    cpdef enforce_single_path(self, traffic_classes):
+        """
+        Force all traffic to flow on a single path given for given traffic classes
+
+        :param traffic_classes: traffic classes for which to enable this constraint
+        """
+        if traffic_classes is None:
+            traffic_classes = self._all_pptc.tcs()
+        ids = array([tc.ID for tc in traffic_classes], dtype=int64)
+        # ensure x_* <= b_*
+        self._disable_paths([self._all_pptc.tc_byid(i) for i in ids])
+        # sum of all binary path variables is 1
+        bs = self._bps[ids]
+        valid = bs >= 0
+        rows = arange(ids.size)[:, None].repeat(bs.shape[1], axis=1)[valid]
+        self._add_rows(rows, bs[valid], ones(rows.size), 1, 1, ids.size)
+
+    cpdef flow_affinity(self, tc_pairs):
+        """
+        Ensure that the traffic for each pair of traffic classes in tc_pairs
+        is processed at the same middleboxes, to ensure session-level view of the connection
+
+        :param tc_pairs: list of traffic class pairs
+        """
+        cdef TrafficClass c1, c2
+        cdef int pi, e, r = 0
+        rows, cols, vals = [], [], []
+        for c1, c2 in tc_pairs:
+            m2p = [{}, {}]
+            for side, c in enumerate((c1, c2)):
+                for pi, p in enumerate(self._all_pptc.paths(c)):
+                    for m in p.mboxes():
+                        m2p[side].setdefault(m, []).append(pi)
+            for m in m2p[0]:
+                for e in range(self.num_epochs):
+                    x1 = self._xps[c1.ID, m2p[0][m], e]
+                    x2 = self._xps[c2.ID, m2p[1].get(m, []), e]
+                    rows.append(full(x1.size + x2.size, r, dtype=int64))
+                    cols.append(concatenate([x1, x2]))
+                    vals.append(concatenate([ones(x1.size), full(x2.size, -1.0)]))
+                    r += 1
+        if r > 0:
+            self._add_rows(concatenate(rows), concatenate(cols).astype(int64), concatenate(vals), 0, 0, r)
+
+    cpdef cap_num_paths(self, int max_paths, PPTC pptc=PPTC()):
+        """
+        Cap the total number of paths allowed to be enabled from the given set of paths per traffic class.
+        If pptc is None, all traffic classes (and paths) are used.
+
+        :param max_paths: number of paths
+        :param pptc:
+        :return:
+        """
+        if pptc.empty():
+            pptc = self._all_pptc
+        ids = array([tc.ID for tc in pptc.tcs()], dtype=int64)
+        # ensure x_* <= b_*
+        self._disable_paths(pptc.tcs())
+        bs = self._bps[ids]
+        bs = bs[bs >= 0]
+        self._add_rows(zeros(bs.size, dtype=int64), bs, ones(bs.size), -inf, max_paths, 1)
+
+    cpdef min_latency(self, tcs=None, bool norm=True, cost_func=None, varname=None):
+        """
+        Add a minimize latency objective
+
+        :param tcs: traffic classes
+        :param norm: should the latency be normalized by the network diameter.
+            Default is True, and it is better
+            to keep it that way to ensure that the resulting value is in range [0, 1].
+            An exception is if your cost_func already perfoms some type of normalization.
+        :param cost_func: a cost function that returns the cost of a single path. If none, the *len* function
+            will be used.
+        :param varname: variable name to use. If None, one will be picked automatically
+        :return: An array of column indices, one per epoch
+        """
+        if varname is None:
+            varname = Objective.MIN_LATENCY.name
+        if tcs is None:
+            tcs = list(self._all_pptc.tcs())
+        if cost_func is None:
+            cost_func = len
+        cdef int pi  # path index
+        cdef double norm_factor = 1.0
+        cdef TrafficClass tc
+        if norm:
+            norm_factor = self.topo.diameter() * (self.topo.num_nodes() ** 2)
+        per_epoch_obj = self._add_vars(self.num_epochs, 0, 1)
+        for e in range(self.num_epochs):
+            self._named[u'{}_{}'.format(varname, e)] = per_epoch_obj[e]
+
+        pind, coeffs = [], []
+        for tc in tcs:
+            for pi, path in enumerate(self._all_pptc.paths(tc)):
+                pind.append(tc.ID * self._max_paths + pi)
+                coeffs.append(cost_func(path) / norm_factor)
+        xs = self._xps.reshape(-1, self.num_epochs)[array(pind, dtype=int64)]
+        # Since the global direction is maximize, and latency is minimize, we gotta do '1-' trick:
+        # latency + sum(cost * x_*) <= 1
+        self._add_rows(concatenate([tile(arange(self.num_epochs), len(pind)), arange(self.num_epochs)]),
+                       concatenate([xs.ravel(), per_epoch_obj]),
+                       concatenate([repeat(array(coeffs, dtype=float), self.num_epochs), ones(self.num_epochs)]),
+                       -inf, 1, self.num_epochs)
+        return per_epoch_obj
+
+    cpdef min_enabled_nodes(self, cost_func=None, varname=None):
+        """
+        Minimize the number of enabled nodes
+
+        :param cost_func: compute the cost of a single node. If None, every node costs 1
+        :param varname: variable name to use. If None, one will be picked automatically
+        :return: An array of column indices, one per epoch
+        """
+        if varname is None:
+            varname = Objective.MIN_ENABLED_NODES.name
+        if cost_func is None:
+            cost_func = _one_func
+        self._add_binary_vars([BinType.BIN_NODE])
+        coeffs = array([cost_func(n) for n in range(self._bns.size)], dtype=float)
+        total = coeffs.sum()
+        per_epoch_obj = self._add_vars(self.num_epochs, 0, 1)
+        for e in range(self.num_epochs):
+            self._named[u'{}_{}'.format(varname, e)] = per_epoch_obj[e]
+        # Normalize by the total cost, so objective stays in [0, 1]
+        # num_nodes + sum(cost * b_node) / total == 1
+        self._add_rows(concatenate([arange(self.num_epochs), repeat(arange(self.num_epochs), self._bns.size)]),
+                       concatenate([per_epoch_obj, tile(self._bns, self.num_epochs)]),
+                       concatenate([ones(self.num_epochs), tile(coeffs / total, self.num_epochs)]),
+                       1, 1, self.num_epochs)
+        return per_epoch_obj
+
+    cpdef node_budget(self, int bound, budget_func=None):
+        """
+        Enable at most *bound* nodes.
+
+        :param bound: the maximum bound after budget_func has been computed
+        :param budget_func: compute the cost of a single node.
+            If None, 1 will be used, simply counting the nodes
+        """
+        if budget_func is None:
+            budget_func = _one_func
+        # double check we have binary variables
+        self._add_binary_vars([BinType.BIN_NODE])
+        nodes = array(list(self.topo.nodes(data=False)), dtype=int64)
+        self._add_rows(zeros(nodes.size, dtype=int64), self._bns[nodes],
+                       array([budget_func(n) for n in nodes], dtype=float), -inf, bound, 1)
+
+    cdef _min_load(self, unicode resource, tcs, varname):
+        """
+        Minimize load imposed by given traffic classes on a given resource
+
+        :param resource: the name of resource in question
+        :param tcs: the traffic classes to account for.
+            If None, all traffic classes are used.
+        :param varname: name of the varible. If none, one will be generated
+        :return:
+        """
+        logger.debug('Minimizing load for %s' % resource)
+        if tcs is None:
+            tcs = list(self._all_pptc.tcs())
+        if varname is None:
+            varname = u'{}_{}'.format(MIN_LOAD_PREFIX, resource)
+        per_epoch_objs = self._add_vars(self.num_epochs, 0, 1)
+        for e in range(self.num_epochs):
+            self._named[u'{}_{}'.format(varname, e)] = per_epoch_objs[e]
+
+        load = self._resource_load(resource)
+        if load is None:
+            return per_epoch_objs
+        # Only account for the given traffic classes
+        tcmask = zeros(self._xps.shape[0], dtype=bool)
+        tcmask[[tc.ID for tc in tcs]] = True
+        keep = tcmask[load.col // (self._max_paths * self.num_epochs)]
+        row, pos, data = load.row[keep], load.col[keep], load.data[keep]
+        # one row per node/link and epoch: load + objective <= 1
+        key, local = unique(row * self.num_epochs + pos % self.num_epochs, return_inverse=True)
+        self._load_rows.append((resource, key, tcmask, self._num_rows + arange(key.size), None, per_epoch_objs))
+        self._add_rows(concatenate([local.ravel(), arange(key.size)]),
+                       concatenate([self._xps.ravel()[pos], per_epoch_objs[key % self.num_epochs]]),
+                       concatenate([data, ones(key.size)]), -inf, 1, key.size)
+        return per_epoch_objs
+
+    cpdef min_node_load(self, unicode resource, tcs=None, varname=None):
+        """
+        Minimize node load for a particular resource
+
+        :param resource: name of the resource
+        :param tcs: the traffic classes that influence the objective
+        :param varname: the name of the objective variable
+        :return: An array of column indices, one per epoch
+        """
+        return self._min_load(resource, tcs, varname)
+
+    cpdef min_link_load(self, unicode resource, tcs=None, varname=None):
+        """
+        Minimize link load for a particular resource
+
+        :param resource: name of the resource
+        :param tcs: the traffic classes that influence the objective
+        :param varname: now to name the objective variable. If None, a default will be provided
+        :return: An array of column indices, one per epoch
+        """
+        return self._min_load(resource, tcs, varname)
+
+    cpdef max_flow(self, tcs=None, varname=None):
+        """
+        Maximize total network flow.
+
+        :param tcs: traffic classes for which the flow allocation should be maximized
+        :param varname: now to name the objective variable. If None, a default will be provided
+        :return: An array of column indices, one per epoch
+        """
+        varname = Objective.MAX_FLOW.name if varname is None else varname
+        if not tcs:
+            tcs = list(self._all_pptc.tcs())
+        cdef int n = len(tcs)
+        per_epoch_objs = self._add_vars(self.num_epochs, 0, 1)
+        for e in range(self.num_epochs):
+            self._named[u'{}_{}'.format(varname, e)] = per_epoch_objs[e]
+        als = self._als[[tc.ID for tc in tcs]]
+        # the objective is the normalized sum of all allocations
+        self._add_rows(concatenate([arange(self.num_epochs), tile(arange(self.num_epochs), n)]),
+                       concatenate([per_epoch_objs, als.ravel()]),
+                       concatenate([ones(self.num_epochs), full(als.size, -1.0 / n)]),
+                       -inf, 0, self.num_epochs)
+        return per_epoch_objs
+
+    cdef _compose_obj_one_epoch(self, int epoch, ndarray obj, fairness_mode, weight_arr):
+        """
+        Compose multiple objectives into a single objective **for a single epoch**
+        :param epoch: the epoch we are in
+        :param obj: the array containing all objectives (as column indices)
+        :param fairness_mode: how to compose the objectives (e.g., weighted, max-min, propfair, etc.)
+        :param weight_arr: the weights array. Only applicable if the fairness_mode is "weighted"
+        :return: column index of the composed objective
+        """
+        cdef int i
+        cdef int n = obj.size
+        epoch_obj = self._add_vars(1, -inf, inf)[0]
+        self._named[u'{}_{}'.format(THE_OBJECTIVE, epoch)] = epoch_obj
+        if fairness_mode == Fairness.WEIGHTED:
+            self._add_rows(zeros(n + 1, dtype=int64), concatenate([[epoch_obj], obj]),
+                           concatenate([[1.0], -weight_arr.astype(float)]), 0, 0, 1)
+        elif fairness_mode == Fairness.MAXMIN:
+            self._add_rows(tile(arange(n), 2), concatenate([full(n, epoch_obj, dtype=int64), obj]),
+                           concatenate([ones(n), full(n, -1.0)]), -inf, 0, n)
+        elif fairness_mode == Fairness.PROPFAIR:
+            # picewise appromation of proportional fairness.
+            # x defines x-values at which the function should be evaluated
+            x = array([EPSILON, 0.01, 0.02, 0.03, 0.05, 0.08, 0.12, 0.18, 0.28, 0.43, 0.66, 1.])
+            # y is the log value of x array
+            y = log(x)
+            slope = (y[1:] - y[:-1]) / (x[1:] - x[:-1])
+            o_approx = self._add_vars(n, -inf, inf)
+            # o_approx - slope * o <= y - slope * x, for every objective and every piece
+            pieces = slope.size
+            self._add_rows(tile(arange(n * pieces), 2),
+                           concatenate([repeat(o_approx, pieces), repeat(obj, pieces)]),
+                           concatenate([ones(n * pieces), tile(-slope, n)]),
+                           -inf, tile(y[:-1] - slope * x[:-1], n), n * pieces)
+            self._add_rows(zeros(n + 1, dtype=int64), concatenate([[epoch_obj], o_approx]),
+                           concatenate([[1.0], full(n, -1.0)]), -inf, 0, 1)
+        elif fairness_mode == Fairness.NONE:
+            self._add_rows(zeros(n + 1, dtype=int64), concatenate([[epoch_obj], obj]),
+                           concatenate([[1.0], full(n, -1.0)]), 0, 0, 1)
+        else:
+            raise InvalidConfigException(ERR_UNKNOWN_MODE % ('fairness', fairness_mode))
+        return epoch_obj
+
+    cpdef compose_objectives(self, ndarray obj_arr, epoch_mode, fairness_mode, weight_arr):
+        """
+        Compose multiple objectives, across different epochs, into a unified objective function.
+
+        :param obj_arr: a 2-d array of column indices. First dimention should be different objectives (i.e., from
+            different applications). Second dimension should be objectives for a single app across epochs.
+        :param epoch_mode: the composition mode of objective functions across epochs
+            (:py:class:sol.utils.const.EpochComposition). Supported values are AVG and WORST.
+        :param fairness_mode: how to compose the objectives of different applications
+        :param weight_arr: the weights array. Only applicable if the fairness_mode is "weighted"
+        :return: column index of the overall objective
+        """
+        cdef int e
+        obj_arr = obj_arr.astype(int64)
+        # repeat the weight array across ecpochs if only a single set of weights has been specified
+        if weight_arr.ndim == 1:
+            weight_arr = tile(weight_arr.reshape(-1, 1), (1, self.num_epochs))
+        if epoch_mode != EpochComposition.AVG and epoch_mode != EpochComposition.WORST:
+            raise ValueError(ERR_UNKNOWN_MODE % (u'epoch composition', epoch_mode))
+
+        the_obj = self._add_vars(1, -inf, inf)[0]
+        self._obj[the_obj] = 1.0
+        self._named[THE_OBJECTIVE] = the_obj
+        epoch_objs = array([self._compose_obj_one_epoch(e, obj_arr[:, e], fairness_mode, weight_arr[:, e])
+                            for e in range(self.num_epochs)], dtype=int64)
+        if epoch_mode == EpochComposition.AVG:
+            self._add_rows(zeros(self.num_epochs + 1, dtype=int64), concatenate([[the_obj], epoch_objs]),
+                           concatenate([[1.0], full(self.num_epochs, -1.0 / self.num_epochs)]), -inf, 0, 1)
+        else:
+            self._add_rows(tile(arange(self.num_epochs), 2),
+                           concatenate([full(self.num_epochs, the_obj, dtype=int64), epoch_objs]),
+                           concatenate([ones(self.num_epochs), full(self.num_epochs, -1.0)]),
+                           -inf, 0, self.num_epochs)
+        return the_obj
+
+    cpdef relax_to_lp(self):
+        """
+        Change integer (or binary) variables to continuous variables.
+
+        .. warning::
+
+            Solution is no longer guaranteed to be close to optimal (or even to make sense).
+            This assumes you know what you are doing and are intentionally attempting to
+            implement randomized rounding or other similar techniques.
+        """
+        self._integrality[:] = 0
+
+    cpdef set_time_limit(self, double time):
+        """
+        Limit how long HiGHS looks for the solution.
+        :param time: time, in seconds. Use *inf* to remove the limit.
+        """
+        if time == inf:
+            self._options.pop(u'time_limit', None)
+        else:
+            self._options[u'time_limit'] = time
+
+    def solve(self):
+        """
+        Solve the optimization
+
+        ..note::
+            Can be a time consuming operation
+        """
+        logger.info("Running HiGHS solver")
+        start = time.time()
+        a, rlb, rub = self._constraint_matrix()
+        constraints = [LinearConstraint(a, rlb, rub)] if self._num_rows > 0 else []
+        ub = self._ub.copy()
+        ub[self._off] = 0
+        self._duals = None
+        self._row_dual_values = None
+        # milp minimizes, SOL maximizes
+        with self.phase(u'solve'):
+            if self._integrality.any():
+                self._result = milp(-self._obj, integrality=self._integrality,
+                                    bounds=Bounds(self._lb, ub),
+                                    constraints=constraints, options=self._options)
+            else:
+                # linear programs are solved with linprog, which also computes the dual values
+                self._solve_lp(a, rlb, rub, ub)
+        if self._do_time:
+            self._time = time.time() - start
+
+    cdef _solve_lp(self, a, ndarray rlb, ndarray rub, ndarray ub):
+        """
+        Solve the (linear) optimization with :py:func:`scipy.optimize.linprog`, and keep the dual values of the rows.
+        Rows are split into equalities and upper bounds, as linprog expects them.
+        """
+        eq = rlb == rub
+        upper = ~eq & (rub < inf)
+        lower = ~eq & (rlb > -inf)
+        cdef int nu = upper.sum()
+        a_ub = b_ub = a_eq = b_eq = None
+        if nu + lower.sum() > 0:
+            a_ub = vstack([a[upper], -a[lower]]).tocsr()
+            b_ub = concatenate([rub[upper], -rlb[lower]])
+        if eq.any():
+            a_eq, b_eq = a[eq], rlb[eq]
+        self._result = linprog(-self._obj, A_ub=a_ub, b_ub=b_ub, A_eq=a_eq, b_eq=b_eq,
+                               bounds=column_stack([self._lb, ub]), method=u'highs', options=self._options)
+        if self._result.status != 0:
+            return
+        # marginals are sensitivities of the minimized objective, SOL maximizes
+        duals = zeros(self._num_rows)
+        if a_eq is not None:
+            duals[eq] = -self._result.eqlin.marginals
+        if a_ub is not None:
+            duals[upper] -= self._result.ineqlin.marginals[:nu]
+            duals[lower] += self._result.ineqlin.marginals[nu:]
+        self._row_dual_values = duals
+
+    cpdef write(self, fname):
+        """
+        Writes the LP/ILP formulation to disk, as a set of numpy arrays.
+        ".npz" suffix is appended automatically
+
+        :param fname: filename of the model file
+        """
+        a, rlb, rub = self._constraint_matrix()
+        savez(u'{}.npz'.format(fname), data=a.data, indices=a.indices, indptr=a.indptr,
+              shape=a.shape, rlb=rlb, rub=rub, lb=self._lb, ub=self._ub, obj=self._obj,
+              integrality=self._integrality)
+
+    cpdef write_solution(self, fname):
+        """
+        Write the solution to disk
+
+        :param fname: filename of the solution file.
+            ".sol" suffix is appended automatically
+        """
+        with open(u'{}.sol'.format(fname), 'w') as f:
+            f.write(u'# Objective value = {}\n'.format(self.get_solved_objective()))
+            for name, val in sorted(self.get_var_values().items()):
+                f.write(u'{} {}\n'.format(name, val))
+
+    cdef ndarray _x_values(self):
+        """
+        Values of the x_* variables, in the same shape as the x_* index array.
+        Missing variables have a value of 0.
+        """
+        vals = zeros((<object> self._xps).shape, dtype=float)
+        valid = self._xps >= 0
+        vals[valid] = self._result.x[self._xps[valid]]
+        return vals
+
+    cdef ndarray _b_values(self):
+        """
+        Values of the b_* variables (traffic classes by paths). Missing variables have a value of nan.
+        """
+        vals = full((<object> self._bps).shape, nan)
+        hasb = self._bps >= 0
+        vals[hasb] = self._result.x[self._bps[hasb]]
+        return vals
+
+    cdef _set_start_values(self, ndarray x, ndarray b):
+        """
+        Starting solutions are ignored, :py:func:`scipy.optimize.milp` does not accept one.
+        """
+        logger.debug(u'HiGHS backend ignores starting solutions')
+
+    cpdef get_var_values(self):
+        """
+        Returns the mapping of variable names to values assigned by optimization
+        """
+        cdef TrafficClass tc
+        cdef int pi, e, u, v
+        x = self._result.x
+        result = {name: x[col] for name, col in self._named.items()}
+        for tc in self._all_pptc.tcs():
+            for e in range(self.num_epochs):
+                result[al(tc, e)] = x[self._als[tc.ID, e]]
+            for pi in range(self._all_pptc.num_paths(tc)):
+                for e in range(self.num_epochs):
+                    result[xp(tc, pi, e)] = x[self._xps[tc.ID, pi, e]]
+                if self._bps[tc.ID, pi] >= 0:
+                    result[bp(tc, pi)] = x[self._bps[tc.ID, pi]]
+        for n in flatnonzero(self._bns >= 0):
+            result[bn(n)] = x[self._bns[n]]
+        for u, v in zip(*(self._bes >= 0).nonzero()):
+            result[be(u, v)] = x[self._bes[u, v]]
+        return result
+
+    cpdef get_solved_objective(self, app=None):
+        """
+        :param app: If None, global objective is returned, otherwise the objective value for the given application
+            is returned.
+        :return: The objective value after the optimization is solved
+        :rtype: float
+        """
+        if app is None:
+            return -self._result.fun
+        else:
+            return [self._result.x[self._named[u'{}_{}'.format(app.name, e)]] for e in range(self.num_epochs)]
+
+    cpdef is_solved(self):
+        """
+        Check if the optimization is solved
+
+        :return: True if an optimal solution has been found
+        """
+        return self._result is not None and self._result.status == 0
+
+    cpdef has_solution(self):
+        """
+        Check if the optimization has a solution, even if it is not (proven to be) optimal
+
+        :return: True if a feasible solution has been found
+        """
+        return self._result is not None and self._result.x is not None
+
+    cdef ndarray _row_duals(self, rows):
+        """
+        Dual values of the given rows, computed when a linear program is solved
+        """
+        if self._row_dual_values is None:
+            raise SOLException(ERR_NO_DUALS)
+        return self._row_dual_values[array(list(rows), dtype=int64)]
+
+    cpdef get_xps(self):
+        """
+        Return the 3-dimentional array of column indices of all decision variables.
+        Dimensions are:
+
+        1. Traffic classes (by ID)
+        2. Paths
+        3. Epochs
+
+        Missing variables are indicated by -1.
+
+        If paths were masked with :py:meth:`mask_paths`, only the variables of unmasked paths are returned.
+
+        .. warning::
+            This reflects internal state of the optimization, use for read-only purposes
+
+        :return:  numpy array
+        """
+        return self._exposed(self._xps, -1)
+
+    cpdef get_enabled_nodes(self):
+        """
+        Return the list of enabled nodes, as determined by the optimization
+        :return:
+        """
+        return [n for n in self.topo.nodes()
+                if self._bns[n] >= 0 and around(self._result.x[self._bns[n]]) == 1]
+
+    cpdef get_enabled_links(self):
+        """
+        Return the list of enabled links, as determined by the optimization
+        :return:
+        """
+        return [(u, v) for u, v in self.topo.links()
+                if self._bes[u, v] >= 0 and around(self._result.x[self._bes[u, v]]) == 1]
+
+    cpdef fix_paths(self, PPTC pptc, fix_zero_paths=False):
+        """
+        Fix flow allocation of for given paths to a precise value.
+
+        :param pptc: path per traffic class, with flow fractions set
+        :param fix_zero_paths: fix the allocation of paths where the fraction == 0.
+            (The default if False, as this function is commonly used to fix flow-carrying paths
+            from a previous epoch or other type of solution)
+        """
+        cdef int pi
+        cdef TrafficClass tc
+        cdef Path p
+        for tc in pptc.tcs():
+            for pi, p in enumerate(pptc.paths(tc)):
+                # Only fix non-zero paths
+                if p.flow_fraction() > 0 or fix_zero_paths:
+                    self._lb[self._xps[tc.ID, pi]] = p.flow_fraction()
+                    self._ub[self._xps[tc.ID, pi]] = p.flow_fraction()
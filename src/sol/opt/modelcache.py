@@ -0,0 +1,185 @@
+# coding=utf-8
+"""
+On-disk cache of built optimizations, keyed by a fingerprint of everything they are built from
+"""
+
+import hashlib
+import json
+import os
+from enum import Enum
+
+import numpy
+
+from sol.utils.exceptions import UnsupportedOperationException
+from sol.utils.logger import logger
+
+__all__ = ['ModelCache']
+
+
+def _canonical(obj):
+    """
+    A deterministic, hashable description of an object: dictionaries are sorted,
+    arrays are converted to lists, and functions are described by their name
+    """
+    if isinstance(obj, dict):
+        return tuple(sorted((repr(_canonical(k)), _canonical(v)) for k, v in obj.items()))
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        items = [_canonical(o) for o in obj]
+        return tuple(sorted(items, key=repr) if isinstance(obj, (set, frozenset)) else items)
+    if isinstance(obj, numpy.ma.MaskedArray):
+        return _canonical(obj.compressed())
+    if isinstance(obj, numpy.ndarray):
+        return _canonical(obj.tolist())
+    if isinstance(obj, numpy.generic):
+        return obj.item()
+    if isinstance(obj, Enum):
+        return '%s.%s' % (type(obj).__name__, obj.name)
+    if isinstance(obj, type) or callable(obj):
+        name = getattr(obj, '__qualname__', getattr(obj, '__name__', None))
+        # lambdas and nested functions can differ by what they capture, only trust the object itself
+        if name is None or '<' in name:
+            return repr(obj)
+        return '%s.%s' % (getattr(obj, '__module__', ''), name)
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+        return obj
+    return repr(obj)
+
+
+class ModelCache(object):
+    """
+    Stores built optimizations on disk and restores them when the same composition is built again.
+
+    A model is keyed by the topology (including resource capacities), the paths of every traffic
+    class, the applications, the network caps and the composition options.
+    Traffic volumes are not part of the key (only which traffic classes carry traffic in each epoch):
+    on a hit, the saved model is loaded and only its volume-dependent coefficients are updated
+    (see :py:meth:`~sol.opt.gurobiwrapper.OptimizationGurobi.load`).
+
+    Only backends that implement :py:meth:`~sol.opt.optbase.Optimization.save` can be cached.
+    When the cache grows over *max_size* bytes, the least recently used models are evicted.
+
+    Usage::
+
+        cache = ModelCache('/tmp/solcache')
+        opt = compose_apps(apps, topo, config, cache=cache)
+
+    :param path: the cache directory, created if it does not exist
+    :param max_size: maximum total size of the cached files, in bytes
+    """
+
+    def __init__(self, path, max_size=1 << 30):
+        self.path = path
+        self.max_size = max_size
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        self._index_file = os.path.join(path, 'index.json')
+        self._index = {}
+        if os.path.exists(self._index_file):
+            with open(self._index_file) as f:
+                self._index = json.load(f)
+
+    def key(self, apps, topo, network_config, epoch_mode, fairness, weights, backend, backend_opts, all_pptc):
+        """
+        Fingerprint of a composition. Arguments are the same as for
+        :py:func:`~sol.opt.composer.compose_apps` (*all_pptc* must be given).
+
+        :return: a hex digest
+        """
+        graph = topo.get_graph()
+        tcs = []
+        for tc in sorted(all_pptc.tcs(), key=lambda t: t.ID):
+            tcs.append((tc.ID, tc.src, tc.dst, (tc.volFlows.compressed() > 0).tolist(),
+                        [(tuple(p.nodes()), p.mboxes()) for p in all_pptc.paths(tc)]))
+        caps = None
+        if network_config is not None and network_config.get_caps() is not None:
+            caps = network_config.get_caps()
+            caps = {r: caps.caps(r) for r in caps.resources()}
+        desc = (
+            topo.name, sorted(graph.nodes(data=True)), sorted(graph.edges(data=True)),
+            tcs,
+            [(app.name, app.constraints, app.obj, app.resource_cost, [tc.ID for tc in app.obj_tc])
+             for app in apps],
+            caps, epoch_mode, fairness, weights, backend, backend_opts
+        )
+        return hashlib.sha1(repr(_canonical(desc)).encode('utf-8')).hexdigest()
+
+    def get(self, key, backend_cls, topo, all_pptc, weights=None, profile=False):
+        """
+        Restore a cached optimization
+
+        :param key: the fingerprint, see :py:meth:`key`
+        :param backend_cls: the optimization class
+        :param weights: weights of the composed objectives, for the current volumes
+        :return: the optimization, or None if it is not cached
+        """
+        if key not in self._index:
+            return None
+        try:
+            opt = backend_cls.load(topo, all_pptc, self._fname(key), weights=weights, profile=profile)
+        except (IOError, OSError) as e:
+            logger.warning('Cannot load cached model %s: %s' % (key, e))
+            self._evict(key)
+            self._write_index()
+            return None
+        if opt is None:
+            return None
+        self._touch(key)
+        self._write_index()
+        logger.debug('Model cache hit %s' % key)
+        return opt
+
+    def put(self, key, opt):
+        """
+        Add a built optimization to the cache, evicting least recently used models if needed
+
+        :param key: the fingerprint, see :py:meth:`key`
+        :param opt: the optimization, as built (before it is modified for solving)
+        :return: True if the optimization was cached
+        """
+        try:
+            files = opt.save(self._fname(key))
+        except UnsupportedOperationException:
+            logger.debug('Backend %s cannot be cached' % type(opt).__name__)
+            return False
+        self._index[key] = dict(size=sum(os.path.getsize(f) for f in files), files=files)
+        self._touch(key)
+        while self.size() > self.max_size and len(self._index) > 1:
+            self._evict(min((k for k in self._index if k != key), key=lambda k: self._index[k]['used']))
+        self._write_index()
+        return True
+
+    def size(self):
+        """
+        :return: total size of the cached files, in bytes
+        """
+        return sum(entry['size'] for entry in self._index.values())
+
+    def clear(self):
+        """
+        Remove all cached models
+        """
+        for key in list(self._index):
+            self._evict(key)
+        self._write_index()
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def _fname(self, key):
+        return os.path.join(self.path, key)
+
+    def _touch(self, key):
+        self._index[key]['used'] = max([e.get('used', 0) for e in self._index.values()] + [0]) + 1
+
+    def _evict(self, key):
+        logger.debug('Evicting cached model %s' % key)
+        for f in self._index.pop(key)['files']:
+            if os.path.exists(f):
+                os.remove(f)
+
+    def _write_index(self):
+        with open(self._index_file, 'w') as f:
+            json.dump(self._index, f)
@@ -0,0 +1,122 @@
+# coding=utf-8
+from sol.path.paths cimport PPTC
+from sol.topology.traffic cimport TrafficClass
+from sol.topology.topologynx cimport Topology
+from cpython cimport bool
+from numpy cimport ndarray
+
+# noinspection PyClassicStyleClass
+cdef class Optimization:
+
+    # topology
+    cdef public Topology topo
+    # time measurement vars
+    cdef bool _do_time
+    cdef double _time
+    # depth of nested batch() blocks
+    cdef int _batch
+    # per-phase profile, and whether model sizes are measured for it
+    cdef object _profile
+    cdef bool _profile_sizes
+    # number of epochs
+    cdef int num_epochs
+    # max number of paths in a single traffic class
+    cdef int _max_paths
+    # all the paths per traffic class
+    cdef PPTC _all_pptc
+    # all resources present in the topology
+    cdef public set _resources
+    # every node and link in the topology, and their index (rows of the load matrices)
+    cdef list _elements
+    cdef dict _elem_index
+    # load computation dict: resource -> list of sparse (element, x_* position) matrices
+    cdef public dict _load_dict
+    # paths disabled by mask_paths (traffic classes by paths)
+    cdef ndarray _masked
+    # number of paths of every traffic class (by ID) that have x_* variables
+    cdef ndarray _num_paths
+    # load of a unit of flow on every node/link, by resource (None if the load depends on cost functions)
+    cdef dict _unit_loads
+    # rows of the flow allocation (traffic classes by epochs) and groups of resource load rows:
+    # (resource, row keys, traffic class mask or None, rows, caps or None, objective variables or None),
+    # used to compute dual prices and to add paths
+    cdef ndarray _alloc_rows
+    cdef list _load_rows
+    # dual values of the allocation rows and of every group of load rows, read when first needed
+    cdef list _duals
+
+    # Deferred model updates
+    cdef _update(self)
+    cdef _flush(self)
+    cdef tuple _model_size(self)
+
+    # Routing and path constraints
+    cpdef allocate_flow(self, tcs, allocation=*)
+    cpdef route_all(self, tcs=*)
+    cpdef cap_num_paths(self, int max_paths, PPTC pptc=*)
+    cpdef enforce_single_path(self, traffic_classes)
+    cpdef flow_affinity(self, tc_pairs)
+
+    # resource consumption functions
+    cpdef consume(self, tcs, unicode resource, caps, mode, double cost_val, cost_funcs=*)
+    cpdef cap(self, unicode resource, caps, path_dep=*, tcs=*)
+    cdef _resource_load(self, unicode resource)
+
+    # Objective computation functions
+    cpdef min_node_load(self, unicode resource, tcs=*, varname=*)
+    cpdef min_link_load(self, unicode resource, tcs=*, varname=*)
+    cpdef min_latency(self, tcs=*, bool norm=*, cost_func=*, varname=*)
+    cpdef max_flow(self, tcs=*, varname=*)
+    cpdef min_enabled_nodes(self, cost_func=*, varname=*)
+    cpdef compose_objectives(self, ndarray obj_arr, epoch_mode, fairness_mode, weight_arr)
+
+    # Node/link toggle functions
+    cpdef req_all_nodes(self, traffic_classes=*, node_mode=*)
+    cpdef req_all_links(self, traffic_classes=*)
+    cpdef req_some_nodes(self, traffic_classes=*, node_mode=*)
+    cpdef req_some_links(self, traffic_classes=*)
+    cpdef node_budget(self, int bound, budget_func=*)
+
+    # Solution parsing functions and general helper funcs
+    cpdef is_solved(self)
+    cpdef has_solution(self)
+    cpdef get_paths(self, int epoch=*)
+    cpdef get_solved_objective(self, app=*)
+    cpdef get_chosen_paths(self, relaxed=*)
+    cpdef get_var_values(self)
+    cpdef get_enabled_nodes(self)
+    cpdef get_enabled_links(self)
+    cpdef fix_paths(self, PPTC pptc, fix_zero_paths=*)
+
+    cpdef write(self, fname)
+    cpdef write_solution(self, fname)
+    cpdef set_time_limit(self, double time)
+    cpdef double get_time(self)
+
+    # Advanced functionality functions
+    cpdef relax_to_lp(self)
+    cpdef tuple get_prices(self, TrafficClass tc)
+    cdef ndarray _row_duals(self, rows)
+    cpdef get_xps(self)
+    cpdef save(self, fname)
+    cpdef get_x_values(self)
+    cdef ndarray _exposed(self, ndarray values, fill)
+    cpdef mask_paths(self, PPTC pptc)
+    cdef _mask_columns(self, ndarray off)
+
+    # Adding paths in place
+    cpdef bool can_add_paths(self)
+    cpdef add_paths(self)
+    cdef bool _paths_priced(self)
+    cdef _grow(self, int max_paths)
+    cdef ndarray _add_path_vars(self, ndarray new)
+    cdef _set_coeffs(self, ndarray rows, ndarray variables, ndarray vals)
+    cdef ndarray _add_le_rows(self, ndarray rows, ndarray variables, ndarray vals, ub, int num_rows)
+
+    # Starting solutions
+    cdef ndarray _path_keys(self)
+    cpdef get_start(self)
+    cpdef set_start(self, dict start)
+    cdef ndarray _x_values(self)
+    cdef ndarray _b_values(self)
+    cdef _set_start_values(self, ndarray x, ndarray b)
@@ -0,0 +1,1041 @@
+# coding=utf-8
+# cython: profile=True
+# cython: binding=True
+
+"""
+Solver-independent interface for SOL optimizations
+"""
+
+from __future__ import division, print_function
+
+import time
+
+from numpy import ma, arange, array, full, full_like, zeros, ones, concatenate, int64, nan, isnan, around, \
+    flatnonzero, add, argsort, searchsorted, unique
+from numpy cimport ndarray
+from scipy.sparse import coo_matrix
+from six import next
+from cpython cimport bool
+from sol.path.paths cimport Path, PPTC
+from sol.topology.traffic cimport TrafficClass
+from sol.topology.topologynx cimport Topology
+from sol.utils.const import *
+from sol.utils.exceptions import InvalidConfigException, SOLException, UnsupportedOperationException
+from sol.utils.logger import logger
+from sol.opt.profiling import BuildProfile
+
+cdef class _Batch:
+    """
+    Context manager returned by :py:meth:`Optimization.batch`
+    """
+    cdef Optimization _opt
+
+    def __init__(self, Optimization opt):
+        self._opt = opt
+
+    def __enter__(self):
+        self._opt._batch += 1
+        return self._opt
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._opt._batch -= 1
+        if self._opt._batch == 0:
+            self._opt._flush()
+        return False
+
+cdef class _Phase:
+    """
+    Context manager returned by :py:meth:`Optimization.phase`
+    """
+    cdef Optimization _opt
+    cdef object _phase
+    cdef object _name
+    cdef tuple _size
+    cdef double _start
+
+    def __init__(self, Optimization opt, phase, name):
+        self._opt = opt
+        self._phase = phase
+        self._name = name
+
+    def __enter__(self):
+        self._size = self._opt._model_size()
+        self._start = time.time()
+        return self._opt
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        cdef tuple size
+        if exc_type is None:
+            size = self._opt._model_size()
+            if size is None:
+                self._opt._profile.add(self._phase, self._name, time.time() - self._start)
+            else:
+                self._opt._profile.add(self._phase, self._name, time.time() - self._start,
+                                       *[after - before for before, after in zip(self._size, size)])
+        return False
+
+# noinspection PyClassicStyleClass
+cdef class Optimization:
+    """
+    Represents a SOL optimization problem, independent of the solver used to
+    build and solve it.
+
+    Concrete backends (e.g., :py:class:`~sol.opt.gurobiwrapper.OptimizationGurobi`
+    or :py:class:`~sol.opt.highswrapper.OptimizationHighs`) implement
+    the model-building and solution-parsing functions.
+    """
+    def __init__(self, Topology topo, PPTC all_pptc, bool profile=False):
+        # Keep track of the topology and all traffic classes
+        self.topo = topo
+        self._all_pptc = all_pptc
+
+        # Should we measure the time it takes to solve the optimization
+        self._do_time = True
+        self._time = 0
+        # Depth of nested batch() blocks, model updates are deferred while this is positive
+        self._batch = 0
+        # Per-phase profile, model sizes are only measured if profiling was asked for
+        self._profile = BuildProfile()
+        self._profile_sizes = profile
+
+        # Compute the set of all resources
+        self._resources = set()
+        for node in topo.nodes():
+            self._resources.update(topo.get_resources(node))
+        for link in topo.links():
+            self._resources.update(topo.get_resources(link))
+        # Ensure that number of epochs matches up across all traffic classes
+        if len(set([ma.compressed(x.volFlows).size for x in all_pptc.tcs()])) != 1:
+            raise ValueError(ERR_EPOCH_MISMATCH)
+        # Store total number of epochs
+        self.num_epochs = ma.compressed(next(all_pptc.tcs()).volFlows).size
+        # Maximum number of paths for a single traffic class (to calculate the number of x_* variables)
+        self._max_paths = all_pptc.max_paths(all=False)
+        # Number all nodes and links, these are the rows of the load matrices
+        self._elements = list(topo.nodes()) + list(topo.links())
+        self._elem_index = {el: i for i, el in enumerate(self._elements)}
+        self._load_dict = {}
+        # paths disabled by mask_paths (traffic classes by paths), None if no paths were masked
+        self._masked = None
+        # number of paths with x_* variables, per traffic class (see add_paths)
+        self._num_paths = zeros(all_pptc.num_tcs(), dtype=int64)
+        for tc in all_pptc.tcs():
+            self._num_paths[tc.ID] = all_pptc.num_paths(tc)
+        # rows that dual prices are read from (see get_prices), recorded by the backends
+        self._unit_loads = {}
+        self._alloc_rows = full((all_pptc.num_tcs(), self.num_epochs), None, dtype=object)
+        self._load_rows = []
+        self._duals = None
+        logger.debug('Optimization computed: num_epochs=%d, max_paths=%d, num_tcs=%d' %
+                     (self.num_epochs, self._max_paths, self._all_pptc.num_tcs()))
+
+    def batch(self):
+        """
+        Defer model updates while the optimization is being built. The model is updated
+        once, when the (outermost) block exits::
+
+            with opt.batch():
+                opt.route_all()
+                opt.cap(BANDWIDTH, caps)
+
+        Builder functions keep returning usable variables inside the block.
+        """
+        return _Batch(self)
+
+    cdef _update(self):
+        """
+        Update the model after a modification, unless updates are deferred by :py:meth:`batch`
+        """
+        if self._batch == 0:
+            self._flush()
+
+    cdef _flush(self):
+        """
+        Apply all pending model modifications. Backends that do not need this ignore it.
+        """
+        pass
+
+    def phase(self, phase, name=None):
+        """
+        Time a phase of building (or solving) the optimization, and record it in the
+        profile (see :py:meth:`get_profile`)::
+
+            with opt.phase(u'consume', BANDWIDTH):
+                opt.consume(...)
+
+        :param phase: the phase
+        :param name: the resource, app or constraint the phase is for
+        """
+        return _Phase(self, phase, name)
+
+    cdef tuple _model_size(self):
+        """
+        :return: number of variables, constraints and non-zero coefficients in the model,
+            or None if model sizes are not measured
+        """
+        return None
+
+    def get_profile(self):
+        """
+        Per-phase profile of this optimization: wall time of building the decision variables,
+        the flow allocation, every resource consumption and cap, every named constraint and
+        objective, the objective composition, and of every path masking, addition of paths and solve.
+
+        Numbers of variables, constraints and non-zeros added by each phase are only
+        measured if the optimization was created with *profile=True*, as that
+        (for some backends) requires applying pending model updates after every phase.
+
+        :rtype: :py:class:`~sol.opt.profiling.BuildProfile`
+        """
+        return self._profile
+
+    cpdef allocate_flow(self, tcs, allocation=None):
+        """
+        Allocate network flow for each traffic class by allocating flow on each
+        path (and summing it up for each traffic class).
+
+        :param tcs: traffic classes
+        :param allocation: if given, allocation for given traffic classes will
+            be set to this value. Allocation must be between 0 and 1
+        """
+        raise UnsupportedOperationException()
+
+    cpdef route_all(self, tcs=None):
+        """
+        Ensure that all available traffic is routed (no drops) by forcing the allocation of flow to be 1
+        for all given traffic classes.
+
+        :param tcs: list of traffic classes
+        """
+        raise UnsupportedOperationException()
+
+    cpdef cap_num_paths(self, int max_paths, PPTC pptc=PPTC()):
+        """
+        Cap the total number of paths allowed to be enabled from the given set of paths per traffic class.
+
+        :param max_paths: number of paths
+        :param pptc: paths per traffic class. If empty, all traffic classes (and paths) are used.
+        """
+        raise UnsupportedOperationException()
+
+    cpdef enforce_single_path(self, traffic_classes):
+        """
+        Force all traffic to flow on a single path given for given traffic classes
+
+        :param traffic_classes: traffic classes for which to enable this constraint
+        """
+        raise UnsupportedOperationException()
+
+    cpdef flow_affinity(self, tc_pairs):
+        """
+        Ensure that the traffic for each pair of traffic classes in tc_pairs
+        is processed at the same middleboxes
+
+        :param tc_pairs: list of traffic class pairs
+        """
+        raise UnsupportedOperationException()
+
+    cpdef consume(self, tcs, unicode resource, capacities, mode, double cost_val, cost_funcs=None):
+        """
+        Compute the loads on a given resource by given traffic classes.
+
+        Loads are stored sparsely: each call adds a (node/link by x_* position) matrix
+        to the load dictionary. Position of the x_* variable is its index in the flattened
+        (traffic class, path, epoch) array.
+
+        :param tcs: traffic classes that cosume the resource
+        :param resource: resource to be consumed
+        :param capacities: capacities of links (or nodes)
+        :param mode: either 'links', 'nodes' or 'mboxes' -- determines what to iterate over
+        :param cost_val: the cost of a single flow
+        :param cost_funcs: an iterable containing cost functions
+        """
+        logger.debug(u'Consuming resource %s' % resource)
+        cdef int pi  # path index
+        cdef TrafficClass tc
+        cdef Path path
+        if mode not in (NODES, MBOXES, LINKS):
+            raise InvalidConfigException(ERR_UNKNOWN_MODE % ('resource owner', mode))
+
+        cdef int num_epochs = self.num_epochs
+        cdef int num_nodes = self.topo.num_nodes()
+        epochs = arange(num_epochs)
+        tcs = list(tcs)
+        rows, pos, vals = [], [], []
+        if cost_funcs is not None:
+            # cost functions are evaluated per path and node/link, the load of a new path cannot be priced
+            self._unit_loads[resource] = None
+            for tc in tcs:
+                for pi, path in enumerate(self._all_pptc.paths(tc)):
+                    if mode == NODES:
+                        elements = path.nodes()
+                    elif mode == MBOXES:
+                        elements = path.mboxes()
+                    else:
+                        elements = path.links()
+                    for el in elements:
+                        if el in capacities and capacities[el] > 0:
+                            rows.append(full(num_epochs, self._elem_index[el], dtype=int64))
+                            # position of the x_* variable in the flattened x_* array
+                            pos.append((tc.ID * self._max_paths + pi) * num_epochs + epochs)
+                            vals.append(array([func(tc, path, el) for func in cost_funcs]).max(axis=0) /
+                                        capacities[el])
+        else:
+            # Use the path incidence matrix: every non-zero is a (path, node/link) pair
+            inc = self._all_pptc.incidence(mode, num_nodes).tocoo()
+            tcids, pind = self._all_pptc.path_index()
+            # capacity and load matrix row of every incidence column
+            capcol = zeros(inc.shape[1])
+            elemcol = zeros(inc.shape[1], dtype=int64)
+            for el in capacities:
+                if el in self._elem_index:
+                    c = el[0] * num_nodes + el[1] if mode == LINKS else el
+                    capcol[c] = capacities[el]
+                    elemcol[c] = self._elem_index[el]
+            vols = zeros((self._all_pptc.num_tcs(), num_epochs))
+            tcmask = zeros(self._all_pptc.num_tcs(), dtype=bool)
+            for tc in tcs:
+                vols[tc.ID] = tc.volFlows.compressed()
+                tcmask[tc.ID] = True
+            keep = tcmask[tcids[inc.row]] & (capcol[inc.col] > 0)
+            prow, pcol = inc.row[keep], inc.col[keep]
+            t = tcids[prow]
+            rows.append(elemcol[pcol].repeat(num_epochs))
+            pos.append((((t * self._max_paths + pind[prow]) * num_epochs)[:, None] + epochs).ravel())
+            vals.append((vols[t] * (inc.data[keep] * cost_val / capcol[pcol])[:, None]).ravel())
+            # load of a unit of flow on every node/link, to price paths that are not in the optimization
+            units = self._unit_loads.setdefault(resource, zeros(len(self._elements)))
+            if mode != MBOXES and units is not None:
+                for el in capacities:
+                    if el in self._elem_index and capacities[el] > 0:
+                        units[self._elem_index[el]] += cost_val / capacities[el]
+        if not rows:
+            return
+        load = coo_matrix((concatenate(vals), (concatenate(rows), concatenate(pos))),
+                          shape=(len(self._elements), self._all_pptc.num_tcs() * self._max_paths * num_epochs))
+        self._load_dict.setdefault(resource, []).append(load)
+
+    cdef _resource_load(self, unicode resource):
+        """
+        Sum up all of the loads computed for a given resource
+
+        :param resource: the resource
+        :return: a sparse (element x x_* position) matrix in coordinate form, or None if
+            the resource is not consumed.
+        """
+        loads = self._load_dict.get(resource)
+        if not loads:
+            return None
+        load = loads[0].tocsr()
+        for l in loads[1:]:
+            load = load + l.tocsr()
+        load = load.tocoo()
+        load.eliminate_zeros()
+        return load
+
+    cpdef cap(self, unicode resource, caps, path_dep=False, tcs=None):
+        """
+        Cap the usage of a given resource with a given value.
+
+        :param resource: the name of resource to cap
+        :param caps: the maximum utilization of a given resource
+        :param path_dep: whether the resource is consumed per enabled path
+        :param tcs: traffic classes that consume the resource. If None, all traffic classes are used
+        """
+        raise UnsupportedOperationException()
+
+    cpdef min_node_load(self, unicode resource, tcs=None, varname=None):
+        """
+        Minimize node load for a particular resource
+
+        :param resource: name of the resource
+        :param tcs: the traffic classes that influence the objective
+        :param varname: the name of the objective variable
+        :return: an array of objective variables (one per each epoch)
+        """
+        raise UnsupportedOperationException()
+
+    cpdef min_link_load(self, unicode resource, tcs=None, varname=None):
+        """
+        Minimize link load for a particular resource
+
+        :param resource: name of the resource
+        :param tcs: the traffic classes that influence the objective
+        :param varname: the name of the objective variable
+        :return: an array of objective variables (one per each epoch)
+        """
+        raise UnsupportedOperationException()
+
+    cpdef min_latency(self, tcs=None, bool norm=True, cost_func=None, varname=None):
+        """
+        Add a minimize latency objective
+
+        :param tcs: traffic classes
+        :param norm: should the latency be normalized by the network diameter
+        :param cost_func: a cost function that returns the cost of a single path
+        :param varname: variable name to use. If None, one will be picked automatically
+        :return: an array of objective variables (one per each epoch)
+        """
+        raise UnsupportedOperationException()
+
+    cpdef max_flow(self, tcs=None, varname=None):
+        """
+        Maximize total network flow.
+
+        :param tcs: traffic classes for which the flow allocation should be maximized
+        :param varname: the name of the objective variable
+        :return: an array of objective variables (one per each epoch)
+        """
+        raise UnsupportedOperationException()
+
+    cpdef min_enabled_nodes(self, cost_func=None, varname=None):
+        """
+        Minimize the number of enabled nodes
+
+        :param cost_func: compute the cost of a single node. If None, every node costs 1
+        :param varname: the name of the objective variable
+        :return: an array of objective variables (one per each epoch)
+        """
+        raise UnsupportedOperationException()
+
+    cpdef compose_objectives(self, ndarray obj_arr, epoch_mode, fairness_mode, weight_arr):
+        """
+        Compose multiple objectives, across different epochs, into a unified objective function.
+
+        :param obj_arr: a 2-d array of objective variables. First dimension should be different objectives
+            (i.e., from different applications). Second dimension should be objectives for a single app
+            across epochs.
+        :param epoch_mode: the composition mode of objective functions across epochs
+            (:py:class:`sol.utils.const.EpochComposition`)
+        :param fairness_mode: how to compose the objectives of different applications
+        :param weight_arr: the weights array. Only applicable if the fairness_mode is "weighted"
+        :return: the variable referring to the overall objective
+        """
+        raise UnsupportedOperationException()
+
+    cpdef req_all_nodes(self, traffic_classes=None, node_mode=NodeConsumeMode.ALL):
+        """
+        Require all nodes to be enabled for each path
+
+        :param traffic_classes: traffic classes for which to enable this constraint. If None, all are used
+        :param node_mode: whether to count all nodes or only middleboxes
+        """
+        raise UnsupportedOperationException()
+
+    cpdef req_all_links(self, traffic_classes=None):
+        """
+        Require all links to be enabled for each path
+
+        :param traffic_classes: traffic classes for which to enable this constraint. If None, all are used
+        """
+        raise UnsupportedOperationException()
+
+    cpdef req_some_nodes(self, traffic_classes=None, node_mode=NodeConsumeMode.ALL):
+        """
+        Require at least one node to be enabled for each path
+
+        :param traffic_classes: traffic classes for which to enable this constraint. If None, all are used
+        :param node_mode: whether to count all nodes or only middleboxes
+        """
+        raise UnsupportedOperationException()
+
+    cpdef req_some_links(self, traffic_classes=None):
+        """
+        Require at least one link to be enabled for each path
+
+        :param traffic_classes: traffic classes for which to enable this constraint. If None, all are used
+        """
+        raise UnsupportedOperationException()
+
+    cpdef node_budget(self, int bound, budget_func=None):
+        """
+        Enable at most *bound* nodes.
+
+        :param bound: the maximum bound after budget_func has been computed
+        :param budget_func: compute the cost of a single node.
+            If None, 1 will be used, simply counting the nodes
+        """
+        raise UnsupportedOperationException()
+
+    def solve(self):
+        """
+        Solve the optimization
+        """
+        raise UnsupportedOperationException()
+
+    cpdef is_solved(self):
+        """
+        Check if the optimization is solved
+
+        :return: True if an optimal solution has been found
+        """
+        raise UnsupportedOperationException()
+
+    cpdef has_solution(self):
+        """
+        Check if the optimization has a solution, even if it is not (proven to be) optimal.
+        For example, if the solver was stopped by the time limit.
+
+        :return: True if a feasible solution has been found
+        """
+        raise UnsupportedOperationException()
+
+    cpdef get_paths(self, int epoch=0):
+        """
+        :param epoch: Return the paths for this epoch. By default the paths for the first epoch
+            are returned (that is *epoch=0*)
+        :return: paths per traffic class with set flow fractions. The paths (and their masks) are
+            shared with the optimization, flow fractions are assigned when the paths are first accessed.
+            If paths were masked with :py:meth:`mask_paths`, they are masked in the returned paths
+            (which then have masks of their own).
+        :rtype: :py:class:`sol.PPTC`
+        """
+        cdef TrafficClass tc
+        cdef PPTC c
+        if self._masked is None:
+            c = self._all_pptc.copy()
+        else:
+            c = self._all_pptc.copy(deep=True)
+            for tc in c.tcs():
+                c.mask(tc, self._masked[tc.ID, :c.num_paths(tc, all=True)])
+        vals = self.get_x_values()
+        for tc in c.tcs():
+            unmasked = ~c.get_mask_array(tc)
+            fractions = zeros(unmasked.size)
+            fractions[unmasked] = vals[tc.ID, :unmasked.sum(), epoch]
+            c.set_flow_fractions(tc, fractions)
+        return c
+
+    cpdef get_solved_objective(self, app=None):
+        """
+        :param app: If None, global objective is returned, otherwise the objective value for the given application
+            is returned.
+        :return: The objective value after the optimization is solved
+        """
+        raise UnsupportedOperationException()
+
+    cpdef get_chosen_paths(self, relaxed=False):
+        """
+        Return the paths that were deemed "enabled" by the optimization.
+        Unused paths are masked, and the flow fraction of each path is set to its
+        largest allocation across epochs.
+
+        If paths were masked with :py:meth:`mask_paths`, the paths that were not chosen are masked
+        as well, so that the optimization exposes the chosen paths only (see :py:meth:`get_xps`).
+
+        :param relaxed: if True, a path is used if it carries flow in any of the epochs.
+            Otherwise, the path's b_* variable is used (if binary path variables are present).
+        :rtype: :py:class:`sol.PPTC`
+        """
+        cdef TrafficClass tc
+        cdef int n
+        vals = self._x_values()
+        bvals = self._b_values()
+        for tc in self._all_pptc.tcs():
+            # Indices of the paths that are currently unmasked
+            unmasked = flatnonzero(~self._all_pptc.get_mask_array(tc))
+            n = unmasked.size
+            x = vals[tc.ID, :n, :]
+            b = bvals[tc.ID, :n]
+            if relaxed or isnan(b).any():
+                # A path is used if it carries flow in any of the epochs
+                used = (x != 0).any(axis=1)
+            else:
+                # A path is used if its b_p variable is 1
+                used = around(b) != 0
+            fractions = zeros(self._all_pptc.num_paths(tc, all=True))
+            fractions[unmasked] = x.max(axis=1)
+            self._all_pptc.set_flow_fractions(tc, fractions)
+            # Mask the unused paths in the PPTC
+            m = ones(fractions.size, dtype=bool)
+            m[unmasked[used]] = 0
+            self._all_pptc.mask(tc, m)
+            if self._masked is not None:
+                self._masked[tc.ID, :m.size] = m
+        return self._all_pptc
+
+    cpdef get_var_values(self):
+        """
+        Returns the mapping of variable names to values assigned by optimization
+        """
+        raise UnsupportedOperationException()
+
+    cpdef get_enabled_nodes(self):
+        """
+        Return the list of enabled nodes, as determined by the optimization
+        """
+        raise UnsupportedOperationException()
+
+    cpdef get_enabled_links(self):
+        """
+        Return the list of enabled links, as determined by the optimization
+        """
+        raise UnsupportedOperationException()
+
+    cpdef fix_paths(self, PPTC pptc, fix_zero_paths=False):
+        """
+        Fix flow allocation of for given paths to a precise value.
+
+        :param pptc: path per traffic class, with flow fractions set
+        :param fix_zero_paths: fix the allocation of paths where the fraction == 0.
+        """
+        raise UnsupportedOperationException()
+
+    cpdef write(self, fname):
+        """
+        Writes the formulation to disk
+
+        :param fname: filename, the backend appends an appropriate suffix
+        """
+        raise UnsupportedOperationException()
+
+    cpdef write_solution(self, fname):
+        """
+        Write the solution to disk
+
+        :param fname: filename, the backend appends an appropriate suffix
+        """
+        raise UnsupportedOperationException()
+
+    cpdef set_time_limit(self, double time):
+        """
+        Limit how long the solver looks for the solution.
+        When the limit is reached, the optimization is not solved, but it can still
+        have a (feasible) solution, see :py:meth:`has_solution`.
+
+        :param time: the time limit, in seconds. Use *inf* to remove the limit.
+        """
+        raise UnsupportedOperationException()
+
+    cpdef double get_time(self):
+        """
+        :return: The time it took to solve the optimization
+        """
+        return self._time
+
+    cpdef relax_to_lp(self):
+        """
+        Change integer (or binary) variables to continuous variables.
+        """
+        raise UnsupportedOperationException()
+
+    cpdef tuple get_prices(self, TrafficClass tc):
+        """
+        Dual prices of a solved linear program (see :py:meth:`relax_to_lp`), which price paths that
+        are not part of the optimization (e.g., for column generation). The reduced cost of a new path of
+        traffic class *tc* in epoch *e* is::
+
+            -allocation[e] - volume[e] * sum(prices[el][e] for el in nodes and links of the path)
+
+        and the path can improve the objective if its reduced cost is positive.
+        Only the flow allocation and the resource loads (resource caps and load objectives) are priced,
+        other constraints that involve paths are not.
+
+        :param tc: the traffic class
+        :return: a tuple of the allocation prices (one per epoch), and the prices of a unit of flow on
+            nodes and links (a dictionary of per-epoch arrays, only for nodes and links with a non-zero price)
+        :raise SOLException: if the optimization is not a solved linear program
+        """
+        cdef int ne = self.num_epochs
+        if self._duals is None:
+            for row in self._alloc_rows.ravel():
+                if row is None:
+                    raise SOLException(ERR_NO_DUALS)
+            self._duals = [self._row_duals(self._alloc_rows.ravel()).reshape(-1, ne)] + \
+                          [self._row_duals(rows) for _, _, _, rows, _, _ in self._load_rows]
+        prices = zeros((len(self._elements), ne))
+        for (resource, keys, tcmask, _, _, _), duals in zip(self._load_rows, self._duals[1:]):
+            units = self._unit_loads.get(resource)
+            if units is None or (tcmask is not None and not tcmask[tc.ID]):
+                continue
+            el = keys // ne
+            add.at(prices, (el, keys % ne), duals * units[el])
+        return self._duals[0][tc.ID], {self._elements[i]: prices[i] for i in flatnonzero(prices.any(axis=1))}
+
+    cdef ndarray _row_duals(self, rows):
+        """
+        Dual values of the given rows (as recorded by the backend), in the convention of a maximization:
+        the reduced cost of a column is its objective coefficient minus the dual-weighted sum of its coefficients
+
+        :raise SOLException: if the optimization is not a solved linear program
+        """
+        raise UnsupportedOperationException()
+
+    cpdef save(self, fname):
+        """
+        Write the built model to disk, so that it can be restored with :py:meth:`load`
+        instead of being built again.
+
+        :param fname: file name, without the suffix
+        :return: a list of the files written
+        """
+        raise UnsupportedOperationException()
+
+    @staticmethod
+    def load(Topology topo, PPTC all_pptc, fname, weights=None, bool profile=False):
+        """
+        Restore an optimization written by :py:meth:`save`, updated to the traffic
+        volumes of *all_pptc*.
+
+        :return: the optimization, or None if it cannot be restored for these volumes
+        """
+        raise UnsupportedOperationException()
+
+    cpdef get_xps(self):
+        """
+        Return the 3-dimentional array of all decision variables.
+        Dimensions are traffic classes (by ID), paths and epochs.
+
+        If paths were masked with :py:meth:`mask_paths`, only the variables of unmasked paths are
+        returned, so that path indices match the paths of the masked PPTC.
+        """
+        raise UnsupportedOperationException()
+
+    cpdef get_x_values(self):
+        """
+        Return the values of all decision variables in the solution, read in bulk.
+
+        :return: a 3-dimentional float array, in the same shape as :py:meth:`get_xps`
+            (traffic classes by ID, paths and epochs). Missing variables have a value of 0.
+        """
+        return self._exposed(self._x_values(), 0)
+
+    cdef ndarray _exposed(self, ndarray values, fill):
+        """
+        Keep the values of the paths that are not masked by :py:meth:`mask_paths`, in the order of the paths.
+        If no paths were masked, the values are returned as they are.
+
+        :param values: an array indexed by traffic class ID and path (and possibly by epoch)
+        :param fill: the value of the missing paths
+        """
+        cdef TrafficClass tc
+        cdef ndarray out, pos
+        if self._masked is None:
+            return values
+        out = full_like(values, fill)
+        for tc in self._all_pptc.tcs():
+            pos = flatnonzero(~self._masked[tc.ID, :self._all_pptc.num_paths(tc, all=True)])
+            out[tc.ID, :pos.size] = values[tc.ID, pos]
+        return out
+
+    cpdef mask_paths(self, PPTC pptc):
+        """
+        Disable the paths that are masked in *pptc* by forcing their flow to 0
+        (the upper bounds of their x_* and b_* variables are set to 0).
+        Paths that are not masked are enabled again.
+
+        This allows a single optimization, built over all candidate paths, to be
+        re-solved for different path selections instead of being rebuilt.
+        Solutions are read back in terms of the unmasked paths only (see :py:meth:`get_paths`
+        and :py:meth:`get_xps`), as if the optimization was built over the masked paths.
+
+        :param pptc: paths per traffic class, with the same paths (masked ones included)
+            as the optimization was built with
+        :raises InvalidConfigException: if the optimization was built with masked paths,
+            or the paths do not match
+        """
+        cdef TrafficClass tc
+        cdef int n
+        cdef ndarray off = zeros((self._all_pptc.num_tcs(), self._max_paths), dtype=bool)
+        for tc in self._all_pptc.tcs():
+            n = self._all_pptc.num_paths(tc, all=True)
+            if self._all_pptc.num_paths(tc) != n or pptc.num_paths(tc, all=True) != n:
+                raise InvalidConfigException(ERR_PATH_MASK)
+            off[tc.ID, :n] = pptc.get_mask(tc)
+        self._masked = off
+        with self.phase(u'mask_paths'):
+            self._mask_columns(off)
+
+    cdef _mask_columns(self, ndarray off):
+        """
+        Set the upper bounds of the path variables
+
+        :param off: a 2-d boolean array (traffic classes by paths), True means the path is disabled
+        """
+        raise UnsupportedOperationException()
+
+    cpdef bool can_add_paths(self):
+        """
+        Check if paths can be added in place (see :py:meth:`add_paths`): the optimization has no integer
+        variables, and the paths only appear in the flow allocation and in the resource loads
+        (consumed without cost functions) that are capped or minimized.
+        """
+        for units in self._unit_loads.values():
+            if units is None:
+                return False
+        return self._paths_priced()
+
+    cpdef add_paths(self):
+        """
+        Add variables for the paths that were appended to the paths of the optimization after it was built
+        (e.g., with :py:meth:`~sol.path.paths.PPTC.extend`), instead of rebuilding it.
+        The new paths carry the flow of their traffic class and add to the loads of the nodes and links
+        they consume (and thus to the caps and load objectives), the same way the dual prices price them
+        (see :py:meth:`get_prices`).
+
+        :raise UnsupportedOperationException: if paths cannot be added in place (see :py:meth:`can_add_paths`)
+        :raise InvalidConfigException: if paths were masked since the optimization was built
+        """
+        cdef TrafficClass tc
+        cdef Path p
+        cdef int ne = self.num_epochs, nt = self._all_pptc.num_tcs(), mp, j
+        counts = zeros(nt, dtype=int64)
+        vols = zeros((nt, ne))
+        for tc in self._all_pptc.tcs():
+            counts[tc.ID] = self._all_pptc.num_paths(tc)
+            vols[tc.ID] = tc.volFlows.compressed()
+        if (counts < self._num_paths).any():
+            raise InvalidConfigException(ERR_PATHS_REMOVED)
+        if (counts == self._num_paths).all():
+            return
+        if not self.can_add_paths():
+            raise UnsupportedOperationException(ERR_ADD_PATHS)
+        with self.phase(u'add_paths'):
+            mp = max(self._max_paths, counts.max())
+            if mp > self._max_paths:
+                self._grow(mp)
+            ind = arange(mp)[None, :]
+            new = (ind >= self._num_paths[:, None]) & (ind < counts[:, None])
+            self._num_paths = counts
+            tcids, pind = new.nonzero()
+            xvars = self._add_path_vars(new)
+            # the flow on every new path adds up to the allocation of its traffic class
+            rows, variables, vals = [self._alloc_rows[tcids].ravel()], [xvars.ravel()], [ones(xvars.size)]
+            # nodes and links of every new path
+            paths = {}
+            pj, el = [], []
+            for j in range(tcids.size):
+                if tcids[j] not in paths:
+                    paths[tcids[j]] = self._all_pptc.paths(self._all_pptc.tc_byid(tcids[j]))
+                p = paths[tcids[j]][pind[j]]
+                elements = [self._elem_index[n] for n in p.nodes()] + \
+                           [self._elem_index[link] for link in p.links()]
+                pj.append(full(len(elements), j, dtype=int64))
+                el.append(array(elements, dtype=int64))
+            pj, el = concatenate(pj), concatenate(el)
+            epochs = arange(ne)
+            for resource, units in self._unit_loads.items():
+                keep = units[el] > 0
+                pos = ((tcids[pj[keep]] * mp + pind[pj[keep]]) * ne)[:, None] + epochs
+                self._load_dict.setdefault(resource, []).append(coo_matrix(
+                    ((vols[tcids[pj[keep]]] * units[el[keep]][:, None]).ravel(), (el[keep].repeat(ne), pos.ravel())),
+                    shape=(len(self._elements), nt * mp * ne)))
+            for g, (resource, keys, tcmask, grows, caps, objs) in enumerate(self._load_rows):
+                units = self._unit_loads[resource]
+                keep = units[el] > 0
+                if tcmask is not None:
+                    keep &= tcmask[tcids[pj]]
+                if caps is not None:
+                    keep &= ~isnan(caps[el])
+                rowkeys = ((el[keep] * ne)[:, None] + epochs).ravel()
+                coeffs = (vols[tcids[pj[keep]]] * units[el[keep]][:, None]).ravel()
+                xv = xvars[pj[keep]].ravel()
+                at = searchsorted(keys, rowkeys).clip(0, max(keys.size - 1, 0))
+                found = keys[at] == rowkeys if keys.size > 0 else zeros(rowkeys.size, dtype=bool)
+                rows.append(array(list(grows), dtype=object)[at[found]])
+                variables.append(xv[found])
+                vals.append(coeffs[found])
+                # nodes/links (and epochs) that carried no load so far get rows of their own
+                nkeys, local = unique(rowkeys[~found], return_inverse=True)
+                if nkeys.size == 0:
+                    continue
+                if objs is None:
+                    # load <= cap
+                    newrows = self._add_le_rows(local.ravel(), xv[~found], coeffs[~found], caps[nkeys // ne],
+                                                nkeys.size)
+                else:
+                    # load + objective <= 1
+                    newrows = self._add_le_rows(concatenate([local.ravel(), arange(nkeys.size)]),
+                                                concatenate([xv[~found], objs[nkeys % ne]]),
+                                                concatenate([coeffs[~found], ones(nkeys.size)]), 1, nkeys.size)
+                order = argsort(concatenate([keys, nkeys]), kind='stable')
+                self._load_rows[g] = (resource, concatenate([keys, nkeys])[order], tcmask,
+                                      concatenate([array(list(grows), dtype=object), newrows])[order], caps, objs)
+            self._set_coeffs(concatenate(rows), concatenate(variables), concatenate(vals))
+            self._duals = None
+            self._update()
+
+    cdef bool _paths_priced(self):
+        """
+        :return: True if the optimization has no integer variables, and the x_* variables only appear in the
+            flow allocation rows and in the resource load rows (see :py:meth:`get_prices`)
+        """
+        return False
+
+    cdef _grow(self, int max_paths):
+        """
+        Make room for up to *max_paths* paths per traffic class in the path variables and the load matrices.
+        Backends grow their own variable arrays, and then call this.
+        """
+        cdef int ne = self.num_epochs
+        cdef int nt = self._all_pptc.num_tcs()
+        for resource in self._load_dict:
+            grown = []
+            for load in self._load_dict[resource]:
+                tcid, rest = divmod(load.col, self._max_paths * ne)
+                grown.append(coo_matrix((load.data, (load.row, tcid * max_paths * ne + rest)),
+                                        shape=(len(self._elements), nt * max_paths * ne)))
+            self._load_dict[resource] = grown
+        if self._masked is not None:
+            self._masked = concatenate([self._masked, zeros((nt, max_paths - self._max_paths), dtype=bool)],
+                                       axis=1)
+        self._max_paths = max_paths
+
+    cdef ndarray _add_path_vars(self, ndarray new):
+        """
+        Add the x_* variables of new paths
+
+        :param new: a 2-d boolean array (traffic classes by paths) of the new paths
+        :return: the new variables (new paths by epochs)
+        """
+        raise UnsupportedOperationException()
+
+    cdef _set_coeffs(self, ndarray rows, ndarray variables, ndarray vals):
+        """
+        Set coefficients of (new) variables in existing rows
+
+        :param rows: the rows, one per coefficient
+        :param variables: the variables, one per coefficient
+        :param vals: the coefficients
+        """
+        raise UnsupportedOperationException()
+
+    cdef ndarray _add_le_rows(self, ndarray rows, ndarray variables, ndarray vals, ub, int num_rows):
+        """
+        Add a block of rows of the form A x <= ub
+
+        :param rows: row index of each non-zero coefficient, local to this block
+        :param variables: the variable of each non-zero coefficient
+        :param vals: the coefficients
+        :param ub: upper bounds of the rows (a scalar or an array of size *num_rows*)
+        :param num_rows: number of rows
+        :return: the new rows
+        """
+        raise UnsupportedOperationException()
+
+    cdef ndarray _path_keys(self):
+        """
+        Keys that identify the paths of this optimization independently of their position,
+        so that solution values can be matched up between optimizations.
+
+        :return: a 2-d object array (traffic classes by paths) of (traffic class ID, nodes, middleboxes)
+            tuples. Missing paths have a key of None.
+        """
+        cdef TrafficClass tc
+        cdef Path p
+        cdef int pi
+        keys = full((self._all_pptc.num_tcs(), self._max_paths), None, dtype=object)
+        for tc in self._all_pptc.tcs():
+            for pi, p in enumerate(self._all_pptc.paths(tc)):
+                keys[tc.ID, pi] = (tc.ID, tuple(p.nodes()), p.mboxes())
+        return keys
+
+    cpdef get_start(self):
+        """
+        Values of the x_* and b_* variables in the current solution, keyed by traffic class and path.
+        These can be passed to :py:meth:`set_start` of another optimization that shares
+        (some of) the same traffic classes and paths.
+
+        :return: a dictionary mapping (traffic class ID, nodes, middleboxes) tuples to
+            (array of x_* values per epoch, b_* value) tuples. The b_* value is nan if the
+            path has no binary variable.
+        """
+        cdef ndarray keys = self._path_keys()
+        x = self._x_values()
+        b = self._b_values()
+        return {keys[ind]: (x[ind], b[ind]) for ind in zip(*(keys != None).nonzero())}
+
+    cpdef set_start(self, dict start):
+        """
+        Set a starting solution (MIP start) for the next solve. Paths are matched by their keys
+        (see :py:meth:`get_start`), paths that are not in *start* get no starting value.
+        Paths disabled with :py:meth:`mask_paths` always start at 0.
+
+        :param start: starting values, as returned by :py:meth:`get_start`
+        """
+        cdef ndarray keys = self._path_keys()
+        x = full((self._all_pptc.num_tcs(), self._max_paths, self.num_epochs), nan)
+        b = full((self._all_pptc.num_tcs(), self._max_paths), nan)
+        for ind in zip(*(keys != None).nonzero()):
+            val = start.get(keys[ind])
+            # starting values from optimizations with a different number of epochs cannot be used
+            if val is not None and len(val[0]) == self.num_epochs:
+                x[ind] = val[0]
+                b[ind] = val[1]
+        if self._masked is not None:
+            x[self._masked] = 0
+            b[self._masked] = 0
+        self._set_start_values(x, b)
+
+    cdef ndarray _x_values(self):
+        """
+        Values of the x_* variables, in the shape of :py:meth:`get_xps`. Missing variables have a value of 0.
+        """
+        raise UnsupportedOperationException()
+
+    cdef ndarray _b_values(self):
+        """
+        Values of the b_* variables (traffic classes by paths). Missing variables have a value of nan.
+        """
+        raise UnsupportedOperationException()
+
+    cdef _set_start_values(self, ndarray x, ndarray b):
+        """
+        Set the starting values of the x_* and b_* variables. A value of nan means no starting value.
+
+        :param x: values of the x_* variables, in the shape of :py:meth:`get_xps`
+        :param b: values of the b_* variables (traffic classes by paths)
+        """
+        raise UnsupportedOperationException()
+
+    def add_single_objective(self, name, *args, **kwargs):
+        """
+        Add an objective to the optimization
+        :param name: name of the objective
+        :param args: arguments to be passed to the objective generation function
+        :param kwargs: keyword arguments to be passed to objective generation function
+        :return:
+        """
+        logger.debug("add Single Objective")
+
+        epoch_objs = None
+        if name == Objective.MIN_LINK_LOAD:
+            epoch_objs = self.min_link_load(*args, **kwargs)
+        elif name == Objective.MIN_NODE_LOAD:
+            epoch_objs = self.min_node_load(*args, **kwargs)
+        elif name == Objective.MIN_LATENCY:
+            epoch_objs = self.min_latency(*args, **kwargs)
+        elif name == Objective.MAX_FLOW:
+            epoch_objs = self.max_flow(*args, **kwargs)
+        elif name == Objective.MIN_ENABLED_NODES:
+            epoch_objs = self.min_enabled_nodes(*args, **kwargs)
+        else:
+            raise InvalidConfigException("Unknown objective %s" % name)
+        return epoch_objs
+
+    def add_named_constraints(self, app):
+        """
+        Add supported constraints from the application to the optimization
+        :param app: the application
+        """
+        for c in app.constraints:
+            args, kwargs = c[1], c[2]
+            with self.phase(u'constraint', u'%s:%s' % (app.name, getattr(c[0], 'name', c[0]))):
+                if c[0] == Constraint.ROUTE_ALL:
+                    self.route_all(*args, **kwargs)
+                elif c[0] == Constraint.CAP_LINKS or c[0] == Constraint.CAP_NODES:
+                    self.cap(*args, **kwargs)
+                elif c[0] == Constraint.REQ_ALL_LINKS:
+                    self.req_all_links(*args, **kwargs)
+                elif c[0] == Constraint.REQ_ALL_NODES:
+                    self.req_all_nodes(*args, **kwargs)
+                elif c[0] == Constraint.REQ_SOME_LINKS:
+                    self.req_some_links(*args, **kwargs)
+                elif c[0] == Constraint.REQ_SOME_NODES:
+                    self.req_some_nodes(*args, **kwargs)
+                elif c[0] == Constraint.FIX_PATHS:
+                    self.fix_paths(*args, **kwargs)
+                elif c[0] == Constraint.NODE_BUDGET:
+                    self.node_budget(*args, **kwargs)
+                else:
+                    raise InvalidConfigException("Unsupported constraint type %s" % c)
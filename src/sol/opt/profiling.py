@@ -0,0 +1,102 @@
+# coding=utf-8
+"""
+Per-phase profiles of building (and solving) optimizations
+"""
+
+from collections import namedtuple, OrderedDict
+
+__all__ = ['PhaseRecord', 'BuildProfile']
+
+#: One timed phase: what it was (e.g., *consume*), which resource/app/constraint it was for,
+#: the wall time in seconds, and how many variables, constraints and non-zero coefficients
+#: it added to the model (None if model sizes were not measured)
+PhaseRecord = namedtuple('PhaseRecord', ['phase', 'name', 'time', 'vars', 'constrs', 'nonzeros'])
+
+
+class BuildProfile(object):
+    """
+    Wall time and model growth of every phase of an optimization, in the order they ran.
+    Returned by :py:meth:`~sol.opt.optbase.Optimization.get_profile`.
+
+    Phases are *decision_vars*, *allocate_flow*, *consume*, *cap*, *constraint*, *objective*,
+    *compose_objectives*, *mask_paths*, *add_paths* and *solve*.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def add(self, phase, name, seconds, num_vars=None, num_constrs=None, nonzeros=None):
+        """
+        Record a phase
+
+        :param phase: the phase
+        :param name: name of the resource, app or constraint the phase was for (or None)
+        :param seconds: wall time of the phase
+        :param num_vars: number of variables the phase added
+        :param num_constrs: number of constraints the phase added
+        :param nonzeros: number of non-zero coefficients the phase added
+        """
+        self.records.append(PhaseRecord(phase, name, seconds, num_vars, num_constrs, nonzeros))
+
+    def extend(self, other):
+        """
+        Append all records of another profile to this one
+
+        :param other: a :py:class:`BuildProfile`
+        :return: this profile
+        """
+        self.records.extend(other.records)
+        return self
+
+    def total_time(self, phase=None):
+        """
+        :param phase: only count the records of this phase. If None, all records are counted.
+        :return: total wall time, in seconds
+        """
+        return sum(r.time for r in self.records if phase is None or r.phase == phase)
+
+    def summary(self, by_name=False):
+        """
+        Aggregate the records.
+
+        :param by_name: if True, aggregate by (phase, name) instead of by phase only,
+            to see which resource or app is expensive
+        :return: an ordered dictionary, from the phase (or a (phase, name) tuple) to a dictionary
+            with the *count* of records and the sums of their *time*, *vars*, *constrs* and *nonzeros*
+        """
+        res = OrderedDict()
+        for r in self.records:
+            key = (r.phase, r.name) if by_name else r.phase
+            if key not in res:
+                res[key] = dict(count=0, time=0, vars=0, constrs=0, nonzeros=0)
+            agg = res[key]
+            agg['count'] += 1
+            agg['time'] += r.time
+            for field in ('vars', 'constrs', 'nonzeros'):
+                value = getattr(r, field)
+                if value is None or agg[field] is None:
+                    agg[field] = None
+                else:
+                    agg[field] += value
+        return res
+
+    def format(self, by_name=False):
+        """
+        :return: the :py:meth:`summary` as a human-readable table
+        """
+        lines = ['%-32s %6s %10s %10s %10s %10s' % ('phase', 'count', 'time (s)', 'vars', 'constrs', 'nonzeros')]
+        for key, agg in self.summary(by_name).items():
+            if by_name:
+                key = key[0] if key[1] is None else '%s:%s' % key
+            values = (key, agg['count'], agg['time'], agg['vars'], agg['constrs'], agg['nonzeros'])
+            lines.append('%-32s %6d %10.4f %10s %10s %10s' % values)
+        return '\n'.join(lines)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __repr__(self):
+        return 'BuildProfile(%d phases, %.4fs)' % (len(self.records), self.total_time())
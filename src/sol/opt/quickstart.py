@@ -4,22 +4,26 @@ from numpy import array
 from sol.utils.const import NODES, LINKS, EpochComposition, ERR_UNKNOWN_MODE, Fairness, MBOXES
 from sol.utils.exceptions import InvalidConfigException
 from sol.utils.logger import logger
-from .gurobiwrapper import OptimizationGurobi
+from .backends import get_backend
 
 __all__ = ['from_app']
 
 
-def from_app(topo, app, network_config):
+def from_app(topo, app, network_config, backend=None, backend_opts=None):
     """
     Create an optimization from a single application.
 
     :param topo: the network topology
     :param app: the application
     :param network_config: operator-specified network config. (see :py:class:`sol.NetworkConfig`)
+    :param backend: the optimization backend (solver) to use. See :py:class:`~sol.utils.const.Backend`.
+        If None, the default backend is used.
+    :param backend_opts: a dictionary of extra keyword arguments passed to the backend constructor
+        (e.g., *matrix=True* for Gurobi)
     :return: the optimization object
     """
     # Start the optimization
-    opt = OptimizationGurobi(topo, app.pptc)
+    opt = get_backend(backend)(topo, app.pptc, **(backend_opts or {}))
     # Extract the capacities from all links and nodes
     node_caps = {node: topo.get_resources(node) for node in topo.nodes()}
     link_caps = {link: topo.get_resources(link) for link in topo.links()}
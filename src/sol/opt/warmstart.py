@@ -0,0 +1,63 @@
+# coding=utf-8
+"""
+Propagation of solutions between successive solves, as starting points (MIP starts)
+"""
+
+from sol.utils.logger import logger
+
+__all__ = ['WarmStart']
+
+
+class WarmStart(object):
+    """
+    Records the solution of the last solved optimization and uses it as the starting
+    solution of the next one.
+
+    Values are keyed by traffic class ID and path (not by the position of the path),
+    so they carry over to optimizations that are rebuilt, or re-solved with different
+    path masks, as long as they share (some of) the same traffic classes and paths.
+
+    Usage::
+
+        ws = WarmStart()
+        for ...:
+            opt = compose_apps(...)
+            ws.apply(opt)
+            opt.solve()
+            ws.record(opt)
+    """
+
+    def __init__(self):
+        self._start = {}
+
+    def record(self, opt):
+        """
+        Remember the solution of the given optimization. Nothing is recorded if
+        the optimization is not solved.
+
+        :param opt: the optimization
+        :return: True if the solution was recorded
+        """
+        if not opt.is_solved():
+            return False
+        self._start = opt.get_start()
+        return True
+
+    def apply(self, opt):
+        """
+        Set the last recorded solution as the starting solution of the given optimization.
+
+        :param opt: the optimization, before it is solved
+        """
+        if self._start:
+            logger.debug('Warm starting from %d paths' % len(self._start))
+            opt.set_start(self._start)
+
+    def clear(self):
+        """
+        Forget the recorded solution
+        """
+        self._start = {}
+
+    def __len__(self):
+        return len(self._start)
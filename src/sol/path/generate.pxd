@@ -1,12 +1,25 @@
 # coding=utf-8
 
+from sol.path.pathcache cimport PathCache
 from sol.path.paths cimport PPTC
 from sol.topology.topologynx cimport Topology
 
 cpdef use_mbox_modifier(path, Topology topology, chain_length=*)
+
+cdef class MboxModifier:
+    cdef public int chain_length
+    cdef public object path_budget
+    cdef public object tc_budget
+    cdef public object score
+
 # cpdef generate_paths_ie(int source, int sink, Topology topology, predicate,
 #                         int cutoff, float max_paths= *, modify_func= *,
 #                         bool raise_on_empty= *)
+cpdef unicode paths_fingerprint(Topology topology, predicate=*, cutoff=*, max_paths=*, modify_func=*,
+                                strategy=*)
+cpdef dict generate_paths_pairs(Topology topology, pairs, predicate=*, cutoff=*,
+                                max_paths=*, modify_func=*, raise_on_empty=*, strategy=*)
 cpdef PPTC generate_paths_tc(Topology topology, traffic_classes, predicate=*,
                              cutoff=*, max_paths=*, modify_func=*,
-                             raise_on_empty=*, name=*)
+                             raise_on_empty=*, name=*, workers=*, PathCache cache=*, strategy=*)
+cpdef dict repair_paths(PPTC pptc, Topology topology, failed, predicate=*, cutoff=*, modify_func=*, quota=*)
@@ -1,16 +1,28 @@
 # coding=utf-8
+import hashlib
 import itertools
+from collections import OrderedDict
+from multiprocessing import Pool
+
+import networkx
+import numpy
 
 from cpython cimport bool
-from networkx import NetworkXNoPath
+from sol.path.ksp import KShortestPaths
+from sol.path.pathcache import PathCache
+from sol.path.pathcache cimport PathCache
 from sol.path.paths import PathWithMbox
-from sol.path.predicates import null_predicate
+from sol.path.predicates import batch_predicate, null_predicate, PathBlock
 from sol.topology.topologynx import Topology
 from sol.topology.topologynx cimport Topology
 
 from paths cimport Path, PPTC
 from sol.utils import exceptions
-from sol.utils.const import ERR_NO_PATH
+from sol.utils.const import ERR_NO_PATH, ERR_UNKNOWN_MODE, GENERATE_SHORTEST, GENERATE_EDGE_DISJOINT, \
+    GENERATE_NODE_DISJOINT, GENERATE_DIVERSE
+
+# Largest number of candidate paths checked by a batch predicate at once
+_MAX_BLOCK = 1024
 
 cpdef use_mbox_modifier(path, Topology topology, chain_length=1):
     """
@@ -28,12 +40,69 @@ cpdef use_mbox_modifier(path, Topology topology, chain_length=1):
         paths where :math:`n` is
         the number of switches with middleboxes attached to them in the current path.
     """
-    return [PathWithMbox(path, chain) for chain in itertools.combinations(path, chain_length)
-            if all([topology.has_middlebox(n) for n in chain])]
+    mask = topology.mbox_mask()
+    # only nodes with middleboxes can be in a chain
+    return [PathWithMbox(path, chain)
+            for chain in itertools.combinations([n for n in path if mask[n]], chain_length)]
+
+cdef class MboxModifier:
+    """
+    A streaming version of :py:func:`use_mbox_modifier`, to use as the *modify_func* of path generation.
+
+    Chains of middleboxes are enumerated lazily, and the predicate is checked (in batches, if it supports them)
+    before any path objects are created. Expansion stops as soon as *max_paths* paths were found,
+    or a budget is used up.
+
+    :param chain_length: how many middleboxes are required
+    :param path_budget: maximum number of chains to check per path (None for no limit)
+    :param tc_budget: maximum number of chains to check per traffic class, i.e., per (source, sink) pair
+        (None for no limit)
+    :param score: order of the middleboxes. If None, chains are enumerated in the order of positions
+        along the path. Otherwise, a dictionary or a function that gives the score of a middlebox node
+        (e.g., its load): chains of lower-scoring middleboxes are enumerated first.
+    """
+
+    def __init__(self, int chain_length=1, path_budget=None, tc_budget=None, score=None):
+        self.chain_length = chain_length
+        self.path_budget = path_budget
+        self.tc_budget = tc_budget
+        self.score = score
+
+    def chains(self, path, Topology topology):
+        """
+        Iterate over the middlebox chains of a path, up to the path budget
+
+        :param path: the path, as a list of nodes
+        :param topology: the topology
+        :return: a generator over tuples of middlebox nodes, in the order of the path
+        """
+        mask = topology.mbox_mask()
+        boxes = [n for n in path if mask[n]]
+        position = {n: i for i, n in enumerate(path)}
+        scores = self.score
+        if isinstance(scores, dict):
+            boxes.sort(key=lambda n: (scores.get(n, 0), position[n]))
+        elif scores is not None:
+            boxes.sort(key=lambda n: (scores(n), position[n]))
+        chains = itertools.combinations(boxes, self.chain_length)
+        if self.path_budget is not None:
+            chains = itertools.islice(chains, self.path_budget)
+        for chain in chains:
+            yield chain if self.score is None else tuple(sorted(chain, key=position.get))
+
+    def __call__(self, path, Topology topology):
+        return [PathWithMbox(path, chain) for chain in self.chains(path, topology)]
+
+    def __reduce__(self):
+        return MboxModifier, (self.chain_length, self.path_budget, self.tc_budget, self.score)
+
+    def __repr__(self):
+        return u'MboxModifier(chain_length={}, path_budget={}, tc_budget={}, score={})'.format(
+            self.chain_length, self.path_budget, self.tc_budget, self.score)
 
 def generate_paths_ie(int source, int sink, Topology topology, predicate,
                       int cutoff, float max_paths=float('inf'),
-                      modify_func=None, bool raise_on_empty=True):
+                      modify_func=None, bool raise_on_empty=True, PathCache cache=None, strategy=None):
     """
     Generates all simple paths between source and sink using a given predicate.
 
@@ -52,54 +121,236 @@ def generate_paths_ie(int source, int sink, Topology topology, predicate,
         to expand a list of switches into all possible combinations of middleboxes
     :param raise_on_empty: whether to raise an exception if no valid paths are detected.
         Set to True by default.
+    :param cache: a :py:class:`~sol.path.pathcache.PathCache` to look the paths up in (and add them to)
+    :param strategy: how candidate paths are generated, see :py:func:`generate_paths_tc`
     :raise NoPathsException: if no paths are found
-    :returns: a generator over the path objects
+    :returns: a generator over the path objects (a list, if a cache is used)
+    """
+    if cache is None:
+        engine = topology.path_engine()
+        return _filter_paths(source, sink, _candidates(engine, source, sink, cutoff, max_paths, strategy),
+                             topology, predicate, max_paths, modify_func, raise_on_empty)
+    key = cache.key(source, sink, topology, predicate, cutoff, max_paths, modify_func, strategy)
+    paths = cache.get(key)
+    if paths is None:
+        # the engine is only needed on a miss
+        engine = topology.path_engine()
+        paths = list(_filter_paths(source, sink, _candidates(engine, source, sink, cutoff, max_paths, strategy),
+                                   topology, predicate, max_paths, modify_func, False))
+        cache.put(key, paths)
+    return _copy_paths(source, sink, paths, raise_on_empty)
+
+def _candidates(engine, source, sink, cutoff, max_paths, strategy):
+    """
+    Candidate paths (lists of nodes) between *source* and *sink*, generated with a strategy
+    (see :py:func:`generate_paths_tc`) by a :py:class:`~sol.path.ksp.KShortestPaths` engine
+    """
+    if strategy is None or strategy == GENERATE_SHORTEST:
+        return engine.paths(source, sink, cutoff)
+    elif strategy == GENERATE_EDGE_DISJOINT or strategy == GENERATE_NODE_DISJOINT:
+        return engine.disjoint_paths(source, sink, None if max_paths == float('inf') else int(max_paths),
+                                     strategy == GENERATE_NODE_DISJOINT, cutoff)
+    elif strategy == GENERATE_DIVERSE:
+        return engine.diverse_paths(source, sink, cutoff=cutoff)
+    elif callable(strategy):
+        return strategy(engine, source, sink, cutoff, max_paths)
+    raise ValueError(ERR_UNKNOWN_MODE % (u'path generation', strategy))
+
+cdef list _copy_paths(int source, int sink, list paths, raise_on_empty):
+    """
+    Copies of cached paths, that share the node arrays with the cached ones
+    """
+    if not paths and raise_on_empty:
+        raise exceptions.NoPathsException(ERR_NO_PATH.format(source, sink))
+    return [p.copy() for p in paths]
+
+def _filter_paths(int source, int sink, node_paths, Topology topology, predicate, max_paths,
+                  modify_func, raise_on_empty):
+    """
+    Convert lists of nodes into path objects, keeping the ones that satisfy the predicate.
+    See :py:func:`generate_paths_ie` for the arguments.
     """
-    # paths = []
     num = 0
     if predicate is None:
         predicate = null_predicate
+    batch = batch_predicate(predicate)
+    if isinstance(modify_func, MboxModifier):
+        for p in _filter_chains(node_paths, topology, predicate, batch, max_paths, modify_func):
+            num += 1
+            yield p
+        node_paths = ()
+    elif batch is not None:
+        for p in _filter_batches(node_paths, topology, batch, max_paths, modify_func):
+            num += 1
+            yield p
+        node_paths = ()
 
-    try:
-        for p in topology.paths(source, sink, cutoff):
-            if modify_func is None:
-                if predicate(p, topology):
-                    # paths.append(Path(p, num))
-                    num += 1
-                    yield Path(p)
-                else:
-                    continue
+    for p in node_paths:
+        if modify_func is None:
+            if predicate(p, topology):
+                num += 1
+                yield Path(p)
             else:
-                np = modify_func(p, topology)
-                if isinstance(np, list):
-                    for innerp in np:
-                        if predicate(innerp, topology):
-                            # paths.append(innerp)
-                            num += 1
-                            yield innerp
-                        else:
-                            continue
-                else:
-                    if predicate(np, topology):
-                        # paths.append(np)
+                continue
+        else:
+            np = modify_func(p, topology)
+            if isinstance(np, list):
+                for innerp in np:
+                    if predicate(innerp, topology):
                         num += 1
-                        yield np
+                        yield innerp
                     else:
                         continue
-            if num >= max_paths:
-                return
-    except NetworkXNoPath:
-        if raise_on_empty:
-            raise exceptions.NoPathsException(ERR_NO_PATH.format(source, sink))
-        else:
+            else:
+                if predicate(np, topology):
+                    num += 1
+                    yield np
+                else:
+                    continue
+        if num >= max_paths:
             return
-    # print("num == %d" % num)
     if num == 0 and raise_on_empty:
         raise exceptions.NoPathsException(ERR_NO_PATH.format(source, sink))
 
+def _filter_batches(node_paths, Topology topology, batch, max_paths, modify_func):
+    """
+    Same as :py:func:`_filter_paths`, but candidate paths are checked in blocks, by a batch predicate
+    (see :py:func:`~sol.path.predicates.batch_predicate`)
+    """
+    num = 0
+    # blocks start small when all paths are needed, and are never larger than the number of missing paths,
+    # so that no more paths are enumerated than needed
+    size = 64
+    node_paths = iter(node_paths)
+    while True:
+        if max_paths != float('inf'):
+            size = max_paths - num
+        block = list(itertools.islice(node_paths, max(1, min(int(size), _MAX_BLOCK))))
+        if not block:
+            return
+        size = 2 * size
+        # the node path every candidate comes from
+        origins = None
+        if modify_func is None:
+            candidates = block
+        else:
+            candidates, origins = [], []
+            for i, p in enumerate(block):
+                np = modify_func(p, topology)
+                np = np if isinstance(np, list) else [np]
+                candidates.extend(np)
+                origins.extend([i] * len(np))
+        if not candidates:
+            continue
+        keep = batch(PathBlock(candidates), topology).tolist()
+        for j, c in enumerate(candidates):
+            # all paths made from a node path are kept, as in _filter_paths
+            if origins is not None and j > 0 and origins[j] != origins[j - 1] and num >= max_paths:
+                return
+            if keep[j]:
+                num += 1
+                yield Path(c) if origins is None else c
+            if origins is None and num >= max_paths:
+                return
+        if num >= max_paths:
+            return
+
+def _filter_chains(node_paths, Topology topology, predicate, batch, max_paths, MboxModifier modifier):
+    """
+    Same as :py:func:`_filter_paths`, for a :py:class:`MboxModifier`: middlebox chains are checked
+    before path objects are created, and no more chains are enumerated than needed
+    """
+    num = 0
+    budget = float('inf') if modifier.tc_budget is None else modifier.tc_budget
+    for p in node_paths:
+        chains = modifier.chains(p, topology)
+        while num < max_paths and budget > 0:
+            block = list(itertools.islice(chains, int(min(max_paths - num, budget, _MAX_BLOCK))))
+            if not block:
+                break
+            budget -= len(block)
+            if batch is not None:
+                keep = batch(PathBlock([p] * len(block), block), topology).tolist()
+                for chain, k in zip(block, keep):
+                    if k:
+                        num += 1
+                        yield PathWithMbox(p, chain)
+            else:
+                for chain in block:
+                    path = PathWithMbox(p, chain)
+                    if predicate(path, topology):
+                        num += 1
+                        yield path
+        if num >= max_paths or budget <= 0:
+            return
+
+cpdef unicode paths_fingerprint(Topology topology, predicate=None, cutoff=None, max_paths=float('inf'),
+                                modify_func=None, strategy=None):
+    """
+    Fingerprint of paths generated with the given arguments (see :py:func:`generate_paths_tc`),
+    used to detect stale saved paths (see :py:meth:`~sol.path.paths.PPTC.save`).
+    Functions are identified by their module and name.
+
+    :return: a hex digest
+    """
+    if cutoff is None:
+        cutoff = topology.diameter()
+    desc = (topology.fingerprint(), _func_name(predicate or null_predicate), int(cutoff), float(max_paths),
+            _func_name(modify_func))
+    if strategy is not None and strategy != GENERATE_SHORTEST:
+        # fingerprints of the default strategy are the same as before strategies existed
+        desc += (_func_name(strategy) if callable(strategy) else unicode(strategy),)
+    return unicode(hashlib.sha1(repr(desc).encode('utf-8')).hexdigest())
+
+cdef unicode _func_name(f):
+    if f is None:
+        return u''
+    return u'%s.%s' % (getattr(f, '__module__', ''), getattr(f, '__qualname__', getattr(f, '__name__', repr(f))))
+
+cpdef dict generate_paths_pairs(Topology topology, pairs, predicate=None, cutoff=None,
+                                max_paths=float('inf'), modify_func=None, raise_on_empty=True, strategy=None):
+    """
+    Generate simple paths for many (source, sink) pairs at once. A single
+    :py:class:`~sol.path.ksp.KShortestPaths` engine is shared by all pairs, which is much faster
+    than generating the paths of every pair separately.
+    Arguments are the same as for :py:func:`generate_paths_ie`.
+
+    :param pairs: an iterable of (source, sink) tuples
+    :return: a dictionary mapping (source, sink) tuples to lists of path objects
+    """
+    if cutoff is None:
+        cutoff = topology.diameter()
+    engine = topology.path_engine()
+    result = {}
+    for s, t in pairs:
+        result[s, t] = list(_filter_paths(s, t, _candidates(engine, s, t, cutoff, max_paths, strategy), topology,
+                                          predicate, max_paths, modify_func, raise_on_empty))
+    return result
+
+# Per-process state of the path generation workers, see generate_paths_tc
+_worker_args = None
+_worker_engine = None
+
+def _init_worker(Topology topology, predicate, cutoff, max_paths, modify_func, raise_on_empty, strategy):
+    """
+    Receive the topology and the generation options, once per worker process
+    """
+    global _worker_args, _worker_engine
+    _worker_args = (topology, predicate, max_paths, modify_func, raise_on_empty)
+    _worker_engine = (topology.path_engine(), cutoff, strategy)
+
+def _generate_shard(pairs):
+    """
+    Generate the paths of a shard of (source, sink) pairs, in a worker process
+    """
+    topology, predicate, max_paths, modify_func, raise_on_empty = _worker_args
+    engine, cutoff, strategy = _worker_engine
+    return [list(_filter_paths(s, t, _candidates(engine, s, t, cutoff, max_paths, strategy), topology, predicate,
+                               max_paths, modify_func, raise_on_empty)) for s, t in pairs]
+
 cpdef PPTC generate_paths_tc(Topology topology, traffic_classes, predicate=None,
                              cutoff=None, max_paths=float('inf'), modify_func=None,
-                             raise_on_empty=True, name=None):
+                             raise_on_empty=True, name=None, workers=None, PathCache cache=None, strategy=None):
     """
     Generate all simple paths for each traffic class
 
@@ -116,6 +367,23 @@ cpdef PPTC generate_paths_tc(Topology topology, traffic_classes, predicate=None,
     :param raise_on_empty: whether to raise an exception if no valid paths are detected.
         Set to True by default.
     :param name: name of the owner for these traffic classes (and paths)
+    :param workers: number of worker processes. If more than 1, (source, sink) pairs are split
+        between a pool of processes. The predicate and *modify_func* must then be picklable
+        (e.g., module-level functions)
+    :param cache: a :py:class:`~sol.path.pathcache.PathCache` to look the paths up in (and add them to).
+        Paths are always generated once per (source, sink) pair and shared by all traffic classes
+        with these endpoints, a cache also shares them between calls.
+    :param strategy: how candidate paths are generated, before the predicate and *modify_func* are applied:
+
+        * 'shortest' (or None): all simple paths, shortest first
+        * 'edge_disjoint' or 'node_disjoint': up to *max_paths* paths that do not share links (or nodes),
+          with the smallest total length (see :py:meth:`~sol.path.ksp.KShortestPaths.disjoint_paths`).
+          Useful on topologies with many equal-length paths (e.g., fat-trees), where the shortest paths
+          overlap a lot, so that a small *max_paths* still gives diverse paths
+        * 'diverse': short paths that overlap as little as possible, but may share links
+          (see :py:meth:`~sol.path.ksp.KShortestPaths.diverse_paths`)
+        * a callable that accepts a :py:class:`~sol.path.ksp.KShortestPaths` engine, the source, the sink,
+          the cutoff and *max_paths*, and returns an iterable of paths (lists of nodes)
     :raise NoPathsException: if no paths are found for a trafficClass
     :returns: a mapping of traffic classes to a list of path objects
     :rtype: dict
@@ -124,10 +392,115 @@ cpdef PPTC generate_paths_tc(Topology topology, traffic_classes, predicate=None,
         name = 'noname'
     if cutoff is None:
         cutoff = topology.diameter()
+    if cache is None:
+        cache = PathCache()
+    traffic_classes = list(traffic_classes)
+    # unique pairs, in the order of the traffic classes
+    pairs = list(OrderedDict.fromkeys([(t.src, t.dst) for t in traffic_classes]))
+    keys = {pair: cache.key(pair[0], pair[1], topology, predicate, cutoff, max_paths, modify_func, strategy)
+            for pair in pairs}
+    paths = {}
+    missing = []
+    for pair in pairs:
+        cached = cache.get(keys[pair])
+        if cached is None:
+            missing.append(pair)
+        else:
+            paths[pair] = cached
+    if missing:
+        if workers is not None and workers > 1:
+            generated = _generate_parallel(topology, missing, predicate, cutoff, max_paths, modify_func,
+                                           raise_on_empty, workers, strategy)
+        else:
+            # one engine for all pairs
+            engine = topology.path_engine()
+            generated = [list(_filter_paths(s, t, _candidates(engine, s, t, cutoff, max_paths, strategy), topology,
+                                            predicate, max_paths, modify_func, raise_on_empty)) for s, t in missing]
+        for pair, pair_paths in zip(missing, generated):
+            paths[pair] = pair_paths
+            cache.put(keys[pair], pair_paths)
     result = PPTC()
     for t in traffic_classes:
-        result.add(name, t, list(generate_paths_ie(t.src, t.dst, topology,
-                                                   predicate, cutoff,
-                                                   max_paths, modify_func,
-                                                   raise_on_empty)))
+        # every traffic class gets its own (cheap) copies of the shared paths
+        result.add(name, t, _copy_paths(t.src, t.dst, paths[t.src, t.dst], raise_on_empty))
     return result
+
+cpdef dict repair_paths(PPTC pptc, Topology topology, failed, predicate=None, cutoff=None, modify_func=None,
+                        quota=None):
+    """
+    Handle the failure of nodes or links without regenerating all paths.
+    The paths that use a failed element are found with the inverted index of the paths
+    (see :py:meth:`~sol.path.paths.PPTC.paths_using`) and masked. Replacement paths are then generated,
+    avoiding the failed elements, only for the traffic classes left with fewer paths than their quota,
+    and added after their existing paths (see :py:meth:`~sol.path.paths.PPTC.extend`).
+    The work done depends on the number of affected traffic classes, not on the size of the network.
+
+    :param pptc: the paths, modified in place
+    :param topology: the topology the paths were generated for. It is not modified: failed elements
+        are only hidden from the path generation
+    :param failed: failed node IDs and links, as (u, v) tuples. Links fail in both directions
+    :param predicate: predicate the replacement paths must satisfy, see :py:func:`generate_paths_ie`
+    :param cutoff: maximum length of the replacement paths. If None, there is no limit
+    :param modify_func: converts lists of nodes to path objects, see :py:func:`generate_paths_ie`
+    :param quota: number of (unmasked) paths every traffic class should have. If None, every affected
+        traffic class gets as many replacements as it lost paths
+    :return: a dictionary mapping the affected traffic classes to the number of added paths
+    """
+    nodes = set()
+    links = set()
+    for e in failed:
+        if isinstance(e, tuple):
+            links.add((e[0], e[1]))
+            links.add((e[1], e[0]))
+        else:
+            nodes.add(e)
+    affected = pptc.paths_using(list(nodes) + list(links))
+    engine = None
+    result = {}
+    for tc, pind in affected.items():
+        before = pptc.num_paths(tc)
+        mask = pptc.get_mask_array(tc)
+        mask[pind] = True
+        pptc.mask(tc, mask)
+        wanted = (before if quota is None else quota) - pptc.num_paths(tc)
+        result[tc] = 0
+        if wanted <= 0 or tc.src in nodes or tc.dst in nodes:
+            continue
+        if engine is None:
+            # only built if replacements are needed, over a view of the graph without the failed elements
+            engine = KShortestPaths(networkx.restricted_view(topology.get_graph(), nodes, links))
+        # surviving and previously masked paths are not added again
+        existing = {(tuple(numpy.asarray(p.nodes()).tolist()), p.mboxes()) for p in pptc.all_paths(tc)}
+        new_paths = []
+        for p in _filter_paths(tc.src, tc.dst, engine.paths(tc.src, tc.dst, cutoff), topology, predicate,
+                               float('inf'), modify_func, False):
+            key = (tuple(numpy.asarray(p.nodes()).tolist()), p.mboxes())
+            if key in existing:
+                continue
+            existing.add(key)
+            new_paths.append(p)
+            if len(new_paths) >= wanted:
+                break
+        result[tc] = pptc.extend(tc, new_paths)
+    return result
+
+cdef list _generate_parallel(Topology topology, list pairs, predicate, cutoff, max_paths, modify_func,
+                             raise_on_empty, int workers, strategy):
+    """
+    Generate paths for (source, sink) pairs in a pool of worker processes, see :py:func:`generate_paths_tc`
+
+    :return: lists of path objects, in the order of the pairs
+    """
+    # a few shards per worker, to balance the load
+    num_shards = min(len(pairs), workers * 4) or 1
+    shards = [pairs[i::num_shards] for i in range(num_shards)]
+    pool = Pool(workers, initializer=_init_worker,
+                initargs=(topology, predicate, cutoff, max_paths, modify_func, raise_on_empty, strategy))
+    try:
+        results = pool.map(_generate_shard, shards)
+    finally:
+        pool.terminate()
+    paths = {}
+    for shard, shard_paths in zip(shards, results):
+        paths.update(zip(shard, shard_paths))
+    return [paths[pair] for pair in pairs]
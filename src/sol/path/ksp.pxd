@@ -0,0 +1,32 @@
+# coding=utf-8
+cimport numpy
+from numpy cimport ndarray
+
+ctypedef numpy.int64_t INT_t
+
+cdef class KShortestPaths:
+    # node IDs, and the index of every node ID
+    cdef ndarray _nodes
+    cdef dict _index
+    # successors and predecessors of every node, in compressed (CSR) form
+    cdef INT_t[:] _indptr
+    cdef INT_t[:] _indices
+    cdef INT_t[:] _rindptr
+    cdef INT_t[:] _rindices
+    # breadth-first search trees by source, and hop distances by sink
+    cdef dict _trees
+    cdef dict _dists
+    # reusable search buffers: parents, hop counts, the queue (visited nodes, in order),
+    # nodes that cannot be visited, and the number of nodes visited by the last search
+    cdef INT_t[:] _parents
+    cdef INT_t[:] _levels
+    cdef INT_t[:] _queue
+    cdef numpy.uint8_t[:] _blocked
+    cdef Py_ssize_t _visited
+    # positions of the links in the CSR arrays, built when first needed
+    cdef dict _positions
+
+    cdef INT_t[:] _tree(self, int s)
+    cdef INT_t[:] _dist(self, int t)
+    cdef INT_t[:] _bfs(self, int s, int t, set skip, int depth)
+    cdef tuple _cheapest(self, int s, int t, double[:] weights)
@@ -0,0 +1,454 @@
+# coding=utf-8
+"""
+K-shortest simple paths (by number of hops), using Yen's algorithm over an array-backed adjacency
+"""
+
+import heapq
+
+import numpy
+from six import iteritems
+cimport numpy
+from numpy cimport ndarray
+
+# rounds without a new path after which diverse_paths stops
+cdef int _MAX_STALE = 16
+
+cdef class KShortestPaths:
+    """
+    Generates simple paths in the order of increasing length (number of hops), for many
+    (source, sink) pairs of the same graph.
+
+    The graph is converted to a compressed adjacency (CSR) once. The first path of every pair
+    comes from a breadth-first search tree that is shared by all pairs with the same source,
+    and hop distances to every sink (also computed once per sink) prune the spur searches of
+    Yen's algorithm that cannot produce paths within the cutoff.
+
+    .. note::
+        The engine is a snapshot, changes to the graph after it was created are not seen.
+
+    :param graph: a networkx (directed) graph
+    """
+    def __init__(self, graph):
+        self._nodes = numpy.array(list(graph.nodes()), dtype=numpy.int64)
+        self._index = {n: i for i, n in enumerate(self._nodes.tolist())}
+        cdef int n = self._nodes.size
+        # the same order of neighbors as networkx uses
+        succ = [[self._index[v] for v in graph.successors(u)] for u in self._nodes.tolist()]
+        pred = [[self._index[v] for v in graph.predecessors(u)] for u in self._nodes.tolist()]
+        self._indptr, self._indices = _csr(succ, n)
+        self._rindptr, self._rindices = _csr(pred, n)
+        self._trees = {}
+        self._dists = {}
+        # search buffers, reused by all searches. Only the nodes visited by the last search are reset
+        self._parents = numpy.full(n, -1, dtype=numpy.int64)
+        self._levels = numpy.zeros(n, dtype=numpy.int64)
+        self._queue = numpy.zeros(n, dtype=numpy.int64)
+        self._blocked = numpy.zeros(n, dtype=numpy.uint8)
+        self._visited = 0
+
+    cdef INT_t[:] _tree(self, int s):
+        """
+        Breadth-first search tree rooted at *s*, as an array of parents (-1 if unreachable)
+        """
+        parents = self._trees.get(s)
+        if parents is None:
+            parents = self._trees[s] = numpy.array(self._bfs(s, -1, None, -1))
+        return parents
+
+    cdef INT_t[:] _dist(self, int t):
+        """
+        Hop distance from every node to *t* (-1 if *t* is unreachable)
+        """
+        dist = self._dists.get(t)
+        if dist is not None:
+            return dist
+        dist = numpy.full(self._nodes.size, -1, dtype=numpy.int64)
+        cdef INT_t[:] d = dist
+        cdef INT_t[:] queue = numpy.empty(self._nodes.size, dtype=numpy.int64)
+        cdef Py_ssize_t head = 0, tail = 1, j
+        cdef INT_t u, v
+        queue[0] = t
+        d[t] = 0
+        while head < tail:
+            u = queue[head]
+            head += 1
+            for j in range(self._rindptr[u], self._rindptr[u + 1]):
+                v = self._rindices[j]
+                if d[v] < 0:
+                    d[v] = d[u] + 1
+                    queue[tail] = v
+                    tail += 1
+        self._dists[t] = dist
+        return dist
+
+    cdef INT_t[:] _bfs(self, int s, int t, set skip, int depth):
+        """
+        Breadth-first search from *s*, that does not visit the blocked nodes
+
+        :param t: stop as soon as *t* is reached (-1 to search the whole graph)
+        :param skip: neighbors of *s* that cannot be visited, or None
+        :param depth: maximum number of hops (-1 for no limit)
+        :return: an array of parents (-1 if not reached, *s* is its own parent).
+            The array is overwritten by the next search.
+        """
+        cdef INT_t[:] par = self._parents
+        cdef INT_t[:] lvl = self._levels
+        cdef INT_t[:] queue = self._queue
+        cdef numpy.uint8_t[:] blk = self._blocked
+        cdef Py_ssize_t head = 0, tail = 1, j
+        cdef INT_t u, v
+        for j in range(self._visited):
+            par[queue[j]] = -1
+        queue[0] = s
+        par[s] = s
+        lvl[s] = 0
+        while head < tail:
+            u = queue[head]
+            head += 1
+            if depth >= 0 and lvl[u] >= depth:
+                continue
+            for j in range(self._indptr[u], self._indptr[u + 1]):
+                v = self._indices[j]
+                if par[v] >= 0 or blk[v]:
+                    continue
+                if u == s and skip and v in skip:
+                    continue
+                par[v] = u
+                lvl[v] = lvl[u] + 1
+                queue[tail] = v
+                tail += 1
+                if v == t:
+                    head = tail
+                    break
+        self._visited = tail
+        return par
+
+    def paths(self, source, sink, cutoff=None):
+        """
+        Iterate over the simple paths from *source* to *sink*, shortest first.
+
+        :param source: the source node
+        :param sink: the sink node
+        :param cutoff: maximum length of the paths, in hops. If None, all simple paths are generated
+        :return: a generator over paths (lists of nodes)
+        """
+        cdef int s = self._index[source], t = self._index[sink]
+        # simple paths are never longer than the number of nodes
+        cdef int limit = -1 if cutoff is None or cutoff >= self._nodes.size else cutoff
+        cdef int i, j
+        if s == t:
+            yield [source]
+            return
+        first = _trace(self._tree(s), s, t)
+        if first is None or (limit >= 0 and len(first) - 1 > limit):
+            return
+        cdef INT_t[:] dist = self._dist(t)
+        nodes = self._nodes
+        found = [first]
+        # for every prefix (root) of a found path, the nodes that follow it
+        following = {}
+        _add_prefixes(following, first)
+        seen = {tuple(first)}
+        candidates = []
+        cdef long counter = 0
+        cdef numpy.uint8_t[:] blk = self._blocked
+        yield nodes[first].tolist()
+        while True:
+            prev = found[-1]
+            for i in range(len(prev) - 1):
+                spur = prev[i]
+                # the sink cannot be reached from the spur node, or not within the cutoff
+                if dist[spur] < 0 or (limit >= 0 and i + dist[spur] > limit):
+                    continue
+                root = prev[:i]
+                for j in root:
+                    blk[j] = 1
+                parents = self._bfs(spur, t, following[tuple(prev[:i + 1])], limit - i if limit >= 0 else -1)
+                for j in root:
+                    blk[j] = 0
+                spur_path = _trace(parents, spur, t)
+                if spur_path is None:
+                    continue
+                path = root + spur_path
+                key = tuple(path)
+                if key in seen:
+                    continue
+                seen.add(key)
+                heapq.heappush(candidates, (len(path), counter, path))
+                counter += 1
+            if not candidates:
+                return
+            length, _, path = heapq.heappop(candidates)
+            if limit >= 0 and length - 1 > limit:
+                return
+            found.append(path)
+            _add_prefixes(following, path)
+            yield nodes[path].tolist()
+
+    def disjoint_paths(self, source, sink, k=None, nodes=False, cutoff=None):
+        """
+        Up to *k* link-disjoint (or node-disjoint) paths with the smallest total length, found together
+        with Suurballe's algorithm: successive shortest paths in the residual graph, with unit capacities.
+        Unlike taking the shortest paths one by one, this never blocks the remaining paths with an
+        unlucky first choice.
+
+        :param source: the source node
+        :param sink: the sink node
+        :param k: maximum number of paths. If None, as many disjoint paths as exist
+        :param nodes: if True, paths do not share any nodes (except the source and the sink),
+            otherwise they only do not share links
+        :param cutoff: maximum length of the paths, in hops. Longer paths are dropped
+            once all paths are found
+        :return: a list of paths (lists of nodes), shortest first
+        """
+        cdef int s = self._index[source], t = self._index[sink]
+        cdef int n = self._nodes.size, m = self._indices.shape[0]
+        cdef int num_nodes = 2 * n if nodes else n
+        cdef int max_flows = n if k is None else k
+        cdef int flows = 0, src = s + n if nodes else s, head_pos = 0, tail_pos = 0
+        cdef INT_t u, v, e, j
+        if s == t:
+            return [[source]]
+        # forward edges: links first, from the out copy of a node to the in copy of the next one if nodes
+        # are split, and then the edges between the in and out copies (capacity 1, except at the endpoints)
+        ftails = numpy.repeat(numpy.arange(n, dtype=numpy.int64), numpy.diff(self._indptr))
+        fheads = numpy.asarray(self._indices).copy()
+        fcaps = numpy.ones(m, dtype=numpy.int64)
+        fcosts = numpy.ones(m, dtype=numpy.int64)
+        if nodes:
+            split = numpy.ones(n, dtype=numpy.int64)
+            split[[s, t]] = max_flows
+            ftails = numpy.concatenate([ftails + n, numpy.arange(n, dtype=numpy.int64)])
+            fheads = numpy.concatenate([fheads, numpy.arange(n, dtype=numpy.int64) + n])
+            fcaps = numpy.concatenate([fcaps, split])
+            fcosts = numpy.concatenate([fcosts, numpy.zeros(n, dtype=numpy.int64)])
+        # edge 2i is forward edge i, edge 2i + 1 is its reverse in the residual graph
+        tails = numpy.empty(2 * fcaps.size, dtype=numpy.int64)
+        tails[0::2] = ftails
+        tails[1::2] = fheads
+        heads = numpy.empty_like(tails)
+        heads[0::2] = fheads
+        heads[1::2] = ftails
+        caps = numpy.zeros_like(tails)
+        caps[0::2] = fcaps
+        costs = numpy.empty_like(tails)
+        costs[0::2] = fcosts
+        costs[1::2] = -fcosts
+        order = numpy.argsort(tails, kind='mergesort')
+        ptr = numpy.zeros(num_nodes + 1, dtype=numpy.int64)
+        ptr[1:] = numpy.cumsum(numpy.bincount(tails, minlength=num_nodes))
+        cdef INT_t[:] cap = caps, cost = costs, hd = heads, tl = tails, adj = order, adjptr = ptr
+        cdef INT_t[:] dist = numpy.empty(num_nodes, dtype=numpy.int64)
+        cdef INT_t[:] pred = numpy.empty(num_nodes, dtype=numpy.int64)
+        cdef INT_t[:] queue = numpy.empty(num_nodes + 1, dtype=numpy.int64)
+        cdef numpy.uint8_t[:] queued = numpy.zeros(num_nodes, dtype=numpy.uint8)
+        cdef INT_t inf = 2 * num_nodes + 1
+        while flows < max_flows:
+            # shortest path in the residual graph (Bellman-Ford with a queue, costs can be negative)
+            dist[:] = inf
+            dist[src] = 0
+            queue[0] = src
+            queued[src] = 1
+            head_pos, tail_pos = 0, 1
+            while head_pos != tail_pos:
+                u = queue[head_pos]
+                head_pos = (head_pos + 1) % (num_nodes + 1)
+                queued[u] = 0
+                for j in range(adjptr[u], adjptr[u + 1]):
+                    e = adj[j]
+                    v = hd[e]
+                    if cap[e] > 0 and dist[u] + cost[e] < dist[v]:
+                        dist[v] = dist[u] + cost[e]
+                        pred[v] = e
+                        if not queued[v]:
+                            queued[v] = 1
+                            queue[tail_pos] = v
+                            tail_pos = (tail_pos + 1) % (num_nodes + 1)
+            if dist[t] == inf:
+                break
+            v = t
+            while v != src:
+                e = pred[v]
+                cap[e] -= 1
+                cap[e ^ 1] += 1
+                v = tl[e]
+            flows += 1
+        # split the flow into paths: follow forward edges that carry flow (their reverse has capacity)
+        paths = []
+        for _ in range(flows):
+            path = [s]
+            u = src
+            while u != t:
+                for j in range(adjptr[u], adjptr[u + 1]):
+                    e = adj[j]
+                    if e % 2 == 0 and cap[e + 1] > 0:
+                        break
+                cap[e + 1] -= 1
+                u = hd[e]
+                # links lead to nodes of the path, the other edges only connect the copies of a node
+                if e < 2 * m:
+                    path.append(u)
+            paths.append(path)
+        paths.sort(key=len)
+        return [self._nodes[p].tolist() for p in paths if cutoff is None or len(p) - 1 <= cutoff]
+
+    def diverse_paths(self, source, sink, double penalty=1, cutoff=None):
+        """
+        Iterate over paths that share as few links as possible. Every path is a shortest path when every link
+        costs 1, plus *penalty* for every earlier path that used it, so paths spread out over the links
+        while staying short. The iteration ends when no new path is found for several rounds.
+
+        :param source: the source node
+        :param sink: the sink node
+        :param penalty: added to the cost of a link whenever a path uses it
+        :param cutoff: maximum length of the paths, in hops
+        :return: a generator over paths (lists of nodes)
+        """
+        cdef int s = self._index[source], t = self._index[sink]
+        cdef int stale = 0
+        if s == t:
+            yield [source]
+            return
+        weights = numpy.ones(self._indices.shape[0])
+        seen = set()
+        while stale < _MAX_STALE:
+            found = self._cheapest(s, t, weights)
+            if found is None:
+                return
+            path, edges = found
+            weights[edges] += penalty
+            key = tuple(path)
+            if key in seen or (cutoff is not None and len(path) - 1 > cutoff):
+                stale += 1
+                continue
+            seen.add(key)
+            stale = 0
+            yield self._nodes[path].tolist()
+
+    cdef tuple _cheapest(self, int s, int t, double[:] weights):
+        """
+        Dijkstra's search for the cheapest path from *s* to *t*, given the costs of the links (in CSR order)
+
+        :return: a tuple of the path (a list of node indices) and its links (positions in the CSR arrays),
+            or None if *t* cannot be reached
+        """
+        cdef Py_ssize_t j
+        cdef INT_t u, v
+        cdef double d
+        dist = numpy.full(self._nodes.size, numpy.inf)
+        cdef double[:] dst = dist
+        cdef INT_t[:] pred = numpy.full(self._nodes.size, -1, dtype=numpy.int64)
+        cdef INT_t[:] parent = numpy.full(self._nodes.size, -1, dtype=numpy.int64)
+        cdef numpy.uint8_t[:] done = numpy.zeros(self._nodes.size, dtype=numpy.uint8)
+        dst[s] = 0
+        heap = [(0.0, s)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if done[u]:
+                continue
+            done[u] = 1
+            if u == t:
+                break
+            for j in range(self._indptr[u], self._indptr[u + 1]):
+                v = self._indices[j]
+                if not done[v] and d + weights[j] < dst[v]:
+                    dst[v] = d + weights[j]
+                    pred[v] = j
+                    parent[v] = u
+                    heapq.heappush(heap, (dst[v], v))
+        if not done[t]:
+            return None
+        path = [t]
+        edges = []
+        v = t
+        while v != s:
+            edges.append(pred[v])
+            v = parent[v]
+            path.append(v)
+        path.reverse()
+        edges.reverse()
+        return path, edges
+
+    def cheapest_path(self, source, sink, link_costs, double hop_cost=0):
+        """
+        Find the cheapest path between two nodes, given the costs of (some of) the links
+
+        :param source: the source node
+        :param sink: the sink node
+        :param link_costs: a dictionary mapping links (tuples of nodes) to their (non-negative) costs.
+            Links that are missing cost nothing
+        :param hop_cost: added to the cost of every link, to prefer shorter paths among equally cheap ones.
+            Not included in the returned cost
+        :return: a tuple of the path (a list of nodes) and its cost, or None if *sink* cannot be reached
+        """
+        cdef int s = self._index[source], t = self._index[sink]
+        cdef Py_ssize_t j
+        if self._positions is None:
+            self._positions = {}
+            nodes = self._nodes.tolist()
+            for u in range(len(nodes)):
+                for j in range(self._indptr[u], self._indptr[u + 1]):
+                    self._positions[(nodes[u], nodes[self._indices[j]])] = j
+        costs = numpy.zeros(self._indices.shape[0])
+        for link, cost in iteritems(link_costs):
+            j = self._positions.get(link, -1)
+            if j >= 0:
+                costs[j] += cost
+        found = self._cheapest(s, t, costs + hop_cost)
+        if found is None:
+            return None
+        path, edges = found
+        return self._nodes[path].tolist(), costs[edges].sum()
+
+    def k_paths(self, pairs, k=None, cutoff=None):
+        """
+        Generate up to *k* shortest paths for every (source, sink) pair
+
+        :param pairs: an iterable of (source, sink) tuples
+        :param k: number of paths per pair. If None, all paths (within the cutoff) are generated
+        :param cutoff: maximum length of the paths, in hops
+        :return: a dictionary mapping pairs to lists of paths (lists of nodes)
+        """
+        cdef dict result = {}
+        for pair in pairs:
+            paths = []
+            if k is None or k > 0:
+                for p in self.paths(pair[0], pair[1], cutoff):
+                    paths.append(p)
+                    if k is not None and len(paths) >= k:
+                        break
+            result[tuple(pair)] = paths
+        return result
+
+
+cdef tuple _csr(list adjacency, int n):
+    """
+    Compressed (indptr, indices) form of an adjacency list
+    """
+    indptr = numpy.zeros(n + 1, dtype=numpy.int64)
+    indptr[1:] = numpy.cumsum([len(a) for a in adjacency])
+    indices = numpy.array([v for a in adjacency for v in a], dtype=numpy.int64)
+    return indptr, indices
+
+
+cdef _trace(INT_t[:] parents, int s, int t):
+    """
+    Follow the parents from *t* back to *s*
+
+    :return: the path as a list of node indices, or None if *t* was not reached
+    """
+    if parents[t] < 0:
+        return None
+    path = [t]
+    cdef INT_t u = t
+    while u != s:
+        u = parents[u]
+        path.append(u)
+    path.reverse()
+    return path
+
+
+cdef _add_prefixes(dict following, list path):
+    cdef int i
+    for i in range(len(path) - 1):
+        following.setdefault(tuple(path[:i + 1]), set()).add(path[i + 1])
@@ -0,0 +1,15 @@
+# coding=utf-8
+from sol.topology.topologynx cimport Topology
+
+cdef class PathCache:
+    # generated paths by key, least recently used first
+    cdef object _entries
+    cdef public long max_size
+    cdef public long hits
+    cdef public long misses
+
+    cpdef tuple key(self, int source, int sink, Topology topology, predicate, cutoff, max_paths, modify_func,
+                    strategy=*)
+    cpdef get(self, tuple key)
+    cpdef put(self, tuple key, list paths)
+    cpdef clear(self)
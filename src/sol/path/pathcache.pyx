@@ -0,0 +1,83 @@
+# coding=utf-8
+"""
+Memoization of generated paths, shared by traffic classes with the same ingress/egress pair
+"""
+
+from collections import OrderedDict
+
+from sol.topology.topologynx cimport Topology
+
+cdef class PathCache:
+    """
+    Caches the paths generated for (source, sink) pairs, so that traffic classes (or repeated calls)
+    with the same endpoints and generation options do not enumerate the same paths again.
+
+    Paths are keyed by the endpoints, the predicate and modifier functions (by identity), the cutoff,
+    the maximum number of paths, the generation strategy, and the topology with its
+    :py:meth:`~sol.topology.topologynx.Topology.version`.
+    Cached paths are never handed out directly, callers get cheap copies
+    (see :py:meth:`~sol.path.paths.Path.copy`) that share the node arrays.
+
+    Usage::
+
+        cache = PathCache()
+        pptc = generate_paths_tc(topo, tcs, null_predicate, cache=cache)
+
+    :param max_size: maximum number of (source, sink) entries. The least recently used entries
+        are evicted first.
+    """
+
+    def __init__(self, max_size=100000):
+        self._entries = OrderedDict()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    cpdef tuple key(self, int source, int sink, Topology topology, predicate, cutoff, max_paths, modify_func,
+                    strategy=None):
+        """
+        :return: the cache key of the paths between *source* and *sink*, see :py:func:`~sol.path.generate.generate_paths_ie`
+            for the other arguments
+        """
+        return source, sink, predicate, cutoff, max_paths, modify_func, strategy, topology, topology.version()
+
+    cpdef get(self, tuple key):
+        """
+        :param key: the key, see :py:meth:`key`
+        :return: the cached list of path objects (do not modify them), or None if the paths are not cached
+        """
+        paths = self._entries.pop(key, None)
+        if paths is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # most recently used last
+        self._entries[key] = paths
+        return paths
+
+    cpdef put(self, tuple key, list paths):
+        """
+        Cache generated paths
+
+        :param key: the key, see :py:meth:`key`
+        :param paths: a list of path objects
+        """
+        self._entries.pop(key, None)
+        self._entries[key] = paths
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    cpdef clear(self):
+        """
+        Remove all cached paths
+        """
+        self._entries.clear()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return u'PathCache({} entries, {} hits, {} misses)'.format(len(self._entries), self.hits, self.misses)
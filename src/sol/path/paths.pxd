@@ -5,11 +5,44 @@ import numpy
 from cpython cimport bool
 from sol.topology.traffic cimport TrafficClass
 
+cdef class PathStore:
+    # nodes of all paths, in compressed (CSR) form: nodes of path i are _nodes[_offsets[i]:_offsets[i + 1]]
+    cdef public numpy.ndarray _nodes
+    cdef public numpy.ndarray _offsets
+    # flow fraction and owner traffic class ID of every path
+    cdef public numpy.ndarray _fractions
+    cdef public numpy.ndarray _owners
+    # middleboxes used by every path, in the same form, and whether a path has middleboxes
+    # (is a PathWithMbox). None until the first path with middleboxes is added
+    cdef public numpy.ndarray _mboxes
+    cdef public numpy.ndarray _mbox_offsets
+    cdef public numpy.ndarray _with_mbox
+    # number of paths, nodes and middleboxes stored (arrays have spare capacity)
+    cdef readonly Py_ssize_t size
+    cdef Py_ssize_t _num_nodes
+    cdef Py_ssize_t _num_mboxes
+    # inverted index from nodes and links to rows, built as paths are looked up
+    cdef dict _index
+
+    cpdef Py_ssize_t append(self, paths, int owner=*) except -1
+    cpdef path(self, Py_ssize_t row)
+    cpdef numpy.ndarray nodes(self, Py_ssize_t row)
+    cpdef numpy.ndarray fractions(self)
+    cpdef numpy.ndarray owners(self)
+    cpdef numpy.ndarray rows_using(self, nodes=*, links=*)
+    cdef list _lookup(self, mode, numpy.ndarray keys)
+    cdef tuple _gather(self, numpy.ndarray rows, bool mboxes)
+    cdef _reserve(self, Py_ssize_t paths, Py_ssize_t nodes, Py_ssize_t mboxes)
+    cdef _enable_mboxes(self)
+
 cdef class Path:
     # cdef int _ID
     cdef public double _flowFraction
     cdef public numpy.ndarray _nodes
     cdef _links
+    # the store this path is a view of (None for standalone paths), and its row in the store
+    cdef PathStore _store
+    cdef Py_ssize_t _row
 
     cpdef int ingress(self)
     cpdef int egress(self)
@@ -31,18 +64,51 @@ cdef class PathWithMbox(Path):
     cpdef dict encode(self)
     cpdef bool uses_box(self, node)
 
+cdef class _PathSet:
+    # paths of one traffic class: a range of rows in a store, and a mask
+    cdef readonly PathStore store
+    cdef readonly Py_ssize_t start
+    cdef readonly Py_ssize_t stop
+    cdef public mask
+
+    cpdef numpy.ndarray rows(self, all=*)
+    cpdef numpy.ndarray views(self, all=*)
+    cpdef Py_ssize_t count(self, all=*)
+    cpdef numpy.ndarray mask_array(self)
+    cdef _extend(self, paths, int owner)
+    cpdef _PathSet copy(self)
+
+cdef class PathTable:
+    # IDs of the interned paths, by their nodes and middleboxes, and the paths themselves
+    cdef dict _ids
+    cdef readonly PathStore store
+
+    cpdef Py_ssize_t intern(self, path) except -1
+    cpdef numpy.ndarray intern_rows(self, list stores, list rows)
+    cpdef path(self, Py_ssize_t pid)
+
 cdef class PPTC:
+    # path sets by traffic class
     cdef public _data
     cdef public _tcindex
     cdef public _name_to_tcs
     cdef public _tcowner
+    # cached path/element incidence matrices
+    cdef public dict _incidence
+    # the store new paths are added to
+    cdef PathStore _store
+    # the table paths are interned in, created when first needed
+    cdef PathTable _table
     cpdef add(self, name, TrafficClass tc, paths)
     cpdef tcs(self, name= *)
     cpdef paths(self, TrafficClass tc)
     cpdef all_paths(self, TrafficClass tc)
+    cpdef set_flow_fractions(self, TrafficClass tc, numpy.ndarray fractions)
+    cpdef numpy.ndarray flow_fractions(self, TrafficClass tc, all=*)
     cpdef PPTC pptc(self, name)
     cpdef mask(self, TrafficClass tc, mask)
     cpdef get_mask(self, TrafficClass tc)
+    cpdef numpy.ndarray get_mask_array(self, TrafficClass tc)
     cpdef unmask(self, TrafficClass tc)
     cpdef unmaskall(self)
     cpdef clear_masks(self)
@@ -51,6 +117,19 @@ cdef class PPTC:
     cpdef TrafficClass tc_byid(self, int tcid)
     cpdef int max_paths(self, all=*)
     cpdef int num_tcs(self)
+    cpdef numpy.ndarray volumes(self)
     cpdef int total_paths(self)
     cpdef int num_paths(self, TrafficClass tc, all=*)
     cpdef bool empty(self)
+    cpdef dict paths_using(self, elements)
+    cpdef Py_ssize_t extend(self, TrafficClass tc, paths) except -1
+    cdef _invalidate(self, bint masks_only=*)
+    cdef _mask_state(self)
+    cdef tuple _row_state(self)
+    cdef _cache_get(self, key, all)
+    cdef _cache_put(self, key, all, value)
+    cpdef path_index(self, all=*)
+    cpdef PathTable path_table(self)
+    cpdef numpy.ndarray path_ids(self, all=*)
+    cpdef incidence(self, mode=*, int num_nodes=*, all=*)
+    cpdef list save(self, fname, fingerprint=*)
@@ -4,14 +4,21 @@
     Contains implementations of SOL Path objects
 """
 
+import json
+import os
+
 import numpy
+from scipy.sparse import coo_matrix
 from cpython cimport bool
 from six import itervalues, iterkeys, iteritems
 from sol.topology.traffic cimport TrafficClass
 from sol.utils.ph import listeq
 
 from paths cimport Path, PathWithMbox
-from sol.utils.const import ERR_UNKNOWN_TYPE
+from sol.topology.traffic import TrafficClass
+from sol.utils.const import ERR_UNKNOWN_TYPE, ERR_UNKNOWN_MODE, ERR_STALE_PATHS, ERR_PATHS_TC, NODES, LINKS, \
+    MBOXES
+from sol.utils.exceptions import StalePathsException
 
 # noinspection PyClassicStyleClass
 cdef class Path:
@@ -25,7 +32,8 @@ cdef class Path:
         """
         self._nodes = numpy.array(nodes)
         self._flowFraction = flow_fraction
-        self._links = self._compute_links()
+        # computed when first needed
+        self._links = None
 
     cpdef int ingress(self):
         """
@@ -59,6 +67,8 @@ cdef class Path:
         """
         :return: the number of flows on this path.
         """
+        if self._store is not None:
+            return self._store._fractions[self._row]
         return self._flowFraction
 
     cpdef set_flow_fraction(self, double f):
@@ -67,13 +77,18 @@ cdef class Path:
 
         :param f: the new number of flows
         """
-        self._flowFraction = f
+        if self._store is not None:
+            self._store._fractions[self._row] = f
+        else:
+            self._flowFraction = f
 
     cpdef links(self):
         """
         :return: Return an iterator over the links in this path
         """
         # return zip(self._nodes, self._nodes[1:])
+        if self._links is None:
+            self._links = self._compute_links()
         return self._links
 
     # cpdef int get_id(self):
@@ -102,7 +117,7 @@ cdef class Path:
         """
         return {u'type': u'Path',
                 u'nodes': self._nodes.tolist(),
-                u'flow_fraction': self._flowFraction}
+                u'flow_fraction': self.flow_fraction()}
 
     @staticmethod
     def decode(dict d):
@@ -130,7 +145,7 @@ cdef class Path:
 
     def __repr__(self):
         return u"Path(nodes={}, flowFraction={})".format(str(self._nodes),
-                                                         self._flowFraction)
+                                                         self.flow_fraction())
 
     # noinspection PyProtectedMember
     def __richcmp__(Path self, other not None, int op):
@@ -143,7 +158,8 @@ cdef class Path:
             raise TypeError
 
     def __hash__(self):
-        return hash(self._nodes)
+        # stable across processes
+        return hash(tuple(self._nodes.tolist()))
 
     def copy(self):
         """ Create a copy of this path
@@ -152,11 +168,19 @@ cdef class Path:
 
             The copy will be shallow, without a deep copy of the nodes array
         """
-        return Path(self._nodes, self._flowFraction)
+        cdef Path p = Path.__new__(Path)
+        p._nodes = self._nodes
+        p._links = self._links
+        p._flowFraction = self.flow_fraction()
+        return p
 
     def __copy__(self):
         return self.copy()
 
+    def __reduce__(self):
+        # views are pickled as standalone paths, without their store
+        return Path, (self._nodes, self.flow_fraction())
+
 # noinspection PyClassicStyleClass
 cdef class PathWithMbox(Path):
     """
@@ -190,7 +214,7 @@ cdef class PathWithMbox(Path):
         :return: dictionary representation of this path
         """
         return {u'nodes': self._nodes.tolist(),
-                u'flow_fraction': self._flowFraction,
+                u'flow_fraction': self.flow_fraction(),
                 u'use_mboxes': self.useMBoxes,
                 u'type': u'PathWithMBox'}
 
@@ -214,9 +238,12 @@ cdef class PathWithMbox(Path):
         else:
             raise TypeError
 
+    def __hash__(self):
+        return hash((tuple(self._nodes.tolist()), tuple(self.useMBoxes)))
+
     def __repr__(self):
         return u"PathWithMbox(nodes={}, useMBoxes={} flowFraction={})". \
-            format(str(self._nodes), self.useMBoxes, self._flowFraction)
+            format(str(self._nodes), self.useMBoxes, self.flow_fraction())
 
     def copy(self):
         """ Create a copy of this path
@@ -225,17 +252,475 @@ cdef class PathWithMbox(Path):
 
             The copy will be shallow, without a deep copy of the nodes array
         """
-        return PathWithMbox(self._nodes, self.useMBoxes, self._flowFraction)
+        cdef PathWithMbox p = PathWithMbox.__new__(PathWithMbox)
+        p._nodes = self._nodes
+        p._links = self._links
+        p._flowFraction = self.flow_fraction()
+        p.useMBoxes = list(self.useMBoxes)
+        return p
 
     def __copy__(self):
         return self.copy()
 
+    def __reduce__(self):
+        return PathWithMbox, (self._nodes, self.useMBoxes, self.flow_fraction())
+
+cdef class PathStore:
+    """
+    Compact, columnar storage of many paths.
+
+    Nodes of all paths are kept in a single array, with the offsets of every path
+    (a compressed sparse row layout), next to a column of flow fractions and the ID of the traffic
+    class that owns every path. Middleboxes used by :py:class:`PathWithMbox` paths are stored the same way.
+    :py:class:`Path` objects are only created on demand (see :py:meth:`path`), as lightweight views
+    that share the node array and read (and write) their flow fraction from the store.
+
+    Paths can only be appended to a store, rows never change once added.
+
+    :param capacity: number of paths to allocate space for, the store grows as needed
+    """
+
+    def __init__(self, Py_ssize_t capacity=16):
+        capacity = max(capacity, 1)
+        self._nodes = numpy.zeros(4 * capacity, dtype=numpy.int64)
+        self._offsets = numpy.zeros(capacity + 1, dtype=numpy.int64)
+        self._fractions = numpy.zeros(capacity)
+        self._owners = numpy.full(capacity, -1, dtype=numpy.int64)
+        self._mboxes = None
+        self._mbox_offsets = None
+        self._with_mbox = None
+        self.size = 0
+        self._num_nodes = 0
+        self._num_mboxes = 0
+
+    cpdef Py_ssize_t append(self, paths, int owner=-1) except -1:
+        """
+        Add paths to the store
+
+        :param paths: an iterable of path objects
+        :param owner: ID of the traffic class that owns the paths
+        :return: the row of the first added path. Paths are added to consecutive rows.
+        """
+        cdef Py_ssize_t start = self.size, n, total, mtotal
+        paths = list(paths)
+        n = len(paths)
+        if n == 0:
+            return start
+        nodes = [numpy.asarray(p.nodes(), dtype=numpy.int64) for p in paths]
+        lens = numpy.array([a.size for a in nodes], dtype=numpy.int64)
+        total = lens.sum()
+        with_mbox = numpy.array([isinstance(p, PathWithMbox) for p in paths], dtype=numpy.uint8)
+        if self._with_mbox is None and with_mbox.any():
+            self._enable_mboxes()
+        mboxes = [numpy.asarray(p.mboxes(), dtype=numpy.int64) for p in paths] \
+            if self._with_mbox is not None else []
+        mlens = numpy.array([a.size for a in mboxes], dtype=numpy.int64)
+        mtotal = mlens.sum()
+        self._reserve(n, total, mtotal)
+
+        self._nodes[self._num_nodes:self._num_nodes + total] = numpy.concatenate(nodes)
+        self._offsets[start + 1:start + n + 1] = self._num_nodes + numpy.cumsum(lens)
+        self._fractions[start:start + n] = [p.flow_fraction() for p in paths]
+        self._owners[start:start + n] = owner
+        if self._with_mbox is not None:
+            if mtotal:
+                self._mboxes[self._num_mboxes:self._num_mboxes + mtotal] = numpy.concatenate(mboxes)
+            self._mbox_offsets[start + 1:start + n + 1] = self._num_mboxes + numpy.cumsum(mlens)
+            self._with_mbox[start:start + n] = with_mbox
+            self._num_mboxes += mtotal
+        self._num_nodes += total
+        self.size += n
+        return start
+
+    @staticmethod
+    def from_arrays(nodes, offsets, fractions, owners, mboxes=None, mbox_offsets=None, with_mbox=None):
+        """
+        Create a store over existing arrays (e.g., memory-mapped ones), without copying them.
+        Arrays are replaced by in-memory copies if more paths are added.
+
+        :param nodes: nodes of all paths
+        :param offsets: offsets of the paths' nodes, one more than the number of paths
+        :param fractions: flow fractions of the paths, must be writeable
+        :param owners: IDs of the traffic classes that own the paths
+        :param mboxes: middleboxes of all paths, or None
+        :param mbox_offsets: offsets of the paths' middleboxes, or None
+        :param with_mbox: whether every path has middleboxes, or None
+        :return: a new store
+        """
+        cdef PathStore store = PathStore.__new__(PathStore)
+        store._nodes = nodes
+        store._offsets = offsets
+        store._fractions = fractions
+        store._owners = owners
+        store._mboxes = mboxes
+        store._mbox_offsets = mbox_offsets
+        store._with_mbox = with_mbox
+        store.size = offsets.size - 1
+        store._num_nodes = offsets[store.size]
+        store._num_mboxes = 0 if mbox_offsets is None else mbox_offsets[store.size]
+        return store
+
+    cpdef path(self, Py_ssize_t row):
+        """
+        :param row: the row of the path
+        :return: a :py:class:`Path` (or :py:class:`PathWithMbox`) view of the stored path
+        """
+        cdef Path p
+        cdef PathWithMbox pm
+        if row < 0 or row >= self.size:
+            raise IndexError(row)
+        if self._with_mbox is not None and self._with_mbox[row]:
+            pm = PathWithMbox.__new__(PathWithMbox)
+            pm.useMBoxes = self._mboxes[self._mbox_offsets[row]:self._mbox_offsets[row + 1]].tolist()
+            p = pm
+        else:
+            p = Path.__new__(Path)
+        p._nodes = self._nodes[self._offsets[row]:self._offsets[row + 1]]
+        p._store = self
+        p._row = row
+        return p
+
+    cpdef numpy.ndarray nodes(self, Py_ssize_t row):
+        """
+        :return: nodes of the path in a given row (a view of the store, do not modify)
+        """
+        return self._nodes[self._offsets[row]:self._offsets[row + 1]]
+
+    cpdef numpy.ndarray fractions(self):
+        """
+        :return: flow fractions of all stored paths (a view of the store)
+        """
+        return self._fractions[:self.size]
+
+    cpdef numpy.ndarray owners(self):
+        """
+        :return: IDs of the traffic classes that own the stored paths
+        """
+        return self._owners[:self.size]
+
+    cdef tuple _gather(self, numpy.ndarray rows, bool mboxes):
+        """
+        Nodes (or middleboxes) of many paths at once
+
+        :return: a tuple of the number of elements of every path, and the elements of all paths
+        """
+        offsets = self._mbox_offsets if mboxes else self._offsets
+        values = self._mboxes if mboxes else self._nodes
+        if offsets is None:
+            return numpy.zeros(rows.size, dtype=numpy.int64), numpy.zeros(0, dtype=numpy.int64)
+        starts = offsets[rows]
+        lens = offsets[rows + 1] - starts
+        # position of every element: the start of its path, plus its index within the path
+        index = numpy.repeat(starts - numpy.cumsum(lens) + lens, lens) + numpy.arange(lens.sum())
+        return lens, values[index]
+
+    cpdef numpy.ndarray rows_using(self, nodes=(), links=()):
+        """
+        Rows of the paths that use any of the given nodes or links, found with an inverted index
+        from elements to rows. The index is built when first needed, and only the paths added
+        since the last lookup are indexed by later lookups.
+
+        :param nodes: node IDs
+        :param links: links, as (u, v) tuples
+        :return: a sorted array of rows
+        """
+        found = [numpy.zeros(0, dtype=numpy.int64)]
+        if len(nodes):
+            found.extend(self._lookup(NODES, numpy.asarray(list(nodes), dtype=numpy.int64)))
+        if len(links):
+            pairs = numpy.asarray(list(links), dtype=numpy.int64).reshape(-1, 2)
+            found.extend(self._lookup(LINKS, pairs[:, 0] * _LINK_SCALE + pairs[:, 1]))
+        return numpy.unique(numpy.concatenate(found))
+
+    cdef list _lookup(self, mode, numpy.ndarray keys):
+        """
+        Look up elements in the inverted index, indexing new paths first
+
+        :param mode: either 'nodes' or 'links'
+        :param keys: node IDs, or link keys (see :py:func:`_link_columns`)
+        :return: a list of arrays of rows
+        """
+        if self._index is None:
+            self._index = {}
+        # chunks of (number of indexed rows, sorted elements, rows of the elements)
+        chunks = self._index.setdefault(mode, [])
+        cdef Py_ssize_t indexed = chunks[-1][0] if chunks else 0
+        if indexed < self.size:
+            rows = numpy.arange(indexed, self.size, dtype=numpy.int64)
+            lens, cols = self._gather(rows, False)
+            if mode == LINKS:
+                lens, cols = _link_columns(lens, cols, _LINK_SCALE)
+            order = numpy.argsort(cols, kind='mergesort')
+            chunks.append((self.size, cols[order], rows.repeat(lens)[order]))
+            if len(chunks) > _MAX_CHUNKS:
+                cols = numpy.concatenate([c[1] for c in chunks])
+                rows = numpy.concatenate([c[2] for c in chunks])
+                order = numpy.argsort(cols, kind='mergesort')
+                chunks[:] = [(self.size, cols[order], rows[order])]
+        res = []
+        for _, cols, rows in chunks:
+            lo = numpy.searchsorted(cols, keys, u'left')
+            hi = numpy.searchsorted(cols, keys, u'right')
+            for a, b in zip(lo.tolist(), hi.tolist()):
+                if b > a:
+                    res.append(rows[a:b])
+        return res
+
+    cdef _reserve(self, Py_ssize_t paths, Py_ssize_t nodes, Py_ssize_t mboxes):
+        """
+        Make room for more paths, nodes and middleboxes, doubling the arrays when they are full
+        """
+        cdef Py_ssize_t capacity
+        if self.size + paths > self._fractions.size:
+            capacity = max(2 * self._fractions.size, self.size + paths)
+            self._offsets = _grow(self._offsets, capacity + 1)
+            self._fractions = _grow(self._fractions, capacity)
+            self._owners = _grow(self._owners, capacity)
+            if self._with_mbox is not None:
+                self._mbox_offsets = _grow(self._mbox_offsets, capacity + 1)
+                self._with_mbox = _grow(self._with_mbox, capacity)
+        if self._num_nodes + nodes > self._nodes.size:
+            self._nodes = _grow(self._nodes, max(2 * self._nodes.size, self._num_nodes + nodes))
+        if self._mboxes is not None and self._num_mboxes + mboxes > self._mboxes.size:
+            self._mboxes = _grow(self._mboxes, max(2 * self._mboxes.size, self._num_mboxes + mboxes))
+
+    cdef _enable_mboxes(self):
+        """
+        Add the middlebox columns. Paths already in the store have no middleboxes.
+        """
+        self._mboxes = numpy.zeros(self._offsets.size, dtype=numpy.int64)
+        self._mbox_offsets = numpy.zeros(self._offsets.size, dtype=numpy.int64)
+        self._with_mbox = numpy.zeros(self._fractions.size, dtype=numpy.uint8)
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return u'PathStore({} paths, {} nodes)'.format(self.size, self._num_nodes)
+
+# links are indexed by u * _LINK_SCALE + v, which does not depend on the number of nodes
+cdef long long _LINK_SCALE = 1 << 32
+# inverted index chunks are merged once there are more than this many
+cdef int _MAX_CHUNKS = 8
+
+cdef tuple _link_columns(numpy.ndarray lens, numpy.ndarray vals, long long scale):
+    """
+    Links of many paths at once, from their nodes (see :py:meth:`PathStore._gather`)
+
+    :param scale: links (u, v) are numbered *u * scale + v*
+    :return: a tuple of the number of links of every path, and the link numbers of all paths
+    """
+    # consecutive nodes, except across the boundaries of paths
+    within = numpy.ones(vals.size, dtype=bool)
+    within[(numpy.cumsum(lens) - 1)[lens > 0]] = False
+    return numpy.maximum(lens - 1, 0), (vals[:-1] * scale + vals[1:])[within[:-1]]
+
+cdef numpy.ndarray _grow(numpy.ndarray a, Py_ssize_t size):
+    """
+    Copy of an array, padded with zeros to a given size
+    """
+    res = numpy.zeros(size, dtype=a.dtype)
+    res[:a.size] = a
+    return res
+
+cdef class _PathSet:
+    """
+    Paths of a single traffic class: a range of rows of a :py:class:`PathStore`, and a mask.
+    Path sets are shared between PPTC objects, so are their masks.
+    """
+
+    def __init__(self, PathStore store, Py_ssize_t start, Py_ssize_t stop, mask=numpy.ma.nomask):
+        self.store = store
+        self.start = start
+        self.stop = stop
+        self.mask = mask
+
+    cpdef numpy.ndarray mask_array(self):
+        """
+        :return: the mask as a boolean array, with an element for every path
+        """
+        if self.mask is numpy.ma.nomask:
+            return numpy.zeros(self.stop - self.start, dtype=bool)
+        return self.mask
+
+    cpdef numpy.ndarray rows(self, all=False):
+        """
+        :return: store rows of the (unmasked, unless *all* is True) paths
+        """
+        rows = numpy.arange(self.start, self.stop, dtype=numpy.int64)
+        if all or self.mask is numpy.ma.nomask:
+            return rows
+        return rows[~self.mask]
+
+    cpdef numpy.ndarray views(self, all=False):
+        """
+        :return: an object array of path views (see :py:meth:`PathStore.path`)
+        """
+        rows = self.rows(all)
+        res = numpy.empty(rows.size, dtype=object)
+        for i, r in enumerate(rows.tolist()):
+            res[i] = self.store.path(r)
+        return res
+
+    cpdef Py_ssize_t count(self, all=False):
+        """
+        :return: number of (unmasked, unless *all* is True) paths
+        """
+        if all or self.mask is numpy.ma.nomask:
+            return self.stop - self.start
+        return self.stop - self.start - numpy.count_nonzero(self.mask)
+
+    cdef _extend(self, paths, int owner):
+        """
+        Add paths after the existing ones. The path set is updated in place, so the paths are
+        added to every PPTC that shares it. If the path set does not end the store, its existing
+        paths are copied to the end of the store first.
+        """
+        paths = list(paths)
+        if not paths:
+            return
+        mask = self.mask_array()
+        if self.stop != self.store.size:
+            # flow fractions of the old rows are not shared with the copies
+            self.start = self.store.append([self.store.path(r) for r in range(self.start, self.stop)], owner)
+            self.stop = self.store.size
+        self.store.append(paths, owner)
+        self.stop = self.store.size
+        if self.mask is not numpy.ma.nomask:
+            self.mask = numpy.concatenate([mask, numpy.zeros(len(paths), dtype=bool)])
+
+    cpdef _PathSet copy(self):
+        """
+        :return: a path set over the same rows, with a copy of the mask
+        """
+        return _PathSet(self.store, self.start, self.stop,
+                        self.mask if self.mask is numpy.ma.nomask else self.mask.copy())
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __repr__(self):
+        return repr(numpy.ma.array(self.views(True), mask=self.mask))
+
+cdef class PathTable:
+    """
+    Interns paths: every distinct path (the same nodes, the same middleboxes, and the same type)
+    gets a small integer ID, so paths that different traffic classes (or applications) hold
+    can be recognized as the same path, and work that only depends on the path is done once.
+
+    Interned paths are kept in a :py:class:`PathStore` (IDs are its rows).
+    """
+
+    def __init__(self):
+        self._ids = {}
+        self.store = PathStore()
+
+    cpdef Py_ssize_t intern(self, path) except -1:
+        """
+        :param path: a path object
+        :return: the ID of the path, a new one if the path was not interned before
+        """
+        key = _path_key(path)
+        pid = self._ids.get(key)
+        if pid is None:
+            pid = self._ids[key] = self.store.append([path])
+        return pid
+
+    cpdef numpy.ndarray intern_rows(self, list stores, list rows):
+        """
+        Intern many stored paths at once. Paths are deduplicated with numpy first,
+        so only distinct paths are looked up in the table.
+
+        :param stores: a list of path stores
+        :param rows: rows of the paths, an array for every store
+        :return: the IDs of the paths, in the order of the stores and rows
+        """
+        cdef PathStore store
+        empty = numpy.zeros(0, dtype=numpy.int64)
+        lens, vals, mlens, mvals, with_mbox = [empty], [empty], [empty], [empty], [empty]
+        for store, r in zip(stores, rows):
+            for res, gathered in ((lens, vals), (mlens, mvals)):
+                l, v = store._gather(r, res is mlens)
+                res.append(l)
+                gathered.append(v)
+            with_mbox.append(numpy.zeros(r.size, dtype=numpy.int64) if store._with_mbox is None
+                             else store._with_mbox[r].astype(numpy.int64))
+        which = numpy.concatenate([numpy.full(r.size, i, dtype=numpy.int64) for i, r in enumerate(rows)] + [empty])
+        flat_rows = numpy.concatenate(rows + [empty])
+        if flat_rows.size == 0:
+            return empty
+        table = numpy.hstack([numpy.concatenate(with_mbox)[:, None],
+                              _pad(numpy.concatenate(lens), numpy.concatenate(vals)),
+                              _pad(numpy.concatenate(mlens), numpy.concatenate(mvals))])
+        # rows of the table as single (byte string) values, much faster to sort than rows
+        flat = numpy.ascontiguousarray(table).view(numpy.dtype((numpy.void, table.shape[1] * 8))).ravel()
+        _, first, inverse = numpy.unique(flat, return_index=True, return_inverse=True)
+        ids = numpy.empty(first.size, dtype=numpy.int64)
+        width = 1 + _pad_width(lens)
+        new_paths = []
+        for i, (values, f) in enumerate(zip(table[first].tolist(), first.tolist())):
+            key = (tuple([n for n in values[1:width] if n >= 0]),
+                   tuple([n for n in values[width:] if n >= 0]) if values[0] else None)
+            pid = self._ids.get(key)
+            if pid is None:
+                pid = self._ids[key] = self.store.size + len(new_paths)
+                new_paths.append(stores[which[f]].path(flat_rows[f]))
+            ids[i] = pid
+        self.store.append(new_paths)
+        return ids[inverse.ravel()]
+
+    cpdef path(self, Py_ssize_t pid):
+        """
+        :return: the path with a given ID (a view of the table's store)
+        """
+        return self.store.path(pid)
+
+    def __contains__(self, path):
+        return _path_key(path) in self._ids
+
+    def __len__(self):
+        return self.store.size
+
+    def __repr__(self):
+        return u'PathTable({} paths)'.format(self.store.size)
+
+cdef tuple _path_key(path):
+    """
+    Hashable identity of a path, see :py:class:`PathTable`
+    """
+    return (tuple(numpy.asarray(path.nodes()).tolist()),
+            tuple(path.mboxes()) if isinstance(path, PathWithMbox) else None)
+
+cdef Py_ssize_t _pad_width(list lens):
+    """
+    Number of columns :py:func:`_pad` uses for the concatenation of arrays of element counts
+    """
+    return max([l.max() for l in lens if l.size] or [0]) + 1
+
+cdef numpy.ndarray _pad(numpy.ndarray lens, numpy.ndarray vals):
+    """
+    Elements of many paths as the rows of a matrix, padded with -1 (and at least one column of padding)
+    """
+    res = numpy.full((lens.size, (lens.max() if lens.size else 0) + 1), -1, dtype=numpy.int64)
+    starts = numpy.cumsum(lens) - lens
+    res[numpy.arange(lens.size).repeat(lens), numpy.arange(vals.size) - starts.repeat(lens)] = vals
+    return res
+
 cdef class PPTC:
+    """
+    Paths per traffic class.
+
+    Paths are kept in a :py:class:`PathStore`, and path objects are created on demand
+    when :py:meth:`paths` or :py:meth:`all_paths` are called.
+    """
     def __init__(self):
         self._data = dict()
         self._tcindex = dict()
         self._tcowner = dict()
         self._name_to_tcs = dict()
+        self._incidence = dict()
+        self._store = None
+        self._table = None
 
     cpdef add(self, name, TrafficClass tc, paths):
         """
@@ -246,16 +731,20 @@ cdef class PPTC:
         :param paths: valid paths for this traffic class
         """
 
-        # Strange workaound instead of directly calling numpy.ma.array(paths)
-        # we are doing the if isinstace()
-        # Because it was complaining about mismatched dimentions
-        if isinstance(paths, numpy.ma.MaskedArray):
+        cdef Py_ssize_t start
+        if isinstance(paths, _PathSet):
+            # paths of another PPTC, shared along with their mask
             self._data[tc] = paths
         else:
-            self._data[tc] = numpy.empty(len(paths), dtype=object)
-            for i in numpy.arange(len(paths)):
-                self._data[tc][i] = paths[i]
-            self._data[tc] = numpy.ma.array(self._data[tc], mask=numpy.ma.nomask)
+            mask = numpy.ma.nomask
+            if isinstance(paths, numpy.ma.MaskedArray):
+                mask = numpy.ma.getmask(paths)
+                mask = mask if mask is numpy.ma.nomask else mask.copy()
+                paths = paths.data
+            if self._store is None:
+                self._store = PathStore(len(paths))
+            start = self._store.append(paths, tc.ID)
+            self._data[tc] = _PathSet(self._store, start, self._store.size, mask)
         # Now proceed to set up all the other data structures
         # tcindex so we can get a mapping of tcID -> traffic class
         self._tcindex[tc.ID] = tc
@@ -267,6 +756,7 @@ cdef class PPTC:
             self._tcowner[tc] = {name}
         else:
             self._tcowner[tc].add(name)
+        self._invalidate()
 
     cpdef tcs(self, name=None):
         """
@@ -284,7 +774,13 @@ cdef class PPTC:
         return self._tcindex[tcid]
 
     cpdef paths(self, TrafficClass tc):
-        return self._data[tc].compressed()
+        """
+        Return the unmasked paths of a traffic class
+
+        :param tc: the traffic class
+        :return: an array of path objects (views of the path store)
+        """
+        return self._data[tc].views()
 
     cpdef all_paths(self, TrafficClass tc):
         """
@@ -293,8 +789,29 @@ cdef class PPTC:
         :param tc:
         :return:
         """
+        return self._data[tc].views(True)
+
+    cpdef set_flow_fractions(self, TrafficClass tc, numpy.ndarray fractions):
+        """
+        Set the flow fractions of the paths of a traffic class.
+        Fractions are written to the path store directly, without creating path objects.
+
+        :param tc: the traffic class
+        :param fractions: flow fractions of all paths, masked ones included
+        """
+        cdef _PathSet ps = self._data[tc]
+        ps.store._fractions[ps.start:ps.stop] = fractions
 
-        return self._data[tc].data
+    cpdef numpy.ndarray flow_fractions(self, TrafficClass tc, all=False):
+        """
+        Flow fractions of the paths of a traffic class
+
+        :param tc: the traffic class
+        :param all: if True, fractions of masked paths are returned as well
+        :return: an array of flow fractions
+        """
+        cdef _PathSet ps = self._data[tc]
+        return ps.store._fractions[ps.rows(all)]
 
     cpdef PPTC pptc(self, name):
         r = PPTC()
@@ -309,18 +826,29 @@ cdef class PPTC:
         :param tc: the traffic class
         :param mask: the new mask, will override the old mask
         """
-        self._data[tc].mask = mask
+        cdef _PathSet ps = self._data[tc]
+        ps.mask = numpy.broadcast_to(numpy.asarray(mask, dtype=bool), (len(ps),)).copy()
+        self._invalidate(True)
 
     cpdef get_mask(self, TrafficClass tc):
         return self._data[tc].mask
 
+    cpdef numpy.ndarray get_mask_array(self, TrafficClass tc):
+        """
+        :param tc: the traffic class
+        :return: a copy of the mask of a traffic class, as a boolean array with an element for every path
+        """
+        return self._data[tc].mask_array().copy()
+
     cpdef unmask(self, TrafficClass tc):
         self._data[tc].mask = numpy.ma.nomask
+        self._invalidate(True)
 
     cpdef unmaskall(self):
         cdef TrafficClass tc
         for tc in self.tcs():
             self._data[tc].mask = numpy.ma.nomask
+        self._invalidate(True)
 
     cpdef clear_masks(self):
         """
@@ -329,6 +857,7 @@ cdef class PPTC:
         """
         for a in itervalues(self._data):
             a.mask = numpy.ma.nomask
+        self._invalidate(True)
 
     cpdef int num_tcs(self):
         """
@@ -337,6 +866,21 @@ cdef class PPTC:
         """
         return len(self._data)
 
+    cpdef numpy.ndarray volumes(self):
+        """
+        Traffic volumes of all traffic classes
+
+        :return: a 2-d array of traffic classes (by ID) by epochs
+        """
+        cdef TrafficClass tc
+        if not self._tcindex:
+            return numpy.zeros((0, 0))
+        res = numpy.zeros((max(self._tcindex) + 1, next(iter(self._tcindex.values())).volFlows.compressed().size))
+        for tcid in self._tcindex:
+            tc = self._tcindex[tcid]
+            res[tcid] = tc.volFlows.compressed()
+        return res
+
     cpdef int num_paths(self, TrafficClass tc, all=False):
         """
         Return the number of paths that a given traffic class has.
@@ -346,10 +890,7 @@ cdef class PPTC:
         :param all: count all paths, not just unmasked
         :rtype: int
         """
-        if all:
-            return self._data[tc].size
-        else:
-            return self._data[tc].count()
+        return self._data[tc].count(all)
 
     cpdef int max_paths(self, all=False):
         """
@@ -365,7 +906,7 @@ cdef class PPTC:
     cpdef update(self, PPTC other, deep=False):
         for tc in other.tcs():
             if deep:
-                self._data[tc] = numpy.ma.copy(other._data[tc])
+                self._data[tc] = other._data[tc].copy()
             else:
                 self._data[tc] = other._data[tc]
             self._tcindex[tc.ID] = tc
@@ -378,13 +919,16 @@ cdef class PPTC:
                 self._name_to_tcs[name].update(val)
             else:
                 self._name_to_tcs[name] = val.copy()
+        if self._table is None:
+            self._table = other._table
+        self._invalidate()
 
     cpdef copy(self, deep=False):
         """
         Create a copy of paths per traffic class
 
-        :param deep: indicates whether a copy should be deep and a copy of all
-            paths should be made as well. This can be an expensive operation.
+        :param deep: indicates whether a copy should be deep, with its own copy of the masks.
+            Paths (and their flow fractions) are always shared.
         """
         r = PPTC()
         r.update(self, deep)
@@ -396,6 +940,226 @@ cdef class PPTC:
         """
         return len(self._data) == 0
 
+    cdef _invalidate(self, bint masks_only=False):
+        """
+        Drop cached incidence matrices. Called whenever paths or masks change.
+
+        :param masks_only: if True, only masks changed, and the matrices of all paths are kept
+        """
+        if masks_only:
+            for key in [k for k in self._incidence if not k[-1]]:
+                del self._incidence[key]
+        else:
+            self._incidence.clear()
+
+    cdef _mask_state(self):
+        """
+        Current masks of all traffic classes (in the order of traffic class IDs), as a single array.
+        Masked arrays can be shared between PPTC objects, so this is used to detect
+        mask changes made through another PPTC.
+        """
+        return numpy.concatenate([self._data[self._tcindex[i]].mask_array()
+                                  for i in sorted(self._tcindex)] or [numpy.zeros(0, dtype=bool)])
+
+    cdef tuple _row_state(self):
+        """
+        Rows of the path sets of all traffic classes (in the order of traffic class IDs).
+        Path sets can be shared between PPTC objects, so this is used to detect
+        paths added through another PPTC.
+        """
+        cdef _PathSet ps
+        cdef list state = []
+        for i in sorted(self._tcindex):
+            ps = self._data[self._tcindex[i]]
+            state.append((id(ps.store), ps.start, ps.stop))
+        return tuple(state)
+
+    cdef _cache_get(self, key, all):
+        """
+        A cached value, or None if the paths (or, unless *all* is True, the masks) changed since it was cached
+        """
+        cached = self._incidence.get(key)
+        if cached is None or cached[1] != self._row_state():
+            return None
+        if not all and not numpy.array_equal(cached[2], self._mask_state()):
+            return None
+        return cached[0]
+
+    cdef _cache_put(self, key, all, value):
+        self._incidence[key] = (value, self._row_state(), None if all else self._mask_state())
+
+    cpdef path_index(self, all=False):
+        """
+        Global numbering of paths, used as rows of the incidence matrices.
+        Paths are numbered in the order of traffic class IDs, and then in the order of paths
+        within the traffic class.
+
+        :param all: if True, masked paths are numbered as well
+        :return: a tuple of two arrays: the traffic class ID and the path index (within its traffic class)
+            of every global path index.
+            Unless *all* is True, path indices are relative to the unmasked paths only.
+        """
+        cdef TrafficClass tc
+        key = (u'index', bool(all))
+        cached = self._cache_get(key, all)
+        if cached is not None:
+            return cached
+        tcids, pind = [], []
+        for tcid in sorted(self._tcindex):
+            tc = self._tcindex[tcid]
+            n = self.num_paths(tc, all=all)
+            tcids.append(numpy.full(n, tcid, dtype=numpy.int64))
+            pind.append(numpy.arange(n, dtype=numpy.int64))
+        result = (numpy.concatenate(tcids or [numpy.zeros(0, dtype=numpy.int64)]),
+                  numpy.concatenate(pind or [numpy.zeros(0, dtype=numpy.int64)]))
+        self._cache_put(key, all, result)
+        return result
+
+    cpdef PathTable path_table(self):
+        """
+        :return: the table paths are interned in (see :py:meth:`path_ids`).
+            Copies and merges of this PPTC share the table.
+        """
+        if self._table is None:
+            self._table = PathTable()
+        return self._table
+
+    cpdef numpy.ndarray path_ids(self, all=False):
+        """
+        Interned IDs of the paths (see :py:class:`PathTable`), so that the same path
+        held by different traffic classes (e.g., of different applications) is recognized.
+
+        :param all: if True, masked paths are included as well
+        :return: the ID of every global path index (see :py:meth:`path_index`)
+        """
+        cdef _PathSet ps
+        cdef PathStore store
+        key = (u'ids', bool(all))
+        cached = self._cache_get(key, all)
+        if cached is not None:
+            return cached
+        if all:
+            table = self.path_table()
+            result = numpy.zeros(sum(map(len, itervalues(self._data))), dtype=numpy.int64)
+            # rows of every store, and their positions
+            by_store = {}
+            pos = 0
+            for tcid in sorted(self._tcindex):
+                ps = self._data[self._tcindex[tcid]]
+                rows, positions = by_store.setdefault(id(ps.store), (ps.store, [], []))[1:]
+                rows.append(numpy.arange(ps.start, ps.stop, dtype=numpy.int64))
+                positions.append(numpy.arange(pos, pos + len(ps), dtype=numpy.int64))
+                pos += len(ps)
+            stores = list(itervalues(by_store))
+            if stores:
+                positions = numpy.concatenate([numpy.concatenate(entry[2]) for entry in stores])
+                result[positions] = table.intern_rows([entry[0] for entry in stores],
+                                                      [numpy.concatenate(entry[1]) for entry in stores])
+        else:
+            result = self.path_ids(True)[~self._mask_state()]
+        self._cache_put(key, all, result)
+        return result
+
+    cpdef incidence(self, mode=LINKS, int num_nodes=0, all=False):
+        """
+        Sparse path/element incidence matrix. Rows are global path indices (see :py:meth:`path_index`).
+        Columns are node IDs (when *mode* is 'nodes' or 'mboxes') or link indices, computed as
+        *u * num_nodes + v* for link (u, v).
+
+        The matrix is built once and cached until paths or masks change (also through another PPTC
+        that shares them).
+
+        :param mode: either 'nodes', 'mboxes' or 'links' -- which path elements to use
+        :param num_nodes: number of nodes in the topology, determines the number of columns.
+            If 0, the largest node ID in any path is used.
+        :param all: if True, masked paths are included as well
+        :return: a scipy CSR matrix
+        """
+        cdef _PathSet ps
+        if mode not in (NODES, MBOXES, LINKS):
+            raise ValueError(ERR_UNKNOWN_MODE % (u'path element', mode))
+        key = (mode, num_nodes, bool(all))
+        cached = self._cache_get(key, all)
+        if cached is not None:
+            return cached
+
+        # rows of distinct paths are built once, from the interned paths, and shared by all their copies
+        uniq, inverse = numpy.unique(self.path_ids(all), return_inverse=True)
+        store = self.path_table().store
+        lens, vals = store._gather(uniq, False)
+        if num_nodes == 0:
+            num_nodes = (vals.max() if vals.size else -1) + 1
+        if mode == MBOXES:
+            lens, cols = store._gather(uniq, True)
+        elif mode == LINKS:
+            lens, cols = _link_columns(lens, vals, num_nodes)
+        else:
+            cols = vals
+        rows = numpy.arange(lens.size).repeat(lens)
+        ncols = num_nodes * num_nodes if mode == LINKS else num_nodes
+        result = coo_matrix((numpy.ones(cols.size), (rows, cols)), shape=(lens.size, ncols)).tocsr()
+        result = result[inverse.ravel()]
+        self._cache_put(key, all, result)
+        return result
+
+    cpdef dict paths_using(self, elements):
+        """
+        Find the paths that use any of the given network elements, with the inverted indices of the
+        path stores (see :py:meth:`PathStore.rows_using`). The cost of a lookup depends on the
+        number of paths found, not on the total number of paths.
+
+        :param elements: node IDs and links, as (u, v) tuples
+        :return: a dictionary mapping the affected traffic classes to arrays of path indices.
+            Indices include masked paths (as with :py:meth:`all_paths`), and masked paths are found as well.
+        """
+        cdef _PathSet ps
+        cdef PathStore store
+        nodes = [e for e in elements if not isinstance(e, tuple)]
+        links = [e for e in elements if isinstance(e, tuple)]
+        stores = self._incidence.get((u'stores', True))
+        if stores is None:
+            stores = self._incidence[(u'stores', True)] = list({id(ps.store): ps.store
+                                                                for ps in itervalues(self._data)}.values())
+        res = {}
+        for store in stores:
+            rows = store.rows_using(nodes, links)
+            for row, owner in zip(rows.tolist(), store._owners[rows].tolist()):
+                tc = self._tcindex.get(owner)
+                if tc is None:
+                    continue
+                ps = self._data[tc]
+                # rows the traffic class does not use anymore, or another traffic class with the same ID
+                if ps.store is not store or not ps.start <= row < ps.stop:
+                    continue
+                res.setdefault(tc, []).append(row - ps.start)
+        return {tc: numpy.array(pind, dtype=numpy.int64) for tc, pind in iteritems(res)}
+
+    cpdef Py_ssize_t extend(self, TrafficClass tc, paths) except -1:
+        """
+        Add paths to a traffic class, after its existing paths (so path indices do not change).
+        The new paths are unmasked, and are added to every PPTC that shares the paths of the traffic class.
+
+        :param tc: the traffic class
+        :param paths: the new paths
+        :return: number of added paths
+        """
+        cdef _PathSet ps = self._data[tc]
+        cdef Py_ssize_t before = len(ps)
+        ps._extend(paths, tc.ID)
+        self._invalidate()
+        return len(ps) - before
+
+    def repair(self, topology, failed, predicate=None, cutoff=None, modify_func=None, quota=None):
+        """
+        Handle the failure of nodes or links: mask the paths that use them, and generate replacement
+        paths for the traffic classes left with fewer paths than their quota.
+        See :py:func:`~sol.path.generate.repair_paths`.
+
+        :return: a dictionary mapping the affected traffic classes to the number of added paths
+        """
+        from sol.path.generate import repair_paths
+        return repair_paths(self, topology, failed, predicate, cutoff, modify_func, quota)
+
     def __repr__(self):
         return repr(self._data)
 
@@ -408,6 +1172,132 @@ cdef class PPTC:
     def __len__(self):
         raise AttributeError('len() is abiguious use num_tcs() or total_paths()')
 
+    cpdef list save(self, fname, fingerprint=None):
+        """
+        Save the paths to a directory of flat numpy arrays (node offsets and nodes, flow fractions,
+        masks, and the traffic class table), that :py:meth:`load` can memory-map.
+        Paths of all traffic classes are written as a single store, in the order of traffic class IDs.
+        Traffic volumes are not saved.
+
+        :param fname: the directory, created if it does not exist
+        :param fingerprint: identifies what the paths were generated from (e.g.,
+            :py:func:`~sol.path.generate.paths_fingerprint`), checked by :py:meth:`load`
+        :return: the list of written files
+        """
+        cdef _PathSet ps
+        cdef TrafficClass tc
+        tcids = sorted(self._tcindex)
+        node_lens, nodes, mbox_lens, mboxes, with_mbox, fractions, masks = [], [], [], [], [], [], []
+        for tcid in tcids:
+            ps = self._data[self._tcindex[tcid]]
+            rows = ps.rows(True)
+            lens, vals = ps.store._gather(rows, False)
+            node_lens.append(lens)
+            nodes.append(vals)
+            lens, vals = ps.store._gather(rows, True)
+            mbox_lens.append(lens)
+            mboxes.append(vals)
+            with_mbox.append(numpy.zeros(rows.size, dtype=numpy.uint8) if ps.store._with_mbox is None
+                             else ps.store._with_mbox[rows])
+            fractions.append(ps.store._fractions[rows])
+            masks.append(ps.mask_array())
+        empty = [numpy.zeros(0, dtype=numpy.int64)]
+        counts = numpy.array([len(self._data[self._tcindex[i]]) for i in tcids], dtype=numpy.int64)
+        stops = numpy.cumsum(counts)
+        tcs = [self._tcindex[i] for i in tcids]
+        owner_names = sorted(self._name_to_tcs)
+        arrays = dict(
+            nodes=numpy.concatenate(nodes or empty),
+            offsets=numpy.concatenate([[0], numpy.cumsum(numpy.concatenate(node_lens or empty))]),
+            fractions=numpy.concatenate(fractions or [numpy.zeros(0)]),
+            owners=numpy.repeat(numpy.array(tcids, dtype=numpy.int64), counts),
+            masks=numpy.concatenate(masks or [numpy.zeros(0, dtype=bool)]),
+            # ID, source, sink and the range of paths of every traffic class
+            tcs=numpy.array([[tc.ID, tc.src, tc.dst] for tc in tcs], dtype=numpy.int64).reshape(-1, 3),
+            tc_paths=numpy.stack([stops - counts, stops], axis=1),
+            tc_names=numpy.array([tc.name for tc in tcs], dtype=numpy.str_),
+            # (traffic class, owner) pairs, by their positions
+            tc_owners=numpy.array([(i, owner_names.index(name)) for i, tc in enumerate(tcs)
+                                   for name in sorted(self._tcowner[tc])], dtype=numpy.int64).reshape(-1, 2),
+        )
+        with_mbox = numpy.concatenate(with_mbox or [numpy.zeros(0, dtype=numpy.uint8)])
+        if with_mbox.any():
+            arrays.update(mboxes=numpy.concatenate(mboxes),
+                          mbox_offsets=numpy.concatenate([[0], numpy.cumsum(numpy.concatenate(mbox_lens))]),
+                          with_mbox=with_mbox)
+        if not os.path.isdir(fname):
+            os.makedirs(fname)
+        files = []
+        for name, a in arrays.items():
+            files.append(os.path.join(fname, name + '.npy'))
+            numpy.save(files[-1], a)
+        # written last, a directory without it is incomplete
+        files.append(os.path.join(fname, 'meta.json'))
+        with open(files[-1], 'w') as f:
+            json.dump({'version': 1, 'fingerprint': fingerprint, 'owners': owner_names}, f)
+        return files
+
+    @staticmethod
+    def load(fname, traffic_classes=None, fingerprint=None, mmap=True):
+        """
+        Load paths saved with :py:meth:`save`.
+
+        Paths are memory-mapped (unless *mmap* is False): loading is fast, pages are only read
+        when paths are used, and processes that load the same files share them.
+
+        :param fname: the directory
+        :param traffic_classes: traffic classes to load the paths of, matched by ID (e.g., with the current
+            traffic volumes). If None, traffic classes are restored from the saved source, sink and name.
+        :param fingerprint: the expected fingerprint, see :py:meth:`save`. If None, it is not checked.
+        :param mmap: whether to memory-map the arrays, instead of reading them into memory
+        :raise StalePathsException: if the fingerprint does not match, or the paths of a given traffic class
+            were not saved
+        :rtype: :py:class:`PPTC`
+        """
+        cdef PPTC r = PPTC()
+        cdef _PathSet ps
+        with open(os.path.join(fname, 'meta.json')) as f:
+            meta = json.load(f)
+        if fingerprint is not None and meta['fingerprint'] != fingerprint:
+            raise StalePathsException(ERR_STALE_PATHS.format(fname, meta['fingerprint'], fingerprint))
+        mode = 'r' if mmap else None
+        store = PathStore.from_arrays(
+            _load_array(fname, 'nodes', mode), _load_array(fname, 'offsets', mode),
+            # flow fractions are written to, keep them in memory
+            numpy.array(_load_array(fname, 'fractions', None)), _load_array(fname, 'owners', mode),
+            _load_array(fname, 'mboxes', mode), _load_array(fname, 'mbox_offsets', mode),
+            _load_array(fname, 'with_mbox', mode))
+        masks = _load_array(fname, 'masks', mode)
+        tcs = _load_array(fname, 'tcs', None).tolist()
+        tc_paths = _load_array(fname, 'tc_paths', None).tolist()
+        names = _load_array(fname, 'tc_names', None).tolist()
+        owners = [[] for _ in tcs]
+        for i, o in _load_array(fname, 'tc_owners', None).tolist():
+            owners[i].append(meta['owners'][o])
+        # which traffic classes have masked paths, without reading the masks of the others
+        masked = numpy.concatenate([[0], numpy.cumsum(masks)])
+        masked = (masked[[p[1] for p in tc_paths]] > masked[[p[0] for p in tc_paths]]).tolist()
+        given = None if traffic_classes is None else {tc.ID: tc for tc in traffic_classes}
+        for i, (tcid, src, dst) in enumerate(tcs):
+            if given is None:
+                tc = TrafficClass(tcid, unicode(names[i]), src, dst)
+            else:
+                tc = given.pop(tcid, None)
+                if tc is None:
+                    continue
+                if tc.src != src or tc.dst != dst:
+                    raise StalePathsException(ERR_PATHS_TC.format(fname, tc))
+            start, stop = tc_paths[i]
+            r._data[tc] = _PathSet(store, start, stop,
+                                   numpy.array(masks[start:stop]) if masked[i] else numpy.ma.nomask)
+            r._tcindex[tcid] = tc
+            r._tcowner[tc] = set(owners[i])
+            for name in owners[i]:
+                r._name_to_tcs.setdefault(name, set()).add(tc)
+        if given:
+            raise StalePathsException(ERR_PATHS_TC.format(fname, next(iter(given.values()))))
+        return r
+
     def json_list(self):
         r = []
         for tc in self._data:
@@ -433,6 +1323,15 @@ cdef class PPTC:
             r.add(name, tc, d[tc])
         return r
 
+cdef _load_array(fname, name, mmap_mode):
+    """
+    Load a saved array, or return None if it was not saved
+    """
+    path = os.path.join(fname, name + '.npy')
+    if not os.path.exists(path):
+        return None
+    return numpy.load(path, mmap_mode=mmap_mode)
+
 cpdef path_decoder(o):
     """
     Function for decoding paths from a dictionary (e.g., when deserializing from JSON)
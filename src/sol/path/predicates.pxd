@@ -1,7 +1,21 @@
 # coding=utf-8
 
+cimport numpy
 from sol.topology.topologynx cimport Topology
 
 cpdef null_predicate(path, topology=*)
 cpdef has_mbox_predicate(path, Topology topology)
 cpdef waypoint_mbox_predicate(path, Topology topology, order)
+
+cdef class PathBlock:
+    # number of paths, and the nodes and middleboxes of all paths with their offsets
+    cdef readonly Py_ssize_t size
+    cdef readonly numpy.ndarray nodes
+    cdef readonly numpy.ndarray offsets
+    cdef readonly numpy.ndarray mboxes
+    cdef readonly numpy.ndarray mbox_offsets
+
+    cpdef numpy.ndarray any(self, numpy.ndarray values)
+
+cpdef register_batch(predicate, batch)
+cpdef batch_predicate(predicate)
@@ -2,9 +2,16 @@
 """
 Implement predicates for path validity.
 Both generic (example predicates) and some app-specific predicates
+
+Predicates are called with one path at a time. Predicates can also have a batch version, that checks a whole
+:py:class:`PathBlock` of candidate paths at once (see :py:func:`register_batch`), which path generation uses
+when it is available.
 """
+import functools
 import itertools
 
+import numpy
+from sol.path.paths import Path
 from sol.topology.topologynx cimport Topology
 
 cpdef null_predicate(path, topology=None):
@@ -39,4 +46,100 @@ cpdef waypoint_mbox_predicate(path, Topology topology, order):
     """
     return any([s == order
                 for s in itertools.product(*[topology.get_service_types(node)
-                                             for node in path.mboxes()])])
\ No newline at end of file
+                                             for node in path.mboxes()])])
+
+cdef class PathBlock:
+    """
+    A block of candidate paths, in compressed (CSR) form: nodes of path *i* are
+    *nodes[offsets[i]:offsets[i + 1]]*, and the middleboxes it uses are
+    *mboxes[mbox_offsets[i]:mbox_offsets[i + 1]]*.
+
+    :param paths: a list of paths, either path objects or lists of nodes
+    :param mboxes: the middleboxes used by every path (e.g., to check paths before creating
+        :py:class:`~sol.path.paths.PathWithMbox` objects). If None, middleboxes of path objects are used.
+    """
+
+    def __init__(self, paths, mboxes=None):
+        paths = [(p.nodes(), p.mboxes()) if isinstance(p, Path) else (p, ()) for p in paths]
+        if mboxes is not None:
+            paths = [(p[0], m) for p, m in zip(paths, mboxes)]
+        self.size = len(paths)
+        self.offsets, self.nodes = _flatten([p[0] for p in paths])
+        self.mbox_offsets, self.mboxes = _flatten([p[1] for p in paths])
+
+    cpdef numpy.ndarray any(self, numpy.ndarray values):
+        """
+        :param values: a boolean value for every node of every path (e.g., a node mask indexed by :py:attr:`nodes`)
+        :return: for every path, whether any of its values is True
+        """
+        cdef numpy.ndarray counts = numpy.concatenate([[0], numpy.cumsum(values)])
+        return counts[self.offsets[1:]] > counts[self.offsets[:-1]]
+
+    def __len__(self):
+        return self.size
+
+cdef tuple _flatten(list sequences):
+    """
+    :return: offsets and the concatenated elements of sequences of node IDs
+    """
+    offsets = numpy.zeros(len(sequences) + 1, dtype=numpy.int64)
+    offsets[1:] = numpy.cumsum([len(x) for x in sequences])
+    return offsets, numpy.fromiter(itertools.chain.from_iterable(sequences), dtype=numpy.int64,
+                                   count=offsets[-1])
+
+def _null_batch(PathBlock block, topology=None):
+    return numpy.ones(block.size, dtype=bool)
+
+def _has_mbox_batch(PathBlock block, Topology topology):
+    return block.any(topology.mbox_mask()[block.nodes])
+
+def _waypoint_mbox_batch(PathBlock block, Topology topology, order):
+    # a path has to use exactly one middlebox per service, each providing its service
+    ok = numpy.diff(block.mbox_offsets) == len(order)
+    for k, service in enumerate(order):
+        rows = numpy.flatnonzero(ok)
+        ok[rows] = topology.service_mask(service)[block.mboxes[block.mbox_offsets[rows] + k]]
+    return ok
+
+# batch versions of predicates
+_batch = {
+    null_predicate: _null_batch,
+    has_mbox_predicate: _has_mbox_batch,
+    waypoint_mbox_predicate: _waypoint_mbox_batch,
+}
+
+cpdef register_batch(predicate, batch):
+    """
+    Register the batch version of a predicate
+
+    :param predicate: the predicate, called with a path and the topology
+    :param batch: a function called with a :py:class:`PathBlock` and the topology (and any keyword arguments
+        the predicate is given with, see :py:func:`batch_predicate`), that returns a boolean array:
+        whether every path in the block is valid
+    """
+    _batch[predicate] = batch
+
+cpdef batch_predicate(predicate):
+    """
+    Find the batch version of a predicate: a *batch* attribute of the predicate, a registered function
+    (see :py:func:`register_batch`), or a registered function given the same keyword arguments
+    if the predicate is a :py:func:`functools.partial` (e.g., *partial(waypoint_mbox_predicate, order=order)*).
+
+    :param predicate: the predicate
+    :return: the batch predicate, or None if the predicate can only check one path at a time
+    """
+    if predicate is None:
+        predicate = null_predicate
+    batch = getattr(predicate, 'batch', None)
+    if batch is not None:
+        return batch
+    if isinstance(predicate, functools.partial):
+        batch = batch_predicate(predicate.func)
+        if batch is None or predicate.args:
+            return None
+        return functools.partial(batch, **predicate.keywords)
+    try:
+        return _batch.get(predicate)
+    except TypeError:
+        # not hashable
+        return None
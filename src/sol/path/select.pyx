@@ -3,32 +3,42 @@
 """
 Module that implements different path selection (a.k.a pruning) strategies
 """
-import functools
 import random
 import time
-from collections import defaultdict
+from collections import defaultdict, namedtuple, OrderedDict
 from itertools import combinations, cycle, chain
+from multiprocessing import Pipe, Process
 
 from cpython cimport bool
 from numpy cimport ndarray
-from numpy import arange, power, inf, mean, ones, bitwise_xor, \
-    array, argsort, ma, concatenate, flip, flipud
-from numpy.random import choice
+from numpy import arange, power, inf, mean, ones, packbits, \
+    array, argsort, ma, concatenate, flip, flipud, zeros, full, nan, isnan, isinf, \
+    fmin, lexsort, nansum, searchsorted
+from numpy.random import choice, seed as numpy_seed
+from scipy.sparse import hstack
 from six import iterkeys, iteritems
 from sklearn.cluster import KMeans, AgglomerativeClustering
 from sol.opt.composer cimport compose_apps
+from sol.opt.composer import CompositionSession, compose_apps
+from sol.opt.profiling import BuildProfile
 from sol.path.paths cimport Path, PPTC, PathWithMbox
 from sol.topology.topologynx cimport Topology
 from sol.topology.traffic cimport TrafficClass
 
 from sol.utils.const import *
-from sol.utils.exceptions import SOLException, InvalidConfigException
+from sol.utils.exceptions import SOLException, InvalidConfigException, UnsupportedOperationException
 from sol.utils.logger import logger
 
 _RANDOM = ['random', 'rand']
 _SHORTEST = ['shortest', 'short', 'kshortest', 'k-shortest', 'kshort',
              'k-short']
 
+#: Progress of a path selection, passed to the selection callbacks: the iteration, the objective and
+#: the path masks (by traffic class ID) of the best state so far, the time spent building the optimization,
+#: the time spent solving it, and the total wall time since the selection started (all in seconds)
+SelectionProgress = namedtuple('SelectionProgress', ['iteration', 'objective', 'masks', 'build_time',
+                                                     'solve_time', 'elapsed'])
+
 cpdef choose_rand(PPTC pptc, int num_paths):
     """
     Chooses a specified number of paths per traffic class uniformly at
@@ -77,34 +87,115 @@ cpdef k_shortest_paths(PPTC pptc, int num_paths, bool ret_mask=False):
         inds[tc] = ind
     return inds
 
-# cdef _sort_by_func(arr, func=len):
-#     assert arr.ndim == 1
-#     vals = array(func(x) for x in array)
-#     return argsort(vals)
+cdef tuple _element_resources(Topology t, list resources):
+    """
+    Amount of every resource at every node and link, in a single pass over the topology.
+
+    :param t: the topology
+    :param resources: resource names, in the order of the columns
+    :return: a tuple of (node values, link values) matrices, one column per resource.
+        Rows are laid out as the columns of :py:meth:`PPTC.incidence` matrices.
+        Nodes and links that do not have a resource have a value of nan.
+    """
+    cdef int nn = t.num_nodes(), j
+    columns = {r: j for j, r in enumerate(resources)}
+    nres = full((nn, len(resources)), nan)
+    lres = full((nn * nn, len(resources)), nan)
+    for n in t.nodes():
+        for r, amount in iteritems(t.get_resources(n)):
+            if r in columns:
+                nres[n, columns[r]] = amount
+    for u, v in t.links():
+        for r, amount in iteritems(t.get_resources((u, v))):
+            if r in columns:
+                lres[u * nn + v, columns[r]] = amount
+    return nres, lres
+
+cdef ndarray _bottlenecks(PPTC pptc, Topology t, ndarray nres, ndarray lres):
+    """
+    Bottleneck resources of all paths (including masked ones): the smallest amount of every resource
+    along the path. Nodes and links without a resource do not count towards the minimum,
+    and paths without the resource have a bottleneck of 0.
+
+    :param nres: node resources, see :py:func:`_element_resources`
+    :param lres: link resources, see :py:func:`_element_resources`
+    :return: a matrix with a row per global path index (see :py:meth:`PPTC.path_index`)
+        and a column per resource
+    """
+    cdef int nn = t.num_nodes()
+    # incidence of paths with all elements: nodes, followed by links
+    inc = hstack([pptc.incidence(NODES, nn, all=True), pptc.incidence(LINKS, nn, all=True)], format='csr')
+    inc.sort_indices()
+    vals = concatenate([nres, lres])[inc.indices]
+    least = full((inc.shape[0], nres.shape[1]), nan)
+    starts = inc.indptr[:-1]
+    used = inc.indptr[1:] > starts
+    if vals.shape[0] > 0 and vals.shape[1] > 0:
+        # elements of a path are contiguous, reduce them all at once (fmin ignores missing resources)
+        least[used] = fmin.reduceat(vals, starts[used], axis=0)
+    least[isnan(least)] = 0
+    return least
+
+cdef ndarray _path_lengths(PPTC pptc, Topology t):
+    """
+    :return: number of links of all paths (including masked ones), by global path index
+    """
+    return pptc.incidence(LINKS, t.num_nodes(), all=True).getnnz(axis=1)
 
-cdef compute_score(Path p, Topology t, weights, norm, d):
-    cdef double score = 0
-    for r in weights:
-        score += max(t.get_resources(n).get(r, 0) for n in chain(p.nodes(), p.links())) / norm[r] * weights[r] - len(p) / d
-    return score
+cdef dict _split_by_tc(PPTC pptc, ndarray values):
+    """
+    Split per-path values (by global path index, including masked paths) by traffic class
+    """
+    tcids, _ = pptc.path_index(all=True)
+    result = {}
+    for tc in pptc.tcs():
+        start = searchsorted(tcids, tc.ID)
+        result[tc] = values[start:start + pptc.num_paths(tc, all=True)]
+    return result
+
+cdef ndarray _rank(ndarray scores, ndarray lens):
+    """
+    Order paths by decreasing score, breaking ties by increasing length
+    """
+    return lexsort((lens, -scores))
+
+cdef compute_score(PPTC pptc, Topology t, weights, norm, d):
+    """
+    Score all paths (including masked ones) by the bottleneck of each resource along the path,
+    penalized by path length.
+
+    :param weights: weights of the resources
+    :param norm: normalization of the resources (e.g., their total amount)
+    :param d: normalization of the path length (e.g., the topology diameter)
+    :return: an array of scores, one per global path index (see :py:meth:`PPTC.path_index`)
+    """
+    resources = list(weights)
+    nres, lres = _element_resources(t, resources)
+    least = _bottlenecks(pptc, t, nres, lres)
+    scale = array([weights[r] / norm[r] for r in resources], dtype=float)
+    return least.dot(scale) - len(resources) * _path_lengths(pptc, t) / d
 
 cdef k_resource_paths(PPTC pptc, int num_paths, resource_weights, Topology topo):
+    """
+    Chooses the :math:`k` paths per traffic class with the best resource scores (see :py:func:`compute_score`)
+
+    :return: path indices of each traffic class, sorted by decreasing score
+    """
     inds = {}
-    total_r = {}
-    for r in resource_weights:
-        total_r[r] = topo.total_resource(r)
-    d = topo.diameter()
+    resources = list(resource_weights)
+    nres, lres = _element_resources(topo, resources)
+    # resources are normalized by their total amount
+    total_r = dict(zip(resources, nansum(nres, axis=0) + nansum(lres, axis=0)))
+    # Score all paths, even the masked ones
+    all_scores = compute_score(pptc, topo, resource_weights, norm=total_r, d=topo.diameter())
+    scores = _split_by_tc(pptc, all_scores)
+    lens = _split_by_tc(pptc, _path_lengths(pptc, topo))
     for tc in pptc.tcs():
-        # Get lengths of all paths, even the masked ones
-        scores = array([compute_score(p, topo, resource_weights, norm=total_r, d=d)
-                        for p in pptc.all_paths(tc)])
-        # logger.debug('Path scores %s', scores)
-        # Sort lengths and only return indices
-        ind = flipud(argsort(scores))
-        # logger.debug('Path indices, sorted %s', ind)
+        # Sort scores and only return indices
+        ind = _rank(scores[tc], lens[tc])
         # Create an array mask, with everything masked
         mask = ones(pptc.num_paths(tc, all=True), dtype=bool)
-        # Unmask the shortest paths
+        # Unmask the best paths
         mask[ind[:min(num_paths, mask.size)]] = 0
         pptc.mask(tc, mask)
         # Store the mask in case we need to return it
@@ -156,8 +247,61 @@ def cluster_tcs(tcs, num_clusters, method):
     else:
         raise ValueError('Unsupported clustering method %s' % method)
 
+cdef dict _profile_opts(profile):
+    """
+    Backend options of the optimizations built by the selection functions
+    """
+    return dict(profile=True) if profile else None
+
+cdef double _deadline(double start_time, time_budget):
+    """
+    Wall-clock time at which a selection that started at *start_time* must stop
+    """
+    return inf if time_budget is None else start_time + time_budget
+
+cdef _limit_time(opt, double deadline):
+    """
+    Limit the solver to the time left before the deadline, if the backend supports time limits
+    """
+    try:
+        opt.set_time_limit(max(deadline - time.time(), 0))
+    except UnsupportedOperationException:
+        logger.debug('Backend %s does not support time limits' % type(opt).__name__)
+
+cdef dict _masks(PPTC pptc):
+    """
+    Path masks of all traffic classes, by traffic class ID
+    """
+    return {tc.ID: pptc.get_mask_array(tc).copy() for tc in pptc.tcs()}
+
+cdef bint _report(callback, int iteration, objective, dict masks, build_time, solve_time,
+                  double start_time) except -1:
+    """
+    Pass the progress of a selection to the callback (if there is one)
+
+    :return: True if the callback asked to stop the selection
+    """
+    if callback is None:
+        return False
+    return bool(callback(SelectionProgress(iteration, objective, masks, build_time, solve_time,
+                                           time.time() - start_time)))
+
+cdef _log_profile(opt, profile, list others=None):
+    """
+    Log the profile of the selection: the profiles of the other optimizations the selection built
+    (e.g., in every iteration, or in parallel chains), followed by the profile of the returned
+    optimization. An optimization that is re-solved in place records all of its solves.
+    """
+    if profile:
+        merged = BuildProfile()
+        for other in others or []:
+            merged.extend(other)
+        merged.extend(opt.get_profile())
+        logger.info('Selection profile:\n%s' % merged.format())
+
 cpdef select_ilp(apps, Topology topo, network_config, int num_paths, debug=False,
-                 fairness=Fairness.WEIGHTED, epoch_mode=EpochComposition.WORST):
+                 fairness=Fairness.WEIGHTED, epoch_mode=EpochComposition.WORST, profile=False,
+                 time_budget=None, callback=None):
     """
     Global path selection function. This chooses paths across multiple applications
     for the given topology, under a global cap for total number of paths.
@@ -174,37 +318,79 @@ cpdef select_ilp(apps, Topology topo, network_config, int num_paths, debug=False
         is usually acceptable.
     :param debug: if True, output additional debug information,
         and write ILP+results to disk.
+    :param profile: if True, measure model sizes in the optimization's
+        :py:meth:`~sol.opt.optbase.Optimization.get_profile` and log the profile
+    :param time_budget: wall-clock time, in seconds, the selection (building and solving the ILP) may take.
+        The solver is stopped when the budget runs out, and the best solution found so far is used.
+    :param callback: called with the :py:class:`SelectionProgress` of the selection, once the ILP is solved
 
     :return: None, the applications' :py:attr:`sol.App.pptc` attribute will
         be modified to reflect selected paths.
 
     """
     logger.info('Selecting paths using the ILP')
-    start_time = time.time()
+    cdef double start_time = time.time()
+    cdef double deadline = _deadline(start_time, time_budget)
     opt = compose_apps(apps, topo, network_config, fairness=fairness,
-                       epoch_mode=epoch_mode)
-    opt.cap_num_paths((topo.num_nodes() - 1) ** 2 * num_paths)
+                       epoch_mode=epoch_mode, backend_opts=_profile_opts(profile))
+    with opt.phase(u'constraint', u'cap_num_paths'):
+        opt.cap_num_paths((topo.num_nodes() - 1) ** 2 * num_paths)
+    build_time = time.time() - start_time
+    if time_budget is not None:
+        _limit_time(opt, deadline)
     logger.debug('Solving ILP selection problem')
     opt.solve()
-    all_time = opt.get_time() - start_time
+    all_time = time.time() - start_time
     if debug:
         opt.write('debug/select_ilp_{}'.format(topo.name))
     if not opt.is_solved():
-        raise SOLException("Could not solve path selection problem for "
-                           "topology %s" % topo.name)
+        # The solver may have been stopped by the time budget, with a feasible solution
+        if time_budget is None or not opt.has_solution():
+            raise SOLException("Could not solve path selection problem for "
+                               "topology %s" % topo.name)
+        logger.info('ILP selection stopped by the time budget, using the best solution found')
     if debug:
         opt.write_solution('debug/select_ilp_solution_{}'.format(topo.name))
+    _log_profile(opt, profile)
     # get the paths chosen by the optimization
     # This will mask paths according to selection automatically:
-    # opt.get_chosen_paths()
-    return opt, opt.get_chosen_paths(), all_time, opt.get_time()
+    chosen = opt.get_chosen_paths()
+    _report(callback, 0, opt.get_solved_objective(), _masks(chosen), build_time, opt.get_time(), start_time)
+    return opt, chosen, all_time, opt.get_time()
 
 
 cpdef select_iterative(apps, topo, network_config, max_iter, epsilon, fairness, epoch_mode,
-                       sort_mode='len', debug=False):
+                       sort_mode='len', debug=False, warm_start=False, profile=False,
+                       time_budget=None, callback=None):
+    """
+    Select paths by iteratively doubling the number of paths per traffic class (starting with the
+    best 5, as determined by *sort_mode*) until the objective stops improving.
+
+    The optimization is built once, over all paths, and re-solved as more paths are enabled
+    (see :py:class:`~sol.opt.composer.CompositionSession`).
+    If *warm_start* is True, every solve starts from the previous solution.
+    If *profile* is True, model sizes are measured and the profile of all iterations is logged.
+
+    :param time_budget: wall-clock time, in seconds, the selection may take. An iteration is only solved if
+        there is time left to solve it (estimated by the longest solve so far), and then to solve the last
+        solved iteration again if the iteration has no solution (twice the longest solve, as the solver then
+        starts from the solution of another iteration).
+    :param callback: called with the :py:class:`SelectionProgress` of the selection after every solved
+        iteration. If the callback returns True, the selection stops.
+    :return: a tuple of the optimization, the chosen paths (the applications' paths, masked),
+        the total time and the solver time.
+        The optimization is built once over all candidate paths, but it only exposes the chosen paths:
+        path indices of its paths and variables (see :py:meth:`~sol.opt.optbase.Optimization.get_xps`)
+        match the paths of the returned PPTC.
+    """
     logger.info('Selecting paths using iterative method')
-    start_time = time.time()
-    all_pptc = PPTC.merge([a.pptc for a in apps])
+    cdef double start_time = time.time()
+    cdef double deadline = _deadline(start_time, time_budget)
+    session = CompositionSession(apps, topo, network_config, fairness=fairness, epoch_mode=epoch_mode,
+                                 backend_opts=_profile_opts(profile), warm_start=warm_start)
+    build_time = time.time() - start_time
+    all_pptc = session.pptc
+    opt = session.opt
     cdef int i = 0
     cdef float diff = 1 << 10;
     old_val = 0
@@ -212,6 +398,9 @@ cpdef select_iterative(apps, topo, network_config, max_iter, epsilon, fairness,
     all_time = 0
     opt_time = 0
     indices = None
+    best_masks = None
+    # longest wall-clock time of a solve, see time_budget
+    cdef double solve_time = 0, solve_start
     if sort_mode == 'len':
         indices = k_shortest_paths(all_pptc, k, ret_mask=True)
     elif sort_mode == 'resource':
@@ -228,41 +417,231 @@ cpdef select_iterative(apps, topo, network_config, max_iter, epsilon, fairness,
     cdef int mp = all_pptc.max_paths(all=True)
 
     while i < max_iter and diff > epsilon and k < mp:
+        if time.time() + 3 * solve_time >= deadline:
+            logger.info('Iterative selection stopped by the time budget after %d iterations' % i)
+            break
         logger.info('Selection iteration %d, num_paths=%d, diff=%f' % (i, k, diff))
         for tc in all_pptc.tcs():
             ind = indices[tc]
-            mask = all_pptc.get_mask(tc)
+            mask = all_pptc.get_mask_array(tc)
             mask[ind[:min(k, mask.size)]] = 0
             all_pptc.mask(tc, mask)
-        opt = compose_apps(apps, topo, network_config, fairness=fairness, epoch_mode=epoch_mode)
+        solve_start = time.time()
+        if time_budget is not None:
+            _limit_time(opt, deadline - 2 * solve_time)
+        opt = session.solve()
+        solve_time = max(solve_time, time.time() - solve_start)
         if debug:
             opt.write('debug/select_iterative_{}'.format(i))
-        opt.solve()
         if opt.is_solved():
             obj = opt.get_solved_objective()
             diff = obj - old_val
             old_val = obj
             opt_time += opt.get_time()
+            best_masks = _masks(all_pptc)
             if debug:
                 opt.write_solution('debug/select_iterative_{}'.format(i))
+            if _report(callback, i, obj, best_masks, build_time, opt_time, start_time):
+                logger.info('Iterative selection stopped by the callback after %d iterations' % (i + 1))
+                break
         k *= 2
         i += 1
+    if not opt.is_solved() and best_masks is not None:
+        # The last solve was cut short, go back to the best state
+        for tc in all_pptc.tcs():
+            all_pptc.mask(tc, best_masks[tc.ID])
+        if time_budget is not None:
+            _limit_time(opt, deadline)
+        opt = session.solve()
+        opt_time += opt.get_time()
     all_time = time.time() - start_time
     if not opt.is_solved():
-        raise SOLException('No solution exists')
-    return opt, opt.get_chosen_paths(relaxed=True), all_time, opt_time
-
-
-
-
-
+        if time_budget is None or not opt.has_solution():
+            raise SOLException('No solution exists')
+        logger.info('Iterative selection stopped by the time budget, using the best solution found')
+    _log_profile(opt, profile)
+    return opt, session.get_chosen_paths(relaxed=True), all_time, opt_time
 
+cdef _path_costs(prices, graph, int epoch):
+    """
+    Costs of the links for pricing paths in the given epoch: the price of a link plus the price of the node
+    the link leads to (the source node, the only node no link of the path leads to, is priced separately)
+    """
+    costs = defaultdict(float)
+    for element, price in iteritems(prices):
+        if price[epoch] <= 0:
+            continue
+        if isinstance(element, tuple):
+            costs[element] += price[epoch]
+        else:
+            for u in graph.predecessors(element):
+                costs[(u, element)] += price[epoch]
+    return costs
 
+cdef dict _generate_columns(PPTC pptc, opt, engine, Topology topo, double epsilon, predicate, cutoff):
+    """
+    Price paths with the duals of the solved relaxation, and find the paths that would improve it
 
+    :return: a dictionary mapping traffic classes to their new paths (lists of nodes)
+    """
+    cdef dict result = {}
+    cdef TrafficClass tc
+    cdef int e
+    for tc in pptc.tcs():
+        alloc, prices = opt.get_prices(tc)
+        volumes = tc.volFlows.compressed()
+        existing = set(tuple(p.nodes()) for p in pptc.all_paths(tc))
+        found = []
+        for e in range(volumes.size):
+            if volumes[e] <= 0:
+                continue
+            cheapest = engine.cheapest_path(tc.src, tc.dst, _path_costs(prices, topo.get_graph(), e),
+                                          hop_cost=epsilon)
+            if cheapest is None:
+                continue
+            nodes, cost = cheapest
+            if tc.src in prices:
+                cost += prices[tc.src][e]
+            key = tuple(nodes)
+            if -alloc[e] - volumes[e] * cost <= epsilon or key in existing:
+                continue
+            if (cutoff is not None and len(nodes) - 1 > cutoff) or \
+                    (predicate is not None and not predicate(Path(nodes), topo)):
+                continue
+            existing.add(key)
+            found.append(nodes)
+        if found:
+            result[tc] = found
+    return result
+
+cpdef select_colgen(apps, Topology topo, network_config, int max_iter=50, double epsilon=1e-6,
+                    fairness=Fairness.WEIGHTED, epoch_mode=EpochComposition.WORST, predicate=None, cutoff=None,
+                    debug=False, profile=False, time_budget=None, callback=None):
+    """
+    Select paths by column generation: instead of enumerating paths up front, start from the paths of the
+    applications (e.g., only the shortest path of every traffic class) and add paths as they are needed.
 
+    Every iteration solves the LP relaxation of the composed optimization, and prices paths with its dual
+    prices (see :py:meth:`~sol.opt.optbase.Optimization.get_prices`): the cheapest path of every traffic
+    class, with nodes and links weighted by their prices, is added if it would improve the relaxation.
+    Once no path improves it (or after *max_iter* iterations), the optimization is solved over the
+    generated paths.
 
+    If the composed optimization is a linear program in which paths only carry flow and consume resources
+    (see :py:meth:`~sol.opt.optbase.Optimization.can_add_paths`), it is built once: new paths are added to it
+    in place, and it is solved again. Otherwise, the relaxation is rebuilt in every iteration, and the final
+    optimization is built over the generated paths.
 
+    Only the resource loads are priced. Path constraints that do not depend on loads (e.g., path latency)
+    do not guide the generation. New paths do not use middleboxes, so applications whose paths use
+    middleboxes are not supported. New paths are added to the applications' paths
+    (see :py:meth:`~sol.path.paths.PPTC.extend`).
 
+    :param apps: list of applications for which we are selecting paths
+    :param topo: network topology
+    :param network_config: the network configuration (e.g., global network capacities)
+    :param max_iter: maximum number of pricing iterations
+    :param epsilon: minimum improvement (reduced cost) of a new path
+    :param predicate: new paths must satisfy the predicate (see :py:mod:`~sol.path.predicates`).
+        If None, all paths are valid
+    :param cutoff: maximum length of new paths, in hops
+    :param time_budget: wall-clock time, in seconds, after which no new iterations are started.
+        The final solve is limited to the time left, and its best solution so far is used.
+    :param callback: called with the :py:class:`SelectionProgress` of the selection after every
+        iteration, with the objective of the relaxation. If the callback returns True, the generation stops.
+    :param profile: if True, model sizes are measured, and the profiles of the optimizations of all
+        iterations and of the final optimization (or of the one optimization) are logged
+    :return: a tuple of the final optimization, the chosen paths, the total time and the solver time
+    :raise InvalidConfigException: if the paths of an application use middleboxes
+    """
+    logger.info('Selecting paths using column generation')
+    for app in apps:
+        for tc in app.pptc.tcs():
+            for p in app.pptc.all_paths(tc):
+                if isinstance(p, PathWithMbox):
+                    raise InvalidConfigException(ERR_COLGEN_MBOX.format(app.name))
+    cdef double start_time = time.time()
+    cdef double deadline = _deadline(start_time, time_budget)
+    engine = topo.path_engine()
+    cdef PPTC all_pptc = PPTC.merge([app.pptc for app in apps])
+    cdef dict added = {}
+    cdef int i = 0
+    cdef list profiles = []
+    opt_time = 0
+    t = time.time()
+    opt = compose_apps(apps, topo, network_config, fairness=fairness, epoch_mode=epoch_mode,
+                       backend_opts=_profile_opts(profile), all_pptc=all_pptc)
+    in_place = opt.can_add_paths()
+    if not in_place:
+        opt.relax_to_lp()
+    build_time = time.time() - t
+    # whether the optimization holds a solution over all the paths
+    stale = True
+    while i < max_iter:
+        if time.time() >= deadline:
+            logger.info('Column generation stopped by the time budget after %d iterations' % i)
+            break
+        if opt is None:
+            t = time.time()
+            all_pptc = PPTC.merge([app.pptc for app in apps])
+            opt = compose_apps(apps, topo, network_config, fairness=fairness, epoch_mode=epoch_mode,
+                               backend_opts=_profile_opts(profile), all_pptc=all_pptc)
+            opt.relax_to_lp()
+            build_time += time.time() - t
+        if time_budget is not None:
+            _limit_time(opt, deadline)
+        opt.solve()
+        opt_time += opt.get_time()
+        stale = False
+        if not opt.is_solved():
+            if time.time() >= deadline:
+                break
+            raise SOLException('Could not solve the relaxed path selection problem for '
+                               'topology %s' % topo.name)
+        obj = opt.get_solved_objective()
+        added = _generate_columns(all_pptc, opt, engine, topo, epsilon, predicate, cutoff)
+        logger.info('Column generation iteration %d, objective=%f, new paths=%d' % (
+            i, obj, sum([len(v) for v in added.values()])))
+        # the path sets are shared with the applications, so the paths are added to them as well
+        for tc, paths in iteritems(added):
+            all_pptc.extend(tc, [Path(nodes) for nodes in paths])
+        if added:
+            stale = True
+            if in_place:
+                t = time.time()
+                opt.add_paths()
+                build_time += time.time() - t
+            else:
+                profiles.append(opt.get_profile())
+                opt = None
+        i += 1
+        if _report(callback, i - 1, obj, _masks(all_pptc), build_time, opt_time, start_time):
+            logger.info('Column generation stopped by the callback after %d iterations' % i)
+            break
+        if not added:
+            break
+    if not in_place:
+        if opt is not None:
+            profiles.append(opt.get_profile())
+        t = time.time()
+        opt = compose_apps(apps, topo, network_config, fairness=fairness, epoch_mode=epoch_mode,
+                           backend_opts=_profile_opts(profile))
+        build_time += time.time() - t
+        stale = True
+    if stale:
+        if time_budget is not None:
+            _limit_time(opt, deadline)
+        opt.solve()
+        opt_time += opt.get_time()
+    if debug:
+        opt.write('debug/select_colgen_{}'.format(topo.name))
+    if not opt.is_solved():
+        if time_budget is None or not opt.has_solution():
+            raise SOLException("Could not solve path selection problem for "
+                               "topology %s" % topo.name)
+        logger.info('Column generation stopped by the time budget, using the best solution found')
+    _log_profile(opt, profile, profiles)
+    return opt, opt.get_chosen_paths(), time.time() - start_time, opt_time
 
 
 #######################################
@@ -338,14 +717,14 @@ cdef inline double _saprob(oldo, newo, temp):
 cdef _obj_state(opt):
     return opt.get_solved_objective() if opt.is_solved() else -inf
 
-
-cdef _expel(tcid, existing_mask, xps, mode=ExpelMode.no_flow):
+cdef _expel(tcid, existing_mask, ndarray xvals, mode=ExpelMode.no_flow):
     """
     Kick out paths by masking them in the pptc
     :param tcid: traffic class for which this is performed
     :param existing_mask: existing path mask (for the given traffic class).
         This mask will be modified in-place (no copy)!
-    :param xps: all the x_* variables from the last available optimization
+    :param xvals: values of the x_* variables from the last available optimization, indexed by
+        traffic class, unmasked path and epoch
     :param mode: expel mode, see :py:class:ExpelMode
     :return: the updated mask, which is really a pointer to the existing_mask
     """
@@ -353,13 +732,13 @@ cdef _expel(tcid, existing_mask, xps, mode=ExpelMode.no_flow):
     if mode == ExpelMode.no_flow:
         for i, maskval in enumerate(existing_mask):
             if not maskval:  # the value was unmasked and path was used
-                if not any([x.x != 0 for x in xps[tcid, ii, :] if not isinstance(x, int)]):
+                if not (xvals[tcid, ii, :] != 0).any():
                     existing_mask[i] = 1  # mask it, it was useless path
                 ii += 1
     elif mode == ExpelMode.inverse_flow:
         for i, maskval in enumerate(existing_mask):
             if not maskval:  # the value was unmasked and path was used
-                flow = mean([x.x for x in xps[tcid, ii, :] if not isinstance(x, int)])
+                flow = mean(xvals[tcid, ii, :])
                 # sample uniformly at random; if low enough kick the path anyway
                 # flow == 0 -> 100% probability of getting expelled
                 # flow == 1, 1-1 = 0 -> 0% of getting expelled
@@ -378,33 +757,61 @@ cdef _expel(tcid, existing_mask, xps, mode=ExpelMode.no_flow):
         raise ValueError('Unsupported annealing expel mode: %s' % mode)
     return existing_mask
 
-cdef bool _in(ndarray mask, explored):
+cdef class _Explored:
+    """
+    Path masks (combinations) explored for a traffic class. Masks are kept as packed bits
+    in a hash set, so checking whether a mask was explored takes constant time.
+    When more than *max_size* masks were explored, the oldest ones are forgotten
+    (and may be explored again).
     """
-    Check that the existing mask (i.e., path combination has been used before)
+    cdef object _keys
+    cdef ndarray _last
+    cdef public long max_size
+
+    def __init__(self, ndarray mask, long max_size=10000):
+        self._keys = OrderedDict()
+        self.max_size = max_size
+        self.append(mask)
+
+    cpdef append(self, ndarray mask):
+        """
+        Add an explored mask. The mask becomes the :py:meth:`last` one, it should not be modified afterwards.
+        """
+        key = packbits(mask).tobytes()
+        self._keys.pop(key, None)
+        self._keys[key] = None
+        while len(self._keys) > self.max_size:
+            self._keys.popitem(last=False)
+        self._last = mask
+
+    cpdef ndarray last(self):
+        """
+        :return: the last explored mask
+        """
+        return self._last
 
-    .. warning::
-        This is dependent on mask arrays being of dtype bool
-        We XORing the arrays here (for speed) and bool arrays give us the results
-        we expect.
+    def __contains__(self, ndarray mask):
+        # masks of a traffic class have the same length, so packed bits are unique
+        return packbits(mask).tobytes() in self._keys
 
-    :param mask: path mask (combination) to check
-    :param explored: previously explored combinations
-    :return: True or False
+    def __len__(self):
+        return len(self._keys)
+
+cdef _path_score(PPTC pptc, Topology topo, resource_weights):
     """
-    cdef ndarray x
-    for x in explored:
-        if (bitwise_xor(mask, x) == 0).all():
-            return True
-    return False
+    Score all paths (including masked ones) by the bottleneck of each resource along the path,
+    and the path length. Resources (and 'len') are weighed using *resource_weights*.
 
-cdef double _path_score(Path path, Topology topo, resource_weights):
-    radd = defaultdict([])
-    for nl in chain(path.nodes(), path.links()):
-        res = topo.get_resources(nl)
-        for r in res:
-            radd[r].append(res[r])
-    radd['len'].append(len(path))
-    return sum(resource_weights[r] * min(radd[r]) for r in radd)
+    :return: an array of scores, one per global path index (see :py:meth:`PPTC.path_index`)
+    """
+    resources = set()
+    for nl in chain(topo.nodes(), topo.links()):
+        resources.update(topo.get_resources(nl))
+    resources = sorted(resources)
+    nres, lres = _element_resources(topo, resources)
+    weights = array([resource_weights.get(r, 0) for r in resources], dtype=float)
+    return resource_weights.get('len', 0) * _path_lengths(pptc, topo) + \
+        _bottlenecks(pptc, topo, nres, lres).dot(weights)
 
 cdef _replace(explored, mask, num_paths,
               mode=ReplaceMode.next_sorted, tree=None):
@@ -412,11 +819,12 @@ cdef _replace(explored, mask, num_paths,
     Replace paths by picking some and adding them to the mask.
     For a single traffic class
 
-    :param explored: Paths that have already been explored/used
+    :param explored: Path combinations that have already been explored/used (an :py:class:`_Explored`)
     :param mask: the current path mask (after paths have been expelled)
     :param num_paths: number of paths we want
     :param mode: replacement mode
-    :param tree: if the replacement mode is pathtree, provide the tree here
+    :param tree: if the replacement mode is pathtree, provide the tree here.
+        If the replacement mode is pathscore, provide the path indices, sorted by decreasing score.
     :return:
     """
     cdef int num_tries = 0, max_tries = 100, i = 0
@@ -431,15 +839,18 @@ cdef _replace(explored, mask, num_paths,
     if len(unused) < replace_len:
         mask[:] = 0
         return
-    if mode == ReplaceMode.next_sorted:
+    if mode == ReplaceMode.next_sorted or mode == ReplaceMode.pathscore:
         # Just keep going down the list of paths
         # XXX: this assumes paths have been sorted by length in increasing order
+        if mode == ReplaceMode.pathscore:
+            # go down the list of paths in the order of their scores instead
+            unused = [i for i in tree if mask[i] == 1]
         found_new = False
         for comb in combinations(unused, replace_len):
             # print comb
             mask[list(comb)] = 0
             # print mask
-            if not _in(mask, explored):
+            if mask not in explored:
                 found_new = True
                 break
             else:
@@ -452,7 +863,7 @@ cdef _replace(explored, mask, num_paths,
     elif mode == ReplaceMode.random:
         comb = choice(unused, replace_len, replace=False)
         mask[comb] = 0
-        while not _in(mask, explored) and num_tries < max_tries:
+        while mask in explored and num_tries < max_tries:
             mask[comb] = 1
             comb = choice(unused, replace_len, replace=0)
             mask[comb] = 0
@@ -463,7 +874,7 @@ cdef _replace(explored, mask, num_paths,
             comb.add(next(tree))
         comb = list(comb)
         mask[comb] = 0
-        while _in(mask, explored) and num_tries < max_tries:
+        while mask in explored and num_tries < max_tries:
             mask[comb] = 1
             comb = set()
             while len(comb) < replace_len:
@@ -477,140 +888,399 @@ cdef _replace(explored, mask, num_paths,
 cdef _get_mboxes(x):
     return x.mboxes()
 
-cpdef select_sa(apps, Topology topo, network_config, int num_paths=5, int max_iter=20,
-                double tstart=.72, double c=.88,
-                fairness=Fairness.WEIGHTED,
-                epoch_mode=EpochComposition.WORST,
-                expel_mode=ExpelMode.no_flow,
-                replace_mode=ReplaceMode.next_sorted,
-                resource_weights=None,
-                cb=None,
-                select_config=None, debug=False):
+class _AnnealingChain(object):
     """
-    Select optimal paths using the simulated annealing search algorithm
+    A simulated annealing chain: the optimization (built once over all paths), the explored path masks
+    and the best state so far. See :py:func:`select_sa` for the arguments.
     """
 
-    logger.info('Starting simulated annealing selection')
-    logger.debug('Replace mode %s' % replace_mode)
-    # Starting temperature and probability of acceptance
-    cdef double t = tstart, prob
-    # Merge all paths
-    all_pptc = PPTC.merge([a.pptc for a in apps])
-    # compute number of epochs
-    cdef int nume = ma.compressed(next(all_pptc.tcs()).volFlows).size
-    # compute length of paths per each traffic class
-    pptc_len = {tc: all_pptc.num_paths(tc) for tc in all_pptc.tcs()}
-    explored = {}  # all explored combos per traffic class
-    bestopt = None  # best available optimization
-    opt = None  # current optimization
-    bestpaths = {tc: None for tc in all_pptc.tcs()}  # indices of best paths, initialized to empty
-    cdef unsigned int accepted = 1  # whether the new state was accepted or not
-    cdef int k = 0  # iteration number
-
-    # Helper vars to measure time elapsed
-    cdef double start_time = time.time()
-    cdef double opt_time = 0
-
-    # choose shortest paths first
-    initial_masks = k_shortest_paths(all_pptc, num_paths, ret_mask=True)
-    for tc in initial_masks:
-        explored[tc] = [initial_masks[tc]]
-
-    # TODO: build resource scores for different paths
-
-
-    # build the pathtrees for each traffic class
-    pathtrees = {}
-    if replace_mode == ReplaceMode.pathtree:
-        for tc in all_pptc.tcs():
-            pathtrees[tc] = PathTree(all_pptc.all_paths(tc))
-    elif replace_mode == ReplaceMode.pathscore:
-        for tc in all_pptc.tcs():
-            _sort_by_func(all_pptc[tc], functools.partial(_path_score, topo=topo, resource_weights=resource_weights))
-    else:
-        for tc in all_pptc.tcs():
-            pathtrees[tc] = None
-
-    # Create and solve the initial problem
-    opt = compose_apps(apps, topo, network_config, fairness=fairness, epoch_mode=epoch_mode)
-    opt.solve()
-    opt_time += opt.get_time()
-
-    if debug:
-        opt.write('debug/annealing_{}_{}'.format(topo.name, k))
+    def __init__(self, apps, Topology topo, network_config, int num_paths, double tstart, double c, fairness,
+                 epoch_mode, expel_mode, replace_mode, resource_weights, debug, warm_start, profile,
+                 max_explored):
+        cdef double build_start = time.time()
+        self.topo = topo
+        self.num_paths = num_paths
+        self.tstart = tstart
+        self.c = c
+        self.expel_mode = expel_mode
+        self.replace_mode = replace_mode
+        self.debug = debug
+        # Build the optimization once, over all paths. Only the path masks change between iterations
+        self.session = CompositionSession(apps, topo, network_config, fairness=fairness, epoch_mode=epoch_mode,
+                                          backend_opts=_profile_opts(profile), warm_start=warm_start)
+        self.pptc = self.session.pptc
+        # compute length of paths per each traffic class
+        self.pptc_len = {tc: self.pptc.num_paths(tc, all=True) for tc in self.pptc.tcs()}
+        self.explored = {}  # all explored combos per traffic class
+        self.opt = None  # the optimization, solved for the current state
+        self.opt_time = 0
+        self.bestobj = -inf  # objective of the best state
+        self.bestx = None  # flow values of the best state
+        self.solve_time = 0  # longest wall-clock time of a solve, including applying the masks
+        self.step_time = 0  # longest wall-clock time of a step
+        self.bestpaths = {tc: None for tc in self.pptc.tcs()}  # best path masks
+        self.accepted = True  # whether the last state was accepted or not
+        self.deadline = inf  # solves of new states are stopped at the deadline
+
+        # choose shortest paths first
+        k_shortest_paths(self.pptc, num_paths, ret_mask=True)
+        for tc in self.pptc.tcs():
+            self.explored[tc] = _Explored(self.pptc.get_mask_array(tc), max_explored)
+
+        # build the pathtrees for each traffic class
+        self.pathtrees = {}
+        if replace_mode == ReplaceMode.pathtree:
+            for tc in self.pptc.tcs():
+                self.pathtrees[tc] = PathTree(self.pptc.all_paths(tc))
+        elif replace_mode == ReplaceMode.pathscore:
+            # paths are replaced in the order of their scores
+            scores = _split_by_tc(self.pptc, _path_score(self.pptc, topo, resource_weights or {}))
+            lens = _split_by_tc(self.pptc, _path_lengths(self.pptc, topo))
+            for tc in self.pptc.tcs():
+                self.pathtrees[tc] = _rank(scores[tc], lens[tc])
+        else:
+            for tc in self.pptc.tcs():
+                self.pathtrees[tc] = None
+        self.build_time = time.time() - build_start
 
-    logger.debug('Shortest paths produced a solution: {}'.format(opt.is_solved()))
+    def solve(self, double deadline):
+        """
+        Solve the optimization for the current masks
 
-    # We need to find at least one acceptable state
-    while not opt.is_solved() and k <= max_iter:
-        # resample paths:
-        for tc in all_pptc.tcs():
-            newmask = _expel(tc.ID, explored[tc][-1], None, ExpelMode.all)
-            _replace(explored[tc], newmask, num_paths, replace_mode,
-                     tree=pathtrees[tc])
-            explored[tc].append(newmask)
-        # Re-run opt
-        opt = compose_apps(apps, topo, network_config, fairness=fairness, epoch_mode=epoch_mode)
-        opt.solve()
-        opt_time += opt.get_time()
-        k += 1
-    if k > max_iter:
-        raise SOLException("Could not solve the base simulated annealing problem after %d iterations" % max_iter)
+        :param deadline: wall-clock time at which the solver is stopped, if the chain has a :py:attr:`deadline`
+        """
+        cdef double start = time.time()
+        if not isinf(self.deadline):
+            _limit_time(self.session.opt, deadline)
+        self.opt = self.session.solve()
+        self.opt_time += self.opt.get_time()
+        self.solve_time = max(self.solve_time, time.time() - start)
+        return self.opt
+
+    def reserve(self):
+        """
+        :return: the time kept to solve the best state again (see :py:meth:`finish`): twice the longest solve
+            so far, as the solver then starts from the solution of another state
+        """
+        return 2 * self.solve_time
 
-    # this is the best we have so far
-    bestopt = opt
-    for tc in all_pptc.tcs():
-        bestpaths[tc] = explored[tc][-1]
+    def expired(self):
+        """
+        :return: True if there is no time left for a new step (estimated by the longest step so far),
+            and then to solve the best state again
+        """
+        return time.time() + self.step_time + self.reserve() >= self.deadline
 
-    logger.info('Starting SA simulation')
+    def start(self, int max_iter):
+        """
+        Solve the initial state (shortest paths), resampling the paths until a solution is found.
+        The initial state is solved regardless of the deadline.
 
-    for k in arange(1, max_iter):
+        :raise SOLException: if there is no solution after *max_iter* attempts
+        """
+        cdef int k = 0
+        opt = self.solve(inf)
+        if self.debug:
+            opt.write('debug/annealing_{}_{}'.format(self.topo.name, k))
+        logger.debug('Shortest paths produced a solution: {}'.format(opt.is_solved()))
+
+        # We need to find at least one acceptable state
+        while not opt.is_solved() and k <= max_iter:
+            # resample paths:
+            for tc in self.pptc.tcs():
+                newmask = _expel(tc.ID, self.explored[tc].last().copy(), None, ExpelMode.all)
+                _replace(self.explored[tc], newmask, self.num_paths, self.replace_mode, tree=self.pathtrees[tc])
+                self.pptc.mask(tc, newmask)
+                self.explored[tc].append(newmask)
+            # Re-run opt
+            opt = self.solve(inf)
+            k += 1
+        if k > max_iter:
+            raise SOLException("Could not solve the base simulated annealing problem after %d iterations" % max_iter)
+
+        # this is the best we have so far
+        self.bestobj = _obj_state(opt)
+        self.bestx = opt.get_x_values()
+        for tc in self.pptc.tcs():
+            self.bestpaths[tc] = self.explored[tc].last()
+
+    def step(self, int k):
+        """
+        Iteration *k* of the annealing: expel and replace paths of the best state, solve, and accept
+        the new state (or not)
+        """
         # Lower the temperature
-        t = tstart * power(c, k)
-
+        cdef double t = self.tstart * power(self.c, k), prob
+        cdef double step_start = time.time()
         # Generate a new set of paths
         # Get exisiting path fractions first
-        optvars = bestopt.get_xps()
-        for tc in explored:
+        for tc in self.explored:
             # nothing we can do if we don't have any new paths to substitute
-            if num_paths >= pptc_len[tc]:
+            if self.num_paths >= self.pptc_len[tc]:
                 continue
             # otherwise check what paths have been unused by the best optimization
-            newmask = _expel(tc.ID, bestpaths[tc].copy(), optvars,
-                             expel_mode)
-            _replace(explored[tc], newmask, num_paths, replace_mode, tree=pathtrees[tc])
+            newmask = _expel(tc.ID, self.bestpaths[tc].copy(), self.bestx, self.expel_mode)
+            _replace(self.explored[tc], newmask, self.num_paths, self.replace_mode, tree=self.pathtrees[tc])
             # modify app pptc accoriding to indices
-            all_pptc.mask(tc, newmask)
-            explored[tc].append(newmask)
-
-        opt = compose_apps(apps, topo, network_config, fairness=fairness, epoch_mode=epoch_mode)
-        opt.solve()
-        opt_time += opt.get_time()
-        if debug:
-            opt.write('debug/annealing_{}_{}'.format(topo.name, k))
+            self.pptc.mask(tc, newmask)
+            self.explored[tc].append(newmask)
+        if time.time() + self.solve_time + self.reserve() >= self.deadline:
+            # the optimization keeps the solution of the last state
+            logger.debug('No time left to solve k=%d' % k)
+            self.step_time = max(self.step_time, time.time() - step_start)
+            return
+
+        opt = self.solve(self.deadline - self.reserve())
+        if self.debug:
+            opt.write('debug/annealing_{}_{}'.format(self.topo.name, k))
 
         if not opt.is_solved():
             logger.debug('No solution k=%d' % k)
-            # if db is not None:
-            #     db.insert_one(dict(solvetime=opt.get_time(), time=time.time() - start_time,
-            #                        temperature=t, accepted=0, iteration=k, config_id=config_id))
-            # continue
 
-        prob = _saprob(_obj_state(bestopt), _obj_state(opt), t)
+        prob = _saprob(self.bestobj, _obj_state(opt), t)
         if random.random() <= prob:
-            bestopt = opt
-            for tc in explored:
-                bestpaths[tc] = explored[tc][-1]
-            accepted = 1
+            self.bestobj = _obj_state(opt)
+            self.bestx = opt.get_x_values()
+            for tc in self.explored:
+                self.bestpaths[tc] = self.explored[tc].last()
+            self.accepted = True
         else:
-            accepted = 0
+            self.accepted = False
+        self.step_time = max(self.step_time, time.time() - step_start)
+
+    def best_state(self):
+        """
+        :return: the objective, the flow values and the path masks (by traffic class ID) of the best state
+        """
+        return self.bestobj, self.bestx, {tc.ID: mask for tc, mask in iteritems(self.bestpaths)}
+
+    def adopt(self, obj, x, masks):
+        """
+        Continue from the best state of another chain, if it is better than the best state of this chain
+
+        :param obj: the objective of the state
+        :param x: the flow values of the state
+        :param masks: path masks, by traffic class ID
+        """
+        if obj <= self.bestobj:
+            return
+        self.bestobj = obj
+        self.bestx = x
+        for tc in self.explored:
+            self.bestpaths[tc] = masks[tc.ID]
+            self.explored[tc].append(masks[tc.ID])
+        # the optimization does not hold the best state anymore
+        self.accepted = False
+
+    def finish(self):
+        """
+        Mask the paths of the best state. If the optimization does not hold the solution of the best state,
+        it is solved again, and stopped at the :py:attr:`deadline`.
+
+        :raise SOLException: if the best state has no solution at the deadline
+        :return: the optimization, solved for the best state
+        """
+        for tc in self.pptc.tcs():
+            self.pptc.mask(tc, self.bestpaths[tc])
+        # The optimization holds the last solution, re-solve it if that state was not accepted
+        if not self.accepted:
+            opt = self.solve(self.deadline)
+            if not opt.is_solved():
+                if not opt.has_solution():
+                    raise SOLException('Could not solve the best simulated annealing state before the deadline')
+                logger.info('Annealing stopped by the time budget, using the best solution found')
+        return self.opt
+
+cdef _chain_option(value, int i):
+    """
+    Option of the i-th annealing chain: a sequence of options is cycled over the chains
+    """
+    if isinstance(value, (list, tuple)):
+        return value[i % len(value)]
+    return value
+
+def _run_chain(conn, apps, topo, network_config, dict options, int max_iter, int exchange, deadline, seed):
+    """
+    Run an annealing chain in a worker process (see :py:func:`select_sa`). After every *exchange* iterations,
+    the best state is sent over *conn*, and the best state of all chains is received back.
+    """
+    cdef int k = 1, stop
+    try:
+        random.seed(seed)
+        numpy_seed(seed)
+        chain = _AnnealingChain(apps, topo, network_config, **options)
+        chain.deadline = deadline
+        chain.start(max_iter)
+        while True:
+            stop = min(k + exchange, max_iter)
+            while k < stop and not chain.expired():
+                chain.step(k)
+                k += 1
+            done = k >= max_iter or chain.expired()
+            conn.send((done, k, chain.best_state(), chain.opt_time, chain.build_time,
+                       chain.opt.get_profile() if options.get('profile') else None))
+            if done:
+                break
+            chain.adopt(*conn.recv())
+    except Exception as e:
+        conn.send(e)
+    finally:
+        conn.close()
+
+cdef tuple _select_sa_parallel(apps, Topology topo, network_config, dict options, int max_iter, int chains,
+                               int exchange, deadline, seed, callback, double start_time):
+    """
+    Run annealing chains in parallel: the first chain in the calling process, and the others in worker processes.
+    After every *exchange* iterations, the chains share their best states, which is reported to the callback,
+    and continue from the best state of all chains.
+
+    :return: the first chain (which holds the best state of all chains), the solver time of the other chains,
+        and the profiles of their optimizations (if profiling was asked for)
+    """
+    cdef int k = 1, stop
+    conns, procs = [], []
+    if seed is not None:
+        random.seed(seed)
+        numpy_seed(seed)
+    else:
+        seed = random.randrange(1 << 30)
+    for i in range(1, chains):
+        conn, child_conn = Pipe()
+        chain_options = {name: _chain_option(value, i) for name, value in iteritems(options)}
+        proc = Process(target=_run_chain, args=(child_conn, apps, topo, network_config, chain_options, max_iter,
+                                                exchange, deadline, seed + i))
+        proc.daemon = True
+        proc.start()
+        child_conn.close()
+        conns.append(conn)
+        procs.append(proc)
+    opt_times = [0] * len(conns)
+    build_times = [0] * len(conns)
+    profiles = [None] * len(conns)
+    try:
+        # the first chain is built and run while the other chains are
+        chain = _AnnealingChain(apps, topo, network_config,
+                                **{name: _chain_option(value, 0) for name, value in iteritems(options)})
+        chain.deadline = deadline
+        chain.start(max_iter)
+        done = False
+        running = list(range(len(conns)))
+        while True:
+            if not done:
+                stop = min(k + exchange, max_iter)
+                while k < stop and not chain.expired():
+                    chain.step(k)
+                    k += 1
+                done = k >= max_iter or chain.expired()
+            best = chain.best_state()
+            results = {}
+            iteration = k
+            for i in running:
+                res = conns[i].recv()
+                if isinstance(res, Exception):
+                    raise res
+                results[i], chain_iter, state, opt_times[i], build_times[i], profiles[i] = res
+                iteration = max(iteration, chain_iter)
+                if state[0] > best[0]:
+                    best = state
+            logger.debug('Best objective of %d annealing chains: %s' % (len(running) + 1, best[0]))
+            chain.adopt(*best)
+            if _report(callback, iteration, best[0], best[2], max(build_times + [chain.build_time]),
+                       sum(opt_times) + chain.opt_time, start_time):
+                logger.info('Annealing stopped by the callback after %d iterations' % iteration)
+                break
+            running = [i for i in running if not results[i]]
+            for i in running:
+                conns[i].send(best)
+            if done and not running:
+                break
+    finally:
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+            proc.join()
+    return chain, sum(opt_times), [p for p in profiles if p is not None]
 
-            # if db is not None:
-            #     val = dict(obj=_obj_state(opt), solvetime=opt.get_time(), time=time.time() - start_time,
-            #                temperature=t, accepted=accepted, iteration=k, config_id=config_id)
-            #     db.insert(val)
+cpdef select_sa(apps, Topology topo, network_config, int num_paths=5, int max_iter=20,
+                double tstart=.72, double c=.88,
+                fairness=Fairness.WEIGHTED,
+                epoch_mode=EpochComposition.WORST,
+                expel_mode=ExpelMode.no_flow,
+                replace_mode=ReplaceMode.next_sorted,
+                resource_weights=None,
+                cb=None,
+                select_config=None, debug=False, warm_start=False, profile=False,
+                int chains=1, int exchange=5, time_budget=None, seed=None, max_explored=10000, callback=None):
+    """
+    Select optimal paths using the simulated annealing search algorithm
 
-    for tc in all_pptc:
-        all_pptc.mask(tc, bestpaths[tc])
+    If *warm_start* is True, every solve starts from the previous solution
+    (see :py:class:`~sol.opt.warmstart.WarmStart`).
+    If *profile* is True, model sizes are measured and the profile of all iterations is logged
+    (with parallel chains, the profiles of all chains).
+
+    With *chains* larger than 1, independent annealing chains run in parallel, the first one in the calling
+    process and the others in worker processes, each with its own optimization and random seed.
+    Every *exchange* iterations, the chains share their best states, and continue from the best state of all
+    chains. *expel_mode* and *replace_mode* can then be lists, to run the chains with different modes
+    (modes are cycled over the chains). The first chain finally returns the best state of all chains:
+    if another chain found it, it is solved again in the calling process (within the time budget).
+
+    :param time_budget: wall-clock time, in seconds, the selection may take (across all chains).
+        A new state is only solved if there is time left to solve it (estimated by the longest solve so far),
+        and then to solve the best state again if the optimization does not hold its solution at the end
+        (twice the longest solve, as the solver then starts from the solution of another state).
+        A solve stopped by the deadline is not accepted. The initial state is always solved.
+    :param callback: called with the :py:class:`SelectionProgress` of the selection after the initial state
+        is solved and every time a new state is accepted (with parallel chains, after every exchange).
+        If the callback returns True, the selection stops.
+    :param cb: deprecated alias of *callback*
+    :param seed: seed of the random choices. Chain *i* uses *seed + i*
+    :param max_explored: number of explored path combinations remembered per traffic class
+        (and not explored again). Older combinations are forgotten first.
+    :return: a tuple of the optimization (solved for the best state), the paths, the total time,
+        and the time spent solving (by all chains).
+        As with :py:func:`select_iterative`, path indices of the optimization match the returned paths.
+    """
 
-    return bestopt, all_pptc, time.time() - start_time, opt_time
+    logger.info('Starting simulated annealing selection')
+    logger.debug('Replace mode %s' % replace_mode)
+    # Helper vars to measure time elapsed
+    cdef double start_time = time.time()
+    cdef double opt_time = 0
+    cdef double deadline = _deadline(start_time, time_budget)
+    if callback is None:
+        callback = cb
+    options = dict(num_paths=num_paths, tstart=tstart, c=c, fairness=fairness, epoch_mode=epoch_mode,
+                   expel_mode=expel_mode, replace_mode=replace_mode, resource_weights=resource_weights,
+                   debug=debug, warm_start=warm_start, profile=profile, max_explored=max_explored)
+    profiles = None
+    if chains > 1:
+        chain, opt_time, profiles = _select_sa_parallel(apps, topo, network_config, options, max_iter, chains,
+                                                        exchange, deadline, seed, callback, start_time)
+    else:
+        if seed is not None:
+            random.seed(seed)
+            numpy_seed(seed)
+        chain = _AnnealingChain(apps, topo, network_config,
+                                **{name: _chain_option(value, 0) for name, value in iteritems(options)})
+        chain.deadline = deadline
+        chain.start(max_iter)
+        logger.info('Starting SA simulation')
+        stop = _report(callback, 0, chain.bestobj, chain.best_state()[2], chain.build_time, chain.opt_time,
+                       start_time)
+        for k in range(1, max_iter):
+            if stop:
+                logger.info('Annealing stopped by the callback after %d iterations' % (k - 1))
+                break
+            if chain.expired():
+                logger.info('Annealing stopped by the time budget after %d iterations' % (k - 1))
+                break
+            chain.step(k)
+            if chain.accepted:
+                stop = _report(callback, k, chain.bestobj, chain.best_state()[2], chain.build_time,
+                               chain.opt_time, start_time)
+    opt = chain.finish()
+    opt_time += chain.opt_time
+    _log_profile(opt, profile, profiles)
+    return opt, chain.pptc, time.time() - start_time, opt_time
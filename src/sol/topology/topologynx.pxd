@@ -6,6 +6,14 @@ from cpython cimport bool
 cdef class Topology:
     cdef public unicode name
     cdef public _graph
+    # number of modifications made through the topology methods
+    cdef long _version
+    # boolean node arrays (see mbox_mask), and the version they were computed for
+    cdef dict _masks
+    cdef tuple _masks_version
+    # shared k-shortest paths engine (see path_engine), and the version it was built for
+    cdef object _engine
+    cdef tuple _engine_version
 
     cdef _process_graph(self)
     cpdef num_nodes(self, unicode service=*)
@@ -27,3 +35,10 @@ cdef class Topology:
     cpdef set_mbox(self, int node, val=*)
     cpdef int diameter(self)
     cpdef bool is_leaf(self, int node)
+    cpdef mbox_mask(self)
+    cpdef service_mask(self, service)
+    cdef _node_mask(self, key)
+    cpdef tuple version(self)
+    cpdef unicode fingerprint(self)
+    cpdef touch(self)
+    cpdef path_engine(self)
@@ -2,9 +2,12 @@
 """
 Implements the topology for SOL optimization
 """
+import hashlib
+import json
 from itertools import chain
 
 import networkx as nx
+import numpy as np
 from cpython cimport bool
 from networkx.readwrite import graphml, json_graph
 
@@ -81,6 +84,7 @@ cdef class Topology:
         """
         assert isinstance(graph, nx.DiGraph)
         self._graph = graph
+        self.touch()
 
     def write_graph(self, fname, fmt='auto'):
         """ Save the topology to disk
@@ -116,6 +120,7 @@ cdef class Topology:
             self._graph = nx.read_gml(fname, destringizer=int).to_directed()
         else:
             raise ValueError(ERR_FMT)
+        self.touch()
 
     cpdef get_service_types(self, int node):
         """
@@ -158,6 +163,7 @@ cdef class Topology:
         else:
             types = [service_type]
         self._graph.nodes[node][SERVICES] = u';'.join(types)
+        self.touch()
 
     cpdef nodes(self, data=False):
         """
@@ -198,6 +204,7 @@ cdef class Topology:
             self._graph.edges[node_or_link][RESOURCES][resource] = capacity
         else:
             self._graph.nodes[node_or_link][RESOURCES][resource] = capacity
+        self.touch()
 
     cpdef dict get_resources(self, node_or_link):
         """
@@ -269,6 +276,7 @@ cdef class Topology:
         :param val: True or False
         """
         self._graph.nodes[node][HAS_MBOX] = str(val)
+        self.touch()
 
     cpdef set_mbox(self, int node, val=True):
         """
@@ -302,6 +310,85 @@ cdef class Topology:
         except KeyError:
             return False
 
+    cpdef mbox_mask(self):
+        """
+        Which nodes have middleboxes, for vectorized checks of many paths at once.
+        Cached until the topology changes (see :py:meth:`version`).
+
+        :return: a boolean array indexed by node ID
+        """
+        return self._node_mask(HAS_MBOX)
+
+    cpdef service_mask(self, service):
+        """
+        Which nodes provide a service (see :py:meth:`get_service_types`).
+        Cached until the topology changes (see :py:meth:`version`).
+
+        :param service: the service type
+        :return: a boolean array indexed by node ID
+        """
+        return self._node_mask((SERVICES, service))
+
+    cdef _node_mask(self, key):
+        version = self.version()
+        if self._masks is None or self._masks_version != version:
+            self._masks = {}
+            self._masks_version = version
+        mask = self._masks.get(key)
+        if mask is None:
+            nodes = list(self._graph.nodes())
+            mask = np.zeros(max(nodes) + 1 if nodes else 0, dtype=bool)
+            for n in nodes:
+                mask[n] = self.has_middlebox(n) if key == HAS_MBOX else key[1] in self.get_service_types(n)
+            self._masks[key] = mask
+        return mask
+
+    cpdef tuple version(self):
+        """
+        A value that changes whenever the topology is modified, used to invalidate cached paths
+        (see :py:class:`~sol.path.pathcache.PathCache`).
+
+        Changes made through the topology (e.g., :py:meth:`set_resource`) are counted. Changes made
+        directly to the graph, including adding or removing nodes and links, must be followed by a call
+        to :py:meth:`touch`. The numbers of nodes and links are part of the version, but they do not
+        detect every change (e.g., a link replaced by another), and the version is checked far too often
+        to hash the whole graph every time.
+
+        :return: a tuple of (number of modifications, graph identity, number of nodes, number of links)
+        """
+        return self._version, id(self._graph), self._graph.number_of_nodes(), self._graph.number_of_edges()
+
+    cpdef unicode fingerprint(self):
+        """
+        A digest of the topology graph: its nodes and links, with all of their attributes.
+        Unlike :py:meth:`version`, equal topologies have equal fingerprints, across processes.
+
+        :return: a hex digest
+        """
+        desc = (sorted(self._graph.nodes(data=True)), sorted(self._graph.edges(data=True)))
+        return unicode(hashlib.sha1(json.dumps(desc, sort_keys=True, default=str).encode('utf-8')).hexdigest())
+
+    cpdef touch(self):
+        """
+        Mark the topology as modified, see :py:meth:`version`
+        """
+        self._version += 1
+
+    cpdef path_engine(self):
+        """
+        A :py:class:`~sol.path.ksp.KShortestPaths` engine over this topology, shared by all path
+        generation on it. Rebuilt when the topology changes (see :py:meth:`version`).
+
+        :return: the engine
+        """
+        version = self.version()
+        if self._engine is None or self._engine_version != version:
+            # Imported here, paths depend on the topology module
+            from sol.path.ksp import KShortestPaths
+            self._engine = KShortestPaths(self._graph)
+            self._engine_version = version
+        return self._engine
+
     def paths(self, int source, int sink, int cutoff):
         """
         Return an iterator over all of the simple paths in this topology.
@@ -313,17 +400,15 @@ cdef class Topology:
         :return: an iterator over a list of paths (where each path is simply a
             list of nodes, not a Path object yet)
 
+        .. note::
+            All calls share one engine (see :py:meth:`path_engine`). To generate paths for many pairs,
+            use :py:func:`~sol.path.generate.generate_paths_tc`.
+
         .. warning:
             This could be a lot of paths!
         """
-        # return nx.all_simple_paths(self._graph, source, sink, cutoff)
-        for p in nx.shortest_simple_paths(self._graph, source, sink):
-            # We need the -1 here because len(p) will count nodes, not hops.
-            # Hops is the expected length metric for Path objects
-            if len(p) - 1 <= cutoff:
-                yield p
-            else:
-                return
+        # Length is counted in hops, not nodes, which is the expected length metric for Path objects
+        return self.path_engine().paths(source, sink, cutoff)
 
     def to_json(self):
         return json_graph.node_link_data(self._graph)
@@ -92,9 +92,16 @@ MINSTR = u'min'
 ALLSTR = u'all'
 VALIDSTR = u'valid'
 
-# CPLEX = u'cplex'
-# GUROBI = u'gurobi'
-# DEFAULT_OPTIMIZER = GUROBI
+
+class Backend(Enum):
+    """
+    Supported optimization (solver) backends
+    """
+    GUROBI = u'gurobi'
+    HIGHS = u'highs'
+
+DEFAULT_BACKEND = Backend.GUROBI
+
 NODES = 'nodes'
 LINKS = 'links'
 PATHS = 'paths'
@@ -104,6 +111,12 @@ SELECT_RANDOM = u'random'
 SELECT_SHORTEST = u'shortest'
 SELECT_ANNEALING = u'sa'
 
+# Path generation strategies, see sol.path.generate.generate_paths_tc
+GENERATE_SHORTEST = u'shortest'
+GENERATE_EDGE_DISJOINT = u'edge_disjoint'
+GENERATE_NODE_DISJOINT = u'node_disjoint'
+GENERATE_DIVERSE = u'diverse'
+
 # Pre-defined resource names
 BANDWIDTH = u'bw'
 CPU = u'cpu'
@@ -132,6 +145,7 @@ FORMAT_AUTO = u'auto'
 # Error/warning strings
 ERR_NO_GUROBI = u'Cannot use Gurobi Python API. Please install Gurobi and ' \
                 u'gurobipy'
+ERR_NO_HIGHS = u'Cannot use the HiGHS solver. Please install scipy>=1.9.0'
 ERR_FMT = u'Given format is not supported'
 ERR_NO_PATH = u'No paths between nodes {} and {}'
 ERR_EPOCH_MISMATCH = u'Number of epochs insosistent across traffic classes'
@@ -141,6 +155,15 @@ ERR_UNKNOWN_MODE = u'Uknown %s mode: %s'
 ERR_UNKNOWN_TYPE = u'Uknonw %s type: %s'
 ERR_ODD_ARITY = u'-arity of a FatTree topology must be even'
 ERR_OP_NOT_SUPP = u'Operation not supported'
+ERR_PATH_MASK = u'Paths can only be masked in an optimization built over all (unmasked) paths'
+ERR_STALE_PATHS = u'Paths in {} were saved with fingerprint {}, expected {}'
+ERR_PATHS_TC = u'Paths in {} do not match traffic class {}'
+ERR_NO_DUALS = u'Dual prices are only available for solved linear programs (see relax_to_lp) that were built, ' \
+               u'not loaded'
+ERR_ADD_PATHS = u'Paths can only be added to linear optimizations in which paths only carry flow and consume ' \
+                u'resources (without cost functions)'
+ERR_PATHS_REMOVED = u'Paths were masked or removed since the optimization was built, only new paths can be added'
+ERR_COLGEN_MBOX = u'Column generation only adds paths without middleboxes, but application {} uses middleboxes'
 ERR_NO_NORM = "Not normalizing objective functions can produce invalid results, "\
               "especially when composing applications"
 # WARN_NO_PATH_ID = u'No ID given to Path constructor, ' \
@@ -21,6 +21,13 @@ class NoPathsException(InvalidConfigException):
     pass
 
 
+class StalePathsException(SOLException):
+    """
+    Saved paths were generated for a different topology or with different parameters
+    """
+    pass
+
+
 class UnsupportedOperationException(Exception):
     """
     Something is either not allowed or not implemented yet
@@ -0,0 +1,137 @@
+# coding=utf-8
+"""
+Check that the HiGHS backend produces the same solutions as the default one
+"""
+from itertools import product
+
+import pytest
+from numpy import array
+
+from sol import NetworkCaps
+from sol import NetworkConfig
+from sol.opt.app import App
+from sol.opt.backends import get_backend
+from sol.opt.quickstart import from_app
+from sol.path.generate import generate_paths_tc, use_mbox_modifier
+from sol.path.predicates import null_predicate, has_mbox_predicate
+from sol.topology.generators import complete_topology
+from sol.topology.traffic import TrafficClass
+from sol.utils.const import *
+from sol.utils.exceptions import InvalidConfigException
+
+pytest.importorskip('scipy', minversion='1.9')
+
+
+def test_get_backend():
+    from sol.opt.highswrapper import OptimizationHighs
+    assert get_backend(Backend.HIGHS) is OptimizationHighs
+    assert get_backend(u'highs') is OptimizationHighs
+    assert get_backend(OptimizationHighs) is OptimizationHighs
+    with pytest.raises(InvalidConfigException):
+        get_backend(u'nosuchsolver')
+
+
+def test_shortest_path():
+    """ Check that we can correctly implement shortest path routing """
+    topo = complete_topology(5)
+    tcs = [TrafficClass(0, u'classname', 0, 2)]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, cutoff=100)
+    appconfig = {
+        'name': u'minLatencyApp',
+        'constraints': [(Constraint.ROUTE_ALL, (pptc.tcs(),), {})],
+        'obj': (Objective.MIN_LATENCY, (), {}),
+        'resource_cost': {}
+    }
+    app = App(pptc, **appconfig)
+    opt = from_app(topo, app, NetworkConfig(None), backend=Backend.HIGHS)
+    opt.solve()
+    assert opt.is_solved()
+
+    paths = opt.get_paths()
+    for pi, p in enumerate(paths.paths(tcs[0])):
+        if list(p.nodes()) == [0, 2]:
+            assert abs(p.flow_fraction() - 1) <= EPSILON
+        else:
+            assert abs(p.flow_fraction()) <= EPSILON
+
+    # norm factor for latency is diameter * n^2
+    norm = topo.diameter() * 25
+    assert abs(opt.get_solved_objective(app)[0] - (1 - 1 / norm)) <= EPSILON
+    assert abs(opt.get_solved_objective() - (1 - 1 / norm)) <= EPSILON
+
+
+@pytest.mark.parametrize('cap', [1e-3, .5, 1])
+def test_maxflow(cap):
+    """ Check that maxflow works correctly, for a single traffic class """
+    topo = complete_topology(4)
+    for link in topo.links():
+        topo.set_resource(link, BANDWIDTH, 1)
+    tcs = [TrafficClass(0, u'classname', 0, 2, array([3]))]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, cutoff=100)
+    appconfig = {
+        'name': u'mf',
+        'constraints': [],
+        'obj': (Objective.MAX_FLOW, (), {}),
+        'resource_cost': {BANDWIDTH: (LINKS, 1, None)}
+    }
+    app = App(pptc, **appconfig)
+    caps = NetworkCaps(topo)
+    caps.add_cap(BANDWIDTH, cap=cap)
+    opt = from_app(topo, app, NetworkConfig(caps), backend=Backend.HIGHS)
+    opt.solve()
+    assert opt.is_solved()
+    assert abs(opt.get_solved_objective(app)[0] - cap) <= EPSILON
+    assert abs(opt.get_solved_objective() - cap) <= EPSILON
+
+
+def test_te_app():
+    """ Test a single traffic engineering app"""
+    topo = complete_topology(4)
+    for link in topo.links():
+        topo.set_resource(link, BANDWIDTH, 1)
+    tcs = [TrafficClass(0, u'classname', 0, 2, array([1]))]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, cutoff=100)
+    appconfig = {
+        'name': u'te',
+        'constraints': [(Constraint.ROUTE_ALL, (), {})],
+        'obj': (Objective.MIN_LINK_LOAD, (BANDWIDTH,), {}),
+        'resource_cost': {BANDWIDTH: (LINKS, 1, None)}
+    }
+    app = App(pptc, **appconfig)
+    caps = NetworkCaps(topo)
+    caps.add_cap(BANDWIDTH, cap=1)
+    opt = from_app(topo, app, NetworkConfig(caps), backend=Backend.HIGHS)
+    opt.solve()
+    assert opt.is_solved()
+    # THE solution is 1-objective because of the maximization flip
+    assert abs(1 - opt.get_solved_objective(app)[0] - .33333) <= EPSILON
+    assert abs(1 - opt.get_solved_objective() - .33333) <= EPSILON
+
+
+def test_mbox_load_balancing_all_tcs():
+    """Test the middlebox loadbalancing, with path selection binaries"""
+    topo = complete_topology(4)
+    for n in topo.nodes():
+        topo.set_resource(n, CPU, 1)
+        topo.set_mbox(n)
+    tcs = [TrafficClass(i, u'classname', s, t, array([.1]))
+           for i, (s, t) in enumerate(product(topo.nodes(), repeat=2))]
+    pptc = generate_paths_tc(topo, tcs, has_mbox_predicate, modify_func=use_mbox_modifier, cutoff=100)
+    appconfig = {
+        'name': u'mb_lb',
+        'constraints': [(Constraint.ROUTE_ALL, (), {}), (Constraint.REQ_ALL_NODES, (), {})],
+        'obj': (Objective.MIN_NODE_LOAD, (CPU,), {}),
+        'resource_cost': {CPU: (MBOXES, 1, None)}
+    }
+    app = App(pptc, **appconfig)
+    caps = NetworkCaps(topo)
+    caps.add_cap(CPU, cap=1)
+    opt = from_app(topo, app, NetworkConfig(caps), backend=Backend.HIGHS)
+    opt.solve()
+    assert opt.is_solved()
+    # 16 traffic classes with volume .1, spread evenly across 4 middleboxes
+    assert abs(1 - opt.get_solved_objective() - .4) <= EPSILON
+    assert set(opt.get_enabled_nodes()) == set(topo.nodes())
+    chosen = opt.get_chosen_paths()
+    for tc in chosen.tcs():
+        assert chosen.num_paths(tc) >= 1
@@ -1,21 +1,30 @@
 # coding=utf-8
+import logging
 from itertools import product
 
 import pytest
 from hypothesis import given
 from hypothesis import strategies as st
-from numpy import array
+from numpy import array, ones
 
 from sol import NetworkCaps
 from sol import NetworkConfig
 from sol.opt.app import App
+from sol.opt.backends import get_backend
+from sol.opt.composer import CompositionSession, compose_apps
 from sol.opt.funcs import CostFuncFactory
+from sol.opt.modelcache import ModelCache
 from sol.opt.quickstart import from_app
+from sol.opt.warmstart import WarmStart
 from sol.path.generate import generate_paths_tc, use_mbox_modifier
+from sol.path.paths import PPTC
 from sol.path.predicates import null_predicate, has_mbox_predicate
+from sol.path.select import k_shortest_paths, select_colgen, select_iterative, select_sa, ExpelMode, ReplaceMode, \
+    _Explored
 from sol.topology.generators import complete_topology
 from sol.topology.traffic import TrafficClass
 from sol.utils.const import *
+from sol.utils.exceptions import InvalidConfigException, UnsupportedOperationException
 
 
 # When comparing objective functions, use this as the precision
@@ -248,3 +257,536 @@ def test_mbox_load_balancing_all_tcs():
 def test_fixed_paths():
     pass
     # TODO: bring back fixed paths test
+
+
+@pytest.mark.parametrize('objective, resource, mode', [
+    (Objective.MIN_LINK_LOAD, BANDWIDTH, LINKS),
+    (Objective.MIN_NODE_LOAD, CPU, MBOXES),
+    (Objective.MAX_FLOW, BANDWIDTH, LINKS),
+])
+def test_matrix_build(objective, resource, mode):
+    """Check that building the model from sparse matrices yields the same solution"""
+    topo = complete_topology(4)
+    for n in topo.nodes():
+        topo.set_resource(n, CPU, 1)
+        topo.set_mbox(n)
+    for link in topo.links():
+        topo.set_resource(link, BANDWIDTH, 1)
+    pairs = [(s, t) for s, t in product(topo.nodes(), repeat=2) if s != t]
+    tcs = [TrafficClass(i, u'classname', s, t, array([.05, .1])) for i, (s, t) in enumerate(pairs)]
+    pptc = generate_paths_tc(topo, tcs, has_mbox_predicate, modify_func=use_mbox_modifier, cutoff=100)
+    appconfig = {
+        'name': u'app',
+        'constraints': [],
+        'obj': (objective, (resource,) if objective != Objective.MAX_FLOW else (), {}),
+        'resource_cost': {resource: (mode, 1, None)}
+    }
+    if objective != Objective.MAX_FLOW:
+        appconfig['constraints'].append((Constraint.ROUTE_ALL, (), {}))
+    app = App(pptc, **appconfig)
+    caps = NetworkCaps(topo)
+    caps.add_cap(resource, cap=.5)
+    solutions = []
+    for matrix in (False, True):
+        opt = from_app(topo, app, NetworkConfig(caps), backend_opts=dict(matrix=matrix))
+        # adds the binary path variables and x_* <= b_* rows
+        opt.cap_num_paths(2 * len(tcs))
+        opt.solve()
+        assert opt.is_solved()
+        solutions.append(opt.get_solved_objective())
+    assert abs(solutions[0] - solutions[1]) <= EPSILON
+
+
+def test_sparse_load():
+    """Check that consumed loads are stored as sparse (node/link by x_* position) matrices"""
+    topo = complete_topology(5)
+    for link in topo.links():
+        topo.set_resource(link, BANDWIDTH, 2)
+    tcs = [TrafficClass(0, u'classname', 0, 2, array([1, 3]))]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, cutoff=100)
+    appconfig = {
+        'name': u'te',
+        'constraints': [(Constraint.ROUTE_ALL, (), {})],
+        'obj': (Objective.MIN_LINK_LOAD, (BANDWIDTH,), {}),
+        'resource_cost': {BANDWIDTH: (LINKS, 1, None)}
+    }
+    app = App(pptc, **appconfig)
+    opt = from_app(topo, app, NetworkConfig())
+    loads = opt._load_dict[BANDWIDTH]
+    assert len(loads) == 1
+    num_links = sum(len(p.links()) for p in pptc.paths(tcs[0]))
+    # one entry per path link and epoch, scaled by volume and capacity
+    assert loads[0].nnz == num_links * 2
+    assert sorted(set(loads[0].data)) == [.5, 1.5]
+
+
+@pytest.mark.parametrize('backend', [Backend.GUROBI, Backend.HIGHS])
+def test_composition_session(backend):
+    """Check that re-solving a session with masked paths matches rebuilding the optimization"""
+    topo = complete_topology(4)
+    for link in topo.links():
+        topo.set_resource(link, BANDWIDTH, 1)
+    tcs = [TrafficClass(0, u'classname', 0, 2, array([1]))]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, cutoff=100)
+    appconfig = {
+        'name': u'te',
+        'constraints': [(Constraint.ROUTE_ALL, (), {})],
+        'obj': (Objective.MIN_LINK_LOAD, (BANDWIDTH,), {}),
+        'resource_cost': {BANDWIDTH: (LINKS, 1, None)}
+    }
+    app = App(pptc, **appconfig)
+    caps = NetworkCaps(topo)
+    caps.add_cap(BANDWIDTH, cap=1)
+    session = CompositionSession([app], topo, NetworkConfig(caps), backend=backend)
+    for k in (1, 2, pptc.num_paths(tcs[0], all=True)):
+        k_shortest_paths(pptc, k)
+        opt = session.solve()
+        assert opt is session.opt
+        assert opt.is_solved()
+        rebuilt = from_app(topo, app, NetworkConfig(caps), backend=backend)
+        rebuilt.solve()
+        assert abs(opt.get_solved_objective() - rebuilt.get_solved_objective()) <= EPSILON
+    # all paths enabled, the load is split evenly
+    assert abs(1 - opt.get_solved_objective() - .33333) <= EPSILON
+
+
+@pytest.mark.parametrize('backend', [Backend.GUROBI, Backend.HIGHS])
+def test_add_paths(backend):
+    """Check that paths added in place give the same optimization as building it over all paths"""
+    topo = complete_topology(5)
+    for link in topo.links():
+        topo.set_resource(link, BANDWIDTH, 1)
+    caps = NetworkCaps(topo)
+    caps.add_cap(BANDWIDTH, cap=1)
+
+    def build(constraints=(), **kwargs):
+        tcs = [TrafficClass(0, u'a', 0, 2, array([1, .5])), TrafficClass(1, u'b', 1, 2, array([.5, 1]))]
+        app = App(generate_paths_tc(topo, tcs, null_predicate, cutoff=100, **kwargs), name=u'te',
+                  constraints=[(Constraint.ROUTE_ALL, (), {})] + list(constraints),
+                  obj=(Objective.MIN_LINK_LOAD, (BANDWIDTH,), {}), resource_cost={BANDWIDTH: (LINKS, 1, None)})
+        return tcs, app
+
+    tcs, full_app = build()
+    full = compose_apps([full_app], topo, NetworkConfig(caps), epoch_mode=EpochComposition.WORST, backend=backend)
+    full.solve()
+    tcs, app = build(max_paths=1)
+    opt = compose_apps([app], topo, NetworkConfig(caps), epoch_mode=EpochComposition.WORST, backend=backend)
+    assert opt.can_add_paths()
+    opt.solve()
+    assert opt.get_solved_objective() < full.get_solved_objective() - EPSILON
+    # the shortest paths are there already, the other paths are new
+    for tc in tcs:
+        app.pptc.extend(tc, full_app.pptc.paths(tc)[1:])
+    opt.add_paths()
+    opt.solve()
+    assert opt.is_solved()
+    assert abs(opt.get_solved_objective() - full.get_solved_objective()) <= EPSILON
+    x = opt.get_x_values()
+    for tc in tcs:
+        assert abs(x[tc.ID, :app.pptc.num_paths(tc)].sum(axis=0) - 1).max() <= EPSILON
+
+    # paths that also appear in other constraints cannot be added
+    tcs, app = build([(Constraint.REQ_ALL_LINKS, (), {})], max_paths=1)
+    opt = compose_apps([app], topo, NetworkConfig(caps), backend=backend)
+    assert not opt.can_add_paths()
+    app.pptc.extend(tcs[0], full_app.pptc.paths(tcs[0])[1:])
+    with pytest.raises(UnsupportedOperationException):
+        opt.add_paths()
+
+
+@pytest.mark.parametrize('backend', [Backend.GUROBI, Backend.HIGHS])
+def test_min_enabled_nodes(backend):
+    """Both backends enable the same nodes, and normalize the objective the same way"""
+    topo = complete_topology(5)
+    tcs = [TrafficClass(0, u'classname', 0, 2, array([1]))]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, cutoff=100)
+    opt = get_backend(backend)(topo, pptc)
+    opt.route_all(tcs)
+    opt.req_all_nodes()
+    obj = opt.min_enabled_nodes()
+    opt.compose_objectives(array([obj]), EpochComposition.AVG, Fairness.WEIGHTED, ones((1, 1)))
+    opt.solve()
+    assert opt.is_solved()
+    # only the source and the sink are enabled
+    assert abs(opt.get_solved_objective() - .6) <= EPSILON
+
+
+def test_explored_masks():
+    """Check that explored path combinations are found by their packed bits, and the oldest are forgotten"""
+    masks = [array(m, dtype=bool) for m in ([0, 1, 1], [1, 0, 1], [1, 1, 0])]
+    explored = _Explored(masks[0], max_size=2)
+    assert masks[0] in explored and masks[1] not in explored
+    explored.append(masks[1])
+    assert explored.last() is masks[1]
+    explored.append(masks[2])
+    assert len(explored) == 2
+    assert masks[0] not in explored
+    assert masks[1] in explored and masks[2] in explored
+    assert array([1, 1, 0, 0, 0, 0, 0, 0, 0], dtype=bool) not in _Explored(ones(9, dtype=bool))
+
+
+def _profile_count(caplog, phase):
+    """Number of records of a phase in the last logged selection profile"""
+    message = [r.getMessage() for r in caplog.records if r.getMessage().startswith(u'Selection profile')][-1]
+    return int([line.split() for line in message.splitlines() if line.startswith(phase)][0][1])
+
+
+def test_select_sa_chains(caplog):
+    """Check that parallel annealing chains return the best state, within the time budget"""
+    topo = complete_topology(5)
+    for link in topo.links():
+        topo.set_resource(link, BANDWIDTH, 1)
+    tcs = [TrafficClass(i, u'classname', s, t, array([.2])) for i, (s, t) in
+           enumerate(product(range(3), range(3, 5)))]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, cutoff=100)
+    app = App(pptc, name=u'te', constraints=[(Constraint.ROUTE_ALL, (), {})],
+              obj=(Objective.MIN_LINK_LOAD, (BANDWIDTH,), {}), resource_cost={BANDWIDTH: (LINKS, 1, None)})
+    caps = NetworkCaps(topo)
+    caps.add_cap(BANDWIDTH, cap=1)
+    # only the initial (shortest paths) state
+    initial, _, _, _ = select_sa([app], topo, NetworkConfig(caps), num_paths=2, time_budget=0)
+    pptc.unmaskall()
+    # the best state is solved again (if needed) before the deadline
+    opt, _, total_time, _ = select_sa([app], topo, NetworkConfig(caps), num_paths=2, max_iter=10 ** 6, seed=3,
+                                      time_budget=.5)
+    assert opt.is_solved()
+    assert total_time <= .5
+    pptc.unmaskall()
+    with caplog.at_level(logging.INFO, logger=u'sol'):
+        opt, paths, total_time, opt_time = select_sa([app], topo, NetworkConfig(caps), num_paths=2, max_iter=6,
+                                                     chains=2, exchange=2, seed=3, profile=True,
+                                                     expel_mode=[ExpelMode.no_flow, ExpelMode.random])
+    # the logged profile covers the builds of both chains, the calling process runs one of them
+    assert _profile_count(caplog, u'decision_vars') == 2
+    assert opt.is_solved()
+    assert opt.get_solved_objective() >= initial.get_solved_objective() - EPSILON
+    assert 0 < opt_time <= total_time
+    for tc in tcs:
+        assert paths.num_paths(tc) <= 2
+    # the masks of the best state are applied to the applications' paths
+    assert all(pptc.num_paths(tc) == paths.num_paths(tc) for tc in tcs)
+    # the optimization is built over all candidate paths, but its path indices match the chosen paths
+    x = opt.get_x_values()
+    for tc in tcs:
+        chosen = [tuple(p.nodes()) for p in paths.paths(tc)]
+        assert [tuple(p.nodes()) for p in opt.get_paths().paths(tc)] == chosen
+        assert not x[tc.ID, len(chosen):].any()
+
+
+def test_select_progress():
+    """Check that selection strategies report their progress, and stop when the callback asks to"""
+    topo = complete_topology(5)
+    for link in topo.links():
+        topo.set_resource(link, BANDWIDTH, 1)
+    tcs = [TrafficClass(i, u'classname', s, t, array([.2])) for i, (s, t) in
+           enumerate(product(range(3), range(3, 5)))]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, cutoff=100)
+    app = App(pptc, name=u'te', constraints=[(Constraint.ROUTE_ALL, (), {})],
+              obj=(Objective.MIN_LINK_LOAD, (BANDWIDTH,), {}), resource_cost={BANDWIDTH: (LINKS, 1, None)})
+    caps = NetworkCaps(topo)
+    caps.add_cap(BANDWIDTH, cap=1)
+
+    progress = []
+    opt, paths, _, _ = select_iterative([app], topo, NetworkConfig(caps), 10, 1e-6, Fairness.WEIGHTED,
+                                        EpochComposition.WORST, time_budget=60, callback=progress.append)
+    assert opt.is_solved()
+    assert [p.iteration for p in progress] == list(range(len(progress)))
+    assert abs(progress[-1].objective - opt.get_solved_objective()) <= EPSILON
+    for p in progress:
+        assert sorted(p.masks) == [tc.ID for tc in tcs]
+        assert p.build_time >= 0 and 0 <= p.solve_time <= p.elapsed
+    # the optimization exposes the chosen paths, in the same order
+    x = opt.get_x_values()
+    for tc in tcs:
+        chosen = list(paths.paths(tc))
+        assert [tuple(p.nodes()) for p in opt.get_paths().paths(tc)] == [tuple(p.nodes()) for p in chosen]
+        assert all(x[tc.ID, i, 0] == p.flow_fraction() for i, p in enumerate(chosen))
+
+    # stop the annealing as soon as the initial state is solved
+    pptc.unmaskall()
+    progress = []
+    opt, paths, _, _ = select_sa([app], topo, NetworkConfig(caps), num_paths=2, max_iter=10,
+                                 callback=lambda p: progress.append(p) or True)
+    assert len(progress) == 1 and progress[0].iteration == 0
+    assert abs(progress[0].objective - opt.get_solved_objective()) <= EPSILON
+    for tc in tcs:
+        assert (paths.get_mask_array(tc) == progress[0].masks[tc.ID]).all()
+
+
+def test_select_resource_scores():
+    """Check selection with paths ranked by their bottleneck resources"""
+    topo = complete_topology(5)
+    for u, v in topo.links():
+        # links into node 2 are thin
+        topo.set_resource((u, v), BANDWIDTH, .1 if v == 2 else 1)
+    tcs = [TrafficClass(i, u'classname', s, t, array([.2])) for i, (s, t) in
+           enumerate(product(range(2), range(3, 5)))]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, cutoff=100)
+    app = App(pptc, name=u'te', constraints=[(Constraint.ROUTE_ALL, (), {})],
+              obj=(Objective.MIN_LINK_LOAD, (BANDWIDTH,), {}), resource_cost={BANDWIDTH: (LINKS, 1, None)})
+    caps = NetworkCaps(topo)
+    caps.add_cap(BANDWIDTH, cap=1)
+
+    progress = []
+    opt, paths, _, _ = select_iterative([app], topo, NetworkConfig(caps), 1, 1e-6, Fairness.WEIGHTED,
+                                        EpochComposition.WORST, sort_mode='resource', callback=progress.append)
+    assert opt.is_solved()
+    # the first iteration enables the 5 best paths: shorter paths first, then paths with
+    # the widest bottleneck (the longest enabled path avoids node 2)
+    for tc in tcs:
+        enabled = pptc.all_paths(tc)[~progress[0].masks[tc.ID]]
+        assert len(enabled) == 5
+        assert 2 not in max(enabled, key=len).nodes()
+
+    pptc.unmaskall()
+    opt, paths, _, _ = select_sa([app], topo, NetworkConfig(caps), num_paths=2, max_iter=4,
+                                 replace_mode=ReplaceMode.pathscore, resource_weights={BANDWIDTH: 1})
+    assert opt.is_solved()
+    for tc in tcs:
+        assert paths.num_paths(tc) <= 2
+
+
+def test_select_colgen(caplog):
+    """Check that column generation, starting from the shortest paths, finds the paths of the best solution"""
+    def build(constraints=(), **kwargs):
+        topo = complete_topology(6)
+        for link in topo.links():
+            topo.set_resource(link, BANDWIDTH, 1)
+        tcs = [TrafficClass(i, u'classname', s, t, array([.5, .3])) for i, (s, t) in
+               enumerate(product(range(2), range(3, 5)))]
+        pptc = generate_paths_tc(topo, tcs, null_predicate, cutoff=100, **kwargs)
+        app = App(pptc, name=u'te', constraints=[(Constraint.ROUTE_ALL, (), {})] + list(constraints),
+                  obj=(Objective.MIN_LINK_LOAD, (BANDWIDTH,), {}), resource_cost={BANDWIDTH: (LINKS, 1, None)})
+        caps = NetworkCaps(topo)
+        caps.add_cap(BANDWIDTH, cap=1)
+        return topo, tcs, app, NetworkConfig(caps)
+
+    topo, tcs, full_app, config = build()
+    full = compose_apps([full_app], topo, config, epoch_mode=EpochComposition.WORST)
+    full.solve()
+    assert full.is_solved()
+
+    topo, tcs, app, config = build(max_paths=1)
+    progress = []
+    with caplog.at_level(logging.INFO, logger=u'sol'):
+        opt, paths, _, _ = select_colgen([app], topo, config, callback=progress.append, profile=True)
+    assert opt.is_solved()
+    # the optimization is built once, and the new paths of every iteration are added to it
+    assert _profile_count(caplog, u'decision_vars') == 1
+    assert _profile_count(caplog, u'add_paths') == len(progress) - 1
+    assert _profile_count(caplog, u'solve') == len(progress)
+    assert progress[0].objective < progress[-1].objective
+    assert opt.get_solved_objective() == pytest.approx(full.get_solved_objective())
+    for tc in tcs:
+        assert 1 < app.pptc.num_paths(tc, all=True) < full_app.pptc.num_paths(tc, all=True)
+
+    # binary variables are relaxed while generating paths, and restored for the final solve
+    topo, tcs, app, config = build([(Constraint.REQ_ALL_LINKS, (), {})], max_paths=1)
+    progress = []
+    with caplog.at_level(logging.INFO, logger=u'sol'):
+        opt, paths, _, _ = select_colgen([app], topo, config, callback=progress.append, profile=True)
+    assert opt.is_solved()
+    # the relaxation is rebuilt in every iteration
+    assert _profile_count(caplog, u'decision_vars') == len(progress) + 1
+    assert opt.get_solved_objective() == pytest.approx(full.get_solved_objective())
+
+    # new paths would not use middleboxes
+    for n in topo.nodes():
+        topo.set_mbox(n)
+    mbox_app = App(generate_paths_tc(topo, tcs, null_predicate, cutoff=100, modify_func=use_mbox_modifier),
+                   name=u'mb', constraints=[(Constraint.ROUTE_ALL, (), {})],
+                   obj=(Objective.MIN_LINK_LOAD, (BANDWIDTH,), {}), resource_cost={BANDWIDTH: (LINKS, 1, None)})
+    with pytest.raises(InvalidConfigException):
+        select_colgen([mbox_app], topo, config)
+
+
+def test_warm_start():
+    """Check that solution values are carried over to a rebuilt optimization with different paths"""
+    topo = complete_topology(4)
+    for link in topo.links():
+        topo.set_resource(link, BANDWIDTH, 1)
+    tcs = [TrafficClass(0, u'classname', 0, 2, array([1]))]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, cutoff=100)
+    appconfig = {
+        'name': u'te',
+        'constraints': [(Constraint.ROUTE_ALL, (), {})],
+        'obj': (Objective.MIN_LINK_LOAD, (BANDWIDTH,), {}),
+        'resource_cost': {BANDWIDTH: (LINKS, 1, None)}
+    }
+    app = App(pptc, **appconfig)
+    ws = WarmStart()
+    opt = from_app(topo, app, NetworkConfig())
+    opt.cap_num_paths(2)
+    opt.solve()
+    assert ws.record(opt)
+    assert len(ws) == pptc.num_paths(tcs[0])
+    values = {tuple(p.nodes()): x.x for p, x in zip(pptc.paths(tcs[0]), opt.get_xps()[0, :, 0])}
+
+    # Drop the first path, the remaining ones move to different positions
+    mask = array([True] + [False] * (pptc.num_paths(tcs[0]) - 1))
+    pptc.mask(tcs[0], mask)
+    opt = from_app(topo, app, NetworkConfig())
+    opt.cap_num_paths(2)
+    ws.apply(opt)
+    for p, x in zip(pptc.paths(tcs[0]), opt.get_xps()[0, :, 0]):
+        assert x.Start == values[tuple(p.nodes())]
+    opt.solve()
+    assert opt.is_solved()
+
+
+def test_bulk_solution():
+    """Check that solution values read in bulk match the values of individual variables"""
+    topo = complete_topology(4)
+    for link in topo.links():
+        topo.set_resource(link, BANDWIDTH, 1)
+    tcs = [TrafficClass(0, u'classname', 0, 2, array([1, .5])), TrafficClass(1, u'classname', 1, 3, array([1, 1]))]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, cutoff=100)
+    appconfig = {
+        'name': u'te',
+        'constraints': [(Constraint.ROUTE_ALL, (), {})],
+        'obj': (Objective.MIN_LINK_LOAD, (BANDWIDTH,), {}),
+        'resource_cost': {BANDWIDTH: (LINKS, 1, None)}
+    }
+    app = App(pptc, **appconfig)
+    opt = from_app(topo, app, NetworkConfig())
+    opt.solve()
+    assert opt.is_solved()
+    xps = opt.get_xps()
+    vals = opt.get_x_values()
+    assert vals.shape == xps.shape
+    for tc in tcs:
+        for pi in range(pptc.num_paths(tc)):
+            assert [x.x for x in xps[tc.ID, pi]] == list(vals[tc.ID, pi])
+    for epoch in range(2):
+        paths = opt.get_paths(epoch)
+        for tc in tcs:
+            assert [p.flow_fraction() for p in paths.paths(tc)] == list(vals[tc.ID, :pptc.num_paths(tc), epoch])
+    chosen = opt.get_chosen_paths(relaxed=True)
+    for tc in tcs:
+        assert all([p.flow_fraction() > 0 for p in chosen.paths(tc)])
+        assert chosen.num_paths(tc) == (vals[tc.ID] > 0).any(axis=1).sum()
+
+
+def test_batch_build():
+    """Check that model updates are deferred until the batch is done"""
+    topo = complete_topology(4)
+    for link in topo.links():
+        topo.set_resource(link, BANDWIDTH, 1)
+    tcs = [TrafficClass(0, u'classname', 0, 2, array([1]))]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, cutoff=100)
+    appconfig = {
+        'name': u'te',
+        'constraints': [(Constraint.ROUTE_ALL, (), {})],
+        'obj': (Objective.MIN_LINK_LOAD, (BANDWIDTH,), {}),
+        'resource_cost': {BANDWIDTH: (LINKS, 1, None)}
+    }
+    app = App(pptc, **appconfig)
+    opt = from_app(topo, app, NetworkConfig())
+    model = opt.opt
+    num_vars, num_constrs = model.NumVars, model.NumConstrs
+    with opt.batch():
+        with opt.batch():
+            opt.cap_num_paths(1)
+        # nested blocks do not update the model
+        assert model.NumVars == num_vars and model.NumConstrs == num_constrs
+        objs = opt.max_flow(varname=u'flow')
+        assert len(objs) == 1
+    assert model.NumVars == num_vars + pptc.num_paths(tcs[0]) + 1
+    assert model.NumConstrs > num_constrs
+    opt.solve()
+    assert opt.is_solved()
+
+
+@pytest.mark.parametrize('backend', [Backend.GUROBI, Backend.HIGHS])
+def test_profile(backend):
+    """Check that every phase of building and solving the optimization is profiled"""
+    topo = complete_topology(4)
+    for link in topo.links():
+        topo.set_resource(link, BANDWIDTH, 1)
+    tcs = [TrafficClass(0, u'classname', 0, 2, array([1]))]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, cutoff=100)
+    appconfig = {
+        'name': u'te',
+        'constraints': [(Constraint.ROUTE_ALL, (), {})],
+        'obj': (Objective.MIN_LINK_LOAD, (BANDWIDTH,), {}),
+        'resource_cost': {BANDWIDTH: (LINKS, 1, None)}
+    }
+    app = App(pptc, **appconfig)
+    caps = NetworkCaps(topo)
+    caps.add_cap(BANDWIDTH, cap=1)
+    opt = compose_apps([app], topo, NetworkConfig(caps), backend=backend, backend_opts=dict(profile=True))
+    opt.solve()
+    assert opt.is_solved()
+    summary = opt.get_profile().summary()
+    assert list(summary) == [u'decision_vars', u'allocate_flow', u'consume', u'cap', u'constraint',
+                             u'objective', u'compose_objectives', u'solve']
+    assert summary[u'decision_vars'][u'vars'] == pptc.num_paths(tcs[0])
+    assert summary[u'allocate_flow'][u'constrs'] > 0
+    assert summary[u'cap'][u'nonzeros'] > 0
+    assert summary[u'solve'][u'vars'] == 0
+    by_name = opt.get_profile().summary(by_name=True)
+    assert (u'consume', BANDWIDTH) in by_name
+    assert (u'constraint', u'te:ROUTE_ALL') in by_name
+    assert opt.get_profile().total_time() >= opt.get_profile().total_time(u'solve') > 0
+
+    # without profile=True only times are recorded
+    opt = compose_apps([app], topo, NetworkConfig(caps), backend=backend)
+    assert all(r.vars is None for r in opt.get_profile())
+    assert len(opt.get_profile()) == 7
+
+
+@pytest.mark.parametrize('matrix', [False, True])
+def test_model_cache(tmpdir, matrix):
+    """Check that a cached model, restored for new volumes, matches a freshly built one"""
+    topo = complete_topology(4)
+    for link in topo.links():
+        topo.set_resource(link, BANDWIDTH, 1)
+
+    def build(vols, cache=None, apps=None):
+        tcs = [TrafficClass(0, u'a', 0, 2, array(vols[0])), TrafficClass(1, u'b', 1, 3, array(vols[1]))]
+        apps = [] if apps is None else apps
+        for tc in tcs:
+            apps.append(App(generate_paths_tc(topo, [tc], null_predicate, cutoff=100), **{
+                'name': tc.name,
+                'constraints': [(Constraint.ROUTE_ALL, (), {})],
+                'obj': (Objective.MIN_LINK_LOAD, (BANDWIDTH,), {}),
+                'resource_cost': {BANDWIDTH: (LINKS, 1, None)}
+            }))
+        caps = NetworkCaps(topo)
+        caps.add_cap(BANDWIDTH, cap=1)
+        opt = compose_apps(apps, topo, NetworkConfig(caps), backend_opts=dict(matrix=matrix), cache=cache)
+        opt.solve()
+        assert opt.is_solved()
+        return opt
+
+    cache = ModelCache(str(tmpdir))
+    first = build([[.5, 1], [.2, .1]], cache)
+    assert len(cache) == 1
+    vols = [[.25, .4], [.6, .3]]
+    cached = build(vols, cache)
+    assert len(cache) == 1
+    assert u'load' in cached.get_profile().summary()
+    fresh = build(vols)
+    assert abs(cached.get_solved_objective() - fresh.get_solved_objective()) <= EPSILON
+    assert abs(cached.get_solved_objective() - first.get_solved_objective()) > EPSILON
+    # weights of the restored objectives can be given once for all epochs
+    apps = []
+    fname = str(tmpdir.join(u'weighted'))
+    build(vols, apps=apps).save(fname)
+    all_pptc = PPTC.merge([app.pptc for app in apps])
+    restored = []
+    for weights in (array([.9, .1]), array([[.9, .9], [.1, .1]])):
+        opt = type(fresh).load(topo, all_pptc, fname, weights=weights)
+        opt.solve()
+        restored.append(opt.get_solved_objective())
+    assert abs(restored[0] - restored[1]) <= EPSILON
+    assert abs(restored[0] - fresh.get_solved_objective()) > EPSILON
+    # loads saved for a traffic class without volume cannot be rescaled
+    apps = []
+    build([[.25, 0], [.6, .3]], apps=apps).save(fname)
+    assert type(fresh).load(topo, all_pptc, fname) is None
+    # a different topology is a miss, and the least recently used model is evicted
+    cache.max_size = cache.size()
+    topo.set_resource((0, 1), BANDWIDTH, 2)
+    build(vols, cache)
+    assert len(cache) == 1
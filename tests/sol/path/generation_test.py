@@ -2,16 +2,24 @@
 from __future__ import print_function
 
 import types
+from functools import partial
+from itertools import product
 
+import networkx as nx
 import pytest
 from six.moves import xrange
-from sol.path.generate import generate_paths_ie, use_mbox_modifier
-from sol.path.predicates import null_predicate, has_mbox_predicate
+from sol.path.generate import generate_paths_ie, generate_paths_pairs, generate_paths_tc, use_mbox_modifier, \
+    MboxModifier
+from sol.path.ksp import KShortestPaths
+from sol.path.pathcache import PathCache
+from sol.path.predicates import batch_predicate, null_predicate, has_mbox_predicate, waypoint_mbox_predicate, \
+    PathBlock
 
 from sol import Path
 from sol import PathWithMbox
 from sol.topology.generators import chain_topology, \
     complete_topology
+from sol.topology.traffic import TrafficClass
 from sol.utils.exceptions import NoPathsException
 from sol.utils.ph import listeq
 
@@ -104,3 +112,190 @@ def test_pathgen_mbox(topo):
     assert len(paths) == 3
     assert all([p.flow_fraction() == 0 for p in paths])
     assert all([isinstance(p, PathWithMbox) for p in paths])
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_ksp_engine(seed):
+    # The engine must find the same paths as networkx, shortest first
+    graph = nx.gnp_random_graph(10, 0.3, seed=seed, directed=True)
+    engine = KShortestPaths(graph)
+    for source, sink in product(graph.nodes(), repeat=2):
+        if source == sink:
+            continue
+        try:
+            expected = list(nx.shortest_simple_paths(graph, source, sink))
+        except nx.NetworkXNoPath:
+            expected = []
+        for cutoff in (2, 4, None):
+            paths = list(engine.paths(source, sink, cutoff))
+            assert [len(p) for p in paths] == sorted(len(p) for p in paths)
+            assert sorted(map(tuple, paths)) == \
+                sorted(tuple(p) for p in expected if cutoff is None or len(p) - 1 <= cutoff)
+    result = engine.k_paths([(0, 1), (1, 0)], 3)
+    assert all(len(paths) <= 3 for paths in result.values())
+
+
+def test_pathgen_pairs(topo):
+    pairs = [(1, 3), (3, 1), (0, 0)]
+    paths = generate_paths_pairs(topo, pairs, null_predicate, 2, max_paths=5)
+    assert set(paths) == set(pairs)
+    assert len(paths[1, 3]) == 5
+    assert listeq(paths[1, 3][0].nodes(), [1, 3])
+    assert listeq(paths[0, 0][0].nodes(), [0])
+    # same paths as generating them one pair at a time
+    assert [p.nodes().tolist() for p in paths[3, 1]] == \
+        [p.nodes().tolist() for p in generate_paths_ie(3, 1, topo, null_predicate, 2, 5)]
+
+
+def test_pathgen_workers(topo):
+    # includes two classes with the same endpoints
+    tcs = [TrafficClass(i, u'tc', s, t) for i, (s, t) in
+           enumerate([(0, 1), (2, 5), (0, 1), (7, 3), (4, 4), (6, 2)])]
+    serial = generate_paths_tc(topo, tcs, null_predicate, 2, 10)
+    parallel = generate_paths_tc(topo, tcs, null_predicate, 2, 10, workers=2)
+    assert [tc.ID for tc in parallel.tcs()] == [tc.ID for tc in serial.tcs()]
+    for tc in tcs:
+        assert [p.nodes().tolist() for p in parallel.paths(tc)] == \
+            [p.nodes().tolist() for p in serial.paths(tc)]
+    # classes do not share path objects
+    assert parallel.paths(tcs[0])[0] is not parallel.paths(tcs[2])[0]
+    # errors from the workers are raised
+    with pytest.raises(NoPathsException):
+        generate_paths_tc(chain_topology(3), tcs[:1], null_predicate, 0, workers=2)
+
+
+def test_pathgen_cache(topo):
+    # three classes per pair, as in provisioning.traffic_classes
+    tcs = [TrafficClass(i, name, s, t) for i, (name, (s, t)) in
+           enumerate(product([u'web', u'ssh', u'video'], [(0, 1), (2, 5)]))]
+    cache = PathCache()
+    pptc = generate_paths_tc(topo, tcs, null_predicate, 2, 10, cache=cache)
+    assert len(cache) == 2
+    assert cache.misses == 2
+    web, ssh = pptc.paths(tcs[0]), pptc.paths(tcs[2])
+    assert [p.nodes().tolist() for p in web] == [p.nodes().tolist() for p in ssh]
+    # path objects are not shared
+    web[0].set_flow_fraction(.5)
+    assert ssh[0].flow_fraction() == 0
+    # a second call hits the cache
+    again = generate_paths_tc(topo, tcs, null_predicate, 2, 10, cache=cache)
+    assert cache.hits == 2
+    assert [p.nodes().tolist() for p in again.paths(tcs[1])] == \
+        [p.nodes().tolist() for p in pptc.paths(tcs[1])]
+    paths = generate_paths_ie(0, 1, topo, null_predicate, 2, 10, cache=cache)
+    assert cache.hits == 3
+    assert [p.nodes().tolist() for p in paths] == [p.nodes().tolist() for p in web]
+    # different options, or a modified topology, are not served from the cache
+    generate_paths_ie(0, 1, topo, null_predicate, 1, 10, cache=cache)
+    assert len(cache) == 3
+    topo.get_graph().remove_edge(0, 1)
+    topo.touch()
+    paths = generate_paths_ie(0, 1, topo, null_predicate, 2, 10, cache=cache)
+    assert [0, 1] not in [p.nodes().tolist() for p in paths]
+    # a link replaced by another keeps the size of the graph
+    topo.get_graph().add_edge(0, 1)
+    topo.get_graph().remove_edge(2, 5)
+    topo.touch()
+    paths = generate_paths_ie(0, 1, topo, null_predicate, 2, 10, cache=cache)
+    assert [0, 1] in [p.nodes().tolist() for p in paths]
+    topo.set_mbox(3)
+    generate_paths_ie(0, 1, topo, null_predicate, 2, 10, cache=cache)
+    assert len(cache) == 6
+
+
+def test_batch_predicates(topo):
+    for n in [1, 2, 5]:
+        topo.set_mbox(n)
+        topo.add_service_type(n, u'fw' if n < 5 else u'ids')
+    waypoint = partial(waypoint_mbox_predicate, order=(u'fw', u'ids'))
+    assert batch_predicate(lambda p, t: True) is None
+    block = PathBlock([[0, 1, 3], [0, 3], PathWithMbox([0, 2, 5], [2, 5])])
+    assert batch_predicate(has_mbox_predicate)(block, topo).tolist() == [True, False, True]
+    assert batch_predicate(waypoint)(block, topo).tolist() == [False, False, True]
+    # batches give the same paths as checking one path at a time
+    for predicate, modifier, max_paths in [(has_mbox_predicate, None, float('inf')),
+                                           (has_mbox_predicate, None, 7),
+                                           (waypoint, partial(use_mbox_modifier, chain_length=2), 3),
+                                           (null_predicate, use_mbox_modifier, 10)]:
+        batched = list(generate_paths_ie(0, 3, topo, predicate, 3, max_paths, modifier))
+        single = list(generate_paths_ie(0, 3, topo, lambda p, t: predicate(p, t), 3, max_paths, modifier))
+        assert batched == single
+        assert batched
+
+
+def test_mbox_modifier(topo):
+    for n in range(topo.num_nodes()):
+        topo.set_mbox(n)
+    # same paths as use_mbox_modifier, without a budget
+    for predicate in [has_mbox_predicate, lambda p, t: True]:
+        assert list(generate_paths_ie(0, 3, topo, predicate, 2, 1000, MboxModifier(2))) == \
+            list(generate_paths_ie(0, 3, topo, predicate, 2, 1000, partial(use_mbox_modifier, chain_length=2)))
+    # max_paths truncates the expansion
+    paths = list(generate_paths_ie(0, 3, topo, null_predicate, 2, 5, MboxModifier(1)))
+    assert [p.mboxes() for p in paths] == [(0,), (3,), (0,), (1,), (3,)]
+    # budgets
+    assert len(list(generate_paths_ie(0, 3, topo, null_predicate, 2, 1000, MboxModifier(1, path_budget=1)))) == 7
+    assert len(list(generate_paths_ie(0, 3, topo, null_predicate, 2, 1000, MboxModifier(1, tc_budget=4)))) == 4
+    # middleboxes with a lower score first
+    modifier = MboxModifier(1, path_budget=1, score=lambda n: 0 if n == 3 else 1)
+    assert [p.mboxes() for p in generate_paths_ie(0, 3, topo, null_predicate, 2, 3, modifier)] == \
+        [(3,), (3,), (3,)]
+    with pytest.raises(NoPathsException):
+        list(generate_paths_ie(0, 3, topo, null_predicate, 2, 1000, MboxModifier(1, tc_budget=0)))
+
+
+def test_disjoint_paths(topo):
+    # the shortest path 0-1-2-3 blocks both of the two disjoint paths
+    g = nx.Graph([(0, 1), (1, 2), (2, 3), (1, 4), (4, 5), (5, 3), (0, 6), (6, 7), (7, 2)]).to_directed()
+    engine = KShortestPaths(g)
+    assert next(engine.paths(0, 3)) == [0, 1, 2, 3]
+    assert engine.disjoint_paths(0, 3) == [[0, 1, 4, 5, 3], [0, 6, 7, 2, 3]]
+    assert engine.disjoint_paths(0, 3, k=1) == [[0, 1, 2, 3]]
+    assert engine.disjoint_paths(0, 3, cutoff=3) == []
+    # paths can share node 2, but not links
+    g = nx.Graph(list(g.edges()) + [(0, 8), (8, 2), (2, 9), (9, 3)]).to_directed()
+    assert len(KShortestPaths(g).disjoint_paths(0, 3)) == 3
+    assert len(KShortestPaths(g).disjoint_paths(0, 3, nodes=True)) == 2
+
+    engine = KShortestPaths(topo.get_graph())
+    for nodes in (False, True):
+        paths = engine.disjoint_paths(0, 7, nodes=nodes)
+        assert len(paths) == 7
+        assert paths[0] == [0, 7]
+        links = [link for p in paths for link in zip(p, p[1:])]
+        assert len(links) == len(set(links))
+
+    diverse = list(engine.diverse_paths(0, 7, cutoff=2))
+    assert diverse[0] == [0, 7]
+    assert len(diverse) == 7
+    assert len(set(map(tuple, diverse))) == len(diverse)
+
+    # the direct link is expensive, every other link is free
+    assert engine.cheapest_path(0, 7, {}) == ([0, 7], 0)
+    path, cost = engine.cheapest_path(0, 7, {(0, 7): 1, (7, 0): 1}, hop_cost=1e-6)
+    assert len(path) == 3 and cost == 0
+    assert engine.cheapest_path(0, 7, {(0, 7): .5}, hop_cost=1) == ([0, 7], .5)
+
+
+def test_pathgen_strategy(topo):
+    tcs = [TrafficClass(0, u'a', 0, 5), TrafficClass(1, u'a', 2, 3)]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, 2, 3, strategy=u'edge_disjoint')
+    for tc in tcs:
+        paths = list(pptc.paths(tc))
+        assert len(paths) == 3
+        links = [link for p in paths for link in p.links()]
+        assert len(links) == len(set(links))
+    pptc = generate_paths_tc(topo, tcs, null_predicate, 2, 3, strategy=u'diverse')
+    assert all(pptc.num_paths(tc) == 3 for tc in tcs)
+
+    # strategies can be functions of the engine
+    def first(engine, s, t, cutoff, max_paths):
+        return [next(engine.paths(s, t, cutoff))]
+    assert generate_paths_pairs(topo, [(0, 5)], strategy=first)[0, 5] == [Path([0, 5])]
+    # and paths of different strategies are cached separately
+    cache = PathCache()
+    generate_paths_tc(topo, tcs, null_predicate, 2, 3, cache=cache)
+    generate_paths_tc(topo, tcs, null_predicate, 2, 3, cache=cache, strategy=u'node_disjoint')
+    assert cache.hits == 0
+    with pytest.raises(ValueError):
+        generate_paths_tc(topo, tcs, null_predicate, 2, 3, strategy=u'nope')
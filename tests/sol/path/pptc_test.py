@@ -1 +1,220 @@
+# coding=utf-8
 
+import numpy
+import pytest
+from sol.path.generate import generate_paths_tc, paths_fingerprint, use_mbox_modifier
+from sol.path.paths import Path, PathStore, PathWithMbox, PPTC
+from sol.path.predicates import null_predicate
+from sol.topology.generators import complete_topology
+from sol.topology.traffic import TrafficClass
+from sol.utils.const import LINKS, MBOXES, NODES
+from sol.utils.exceptions import StalePathsException
+
+
+@pytest.fixture(scope='function')
+def pptc():
+    topo = complete_topology(5)
+    tcs = [TrafficClass(0, u'a', 0, 2), TrafficClass(1, u'a', 1, 3)]
+    return generate_paths_tc(topo, tcs, null_predicate, 5)
+
+
+def test_incidence(pptc):
+    n = 5
+    num_paths = pptc.total_paths()
+    links = pptc.incidence(LINKS, n)
+    nodes = pptc.incidence(NODES, n)
+    assert links.shape == (num_paths, n * n)
+    assert nodes.shape == (num_paths, n)
+    tcids, pind = pptc.path_index()
+    assert tcids.size == num_paths
+    for row in range(num_paths):
+        p = pptc.paths(pptc.tc_byid(tcids[row]))[pind[row]]
+        assert links[row].nnz == len(p)
+        assert set(nodes[row].indices) == set(p.nodes())
+        assert set(links[row].indices) == set([u * n + v for u, v in p.links()])
+    # Repeated calls reuse the cached matrix
+    assert pptc.incidence(LINKS, n) is links
+
+
+def test_incidence_masked(pptc):
+    n = 5
+    links = pptc.incidence(LINKS, n)
+    tc = pptc.tc_byid(0)
+    mask = numpy.zeros(pptc.num_paths(tc), dtype=bool)
+    mask[0] = True
+    pptc.mask(tc, mask)
+    masked = pptc.incidence(LINKS, n)
+    assert masked is not links
+    assert masked.shape[0] == links.shape[0] - 1
+    assert pptc.path_index()[0].size == masked.shape[0]
+    # Masked paths are still available when asked for
+    assert pptc.incidence(LINKS, n, all=True).shape[0] == links.shape[0]
+    pptc.unmask(tc)
+    assert pptc.incidence(LINKS, n).shape == links.shape
+
+
+def test_incidence_shared_paths(pptc):
+    n = 5
+    links = pptc.incidence(LINKS, n)
+    # paths added through a merged PPTC are shared, and seen by the cached matrices of both
+    merged = PPTC.merge([pptc])
+    merged.extend(pptc.tc_byid(0), [Path([0, 4, 3, 2])])
+    for masked in (False, True):
+        assert pptc.incidence(LINKS, n, all=masked).shape[0] == links.shape[0] + 1
+        assert pptc.path_ids(masked).size == links.shape[0] + 1
+
+
+def test_incidence_bad_mode(pptc):
+    with pytest.raises(ValueError):
+        pptc.incidence(u'paths')
+
+
+def test_flow_fractions(pptc):
+    tc = pptc.tc_byid(0)
+    fractions = numpy.linspace(0, 1, pptc.num_paths(tc, all=True))
+    pptc.set_flow_fractions(tc, fractions)
+    pptc.mask(tc, fractions < .5)
+    # fractions are given for all paths, so masking does not change the assignment
+    assert [p.flow_fraction() for p in pptc.paths(tc)] == list(fractions[fractions >= .5])
+    assert [p.flow_fraction() for p in pptc.all_paths(tc)] == list(fractions)
+
+
+def test_path_store():
+    store = PathStore(1)
+    paths = [Path([0, 1, 2], .5), PathWithMbox([3, 4], [4]), Path([5])]
+    assert store.append(paths, 7) == 0
+    assert store.append([Path([2, 1])]) == 3
+    assert len(store) == 4
+    assert store.nodes(1).tolist() == [3, 4]
+    assert store.owners().tolist() == [7, 7, 7, -1]
+    view = store.path(1)
+    assert isinstance(view, PathWithMbox) and view == paths[1]
+    assert isinstance(store.path(0), Path) and store.path(0).flow_fraction() == .5
+    # views write flow fractions to the store
+    store.path(3).set_flow_fraction(.25)
+    assert store.fractions()[3] == .25
+    # copies are standalone
+    copy = store.path(3).copy()
+    copy.set_flow_fraction(1)
+    assert store.fractions()[3] == .25
+    with pytest.raises(IndexError):
+        store.path(4)
+
+
+def test_pptc_store():
+    tc = TrafficClass(0, u'a', 0, 2)
+    paths = [PathWithMbox([0, 1, 2], [1]), PathWithMbox([0, 3, 2], [0, 3])]
+    pptc = PPTC.from_dict({tc: paths}, u'app')
+    assert list(pptc.paths(tc)) == paths
+    pptc.set_flow_fractions(tc, numpy.array([.2, .8]))
+    # shallow copies share masks and fractions, deep ones only fractions
+    shallow, deep = pptc.copy(), pptc.copy(deep=True)
+    pptc.mask(tc, [True, False])
+    assert shallow.num_paths(tc) == 1 and deep.num_paths(tc) == 2
+    assert [p.flow_fraction() for p in deep.paths(tc)] == [.2, .8]
+    assert pptc.flow_fractions(tc).tolist() == [.8]
+    assert pptc.get_mask_array(tc).tolist() == [True, False]
+    mboxes = deep.incidence(MBOXES, 4)
+    assert mboxes.toarray().tolist() == [[0, 1, 0, 0], [1, 0, 0, 1]]
+    assert deep.incidence(LINKS, 4).nnz == 4
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+def test_save_load(tmpdir, mmap):
+    topo = complete_topology(5)
+    for n in topo.nodes():
+        topo.set_mbox(n)
+    tcs = [TrafficClass(0, u'a', 0, 2), TrafficClass(1, u'b', 1, 3)]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, 2, 5, use_mbox_modifier, name=u'app')
+    pptc.set_flow_fractions(tcs[1], numpy.linspace(0, 1, pptc.num_paths(tcs[1])))
+    pptc.mask(tcs[0], numpy.arange(pptc.num_paths(tcs[0])) % 2 == 0)
+    fingerprint = paths_fingerprint(topo, null_predicate, 2, 5, use_mbox_modifier)
+    fname = str(tmpdir.join('paths'))
+    pptc.save(fname, fingerprint)
+
+    loaded = PPTC.load(fname, fingerprint=fingerprint, mmap=mmap)
+    assert sorted(tc.ID for tc in loaded.tcs(u'app')) == [0, 1]
+    for tc in tcs:
+        tc2 = loaded.tc_byid(tc.ID)
+        assert (tc2.name, tc2.src, tc2.dst) == (tc.name, tc.src, tc.dst)
+        assert list(loaded.all_paths(tc2)) == list(pptc.all_paths(tc))
+        assert loaded.get_mask_array(tc2).tolist() == pptc.get_mask_array(tc).tolist()
+        assert loaded.flow_fractions(tc2, all=True).tolist() == pptc.flow_fractions(tc, all=True).tolist()
+    assert (loaded.incidence(MBOXES, 5) != pptc.incidence(MBOXES, 5)).nnz == 0
+    # loaded paths can be modified
+    loaded.set_flow_fractions(tcs[0], numpy.ones(pptc.num_paths(tcs[0], all=True)))
+    loaded.add(u'app', TrafficClass(2, u'c', 2, 4), list(pptc.paths(tcs[0])))
+    assert loaded.num_paths(loaded.tc_byid(2)) == pptc.num_paths(tcs[0])
+
+    # given traffic classes, matched by ID
+    assert next(PPTC.load(fname, tcs[1:]).tcs()) is tcs[1]
+    with pytest.raises(StalePathsException):
+        PPTC.load(fname, [TrafficClass(1, u'b', 3, 1)])
+    with pytest.raises(StalePathsException):
+        PPTC.load(fname, [TrafficClass(5, u'b', 1, 3)])
+    # paths of a modified topology are stale
+    topo.set_mbox(0, False)
+    with pytest.raises(StalePathsException):
+        PPTC.load(fname, fingerprint=paths_fingerprint(topo, null_predicate, 2, 5, use_mbox_modifier))
+
+
+def test_repair():
+    topo = complete_topology(6)
+    tcs = [TrafficClass(0, u'a', 0, 2), TrafficClass(1, u'a', 1, 3), TrafficClass(2, u'a', 4, 5)]
+    pptc = generate_paths_tc(topo, tcs, null_predicate, 2, 4)
+    # the inverted index agrees with the paths
+    uses = pptc.paths_using([(0, 1), 3])
+    for tc in tcs:
+        expected = [i for i, p in enumerate(pptc.all_paths(tc)) if 3 in p.nodes() or (0, 1) in p.links()]
+        assert uses.get(tc, numpy.zeros(0)).tolist() == expected
+    # and is extended with new paths
+    assert pptc.extend(tcs[0], [Path([0, 3, 2])]) == 1
+    assert pptc.paths_using([3])[tcs[0]].tolist()[-1] == 4
+
+    old = {tc: list(pptc.all_paths(tc)) for tc in tcs}
+    added = pptc.repair(topo, [3], cutoff=3)
+    assert set(added) == set(tc for tc in tcs if any(3 in p.nodes() for p in old[tc]))
+    for tc in tcs:
+        # paths keep their indices, replacements are added at the end
+        assert list(pptc.all_paths(tc))[:len(old[tc])] == old[tc]
+        paths = list(pptc.paths(tc))
+        assert all(3 not in p.nodes() for p in paths)
+        assert len(set(tuple(p.nodes()) for p in paths)) == len(paths)
+    assert pptc.num_paths(tcs[0]) == 5
+    assert pptc.num_paths(tcs[2]) == 4
+    # the sink of the traffic class failed, nothing to replace
+    assert pptc.num_paths(tcs[1]) == 0 and added[tcs[1]] == 0
+
+    # failed links are masked in both directions, and replaced up to the quota
+    added = pptc.repair(topo, [(2, 0)], quota=2)
+    assert all((0, 2) not in p.links() for p in pptc.paths(tcs[0]))
+    assert pptc.num_paths(tcs[0]) >= 2
+
+
+def test_path_interning():
+    topo = complete_topology(5)
+    tcs = [TrafficClass(0, u'a', 0, 2), TrafficClass(1, u'b', 0, 2), TrafficClass(2, u'b', 1, 3)]
+    first = generate_paths_tc(topo, tcs[:1], null_predicate, 2, name=u'a')
+    second = generate_paths_tc(topo, tcs[1:], null_predicate, 2, name=u'b')
+    merged = PPTC.merge([first, second])
+    ids = merged.path_ids(all=True)
+    tcids, pind = merged.path_index(all=True)
+    # the same paths of the two applications are recognized
+    assert ids[tcids == 0].tolist() == ids[tcids == 1].tolist()
+    assert len(merged.path_table()) == merged.num_paths(tcs[0]) + merged.num_paths(tcs[2])
+    for pid, tcid, i in zip(ids, tcids, pind):
+        assert merged.path_table().path(pid) == merged.all_paths(merged.tc_byid(tcid))[i]
+    # paths with middleboxes are different paths
+    table = merged.path_table()
+    assert table.intern(Path([0, 2])) == ids[0]
+    assert PathWithMbox([0, 2], [0]) not in table
+    assert table.intern(PathWithMbox([0, 2], [0])) == len(table) - 1
+    assert len({Path([0, 2]), Path([0, 2]), Path([0, 1, 2]), PathWithMbox([0, 2], [0])}) == 3
+
+    # shared rows give the same incidence as separate ones
+    merged.mask(tcs[1], numpy.arange(merged.num_paths(tcs[1])) == 0)
+    inc = merged.incidence(LINKS, 5).toarray()
+    tcids, pind = merged.path_index()
+    for row in range(inc.shape[0]):
+        path = merged.paths(merged.tc_byid(tcids[row]))[pind[row]]
+        assert sorted(numpy.flatnonzero(inc[row]).tolist()) == sorted(u * 5 + v for u, v in path.links())
@@ -63,6 +63,18 @@ def test_graph_directed():
     assert topo.get_graph().is_directed()
 
 
+def test_path_engine():
+    # One engine is shared until the topology changes
+    topo = complete_topology(4)
+    engine = topo.path_engine()
+    assert topo.path_engine() is engine
+    assert next(topo.paths(0, 1, 3)) == [0, 1]
+    topo.get_graph().remove_edge(0, 1)
+    topo.touch()
+    assert topo.path_engine() is not engine
+    assert len(next(topo.paths(0, 1, 3))) == 3
+
+
 @pytest.mark.skip()
 def test_set_service_types():
     # todo: test code that deals with service types & middleboxes